@@ -0,0 +1,263 @@
+import structlog
+from structlog.typing import FilteringBoundLogger
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.messages import Allgather
+from exasol.analytics.udf.communication.operation_steps import (
+    Steps,
+    poll_peers,
+    recv,
+    run_blocking,
+    send,
+)
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerGroup
+from exasol.analytics.udf.communication.serialization import (
+    deserialize_message,
+    serialize_message,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import (
+    Frame,
+    SocketFactory,
+)
+from exasol.analytics.utils.errors import UninitializedAttributeError
+
+LOGGER: FilteringBoundLogger = structlog.getLogger()
+
+LOCALHOST_LEADER_RANK = 0
+
+
+class AllgatherOperation:
+    """
+    Distributes the values of all instances to all instances.
+
+    The instances send their value to their localhost leader. Each localhost
+    leader sends the values of its node directly to all other localhost
+    leaders, instead of going through the multi node leader, and passes on
+    the values of its own node and of each other node to its local peers as
+    soon as they are complete. Compared to a gather followed by a broadcast,
+    a value needs at most three hops to reach any instance.
+    """
+
+    def __init__(
+        self,
+        sequence_number: int,
+        value: bytes | memoryview,
+        position: int,
+        localhost_communicator: PeerGroup,
+        multi_node_communicator: PeerGroup | None,
+        socket_factory: SocketFactory,
+        number_of_nodes: int,
+        number_of_instances_per_node: int,
+    ):
+        self._number_of_instances_per_node = number_of_instances_per_node
+        self._socket_factory = socket_factory
+        self._value = value
+        self._position = position
+        self._sequence_number = sequence_number
+        self._multi_node_communicator = multi_node_communicator
+        self._localhost_communicator = localhost_communicator
+        self._number_of_instances_in_cluster = (
+            number_of_nodes * number_of_instances_per_node
+        )
+        self._node_base_position = (
+            position // number_of_instances_per_node * number_of_instances_per_node
+        )
+        self._logger = LOGGER.bind(
+            sequence_number=self._sequence_number,
+            position=self._position,
+        )
+
+    def __call__(self) -> list[memoryview]:
+        return run_blocking(self.steps())
+
+    def steps(self) -> Steps[list[memoryview]]:
+        """
+        Steps of the operation, see operation_steps.
+        """
+        # The frames get forwarded as they are, to not copy the values per peer.
+        result: dict[int, Frame] = {
+            self._position: self._socket_factory.create_frame(self._value)
+        }
+        if self._localhost_communicator.rank > LOCALHOST_LEADER_RANK:
+            yield from self._send_to_localhost_leader(result)
+            yield from self._receive_from_localhost_leader(result)
+        else:
+            yield from self._receive_from_local_peers(result)
+            node_positions = self._node_positions()
+            yield from self._send_to_remote_leaders(result, node_positions)
+            yield from self._send_to_local_peers(result, node_positions)
+            yield from self._receive_from_remote_leaders(result)
+        return [
+            result[position].to_memoryview()
+            for position in range(self._number_of_instances_in_cluster)
+        ]
+
+    @property
+    def _checked_multi_node_communicator(self) -> PeerGroup:
+        value = self._multi_node_communicator
+        if value is None:
+            raise UninitializedAttributeError("Multi node communicator is undefined.")
+        return value
+
+    def _node_positions(self) -> list[int]:
+        return list(
+            range(
+                self._node_base_position,
+                self._node_base_position + self._number_of_instances_per_node,
+            )
+        )
+
+    def _send_to_localhost_leader(self, result: dict[int, Frame]) -> Steps[None]:
+        self._logger.info("_send_to_localhost_leader")
+        communicator = self._localhost_communicator
+        yield from self._send(
+            communicator,
+            communicator.leader,
+            {self._position: result[self._position]},
+        )
+
+    def _receive_from_localhost_leader(self, result: dict[int, Frame]) -> Steps[None]:
+        self._logger.info("_receive_from_localhost_leader")
+        communicator = self._localhost_communicator
+        while len(result) < self._number_of_instances_in_cluster:
+            values = yield from self._receive(communicator, communicator.leader)
+            # The leader sends the value of this instance back within
+            # the values of the node, so we skip it.
+            values.pop(self._position, None)
+            self._add_to_result(result, values)
+
+    def _receive_from_local_peers(self, result: dict[int, Frame]) -> Steps[None]:
+        self._logger.info("_receive_from_local_peers")
+        communicator = self._localhost_communicator
+        peers_without_message = [
+            peer for peer in communicator.peers() if peer != communicator.peer
+        ]
+        while len(peers_without_message) > 0:
+            peers = yield from poll_peers(
+                communicator, peers=peers_without_message, tag=self._sequence_number
+            )
+            for peer in peers:
+                values = yield from self._receive(communicator, peer)
+                for position in values.keys():
+                    self._check_position_is_on_my_node(position)
+                self._add_to_result(result, values)
+                peers_without_message.remove(peer)
+
+    def _send_to_remote_leaders(
+        self, result: dict[int, Frame], node_positions: list[int]
+    ) -> Steps[None]:
+        self._logger.info("_send_to_remote_leaders")
+        communicator = self._checked_multi_node_communicator
+        node_values = {position: result[position] for position in node_positions}
+        for peer in communicator.peers():
+            if peer != communicator.peer:
+                yield from self._send(communicator, peer, node_values)
+
+    def _send_to_local_peers(
+        self, result: dict[int, Frame], positions: list[int]
+    ) -> Steps[None]:
+        communicator = self._localhost_communicator
+        values = {position: result[position] for position in positions}
+        for peer in communicator.peers():
+            if peer != communicator.peer:
+                yield from self._send(communicator, peer, values)
+
+    def _receive_from_remote_leaders(self, result: dict[int, Frame]) -> Steps[None]:
+        self._logger.info("_receive_from_remote_leaders")
+        communicator = self._checked_multi_node_communicator
+        peers_without_message = [
+            peer for peer in communicator.peers() if peer != communicator.peer
+        ]
+        while len(peers_without_message) > 0:
+            peers = yield from poll_peers(
+                communicator, peers=peers_without_message, tag=self._sequence_number
+            )
+            for peer in peers:
+                values = yield from self._receive(communicator, peer)
+                self._check_remote_node_positions(values, peer)
+                self._add_to_result(result, values)
+                yield from self._send_to_local_peers(result, list(values.keys()))
+                peers_without_message.remove(peer)
+
+    def _check_position_is_on_my_node(self, position: int):
+        if not (
+            self._node_base_position
+            <= position
+            < self._node_base_position + self._number_of_instances_per_node
+        ):
+            raise RuntimeError(
+                f"Got value for position {position} from a local peer, "
+                f"which is not on this node."
+            )
+
+    def _check_remote_node_positions(self, values: dict[int, Frame], peer: Peer):
+        node_rank = self._checked_multi_node_communicator.peers().index(peer)
+        node_base_position = node_rank * self._number_of_instances_per_node
+        expected_positions = list(
+            range(
+                node_base_position,
+                node_base_position + self._number_of_instances_per_node,
+            )
+        )
+        if sorted(values.keys()) != expected_positions:
+            raise RuntimeError(
+                f"Got values for positions {sorted(values.keys())} from peer {peer}, "
+                f"but expected the positions {expected_positions}."
+            )
+
+    def _add_to_result(self, result: dict[int, Frame], values: dict[int, Frame]):
+        for position, value in values.items():
+            if position in result:
+                raise RuntimeError(f"Already received a value for position {position}.")
+            result[position] = value
+
+    def _send(
+        self, communicator: PeerGroup, peer: Peer, values: dict[int, Frame]
+    ) -> Steps[None]:
+        message = Allgather(
+            sequence_number=self._sequence_number,
+            source=communicator.peer,
+            destination=peer,
+            positions=list(values.keys()),
+        )
+        serialized_message = serialize_message(message)
+        frames = [self._socket_factory.create_frame(serialized_message)] + list(
+            values.values()
+        )
+        yield from send(
+            communicator, peer=peer, message=frames, tag=self._sequence_number
+        )
+
+    def _receive(self, communicator: PeerGroup, peer: Peer) -> Steps[dict[int, Frame]]:
+        frames = yield from recv(communicator, peer, tag=self._sequence_number)
+        message = deserialize_message(frames[0].to_bytes(), messages.Message)
+        specific_message_obj = self._get_and_check_specific_message_obj(message)
+        self._check_sequence_number(specific_message_obj)
+        value_frames = frames[1:]
+        if len(specific_message_obj.positions) != len(value_frames):
+            raise RuntimeError(
+                f"Got message with inconsistent number of positions and values "
+                f"({len(value_frames)}) in message {specific_message_obj}"
+            )
+        return dict(zip(specific_message_obj.positions, value_frames))
+
+    def _check_sequence_number(self, specific_message_obj: Allgather):
+        if specific_message_obj.sequence_number != self._sequence_number:
+            raise RuntimeError(
+                f"Got message with different sequence number. "
+                f"We expect the sequence number {self._sequence_number} "
+                f"but we got {specific_message_obj.sequence_number} in message {specific_message_obj}"
+            )
+
+    def _get_and_check_specific_message_obj(
+        self, message: messages.Message
+    ) -> Allgather:
+        specific_message_obj = message.root
+        if not isinstance(specific_message_obj, Allgather):
+            raise TypeError(
+                f"Received the wrong message type. "
+                f"Expected {Allgather.__name__} got {type(message)}. "
+                f"For message {message}."
+            )
+        return specific_message_obj
@@ -0,0 +1,181 @@
+import structlog
+from structlog.typing import FilteringBoundLogger
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.broadcast_operation import BroadcastOperation
+from exasol.analytics.udf.communication.messages import Reduce
+from exasol.analytics.udf.communication.operation_steps import (
+    Steps,
+    poll_peers,
+    recv,
+    run_blocking,
+    send,
+)
+from exasol.analytics.udf.communication.peer_communicator import PeerGroup
+from exasol.analytics.udf.communication.reducers import Reducer
+from exasol.analytics.udf.communication.serialization import (
+    deserialize_message,
+    serialize_message,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import SocketFactory
+from exasol.analytics.utils.errors import UninitializedAttributeError
+
+LOGGER: FilteringBoundLogger = structlog.getLogger()
+
+LOCALHOST_LEADER_RANK = 0
+MULTI_NODE_LEADER_RANK = 0
+
+
+class AllreduceOperation:
+    """
+    Reduces the values of all instances with the given reducer and
+    distributes the result to all instances.
+
+    Each localhost leader first reduces the values of the instances on its node.
+    Afterward, the multi node leader reduces the values of all nodes and
+    broadcasts the result back through the localhost leaders.
+    """
+
+    def __init__(
+        self,
+        sequence_number: int,
+        value: bytes | memoryview,
+        reducer: Reducer,
+        localhost_communicator: PeerGroup,
+        multi_node_communicator: PeerGroup | None,
+        socket_factory: SocketFactory,
+    ):
+        self._socket_factory = socket_factory
+        self._value = memoryview(value)
+        self._reducer = reducer
+        self._sequence_number = sequence_number
+        self._multi_node_communicator = multi_node_communicator
+        self._localhost_communicator = localhost_communicator
+        self._logger = LOGGER.bind(
+            sequence_number=self._sequence_number,
+        )
+
+    def __call__(self) -> memoryview:
+        return run_blocking(self.steps())
+
+    def steps(self) -> Steps[memoryview]:
+        """
+        Steps of the operation, see operation_steps.
+        """
+        reduced_value = yield from self._reduce()
+        broadcast = BroadcastOperation(
+            sequence_number=self._sequence_number,
+            value=reduced_value,
+            localhost_communicator=self._localhost_communicator,
+            multi_node_communicator=self._multi_node_communicator,
+            socket_factory=self._socket_factory,
+        )
+        return (yield from broadcast.steps())
+
+    def _reduce(self) -> Steps[memoryview | None]:
+        if self._localhost_communicator.rank > LOCALHOST_LEADER_RANK:
+            yield from self._send_to_leader(self._localhost_communicator, self._value)
+            return None
+        node_value = yield from self._reduce_values_from_peers(
+            self._localhost_communicator, self._value
+        )
+        communicator = self._checked_multi_node_communicator
+        if communicator.rank > MULTI_NODE_LEADER_RANK:
+            yield from self._send_to_leader(communicator, node_value)
+            return None
+        return (yield from self._reduce_values_from_peers(communicator, node_value))
+
+    @property
+    def _checked_multi_node_communicator(self) -> PeerGroup:
+        value = self._multi_node_communicator
+        if value is None:
+            raise UninitializedAttributeError("Multi node communicator is undefined.")
+        return value
+
+    def _send_to_leader(
+        self, communicator: PeerGroup, value: memoryview
+    ) -> Steps[None]:
+        leader = communicator.leader
+        message = Reduce(
+            sequence_number=self._sequence_number,
+            destination=leader,
+            source=communicator.peer,
+            position=communicator.rank,
+        )
+        self._logger.info("_send_to_leader", message=message.model_dump())
+        frames = [
+            self._socket_factory.create_frame(serialize_message(message)),
+            self._socket_factory.create_frame(value),
+        ]
+        yield from send(
+            communicator, peer=leader, message=frames, tag=self._sequence_number
+        )
+
+    def _reduce_values_from_peers(
+        self, communicator: PeerGroup, own_value: memoryview
+    ) -> Steps[memoryview]:
+        values = yield from self._receive_values_from_peers(communicator)
+        values[communicator.rank] = own_value
+        reduced_value = values[0]
+        for position in range(1, communicator.number_of_peers):
+            reduced_value = memoryview(self._reducer(reduced_value, values[position]))
+        return reduced_value
+
+    def _receive_values_from_peers(
+        self, communicator: PeerGroup
+    ) -> Steps[dict[int, memoryview]]:
+        values: dict[int, memoryview] = {}
+        number_of_values_from_peers = communicator.number_of_peers - 1
+        while len(values) < number_of_values_from_peers:
+            peers = yield from poll_peers(communicator, tag=self._sequence_number)
+            for peer in peers:
+                frames = yield from recv(communicator, peer, tag=self._sequence_number)
+                message = deserialize_message(frames[0].to_bytes(), messages.Message)
+                specific_message_obj = self._get_and_check_specific_message_obj(message)
+                self._check_sequence_number(specific_message_obj)
+                position = self._get_and_check_position(
+                    specific_message_obj, communicator, values
+                )
+                self._logger.info(
+                    "_receive_values_from_peers", position=position, peer=peer
+                )
+                values[position] = frames[1].to_memoryview()
+        return values
+
+    def _get_and_check_position(
+        self,
+        specific_message_obj: Reduce,
+        communicator: PeerGroup,
+        values: dict[int, memoryview],
+    ) -> int:
+        position = specific_message_obj.position
+        if not (0 < position < communicator.number_of_peers):
+            raise RuntimeError(
+                f"Got message with not allowed position. "
+                f"Position needs to be greater than 0 and smaller than {communicator.number_of_peers}, "
+                f"but we got {position} in message {specific_message_obj}"
+            )
+        if position in values:
+            raise RuntimeError(
+                f"Already received a message for position {position}. "
+                f"Got message {specific_message_obj}"
+            )
+        return position
+
+    def _check_sequence_number(self, specific_message_obj: Reduce):
+        if specific_message_obj.sequence_number != self._sequence_number:
+            raise RuntimeError(
+                f"Got message with different sequence number. "
+                f"We expect the sequence number {self._sequence_number} "
+                f"but we got {specific_message_obj.sequence_number} in message {specific_message_obj}"
+            )
+
+    def _get_and_check_specific_message_obj(self, message: messages.Message) -> Reduce:
+        specific_message_obj = message.root
+        if not isinstance(specific_message_obj, Reduce):
+            raise TypeError(
+                f"Received the wrong message type. "
+                f"Expected {Reduce.__name__} got {type(message)}. "
+                f"For message {message}."
+            )
+        return specific_message_obj
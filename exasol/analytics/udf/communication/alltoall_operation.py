@@ -0,0 +1,355 @@
+from collections import defaultdict
+
+import structlog
+from structlog.typing import FilteringBoundLogger
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.messages import Alltoall
+from exasol.analytics.udf.communication.operation_steps import (
+    Steps,
+    poll_peers,
+    recv,
+    run_blocking,
+    send,
+)
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerGroup
+from exasol.analytics.udf.communication.serialization import (
+    deserialize_message,
+    serialize_message,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import (
+    Frame,
+    SocketFactory,
+)
+from exasol.analytics.utils.errors import UninitializedAttributeError
+
+LOGGER: FilteringBoundLogger = structlog.getLogger()
+
+LOCALHOST_LEADER_RANK = 0
+
+Route = tuple[int, int, Frame]
+"""Source position, destination position and the value frame."""
+
+
+class AlltoallOperation:
+    """
+    Exchanges one value between every pair of instances.
+
+    Instances on the same node send their values directly to each other.
+    Values for other nodes get sent to the own localhost leader, which streams
+    them per incoming message directly to the localhost leaders of the
+    destination nodes. These forward them to the destination instances. As
+    such, no single leader needs to handle the data of the whole cluster.
+    """
+
+    def __init__(
+        self,
+        sequence_number: int,
+        values: list[bytes] | list[memoryview],
+        position: int,
+        localhost_communicator: PeerGroup,
+        multi_node_communicator: PeerGroup | None,
+        socket_factory: SocketFactory,
+        number_of_nodes: int,
+        number_of_instances_per_node: int,
+    ):
+        self._number_of_nodes = number_of_nodes
+        self._number_of_instances_per_node = number_of_instances_per_node
+        self._socket_factory = socket_factory
+        self._values = values
+        self._position = position
+        self._sequence_number = sequence_number
+        self._multi_node_communicator = multi_node_communicator
+        self._localhost_communicator = localhost_communicator
+        self._number_of_instances_in_cluster = (
+            number_of_nodes * number_of_instances_per_node
+        )
+        self._node_base_position = (
+            position // number_of_instances_per_node * number_of_instances_per_node
+        )
+        self._logger = LOGGER.bind(
+            sequence_number=self._sequence_number,
+            position=self._position,
+        )
+
+    def __call__(self) -> list[memoryview]:
+        return run_blocking(self.steps())
+
+    def steps(self) -> Steps[list[memoryview]]:
+        """
+        Steps of the operation, see operation_steps.
+        """
+        self._check_values()
+        result: dict[int, memoryview] = {
+            self._position: memoryview(self._values[self._position])
+        }
+        yield from self._send_values_to_local_peers()
+        if self._localhost_communicator.rank > LOCALHOST_LEADER_RANK:
+            yield from self._receive_as_localhost_peer(result)
+        else:
+            yield from self._send_values_to_remote_leaders()
+            yield from self._route_as_localhost_leader(result)
+        return [result[position] for position in range(len(result))]
+
+    def _check_values(self):
+        if len(self._values) != self._number_of_instances_in_cluster:
+            raise ValueError(
+                f"Number of values needs to be equal to the number of instances "
+                f"in the cluster {self._number_of_instances_in_cluster}, "
+                f"but got {len(self._values)}."
+            )
+
+    @property
+    def _checked_multi_node_communicator(self) -> PeerGroup:
+        value = self._multi_node_communicator
+        if value is None:
+            raise UninitializedAttributeError("Multi node communicator is undefined.")
+        return value
+
+    def _is_on_my_node(self, position: int) -> bool:
+        return (
+            self._node_base_position
+            <= position
+            < self._node_base_position + self._number_of_instances_per_node
+        )
+
+    def _send_values_to_local_peers(self) -> Steps[None]:
+        communicator = self._localhost_communicator
+        leader_position = self._node_base_position + LOCALHOST_LEADER_RANK
+        for rank, peer in enumerate(communicator.peers()):
+            destination_position = self._node_base_position + rank
+            if destination_position == self._position:
+                continue
+            destination_positions = [destination_position]
+            if destination_position == leader_position:
+                destination_positions += [
+                    position
+                    for position in range(self._number_of_instances_in_cluster)
+                    if not self._is_on_my_node(position)
+                ]
+            routes = [
+                (
+                    self._position,
+                    position,
+                    self._socket_factory.create_frame(self._values[position]),
+                )
+                for position in destination_positions
+            ]
+            yield from self._send(communicator, peer, routes)
+
+    def _send_values_to_remote_leaders(self) -> Steps[None]:
+        communicator = self._checked_multi_node_communicator
+        for node_rank, peer in enumerate(communicator.peers()):
+            if node_rank == communicator.rank:
+                continue
+            base_position = node_rank * self._number_of_instances_per_node
+            routes = [
+                (
+                    self._position,
+                    position,
+                    self._socket_factory.create_frame(self._values[position]),
+                )
+                for position in range(
+                    base_position, base_position + self._number_of_instances_per_node
+                )
+            ]
+            yield from self._send(communicator, peer, routes)
+
+    def _receive_as_localhost_peer(self, result: dict[int, memoryview]) -> Steps[None]:
+        communicator = self._localhost_communicator
+        leader = communicator.leader
+        number_of_remote_values = (
+            self._number_of_instances_in_cluster - self._number_of_instances_per_node
+        )
+        expected_frames = {
+            peer: 1 for peer in communicator.peers() if peer != communicator.peer
+        }
+        expected_frames[leader] += number_of_remote_values
+        while len(expected_frames) > 0:
+            peers = yield from poll_peers(
+                communicator,
+                peers=list(expected_frames.keys()),
+                tag=self._sequence_number,
+            )
+            for peer in peers:
+                routes = yield from self._receive(communicator, peer)
+                for source_position, destination_position, frame in routes:
+                    self._check_destination_position(
+                        destination_position, self._position
+                    )
+                    self._add_to_result(result, source_position, frame)
+                self._count_received_frames(expected_frames, peer, len(routes))
+
+    def _route_as_localhost_leader(self, result: dict[int, memoryview]) -> Steps[None]:
+        localhost_communicator = self._localhost_communicator
+        multi_node_communicator = self._checked_multi_node_communicator
+        number_of_remote_values = (
+            self._number_of_instances_in_cluster - self._number_of_instances_per_node
+        )
+        expected_local_frames = {
+            peer: 1 + number_of_remote_values
+            for peer in localhost_communicator.peers()
+            if peer != localhost_communicator.peer
+        }
+        expected_remote_frames = {
+            peer: self._number_of_instances_per_node**2
+            for peer in multi_node_communicator.peers()
+            if peer != multi_node_communicator.peer
+        }
+        while len(expected_local_frames) > 0 or len(expected_remote_frames) > 0:
+            if len(expected_local_frames) > 0:
+                yield from self._route_messages_from_local_peers(
+                    result, expected_local_frames
+                )
+            if len(expected_remote_frames) > 0:
+                yield from self._route_messages_from_remote_leaders(
+                    result, expected_remote_frames
+                )
+
+    def _route_messages_from_local_peers(
+        self, result: dict[int, memoryview], expected_frames: dict[Peer, int]
+    ) -> Steps[None]:
+        localhost_communicator = self._localhost_communicator
+        multi_node_communicator = self._checked_multi_node_communicator
+        peers_with_messages = yield from poll_peers(
+            localhost_communicator,
+            peers=list(expected_frames.keys()),
+            tag=self._sequence_number,
+        )
+        for peer in peers_with_messages:
+            routes = yield from self._receive(localhost_communicator, peer)
+            routes_per_node: dict[int, list[Route]] = defaultdict(list)
+            for route in routes:
+                source_position, destination_position, frame = route
+                if destination_position == self._position:
+                    self._add_to_result(result, source_position, frame)
+                elif self._is_on_my_node(destination_position):
+                    raise RuntimeError(
+                        f"Got value from {source_position} for local peer "
+                        f"{destination_position}, which should have been sent directly."
+                    )
+                else:
+                    node_rank = (
+                        destination_position // self._number_of_instances_per_node
+                    )
+                    routes_per_node[node_rank].append(route)
+            remote_leaders = multi_node_communicator.peers()
+            for node_rank, node_routes in routes_per_node.items():
+                yield from self._send(
+                    multi_node_communicator, remote_leaders[node_rank], node_routes
+                )
+            self._count_received_frames(expected_frames, peer, len(routes))
+
+    def _route_messages_from_remote_leaders(
+        self, result: dict[int, memoryview], expected_frames: dict[Peer, int]
+    ) -> Steps[None]:
+        localhost_communicator = self._localhost_communicator
+        multi_node_communicator = self._checked_multi_node_communicator
+        peers_with_messages = yield from poll_peers(
+            multi_node_communicator,
+            peers=list(expected_frames.keys()),
+            tag=self._sequence_number,
+        )
+        for peer in peers_with_messages:
+            routes = yield from self._receive(multi_node_communicator, peer)
+            local_peers = localhost_communicator.peers()
+            for route in routes:
+                source_position, destination_position, frame = route
+                if not self._is_on_my_node(destination_position):
+                    raise RuntimeError(
+                        f"Got value from {source_position} for position "
+                        f"{destination_position}, which is not on this node."
+                    )
+                if destination_position == self._position:
+                    self._add_to_result(result, source_position, frame)
+                else:
+                    local_rank = destination_position - self._node_base_position
+                    yield from self._send(
+                        localhost_communicator, local_peers[local_rank], [route]
+                    )
+            self._count_received_frames(expected_frames, peer, len(routes))
+
+    def _count_received_frames(
+        self, expected_frames: dict[Peer, int], peer: Peer, number_of_frames: int
+    ):
+        expected_frames[peer] -= number_of_frames
+        if expected_frames[peer] < 0:
+            raise RuntimeError(f"Got more values than expected from peer {peer}.")
+        if expected_frames[peer] == 0:
+            del expected_frames[peer]
+
+    def _add_to_result(
+        self, result: dict[int, memoryview], position: int, frame: Frame
+    ):
+        if position in result:
+            raise RuntimeError(f"Already received a value for position {position}.")
+        result[position] = frame.to_memoryview()
+
+    def _check_destination_position(self, destination_position: int, expected: int):
+        if destination_position != expected:
+            raise RuntimeError(
+                f"Got value for destination position {destination_position}, "
+                f"but expected {expected}."
+            )
+
+    def _send(
+        self, communicator: PeerGroup, peer: Peer, routes: list[Route]
+    ) -> Steps[None]:
+        message = Alltoall(
+            sequence_number=self._sequence_number,
+            source=communicator.peer,
+            destination=peer,
+            source_positions=[route[0] for route in routes],
+            destination_positions=[route[1] for route in routes],
+        )
+        serialized_message = serialize_message(message)
+        frames = [self._socket_factory.create_frame(serialized_message)] + [
+            route[2] for route in routes
+        ]
+        yield from send(
+            communicator, peer=peer, message=frames, tag=self._sequence_number
+        )
+
+    def _receive(self, communicator: PeerGroup, peer: Peer) -> Steps[list[Route]]:
+        frames = yield from recv(communicator, peer, tag=self._sequence_number)
+        message = deserialize_message(frames[0].to_bytes(), messages.Message)
+        specific_message_obj = self._get_and_check_specific_message_obj(message)
+        self._check_sequence_number(specific_message_obj)
+        value_frames = frames[1:]
+        if not (
+            len(specific_message_obj.source_positions)
+            == len(specific_message_obj.destination_positions)
+            == len(value_frames)
+        ):
+            raise RuntimeError(
+                f"Got message with inconsistent number of positions and values "
+                f"({len(value_frames)}) in message {specific_message_obj}"
+            )
+        return list(
+            zip(
+                specific_message_obj.source_positions,
+                specific_message_obj.destination_positions,
+                value_frames,
+            )
+        )
+
+    def _check_sequence_number(self, specific_message_obj: Alltoall):
+        if specific_message_obj.sequence_number != self._sequence_number:
+            raise RuntimeError(
+                f"Got message with different sequence number. "
+                f"We expect the sequence number {self._sequence_number} "
+                f"but we got {specific_message_obj.sequence_number} in message {specific_message_obj}"
+            )
+
+    def _get_and_check_specific_message_obj(
+        self, message: messages.Message
+    ) -> Alltoall:
+        specific_message_obj = message.root
+        if not isinstance(specific_message_obj, Alltoall):
+            raise TypeError(
+                f"Received the wrong message type. "
+                f"Expected {Alltoall.__name__} got {type(message)}. "
+                f"For message {message}."
+            )
+        return specific_message_obj
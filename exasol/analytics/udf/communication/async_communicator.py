@@ -0,0 +1,121 @@
+import asyncio
+from typing import (
+    Any,
+    TypeVar,
+)
+
+from exasol.analytics.udf.communication.communicator import Communicator
+from exasol.analytics.udf.communication.operation_steps import (
+    Steps,
+    run_async,
+)
+from exasol.analytics.udf.communication.peer_communicator import PeerGroup
+from exasol.analytics.udf.communication.peer_communicator.async_peer_communicator import (
+    AsyncPeerCommunicator,
+)
+from exasol.analytics.udf.communication.reducers import Reducer
+
+T = TypeVar("T")
+
+
+class AsyncCommunicator:
+    """
+    asyncio facade for the collective operations of a Communicator.
+
+    The facade runs the same steps of the collective operations as the
+    Communicator, see operation_steps, but awaits their sends and receives
+    with AsyncPeerCommunicators. As such, the operations run in the event
+    loop itself and wait for new messages on the file descriptors of the
+    PeerCommunicators, while the event loop stays free for computations and
+    for other coroutines. The operations run one at a time and in the order
+    in which they were started, such that all instances execute them in the
+    same order. The Communicator must not be used outside the facade, while
+    it is open.
+    """
+
+    def __init__(self, communicator: Communicator):
+        self._communicator = communicator
+        self._async_peer_communicators: dict[PeerGroup, AsyncPeerCommunicator] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def communicator(self) -> Communicator:
+        return self._communicator
+
+    @property
+    def rank(self) -> int:
+        return self._communicator.rank
+
+    @property
+    def number_of_instances(self) -> int:
+        return self._communicator.number_of_instances
+
+    async def gather(
+        self, value: bytes | memoryview, root: int = 0
+    ) -> list[memoryview] | None:
+        return await self._run(self._communicator.create_gather_steps(value, root))
+
+    async def broadcast(
+        self, value: bytes | memoryview | None, root: int = 0
+    ) -> memoryview:
+        return await self._run(self._communicator.create_broadcast_steps(value, root))
+
+    async def gather_object(self, value: Any, root: int = 0) -> list[Any] | None:
+        return await self._run(
+            self._communicator.create_gather_object_steps(value, root)
+        )
+
+    async def broadcast_object(self, value: Any, root: int = 0) -> Any:
+        return await self._run(
+            self._communicator.create_broadcast_object_steps(value, root)
+        )
+
+    async def scatter(
+        self, values: list[bytes] | list[memoryview] | None
+    ) -> memoryview:
+        return await self._run(self._communicator.create_scatter_steps(values))
+
+    async def allreduce(
+        self, value: bytes | memoryview, reducer: Reducer
+    ) -> memoryview:
+        return await self._run(
+            self._communicator.create_allreduce_steps(value, reducer)
+        )
+
+    async def alltoall(
+        self, buffers_per_destination: list[bytes] | list[memoryview]
+    ) -> list[memoryview]:
+        return await self._run(
+            self._communicator.create_alltoall_steps(buffers_per_destination)
+        )
+
+    async def allgather(self, value: bytes | memoryview) -> list[memoryview]:
+        return await self._run(self._communicator.create_allgather_steps(value))
+
+    async def barrier(self):
+        await self.allgather(b"")
+
+    async def _run(self, steps: Steps[T]) -> T:
+        async with self._lock:
+            return await run_async(steps, self._get_async_peer_communicator)
+
+    def _get_async_peer_communicator(
+        self, peer_communicator: PeerGroup
+    ) -> AsyncPeerCommunicator:
+        if peer_communicator not in self._async_peer_communicators:
+            self._async_peer_communicators[peer_communicator] = AsyncPeerCommunicator(
+                peer_communicator
+            )
+        return self._async_peer_communicators[peer_communicator]
+
+    def close(self):
+        """
+        Releases the AsyncPeerCommunicators. The Communicator stays open.
+        """
+        self._async_peer_communicators.clear()
+
+    async def __aenter__(self) -> "AsyncCommunicator":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,275 @@
+"""
+Compact binary encoding for the messages which get exchanged for every payload.
+
+A binary message starts with the format version, followed by the id of the
+message type and the fields of the message in a fixed order. Peers are
+encoded as length-prefixed strings and are cached in both directions, such
+that encoding and decoding a peer, which occurs in nearly every message,
+is a dictionary lookup in the steady state. JSON messages always start with
+"{", which never is a valid format version, so both encodings can be
+distinguished by the first byte.
+"""
+
+import functools
+import struct
+from enum import (
+    Enum,
+    auto,
+)
+from typing import (
+    Any,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.connection_info import ConnectionInfo
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
+from exasol.analytics.udf.communication.peer import Peer
+
+BINARY_FORMAT_VERSION = 3
+
+_HEADER = struct.Struct("!BB")
+_INT = struct.Struct("!q")
+_LENGTH = struct.Struct("!I")
+_PEER_HEADER = struct.Struct("!qIII")
+
+_PEER_CACHE_SIZE = 4096
+
+
+class FieldType(Enum):
+    INT = auto()
+    INT_LIST = auto()
+    PEER = auto()
+
+
+_BINARY_MESSAGE_FIELDS: dict[
+    type[messages.BaseMessage], list[tuple[str, FieldType]]
+] = {
+    messages.Payload: [
+        ("source", FieldType.PEER),
+        ("destination", FieldType.PEER),
+        ("sequence_number", FieldType.INT),
+        ("compressed_frame_indices", FieldType.INT_LIST),
+        ("tag", FieldType.INT),
+    ],
+    messages.AcknowledgePayload: [
+        ("source", FieldType.PEER),
+        ("destination", FieldType.PEER),
+        ("sequence_number", FieldType.INT),
+        ("consumed_messages", FieldType.INT),
+        ("consumed_bytes", FieldType.INT),
+    ],
+    messages.Gather: [
+        ("source", FieldType.PEER),
+        ("destination", FieldType.PEER),
+        ("sequence_number", FieldType.INT),
+        ("position", FieldType.INT),
+    ],
+    messages.GatherBundle: [
+        ("source", FieldType.PEER),
+        ("destination", FieldType.PEER),
+        ("sequence_number", FieldType.INT),
+        ("positions", FieldType.INT_LIST),
+    ],
+    messages.Broadcast: [
+        ("source", FieldType.PEER),
+        ("destination", FieldType.PEER),
+        ("sequence_number", FieldType.INT),
+    ],
+    messages.BroadcastChunk: [
+        ("source", FieldType.PEER),
+        ("destination", FieldType.PEER),
+        ("sequence_number", FieldType.INT),
+        ("chunk_index", FieldType.INT),
+        ("number_of_chunks", FieldType.INT),
+    ],
+    messages.Reduce: [
+        ("source", FieldType.PEER),
+        ("destination", FieldType.PEER),
+        ("sequence_number", FieldType.INT),
+        ("position", FieldType.INT),
+    ],
+    messages.Scatter: [
+        ("source", FieldType.PEER),
+        ("destination", FieldType.PEER),
+        ("sequence_number", FieldType.INT),
+        ("position", FieldType.INT),
+    ],
+    messages.Alltoall: [
+        ("source", FieldType.PEER),
+        ("destination", FieldType.PEER),
+        ("sequence_number", FieldType.INT),
+        ("source_positions", FieldType.INT_LIST),
+        ("destination_positions", FieldType.INT_LIST),
+    ],
+    messages.Allgather: [
+        ("source", FieldType.PEER),
+        ("destination", FieldType.PEER),
+        ("sequence_number", FieldType.INT),
+        ("positions", FieldType.INT_LIST),
+    ],
+    messages.StreamChunk: [
+        ("source", FieldType.PEER),
+        ("destination", FieldType.PEER),
+        ("sequence_number", FieldType.INT),
+        ("chunk_index", FieldType.INT),
+    ],
+    messages.StreamCredit: [
+        ("source", FieldType.PEER),
+        ("destination", FieldType.PEER),
+        ("sequence_number", FieldType.INT),
+        ("number_of_chunks", FieldType.INT),
+    ],
+    messages.ConsumedPayload: [
+        ("peer", FieldType.PEER),
+        ("size_in_bytes", FieldType.INT),
+    ],
+}
+"""
+The fields of the message types with a binary encoding.
+The ids of the message types are their positions in this dictionary,
+so new message types need to be appended to keep the format compatible.
+"""
+
+_MESSAGE_TYPE_IDS = {
+    message_class: message_type_id
+    for message_type_id, message_class in enumerate(_BINARY_MESSAGE_FIELDS)
+}
+_DECODERS = [
+    (message_class, message_class.model_fields["message_type"].default, fields)
+    for message_class, fields in _BINARY_MESSAGE_FIELDS.items()
+]
+
+
+def _check_fields_are_complete():
+    for message_class, fields in _BINARY_MESSAGE_FIELDS.items():
+        field_names = {name for name, _ in fields}
+        model_field_names = set(message_class.model_fields) - {"message_type"}
+        if field_names != model_field_names:
+            raise TypeError(
+                f"Binary encoding of {message_class.__name__} has the fields {field_names}, "
+                f"but the message has the fields {model_field_names}."
+            )
+
+
+_check_fields_are_complete()
+
+
+def has_binary_encoding(message: messages.BaseMessage) -> bool:
+    return type(message) in _MESSAGE_TYPE_IDS
+
+
+def is_binary_message(message: bytes | memoryview) -> bool:
+    return len(message) > 0 and message[0] == BINARY_FORMAT_VERSION
+
+
+@functools.lru_cache(maxsize=_PEER_CACHE_SIZE)
+def _encode_peer(peer: Peer) -> bytes:
+    connection_info = peer.connection_info
+    name = connection_info.name.encode("UTF-8")
+    ip_address = connection_info.ipaddress.ip_address.encode("UTF-8")
+    group_identifier = connection_info.group_identifier.encode("UTF-8")
+    return b"".join(
+        [
+            _PEER_HEADER.pack(
+                connection_info.port.port,
+                len(name),
+                len(ip_address),
+                len(group_identifier),
+            ),
+            name,
+            ip_address,
+            group_identifier,
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=_PEER_CACHE_SIZE)
+def _decode_peer(encoded_peer: bytes) -> Peer:
+    port, name_length, ip_address_length, _ = _PEER_HEADER.unpack_from(encoded_peer)
+    offset = _PEER_HEADER.size
+    name = encoded_peer[offset : offset + name_length]
+    offset += name_length
+    ip_address = encoded_peer[offset : offset + ip_address_length]
+    offset += ip_address_length
+    group_identifier = encoded_peer[offset:]
+    return Peer(
+        connection_info=ConnectionInfo(
+            name=name.decode("UTF-8"),
+            port=Port(port=port),
+            ipaddress=IPAddress(ip_address=ip_address.decode("UTF-8")),
+            group_identifier=group_identifier.decode("UTF-8"),
+        )
+    )
+
+
+def serialize_binary_message(message: messages.BaseMessage) -> bytes:
+    message_type_id = _MESSAGE_TYPE_IDS[type(message)]
+    parts = [_HEADER.pack(BINARY_FORMAT_VERSION, message_type_id)]
+    for name, field_type in _BINARY_MESSAGE_FIELDS[type(message)]:
+        value = getattr(message, name)
+        if field_type is FieldType.PEER:
+            parts.append(_encode_peer(value))
+        elif field_type is FieldType.INT:
+            parts.append(_INT.pack(value))
+        else:
+            parts.append(_LENGTH.pack(len(value)))
+            parts.append(struct.pack(f"!{len(value)}q", *value))
+    return b"".join(parts)
+
+
+def deserialize_binary_message(message: bytes | memoryview) -> messages.BaseMessage:
+    version, message_type_id = _HEADER.unpack_from(message)
+    if version != BINARY_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported binary format version {version}, "
+            f"expected {BINARY_FORMAT_VERSION}."
+        )
+    if message_type_id >= len(_DECODERS):
+        raise ValueError(f"Unknown binary message type id {message_type_id}.")
+    message_class, message_type, message_fields = _DECODERS[message_type_id]
+    offset = _HEADER.size
+    fields: dict[str, Any] = {"message_type": message_type}
+    for name, field_type in message_fields:
+        if field_type is FieldType.PEER:
+            _, *lengths = _PEER_HEADER.unpack_from(message, offset)
+            end = offset + _PEER_HEADER.size + sum(lengths)
+            fields[name] = _decode_peer(bytes(message[offset:end]))
+            offset = end
+        elif field_type is FieldType.INT:
+            (fields[name],) = _INT.unpack_from(message, offset)
+            offset += _INT.size
+        else:
+            (length,) = _LENGTH.unpack_from(message, offset)
+            offset += _LENGTH.size
+            fields[name] = list(struct.unpack_from(f"!{length}q", message, offset))
+            offset += length * _INT.size
+    if offset != len(message):
+        raise ValueError(
+            f"Binary message of type {message_class.__name__} has "
+            f"{len(message) - offset} unexpected trailing bytes."
+        )
+    return construct_without_validation(message_class, fields)
+
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def construct_without_validation(model_class: type[M], fields: dict[str, Any]) -> M:
+    """
+    Creates a model like BaseModel.model_construct, but without its overhead,
+    which dominates the decoding of small messages. The fields need to be
+    complete and to have the types of the model, which holds for the decoded
+    messages by construction.
+    """
+    obj = model_class.__new__(model_class)
+    object.__setattr__(obj, "__dict__", fields)
+    object.__setattr__(obj, "__pydantic_fields_set__", set(fields))
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", None)
+    return obj
@@ -2,8 +2,14 @@ import structlog
 from structlog.typing import FilteringBoundLogger
 
 from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.operation_steps import (
+    Steps,
+    recv,
+    run_blocking,
+    send,
+)
 from exasol.analytics.udf.communication.peer import Peer
-from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.peer_communicator import PeerGroup
 from exasol.analytics.udf.communication.serialization import (
     deserialize_message,
     serialize_message,
@@ -20,18 +26,44 @@ LOCALHOST_LEADER_RANK = 0
 MULTI_NODE_LEADER_RANK = 0
 
 
+def _get_peer(communicator: PeerGroup, rank: int) -> Peer:
+    if rank == LOCALHOST_LEADER_RANK:
+        return communicator.leader
+    return communicator.peers()[rank]
+
+
 class BroadcastOperation:
+    """
+    The out_of_band_buffers get sent as separate frames after the value,
+    such that large buffers don't need to be copied into the value.
+
+    The value originates at the root, which is the instance with the
+    localhost rank local_root_rank on the node with the multi node rank
+    root_node_rank. The root sends the value to the instances on its node.
+    The localhost leader of its node sends it to the other localhost leaders,
+    which send it to the instances on their nodes. For the instances on the
+    other nodes, local_root_rank needs to be the localhost leader rank,
+    because they receive the value from their localhost leader.
+    """
 
     def __init__(
         self,
         sequence_number: int,
-        value: bytes | None,
-        localhost_communicator: PeerCommunicator,
-        multi_node_communicator: PeerCommunicator | None,
+        value: bytes | memoryview | None,
+        localhost_communicator: PeerGroup,
+        multi_node_communicator: PeerGroup | None,
         socket_factory: SocketFactory,
+        out_of_band_buffers: list[bytes] | list[memoryview] | None = None,
+        root_node_rank: int = MULTI_NODE_LEADER_RANK,
+        local_root_rank: int = LOCALHOST_LEADER_RANK,
     ):
+        self._root_node_rank = root_node_rank
+        self._local_root_rank = local_root_rank
         self._socket_factory = socket_factory
         self._value = value
+        self._out_of_band_buffers = (
+            [] if out_of_band_buffers is None else out_of_band_buffers
+        )
         self._sequence_number = sequence_number
         self._multi_node_communicator = multi_node_communicator
         self._localhost_communicator = localhost_communicator
@@ -39,95 +71,143 @@ class BroadcastOperation:
             sequence_number=self._sequence_number,
         )
 
-    def __call__(self) -> bytes:
-        if self._localhost_communicator.rank > LOCALHOST_LEADER_RANK:
-            return self._receive_from_localhost_leader()
-        return self._send_messages_to_local_peers()
-
-    def _receive_from_localhost_leader(self) -> bytes:
-        self._logger.info("_receive_from_localhost_leader")
-        leader = self._localhost_communicator.leader
-        frames = self._localhost_communicator.recv(peer=leader)
+    def __call__(self) -> memoryview:
+        return self.call_with_out_of_band_buffers()[0]
+
+    def call_with_out_of_band_buffers(self) -> list[memoryview]:
+        """
+        Returns the value followed by the out_of_band_buffers.
+        """
+        return run_blocking(self.steps_with_out_of_band_buffers())
+
+    def steps(self) -> Steps[memoryview]:
+        """
+        Steps of the operation, see operation_steps.
+        """
+        parts = yield from self.steps_with_out_of_band_buffers()
+        return parts[0]
+
+    def steps_with_out_of_band_buffers(self) -> Steps[list[memoryview]]:
+        localhost_rank = self._localhost_communicator.rank
+        if localhost_rank > LOCALHOST_LEADER_RANK:
+            if localhost_rank == self._local_root_rank:
+                return (yield from self._send_messages_from_local_root())
+            return (yield from self._receive_from_local_root())
+        return (yield from self._send_messages_to_local_peers())
+
+    def _receive_from_local_root(self) -> Steps[list[memoryview]]:
+        self._logger.info("_receive_from_local_root")
+        value_frames = yield from self._receive_value_frames_from_local_root()
+        return [frame.to_memoryview() for frame in value_frames]
+
+    def _receive_value_frames_from_local_root(self) -> Steps[list[Frame]]:
+        local_root = _get_peer(self._localhost_communicator, self._local_root_rank)
+        frames = yield from recv(
+            self._localhost_communicator, peer=local_root, tag=self._sequence_number
+        )
         message = deserialize_message(frames[0].to_bytes(), messages.Message)
         specific_message_obj = self._get_and_check_specific_message_obj(message)
         self._check_sequence_number(specific_message_obj=specific_message_obj)
-        return frames[1].to_bytes()
+        return frames[1:]
 
-    def _send_messages_to_local_peers(self) -> bytes:
+    def _send_messages_from_local_root(self) -> Steps[list[memoryview]]:
+        self._logger.info("_send_messages_from_local_root")
+        value_parts = self._get_value_parts()
+        value_frames = [self._socket_factory.create_frame(part) for part in value_parts]
+        yield from self._send_messages_to_other_local_peers(value_frames)
+        return [memoryview(part) for part in value_parts]
+
+    def _send_messages_to_local_peers(self) -> Steps[list[memoryview]]:
         if self._multi_node_communicator is None:
             raise UninitializedAttributeError("Multi node communicator is undefined.")
-        if self._multi_node_communicator.rank > 0:
-            return self._forward_from_multi_node_leader()
-        return self._send_messages_from_multi_node_leaders()
-
-    def _forward_from_multi_node_leader(self) -> bytes:
+        if self._multi_node_communicator.rank != self._root_node_rank:
+            return (yield from self._forward_from_multi_node_leader())
+        if self._local_root_rank != LOCALHOST_LEADER_RANK:
+            return (yield from self._forward_from_local_root())
+        return (yield from self._send_messages_from_multi_node_leaders())
+
+    def _forward_from_local_root(self) -> Steps[list[memoryview]]:
+        self._logger.info("_forward_from_local_root")
+        value_frames = yield from self._receive_value_frames_from_local_root()
+        yield from self._send_messages_to_local_leaders(value_frames)
+        return [frame.to_memoryview() for frame in value_frames]
+
+    def _forward_from_multi_node_leader(self) -> Steps[list[memoryview]]:
         self._logger.info("_forward_from_multi_node_leader")
-        value_frame = self.receive_value_frame_from_multi_node_leader()
-        leader = self._localhost_communicator.leader
-        peers = [
-            peer for peer in self._localhost_communicator.peers() if peer != leader
-        ]
-
-        for peer in peers:
-            frames = self._construct_broadcast_message(
-                destination=peer, leader=leader, value_frame=value_frame
-            )
-            self._localhost_communicator.send(peer=peer, message=frames)
-
-        return value_frame.to_bytes()
-
-    def receive_value_frame_from_multi_node_leader(self) -> Frame:
+        value_frames = yield from self._receive_value_frames_from_multi_node_leader()
+        yield from self._send_messages_to_other_local_peers(value_frames)
+        return [frame.to_memoryview() for frame in value_frames]
+
+    def _receive_value_frames_from_multi_node_leader(self) -> Steps[list[Frame]]:
+        """
+        Receives the value frames from the localhost leader of the node of the root.
+        """
         if self._multi_node_communicator is None:
             raise UninitializedAttributeError("Multi node communicator is undefined.")
-        leader = self._multi_node_communicator.leader
-        frames = self._multi_node_communicator.recv(leader)
+        root_node_leader = _get_peer(
+            self._multi_node_communicator, self._root_node_rank
+        )
+        frames = yield from recv(
+            self._multi_node_communicator, root_node_leader, tag=self._sequence_number
+        )
         self._logger.info("received")
         message = deserialize_message(frames[0].to_bytes(), messages.Message)
         specific_message_obj = self._get_and_check_specific_message_obj(message)
         self._check_sequence_number(specific_message_obj=specific_message_obj)
-        return frames[1]
+        return frames[1:]
 
-    def _send_messages_from_multi_node_leaders(self) -> bytes:
-        self._send_messages_to_local_leaders()
-        self._send_messages_to_local_peers_from_multi_node_leaders()
+    def _get_value_parts(self) -> list[bytes | memoryview]:
         if self._value is None:
             raise UninitializedAttributeError("Value is unset.")
-        return self._value
+        return [self._value, *self._out_of_band_buffers]
+
+    def _send_messages_from_multi_node_leaders(self) -> Steps[list[memoryview]]:
+        value_parts = self._get_value_parts()
+        # The same frames get sent to all peers, to not copy the value per peer.
+        value_frames = [self._socket_factory.create_frame(part) for part in value_parts]
+        yield from self._send_messages_to_local_leaders(value_frames)
+        yield from self._send_messages_to_other_local_peers(value_frames)
+        return [memoryview(part) for part in value_parts]
 
-    def _send_messages_to_local_leaders(self):
+    def _send_messages_to_local_leaders(self, value_frames: list[Frame]) -> Steps[None]:
         if self._multi_node_communicator is None:
             return
 
         self._logger.info("_send_messages_to_local_leaders")
-        leader = self._multi_node_communicator.leader
-        peers = [
-            peer for peer in self._multi_node_communicator.peers() if peer != leader
-        ]
+        yield from self._send_messages_to_other_peers(
+            self._multi_node_communicator, self._root_node_rank, value_frames
+        )
 
-        for peer in peers:
-            value_frame = self._socket_factory.create_frame(self._value)
-            frames = self._construct_broadcast_message(
-                destination=peer, leader=leader, value_frame=value_frame
-            )
-            self._multi_node_communicator.send(peer=peer, message=frames)
+    def _send_messages_to_other_local_peers(
+        self, value_frames: list[Frame]
+    ) -> Steps[None]:
+        self._logger.info("_send_messages_to_other_local_peers")
+        yield from self._send_messages_to_other_peers(
+            self._localhost_communicator, self._local_root_rank, value_frames
+        )
 
-    def _send_messages_to_local_peers_from_multi_node_leaders(self):
-        self._logger.info("_send_messages_to_local_peers_from_multi_node_leaders")
-        leader = self._localhost_communicator.leader
-        peers = [p for p in self._localhost_communicator.peers() if p != leader]
+    def _send_messages_to_other_peers(
+        self,
+        communicator: PeerGroup,
+        source_rank: int,
+        value_frames: list[Frame],
+    ) -> Steps[None]:
+        source = _get_peer(communicator, source_rank)
+        peers = [peer for peer in communicator.peers() if peer != source]
         for peer in peers:
-            value_frame = self._socket_factory.create_frame(self._value)
             frames = self._construct_broadcast_message(
-                destination=peer, leader=leader, value_frame=value_frame
+                destination=peer, source=source, value_frames=value_frames
+            )
+            yield from send(
+                communicator, peer=peer, message=frames, tag=self._sequence_number
             )
-            self._localhost_communicator.send(peer=peer, message=frames)
 
     def _check_sequence_number(self, specific_message_obj: messages.Broadcast):
         if specific_message_obj.sequence_number != self._sequence_number:
             raise RuntimeError(
                 f"Got message with different sequence number. "
                 f"We expect the sequence number {self._sequence_number} "
-                f"but we got {self._sequence_number} in message {specific_message_obj}"
+                f"but we got {specific_message_obj.sequence_number} in message {specific_message_obj}"
             )
 
     def _get_and_check_specific_message_obj(
@@ -143,13 +223,13 @@ class BroadcastOperation:
         return specific_message_obj
 
     def _construct_broadcast_message(
-        self, destination: Peer, leader: Peer, value_frame: Frame
+        self, destination: Peer, source: Peer, value_frames: list[Frame]
     ):
         message = messages.Broadcast(
             sequence_number=self._sequence_number,
             destination=destination,
-            source=leader,
+            source=source,
         )
         serialized_message = serialize_message(message)
-        frames = [self._socket_factory.create_frame(serialized_message), value_frame]
+        frames = [self._socket_factory.create_frame(serialized_message), *value_frames]
         return frames
@@ -0,0 +1,45 @@
+from concurrent.futures import (
+    Future,
+    wait,
+)
+from typing import (
+    Generic,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+def _to_seconds(timeout_in_milliseconds: int | None) -> float | None:
+    if timeout_in_milliseconds is None:
+        return None
+    return timeout_in_milliseconds / 1000
+
+
+class CollectiveRequest(Generic[T]):
+    """
+    Handle for a non-blocking collective operation of the Communicator.
+    The operation already has its sequence number, so several requests can
+    be started after each other, before waiting for any of them.
+    """
+
+    def __init__(self, future: Future[T]):
+        self._future = future
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def wait(self, timeout_in_milliseconds: int | None = None) -> bool:
+        """
+        Waits until the operation finished or the timeout expired
+        and returns whether the operation finished.
+        """
+        wait([self._future], timeout=_to_seconds(timeout_in_milliseconds))
+        return self._future.done()
+
+    def result(self, timeout_in_milliseconds: int | None = None) -> T:
+        """
+        Returns the result of the operation or raises its exception.
+        Raises a TimeoutError, if it didn't finish within the timeout.
+        """
+        return self._future.result(timeout=_to_seconds(timeout_in_milliseconds))
@@ -1,4 +1,26 @@
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    Any,
+    TypeVar,
+)
+
+from exasol.analytics.udf.communication.allgather_operation import AllgatherOperation
+from exasol.analytics.udf.communication.allreduce_operation import AllreduceOperation
+from exasol.analytics.udf.communication.alltoall_operation import AlltoallOperation
 from exasol.analytics.udf.communication.broadcast_operation import BroadcastOperation
+from exasol.analytics.udf.communication.collective_request import CollectiveRequest
+from exasol.analytics.udf.communication.communicator_config import (
+    CommunicatorConfig,
+)
+from exasol.analytics.udf.communication.connection_info import ConnectionInfo
 from exasol.analytics.udf.communication.discovery import (
     localhost,
     multi_node,
@@ -8,14 +30,75 @@ from exasol.analytics.udf.communication.ip_address import (
     IPAddress,
     Port,
 )
-from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.node_rank import exchange_node_rank
+from exasol.analytics.udf.communication.object_serialization import (
+    deserialize_object,
+    serialize_object,
+)
+from exasol.analytics.udf.communication.operation_steps import (
+    Steps,
+    run_blocking,
+)
+from exasol.analytics.udf.communication.peer_communicator import (
+    PeerCommunicator,
+    PeerGroup,
+)
+from exasol.analytics.udf.communication.peer_communicator.metrics import (
+    PeerCommunicatorMetrics,
+)
+from exasol.analytics.udf.communication.peer_communicator.transport_config import (
+    TransportConfig,
+)
+from exasol.analytics.udf.communication.pipelined_broadcast_operation import (
+    PipelinedBroadcastOperation,
+)
+from exasol.analytics.udf.communication.point_to_point import (
+    PointToPointConnections,
+    check_point_to_point_connections,
+)
+from exasol.analytics.udf.communication.point_to_point_streams import (
+    PointToPointStreams,
+)
+from exasol.analytics.udf.communication.reducers import Reducer
+from exasol.analytics.udf.communication.scatter_operation import ScatterOperation
 from exasol.analytics.udf.communication.socket_factory.abstract import SocketFactory
+from exasol.analytics.udf.communication.split import (
+    CONTEXT_TAG_STRIDE,
+    compute_context_id,
+    compute_root_ranks,
+    create_peer_groups,
+    pack_split_entry,
+)
+from exasol.analytics.udf.communication.stream_operation import DEFAULT_WINDOW_SIZE
+from exasol.analytics.udf.communication.tree_gather_operation import (
+    TreeGatherOperation,
+)
+from exasol.analytics.utils.errors import IllegalParametersError
 
 LOCALHOST_LEADER_RANK = 0
 MULTI_NODE_LEADER_RANK = 0
+LOCALHOST_LISTEN_IP = IPAddress(ip_address="127.1.0.1")
+
+T = TypeVar("T")
 
 
 class Communicator:
+    """
+    The collective operations return read-only memoryviews of the received
+    frames, such that large values don't get copied into Python objects.
+    Values, which are bytes or read-only memoryviews, get sent without copying
+    them, so the buffer behind a read-only memoryview must not be changed
+    afterward, because a message can get resent after the operation returned.
+    Other buffers, like bytearrays or writable NumPy arrays, get copied.
+
+    The non-blocking operations, like igather, run on a single worker thread in
+    the order in which they were started, so only one of them is in flight at a
+    time. The blocking operations wait for them first, so all instances execute
+    the operations in the same order.
+
+    A Communicator derived with split shares the connections and the worker
+    thread with the root Communicator, but has its own sequence numbers.
+    """
 
     def __init__(
         self,
@@ -32,94 +115,680 @@ class Communicator:
         socket_factory: SocketFactory,
         localhost_communicator_factory: localhost.CommunicatorFactory = localhost.CommunicatorFactory(),
         multi_node_communicator_factory: multi_node.CommunicatorFactory = multi_node.CommunicatorFactory(),
+        config: CommunicatorConfig = CommunicatorConfig(),
     ):
+        name = f"{node_name}_{instance_name}"
+        localhost_communicator = localhost_communicator_factory.create(
+            group_identifier=f"{group_identifier}_{node_name}_local",
+            name=f"{name}_local",
+            number_of_instances=number_of_instances_per_node,
+            listen_ip=LOCALHOST_LISTEN_IP,
+            discovery_port=local_discovery_port,
+            socket_factory=socket_factory,
+            discovery_socket_factory=localhost.DiscoverySocketFactory(),
+            transport_config=TransportConfig(
+                ipc_directory=config.localhost_ipc_directory
+            ),
+            payload_compression_config=config.payload_compression_config,
+        )
+        multi_node_communicator: PeerCommunicator | None = None
+        if localhost_communicator.rank == LOCALHOST_LEADER_RANK:
+            multi_node_communicator = multi_node_communicator_factory.create(
+                group_identifier=f"{group_identifier}_global",
+                name=f"{name}_global",
+                number_of_instances=number_of_nodes,
+                is_discovery_leader=is_discovery_leader_node,
+                listen_ip=listen_ip,
+                discovery_ip=multi_node_discovery_ip,
+                discovery_port=multi_node_discovery_port,
+                socket_factory=socket_factory,
+                discovery_socket_factory=multi_node.DiscoverySocketFactory(),
+                payload_compression_config=config.payload_compression_config,
+            )
+        node_rank = exchange_node_rank(
+            localhost_communicator, multi_node_communicator, socket_factory
+        )
+        point_to_point_connections: PointToPointConnections | None = None
+        if config.enable_point_to_point:
+            point_to_point_connections = PointToPointConnections.create(
+                name=f"{name}_point_to_point",
+                number_of_instances=number_of_nodes * number_of_instances_per_node,
+                listen_ip=listen_ip,
+                group_identifier=f"{group_identifier}_point_to_point",
+                socket_factory=socket_factory,
+                payload_compression_config=config.payload_compression_config,
+            )
+        self._initialize(
+            config=config,
+            socket_factory=socket_factory,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+            node_rank=node_rank,
+            localhost_communicator=localhost_communicator,
+            multi_node_communicator=multi_node_communicator,
+            point_to_point_connections=point_to_point_connections,
+            root_communicator=None,
+            root_ranks=list(range(number_of_nodes * number_of_instances_per_node)),
+            context_id=0,
+        )
+        if point_to_point_connections is not None:
+            self._exchange_point_to_point_connection_infos()
+
+    @classmethod
+    def _from_peer_groups(
+        cls,
+        root_communicator: "Communicator",
+        root_ranks: list[int],
+        context_id: int,
+        localhost_communicator: PeerGroup,
+        multi_node_communicator: PeerGroup | None,
+    ) -> "Communicator":
+        """
+        Creates a Communicator derived with split, which uses the given PeerGroups
+        instead of discovering its peers like __init__. It doesn't share any mutable
+        state with its parent. The connections, the worker thread and its pending
+        requests and the next free context id only exist in the root Communicator.
+        """
+        communicator = cls.__new__(cls)
+        communicator._initialize(
+            config=root_communicator._config,
+            socket_factory=root_communicator._socket_factory,
+            number_of_nodes=1,
+            number_of_instances_per_node=len(root_ranks),
+            node_rank=0,
+            localhost_communicator=localhost_communicator,
+            multi_node_communicator=multi_node_communicator,
+            point_to_point_connections=None,
+            root_communicator=root_communicator,
+            root_ranks=root_ranks,
+            context_id=context_id,
+        )
+        return communicator
+
+    def _initialize(
+        self,
+        config: CommunicatorConfig,
+        socket_factory: SocketFactory,
+        number_of_nodes: int,
+        number_of_instances_per_node: int,
+        node_rank: int,
+        localhost_communicator: PeerGroup,
+        multi_node_communicator: PeerGroup | None,
+        point_to_point_connections: PointToPointConnections | None,
+        root_communicator: "Communicator | None",
+        root_ranks: list[int],
+        context_id: int,
+    ):
+        """
+        The localhost, multi node and point to point connections are owned by
+        the root Communicator, which stops them in close. A Communicator derived
+        with split gets SubPeerCommunicators of them and no point to point
+        connections.
+        """
+        self._config = config
+        self._socket_factory = socket_factory
         self._number_of_nodes = number_of_nodes
         self._number_of_instances_per_node = number_of_instances_per_node
-        self._group_identifier = group_identifier
-        self._node_name = node_name
-        self._multi_node_communicator_factory = multi_node_communicator_factory
-        self._localhost_communicator_factory = localhost_communicator_factory
-        self._socket_factory = socket_factory
-        self._is_discovery_leader_node = is_discovery_leader_node
-        self._multi_node_discovery_ip = multi_node_discovery_ip
-        self._multi_node_discovery_port = multi_node_discovery_port
-        self._localhost_discovery_port = local_discovery_port
-        self._listen_ip = listen_ip
-        self._localhost_listen_ip = IPAddress(ip_address="127.1.0.1")
-        self._name = f"{node_name}_{instance_name}"
-        self._localhost_communicator = self._create_localhost_communicator()
-        self._multi_node_communicator = self._create_multi_node_communicator()
+        self._node_rank = node_rank
+        self._localhost_communicator = localhost_communicator
+        self._multi_node_communicator = multi_node_communicator
         self._sequence_number = 0
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending_requests: list[Future] = []
+        self._point_to_point_connections = point_to_point_connections
+        self._point_to_point_streams: PointToPointStreams | None = None
+        self._root_communicator = root_communicator
+        self._root_ranks = root_ranks
+        self._context_id = context_id
+        self._next_free_context_id = context_id + 1
+        self._is_closed = False
+
+    @property
+    def _root(self) -> "Communicator":
+        """
+        The root Communicator owns the connections and the worker thread.
+        It doesn't reference itself, such that it gets deleted and closes
+        its connections, as soon as it isn't used anymore.
+        """
+        if self._root_communicator is None:
+            return self
+        return self._root_communicator
 
     def _next_sequence_number(self) -> int:
         sequence_number = self._sequence_number
         self._sequence_number += 1
         return sequence_number
 
-    def _create_multi_node_communicator(self) -> PeerCommunicator | None:
-        multi_node_name = f"{self._name}_global"
-        multi_node_group_identifier = f"{self._group_identifier}_global"
-        if self._localhost_communicator.rank == LOCALHOST_LEADER_RANK:
-            discovery_socket_factory = multi_node.DiscoverySocketFactory()
-            is_discovery_leader = (
-                self._localhost_communicator.rank == LOCALHOST_LEADER_RANK
-                and self._is_discovery_leader_node
+    def _exchange_point_to_point_connection_infos(self):
+        """
+        The point to point communicator of each instance listens on a random
+        port, so the instances exchange their connection infos up front, but
+        they only connect to each other on their first send or recv.
+        """
+        connections = self._checked_point_to_point_connections
+        my_connection_info = connections.peer_communicator.my_connection_info
+        connection_infos = self.allgather(my_connection_info.model_dump_json().encode())
+        connections.connection_infos = [
+            ConnectionInfo.model_validate_json(bytes(connection_info))
+            for connection_info in connection_infos
+        ]
+
+    def _locate_root(self, root: int) -> tuple[int, int]:
+        """
+        Returns the multi node rank of the node of the root and the localhost
+        rank of the root on this node. On the other nodes, the localhost leader
+        is the local root, because it forwards the values from and to the root.
+        """
+        if not 0 <= root < self.number_of_instances:
+            raise IllegalParametersError(
+                f"Root needs to be between 0 and {self.number_of_instances - 1}, "
+                f"but got {root}."
             )
-            peer_communicator = self._multi_node_communicator_factory.create(
-                group_identifier=multi_node_group_identifier,
-                name=multi_node_name,
-                number_of_instances=self._number_of_nodes,
-                is_discovery_leader=is_discovery_leader,
-                listen_ip=self._listen_ip,
-                discovery_ip=self._multi_node_discovery_ip,
-                discovery_port=self._multi_node_discovery_port,
+        root_node_rank = root // self._number_of_instances_per_node
+        if root_node_rank != self._node_rank:
+            return root_node_rank, LOCALHOST_LEADER_RANK
+        return root_node_rank, root % self._number_of_instances_per_node
+
+    def gather(
+        self, value: bytes | memoryview, root: int = 0
+    ) -> list[memoryview] | None:
+        """
+        Returns the values of all instances ordered by their rank to the
+        instance with the rank root and None to all others. The values get
+        sent directly to the root, without an additional hop over the
+        instance with rank 0. The gather_topology is only used for root 0.
+        """
+        return self._run(self.create_gather_steps(value, root))
+
+    def igather(
+        self, value: bytes | memoryview, root: int = 0
+    ) -> CollectiveRequest[list[memoryview] | None]:
+        """
+        Non-blocking variant of gather, see CollectiveRequest.
+        The value must not be changed until the request is done. The request
+        only starts after the earlier non-blocking operations finished, because
+        they share a single worker thread.
+        """
+        return self._submit(self.create_gather_steps(value, root))
+
+    def create_gather_steps(
+        self, value: bytes | memoryview, root: int
+    ) -> Steps[list[memoryview] | None]:
+        """
+        The create_*_steps methods return the steps of the collective operations,
+        see operation_steps, which the Communicator runs with run_blocking and
+        AsyncCommunicator with run_async. The steps get created, when the
+        operation gets called, such that the sequence numbers follow the order of
+        the calls, also when the operations run later, as for igather or
+        AsyncCommunicator. Every instance needs to run the steps it created.
+        """
+        root_node_rank, local_root_rank = self._locate_root(root)
+        sequence_number = self._next_sequence_number()
+        if self._config.gather_topology is not None and root == 0:
+            tree_operation = TreeGatherOperation(
+                sequence_number=sequence_number,
+                value=value,
+                localhost_communicator=self._localhost_communicator,
+                multi_node_communicator=self._multi_node_communicator,
                 socket_factory=self._socket_factory,
-                discovery_socket_factory=discovery_socket_factory,
+                number_of_instances_per_node=self._number_of_instances_per_node,
+                topology=self._config.gather_topology,
             )
-            return peer_communicator
-        else:
-            return None
-
-    def _create_localhost_communicator(self) -> PeerCommunicator:
-        localhost_group_identifier = f"{self._group_identifier}_{self._node_name}_local"
-        localhost_name = f"{self._name}_local"
-        discovery_socket_factory = localhost.DiscoverySocketFactory()
-        peer_communicator = self._localhost_communicator_factory.create(
-            group_identifier=localhost_group_identifier,
-            name=localhost_name,
-            number_of_instances=self._number_of_instances_per_node,
-            listen_ip=self._localhost_listen_ip,
-            discovery_port=self._localhost_discovery_port,
+            return tree_operation.steps()
+        operation = GatherOperation(
+            sequence_number=sequence_number,
+            value=value,
+            localhost_communicator=self._localhost_communicator,
+            multi_node_communicator=self._multi_node_communicator,
             socket_factory=self._socket_factory,
-            discovery_socket_factory=discovery_socket_factory,
+            number_of_instances_per_node=self._number_of_instances_per_node,
+            root_node_rank=root_node_rank,
+            local_root_rank=local_root_rank,
+            number_of_nodes=self._number_of_nodes,
         )
-        return peer_communicator
+        return operation.steps()
+
+    def broadcast(self, value: bytes | memoryview | None, root: int = 0) -> memoryview:
+        """
+        Returns the value of the instance with the rank root to all instances.
+        The value gets sent directly from the root, without an additional hop
+        over the instance with rank 0. The broadcast_chunk_size_in_bytes is
+        only used for root 0.
+        """
+        return self._run(self.create_broadcast_steps(value, root))
+
+    def ibroadcast(
+        self, value: bytes | memoryview | None, root: int = 0
+    ) -> CollectiveRequest[memoryview]:
+        """
+        Non-blocking variant of broadcast, see CollectiveRequest.
+        The value must not be changed until the request is done. The request
+        only starts after the earlier non-blocking operations finished, because
+        they share a single worker thread.
+        """
+        return self._submit(self.create_broadcast_steps(value, root))
 
-    def gather(self, value: bytes) -> list[bytes] | None:
+    def create_broadcast_steps(
+        self, value: bytes | memoryview | None, root: int
+    ) -> Steps[memoryview]:
+        root_node_rank, local_root_rank = self._locate_root(root)
         sequence_number = self._next_sequence_number()
-        gather = GatherOperation(
+        if self._config.broadcast_chunk_size_in_bytes is not None and root == 0:
+            pipelined_operation = PipelinedBroadcastOperation(
+                sequence_number=sequence_number,
+                value=value,
+                chunk_size_in_bytes=self._config.broadcast_chunk_size_in_bytes,
+                localhost_communicator=self._localhost_communicator,
+                multi_node_communicator=self._multi_node_communicator,
+                socket_factory=self._socket_factory,
+            )
+            return pipelined_operation.steps()
+        operation = BroadcastOperation(
             sequence_number=sequence_number,
             value=value,
             localhost_communicator=self._localhost_communicator,
             multi_node_communicator=self._multi_node_communicator,
             socket_factory=self._socket_factory,
+            root_node_rank=root_node_rank,
+            local_root_rank=local_root_rank,
+        )
+        return operation.steps()
+
+    def gather_object(self, value: Any, root: int = 0) -> list[Any] | None:
+        """
+        Like gather, but for any picklable value. The values get pickled with
+        protocol 5 and their out-of-band buffers, like the data of NumPy arrays,
+        get sent as separate frames. The NumPy arrays of the result are read-only
+        views of the received frames. It doesn't use the gather_topology.
+        """
+        return self._run(self.create_gather_object_steps(value, root))
+
+    def create_gather_object_steps(
+        self, value: Any, root: int
+    ) -> Steps[list[Any] | None]:
+        root_node_rank, local_root_rank = self._locate_root(root)
+        sequence_number = self._next_sequence_number()
+        data, out_of_band_buffers = serialize_object(value)
+        operation = GatherOperation(
+            sequence_number=sequence_number,
+            value=data,
+            out_of_band_buffers=out_of_band_buffers,
+            localhost_communicator=self._localhost_communicator,
+            multi_node_communicator=self._multi_node_communicator,
+            socket_factory=self._socket_factory,
             number_of_instances_per_node=self._number_of_instances_per_node,
+            root_node_rank=root_node_rank,
+            local_root_rank=local_root_rank,
+            number_of_nodes=self._number_of_nodes,
         )
-        return gather()
+        return _deserialize_gathered_objects(operation.steps_with_out_of_band_buffers())
 
-    def broadcast(self, value: bytes | None) -> bytes:
+    def broadcast_object(self, value: Any, root: int = 0) -> Any:
+        """
+        Like broadcast, but for any picklable value, see gather_object.
+        Only the value of the root is used. It doesn't use the
+        broadcast_chunk_size_in_bytes.
+        """
+        return self._run(self.create_broadcast_object_steps(value, root))
+
+    def create_broadcast_object_steps(self, value: Any, root: int) -> Steps[Any]:
+        root_node_rank, local_root_rank = self._locate_root(root)
         sequence_number = self._next_sequence_number()
+        data: bytes | None = None
+        out_of_band_buffers: list[memoryview] = []
+        if self.rank == root:
+            data, out_of_band_buffers = serialize_object(value)
         operation = BroadcastOperation(
+            sequence_number=sequence_number,
+            value=data,
+            out_of_band_buffers=out_of_band_buffers,
+            localhost_communicator=self._localhost_communicator,
+            multi_node_communicator=self._multi_node_communicator,
+            socket_factory=self._socket_factory,
+            root_node_rank=root_node_rank,
+            local_root_rank=local_root_rank,
+        )
+        return _deserialize_broadcast_object(operation.steps_with_out_of_band_buffers())
+
+    def scatter(self, values: list[bytes] | list[memoryview] | None) -> memoryview:
+        return self._run(self.create_scatter_steps(values))
+
+    def create_scatter_steps(
+        self, values: list[bytes] | list[memoryview] | None
+    ) -> Steps[memoryview]:
+        sequence_number = self._next_sequence_number()
+        operation = ScatterOperation(
+            sequence_number=sequence_number,
+            values=values,
+            localhost_communicator=self._localhost_communicator,
+            multi_node_communicator=self._multi_node_communicator,
+            socket_factory=self._socket_factory,
+            number_of_instances_per_node=self._number_of_instances_per_node,
+        )
+        return operation.steps()
+
+    def allreduce(self, value: bytes | memoryview, reducer: Reducer) -> memoryview:
+        return self._run(self.create_allreduce_steps(value, reducer))
+
+    def create_allreduce_steps(
+        self, value: bytes | memoryview, reducer: Reducer
+    ) -> Steps[memoryview]:
+        sequence_number = self._next_sequence_number()
+        operation = AllreduceOperation(
             sequence_number=sequence_number,
             value=value,
+            reducer=reducer,
+            localhost_communicator=self._localhost_communicator,
+            multi_node_communicator=self._multi_node_communicator,
+            socket_factory=self._socket_factory,
+        )
+        return operation.steps()
+
+    def alltoall(
+        self, buffers_per_destination: list[bytes] | list[memoryview]
+    ) -> list[memoryview]:
+        """
+        Sends buffers_per_destination[i] to the instance with rank i and
+        returns the buffers which the instance received from each rank.
+        """
+        return self._run(self.create_alltoall_steps(buffers_per_destination))
+
+    def create_alltoall_steps(
+        self, buffers_per_destination: list[bytes] | list[memoryview]
+    ) -> Steps[list[memoryview]]:
+        sequence_number = self._next_sequence_number()
+        operation = AlltoallOperation(
+            sequence_number=sequence_number,
+            values=buffers_per_destination,
+            position=self.rank,
             localhost_communicator=self._localhost_communicator,
             multi_node_communicator=self._multi_node_communicator,
             socket_factory=self._socket_factory,
+            number_of_nodes=self._number_of_nodes,
+            number_of_instances_per_node=self._number_of_instances_per_node,
+        )
+        return operation.steps()
+
+    def allgather(self, value: bytes | memoryview) -> list[memoryview]:
+        """
+        Returns the values of all instances ordered by their rank
+        to every instance.
+        """
+        return self._run(self.create_allgather_steps(value))
+
+    def create_allgather_steps(
+        self, value: bytes | memoryview
+    ) -> Steps[list[memoryview]]:
+        sequence_number = self._next_sequence_number()
+        operation = AllgatherOperation(
+            sequence_number=sequence_number,
+            value=value,
+            position=self.rank,
+            localhost_communicator=self._localhost_communicator,
+            multi_node_communicator=self._multi_node_communicator,
+            socket_factory=self._socket_factory,
+            number_of_nodes=self._number_of_nodes,
+            number_of_instances_per_node=self._number_of_instances_per_node,
+        )
+        return operation.steps()
+
+    def barrier(self):
+        """
+        Blocks until all instances reached the barrier.
+        """
+        self.allgather(b"")
+
+    def send(self, rank: int, value: bytes | memoryview, tag: int = 0):
+        """
+        Sends the value directly to the instance with the rank, which receives
+        it with recv and the same tag. Requires enable_point_to_point in the
+        CommunicatorConfig. It is independent of the collective operations, but
+        it waits for the non-blocking ones, because those of a Communicator derived
+        with split can use the same connections on the worker thread.
+        """
+        self._wait_for_pending_requests()
+        self._root._checked_point_to_point_connections.send(
+            self._root_rank_of(rank), value, self._context_tag(tag)
+        )
+
+    def recv(self, rank: int, tag: int = 0) -> memoryview:
+        """
+        Receives the next value with the tag, which the instance with the rank sent.
+        """
+        self._wait_for_pending_requests()
+        return self._root._checked_point_to_point_connections.recv(
+            self._root_rank_of(rank), self._context_tag(tag)
+        )
+
+    def send_stream(
+        self,
+        rank: int,
+        chunks: Iterable[bytes | memoryview],
+        tag: int = 0,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        timeout_in_milliseconds: int | None = None,
+    ):
+        """
+        Sends the chunks one by one to the instance with the rank, which receives
+        them with receive_stream, the same tag and the same window size. At most
+        window_size chunks are in flight, so the chunks get consumed only as fast as
+        the receiver consumes them. If the receiver stops early and no credit for
+        further chunks arrives within the timeout, it raises a TimeoutError.
+        Requires enable_point_to_point in the CommunicatorConfig.
+        """
+        self._wait_for_pending_requests()
+        self._root._checked_point_to_point_streams.send(
+            self._root_rank_of(rank),
+            chunks,
+            tag=self._context_tag(tag),
+            window_size=window_size,
+            timeout_in_milliseconds=timeout_in_milliseconds,
+        )
+
+    def receive_stream(
+        self, rank: int, tag: int = 0, window_size: int = DEFAULT_WINDOW_SIZE
+    ) -> Iterator[memoryview]:
+        """
+        Returns an iterator over the chunks, which the instance with the rank sends
+        with send_stream and the same tag. The consumer may stop early, the next
+        stream from the same instance with the same tag skips the remaining chunks.
+        Like recv, the iterator waits for the non-blocking operations before each chunk.
+        """
+        self._wait_for_pending_requests()
+        chunks = self._root._checked_point_to_point_streams.receive(
+            self._root_rank_of(rank),
+            tag=self._context_tag(tag),
+            window_size=window_size,
+        )
+        return self._wait_for_pending_requests_before_each(chunks)
+
+    def _wait_for_pending_requests_before_each(
+        self, chunks: Iterator[memoryview]
+    ) -> Iterator[memoryview]:
+        while True:
+            self._wait_for_pending_requests()
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                return
+            yield chunk
+
+    def _context_tag(self, tag: int) -> int:
+        if not 0 <= tag < CONTEXT_TAG_STRIDE:
+            raise ValueError(
+                f"Tag needs to be between 0 and {CONTEXT_TAG_STRIDE - 1}, but got {tag}."
+            )
+        return self._context_id * CONTEXT_TAG_STRIDE + tag
+
+    @property
+    def _checked_point_to_point_connections(self) -> PointToPointConnections:
+        return check_point_to_point_connections(self._point_to_point_connections)
+
+    @property
+    def _checked_point_to_point_streams(self) -> PointToPointStreams:
+        if self._point_to_point_streams is None:
+            self._point_to_point_streams = PointToPointStreams(
+                self._checked_point_to_point_connections, self._socket_factory
+            )
+        return self._point_to_point_streams
+
+    def _root_rank_of(self, rank: int) -> int:
+        if not 0 <= rank < self.number_of_instances:
+            raise ValueError(
+                f"Rank needs to be between 0 and {self.number_of_instances - 1}, "
+                f"but got {rank}."
+            )
+        if rank == self.rank:
+            raise ValueError(f"Rank {rank} is the rank of this instance.")
+        return self._root_ranks[rank]
+
+    def split(self, color: int | None, key: int = 0) -> "Communicator | None":
+        """
+        Derives a Communicator for the instances with the same color, which
+        get ranked by their key and then by their rank in this Communicator.
+        Instances with the color None get None. All instances of this
+        Communicator need to call split.
+
+        The derived Communicator reuses the connections. If all its instances
+        are on the same node, it uses the localhost connections, otherwise the
+        point to point connections, which requires enable_point_to_point in the
+        CommunicatorConfig. In both cases, its instances communicate directly
+        with its leader instead of going through the localhost leaders.
+        """
+        root = self._root
+        entry = pack_split_entry(
+            color, key, self._root_ranks[self.rank], root._next_free_context_id
         )
-        return operation()
+        entries = self.allgather(entry)
+        context_id = compute_context_id(entries)
+        root._next_free_context_id = context_id + 1
+        if color is None:
+            return None
+        root_ranks = compute_root_ranks(entries, color)
+        localhost_communicator, multi_node_communicator = create_peer_groups(
+            root_ranks=root_ranks,
+            context_id=context_id,
+            number_of_instances_per_node=root._number_of_instances_per_node,
+            localhost_communicator=root._localhost_communicator,
+            point_to_point_connections=root._point_to_point_connections,
+        )
+        return Communicator._from_peer_groups(
+            root_communicator=root,
+            root_ranks=root_ranks,
+            context_id=context_id,
+            localhost_communicator=localhost_communicator,
+            multi_node_communicator=multi_node_communicator,
+        )
+
+    def _run(self, steps: Steps[T]) -> T:
+        self._wait_for_pending_requests()
+        return run_blocking(steps)
+
+    def _submit(self, steps: Steps[T]) -> CollectiveRequest[T]:
+        root = self._root
+        if root._executor is None:
+            root._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="Communicator"
+            )
+        future = root._executor.submit(run_blocking, steps)
+        root._pending_requests.append(future)
+        return CollectiveRequest(future)
+
+    def _wait_for_pending_requests(self):
+        pending_requests = self._root._pending_requests
+        if len(pending_requests) > 0:
+            wait(pending_requests)
+            pending_requests.clear()
+
+    def close(self):
+        """
+        Waits for the pending non-blocking operations, shuts the worker thread
+        down and stops the connections. Closing a Communicator derived with
+        split only waits for the pending operations, because the root
+        Communicator owns the worker thread and the connections. Closing it
+        again does nothing.
+        """
+        self._wait_for_pending_requests()
+        if self._root_communicator is not None or self._is_closed:
+            return
+        self._is_closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._point_to_point_connections is not None:
+            self._point_to_point_connections.stop()
+        for peer_communicator in [
+            self._multi_node_communicator,
+            self._localhost_communicator,
+        ]:
+            if isinstance(peer_communicator, PeerCommunicator):
+                peer_communicator.stop()
+
+    def __del__(self):
+        """
+        A Communicator, which didn't get closed, only lets its worker thread
+        exit after the pending requests, but doesn't wait for them. The
+        connections get stopped, when the operations don't use them anymore.
+        """
+        # The executor is missing, if __init__ failed before creating it.
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def __enter__(self) -> "Communicator":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def rank(self) -> int:
+        """
+        Position of the instance in the cluster, which is also its position in
+        the result of gather and in the values of scatter and alltoall.
+        """
+        return (
+            self._node_rank * self._number_of_instances_per_node
+            + self._localhost_communicator.rank
+        )
+
+    @property
+    def number_of_instances(self) -> int:
+        return self._number_of_nodes * self._number_of_instances_per_node
+
+    @property
+    def localhost_metrics(self) -> PeerCommunicatorMetrics:
+        """
+        Metrics of the communication with the other instances on this node.
+        """
+        return self._localhost_communicator.metrics
+
+    @property
+    def multi_node_metrics(self) -> PeerCommunicatorMetrics | None:
+        """
+        Metrics of the communication with the other nodes,
+        only the localhost leaders communicate with them.
+        """
+        if self._multi_node_communicator is None:
+            return None
+        return self._multi_node_communicator.metrics
 
     def is_multi_node_leader(self):
         if self._multi_node_communicator is not None:
             return self._multi_node_communicator.rank == MULTI_NODE_LEADER_RANK
         else:
             return self._localhost_communicator.rank == LOCALHOST_LEADER_RANK
+
+
+def _deserialize_gathered_objects(
+    steps: Steps[list[list[memoryview]] | None],
+) -> Steps[list[Any] | None]:
+    result = yield from steps
+    if result is None:
+        return None
+    return [deserialize_object(parts[0], parts[1:]) for parts in result]
+
+
+def _deserialize_broadcast_object(steps: Steps[list[memoryview]]) -> Steps[Any]:
+    parts = yield from steps
+    return deserialize_object(parts[0], parts[1:])
@@ -0,0 +1,36 @@
+import dataclasses
+
+from exasol.analytics.udf.communication.gather_topology import GatherTopology
+from exasol.analytics.udf.communication.peer_communicator.payload_compression_config import (
+    PayloadCompressionConfig,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class CommunicatorConfig:
+    broadcast_chunk_size_in_bytes: int | None = None
+    """
+    If set, broadcast splits the value into chunks of this size and pipelines
+    them through a chain of the nodes, which pays off for large values.
+    """
+    gather_topology: GatherTopology | None = None
+    """
+    If set, gather combines the values of the nodes along this tree,
+    otherwise all localhost leaders send directly to the multi node leader.
+    """
+    localhost_ipc_directory: str | None = None
+    """
+    If set, the instances on the same node connect via zmq ipc endpoints
+    in this directory instead of TCP on the loopback interface.
+    """
+    enable_point_to_point: bool = False
+    """
+    If set, the instances exchange the connection infos for send and recv
+    during the construction of the Communicator. The connections between
+    two instances get established on their first send or recv.
+    """
+    payload_compression_config: PayloadCompressionConfig = PayloadCompressionConfig()
+    """
+    Compression of the payloads, which the instances send to each other,
+    on the localhost, the multi node and the point to point level.
+    """
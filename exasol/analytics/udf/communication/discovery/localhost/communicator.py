@@ -12,9 +12,15 @@ from exasol.analytics.udf.communication.peer_communicator import PeerCommunicato
 from exasol.analytics.udf.communication.peer_communicator.forward_register_peer_config import (
     ForwardRegisterPeerConfig,
 )
+from exasol.analytics.udf.communication.peer_communicator.payload_compression_config import (
+    PayloadCompressionConfig,
+)
 from exasol.analytics.udf.communication.peer_communicator.peer_communicator_config import (
     PeerCommunicatorConfig,
 )
+from exasol.analytics.udf.communication.peer_communicator.transport_config import (
+    TransportConfig,
+)
 from exasol.analytics.udf.communication.socket_factory.abstract import SocketFactory
 
 
@@ -29,6 +35,8 @@ class CommunicatorFactory:
         discovery_port: Port,
         socket_factory: SocketFactory,
         discovery_socket_factory: DiscoverySocketFactory,
+        transport_config: TransportConfig = TransportConfig(),
+        payload_compression_config: PayloadCompressionConfig = PayloadCompressionConfig(),
     ) -> PeerCommunicator:
         peer_communicator = PeerCommunicator(
             name=name,
@@ -39,7 +47,9 @@ class CommunicatorFactory:
                 forward_register_peer_config=ForwardRegisterPeerConfig(
                     is_leader=False,
                     is_enabled=False,
-                )
+                ),
+                transport_config=transport_config,
+                payload_compression_config=payload_compression_config,
             ),
             socket_factory=socket_factory,
         )
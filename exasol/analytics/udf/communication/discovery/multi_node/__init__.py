@@ -4,10 +4,18 @@ from .discovery_socket import (
     DiscoverySocketFactory,
 )
 from .discovery_strategy import DiscoveryStrategy
+from .static_communicator import (
+    StaticCommunicatorFactory,
+    StaticEndpoint,
+    derive_static_endpoints,
+)
 
 __all__ = [
     "CommunicatorFactory",
     "DiscoverySocket",
     "DiscoverySocketFactory",
     "DiscoveryStrategy",
+    "StaticCommunicatorFactory",
+    "StaticEndpoint",
+    "derive_static_endpoints",
 ]
@@ -12,6 +12,9 @@ from exasol.analytics.udf.communication.peer_communicator import PeerCommunicato
 from exasol.analytics.udf.communication.peer_communicator.forward_register_peer_config import (
     ForwardRegisterPeerConfig,
 )
+from exasol.analytics.udf.communication.peer_communicator.payload_compression_config import (
+    PayloadCompressionConfig,
+)
 from exasol.analytics.udf.communication.peer_communicator.peer_communicator_config import (
     PeerCommunicatorConfig,
 )
@@ -31,6 +34,7 @@ class CommunicatorFactory:
         discovery_port: Port,
         socket_factory: SocketFactory,
         discovery_socket_factory: DiscoverySocketFactory,
+        payload_compression_config: PayloadCompressionConfig = PayloadCompressionConfig(),
     ) -> PeerCommunicator:
         peer_communicator = PeerCommunicator(
             name=name,
@@ -41,7 +45,8 @@ class CommunicatorFactory:
                 forward_register_peer_config=ForwardRegisterPeerConfig(
                     is_leader=is_discovery_leader,
                     is_enabled=True,
-                )
+                ),
+                payload_compression_config=payload_compression_config,
             ),
             socket_factory=socket_factory,
         )
@@ -0,0 +1,154 @@
+import dataclasses
+import zlib
+
+from exasol.analytics.udf.communication.connection_info import ConnectionInfo
+from exasol.analytics.udf.communication.discovery.multi_node.communicator import (
+    CommunicatorFactory,
+)
+from exasol.analytics.udf.communication.discovery.multi_node.discovery_socket import (
+    DiscoverySocketFactory,
+)
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.peer_communicator.forward_register_peer_config import (
+    ForwardRegisterPeerConfig,
+)
+from exasol.analytics.udf.communication.peer_communicator.payload_compression_config import (
+    PayloadCompressionConfig,
+)
+from exasol.analytics.udf.communication.peer_communicator.peer_communicator_config import (
+    PeerCommunicatorConfig,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import SocketFactory
+
+DEFAULT_PORT_RANGE = (40000, 50000)
+
+
+@dataclasses.dataclass(frozen=True)
+class StaticEndpoint:
+    node_name: str
+    ip_address: IPAddress
+    port: Port
+
+
+def derive_static_endpoints(
+    group_identifier: str,
+    node_ip_addresses: list[IPAddress],
+    port_range: tuple[int, int] = DEFAULT_PORT_RANGE,
+) -> list[StaticEndpoint]:
+    """
+    Derives the endpoints of the nodes deterministically from the group identifier,
+    such that all nodes compute the same endpoints without any communication.
+    Node i gets the name n{i} and a port within port_range, which depends on
+    the group identifier to avoid collisions between concurrent groups.
+    """
+    first_port, last_port = port_range
+    number_of_ports = last_port - first_port
+    if len(node_ip_addresses) > number_of_ports:
+        raise ValueError(
+            f"Port range {port_range} is too small for {len(node_ip_addresses)} nodes."
+        )
+    offset = zlib.crc32(group_identifier.encode("utf-8"))
+    return [
+        StaticEndpoint(
+            node_name=f"n{index}",
+            ip_address=ip_address,
+            port=Port(port=first_port + (offset + index) % number_of_ports),
+        )
+        for index, ip_address in enumerate(node_ip_addresses)
+    ]
+
+
+class StaticCommunicatorFactory(CommunicatorFactory):
+    """
+    Connects the nodes directly to the endpoints of a list, which is known up front,
+    instead of discovering them with UDP Ping messages. Each node listens on the
+    port of its own endpoint, which it finds by its node name. The PeerCommunicator
+    gets named after the node of the endpoint, because the other nodes only know
+    the endpoints, so the discovery parameters get ignored and the name passed to
+    create only identifies the instance in the errors.
+    """
+
+    def __init__(
+        self,
+        endpoints: list[StaticEndpoint],
+        node_name: str,
+        timeout_in_seconds: int = 120,
+    ):
+        self._endpoints = endpoints
+        self._node_name = node_name
+        self._timeout_in_seconds = timeout_in_seconds
+        self._my_endpoint = self._find_my_endpoint()
+
+    def _find_my_endpoint(self) -> StaticEndpoint:
+        for endpoint in self._endpoints:
+            if endpoint.node_name == self._node_name:
+                return endpoint
+        raise ValueError(f"No endpoint for node {self._node_name}.")
+
+    def create(
+        self,
+        name: str,
+        group_identifier: str,
+        is_discovery_leader: bool,
+        number_of_instances: int,
+        listen_ip: IPAddress,
+        discovery_ip: IPAddress,
+        discovery_port: Port,
+        socket_factory: SocketFactory,
+        discovery_socket_factory: DiscoverySocketFactory,
+        payload_compression_config: PayloadCompressionConfig = PayloadCompressionConfig(),
+    ) -> PeerCommunicator:
+        if number_of_instances != len(self._endpoints):
+            raise ValueError(
+                f"Expected {number_of_instances} endpoints, "
+                f"but got {len(self._endpoints)}."
+            )
+        peer_communicator = PeerCommunicator(
+            name=_get_peer_name(self._my_endpoint),
+            number_of_peers=number_of_instances,
+            listen_ip=self._my_endpoint.ip_address,
+            listen_port=self._my_endpoint.port,
+            group_identifier=group_identifier,
+            config=PeerCommunicatorConfig(
+                forward_register_peer_config=ForwardRegisterPeerConfig(
+                    is_leader=False,
+                    is_enabled=False,
+                ),
+                payload_compression_config=payload_compression_config,
+            ),
+            socket_factory=socket_factory,
+        )
+        connection_infos = [
+            ConnectionInfo(
+                name=_get_peer_name(endpoint),
+                ipaddress=endpoint.ip_address,
+                port=endpoint.port,
+                group_identifier=group_identifier,
+            )
+            for endpoint in self._endpoints
+        ]
+        for connection_info in connection_infos:
+            peer_communicator.register_peer(connection_info)
+        if not peer_communicator.wait_for_peers(self._timeout_in_seconds * 1000):
+            missing_peer_names = [
+                connection_info.name
+                for connection_info in connection_infos
+                if connection_info.name != _get_peer_name(self._my_endpoint)
+                and not peer_communicator.is_connected(
+                    Peer(connection_info=connection_info)
+                )
+            ]
+            raise TimeoutError(
+                f"Instance {name} could not connect to the peers {missing_peer_names} "
+                f"within {self._timeout_in_seconds} seconds."
+            )
+        return peer_communicator
+
+
+def _get_peer_name(endpoint: StaticEndpoint) -> str:
+    return f"{endpoint.node_name}_global"
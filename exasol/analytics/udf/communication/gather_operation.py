@@ -3,8 +3,15 @@ from structlog.typing import FilteringBoundLogger
 
 from exasol.analytics.udf.communication import messages
 from exasol.analytics.udf.communication.messages import Gather
+from exasol.analytics.udf.communication.operation_steps import (
+    Steps,
+    poll_peers,
+    recv,
+    run_blocking,
+    send,
+)
 from exasol.analytics.udf.communication.peer import Peer
-from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.peer_communicator import PeerGroup
 from exasol.analytics.udf.communication.serialization import (
     deserialize_message,
     serialize_message,
@@ -24,20 +31,50 @@ LOCALHOST_LEADER_RANK = 0
 MULTI_NODE_LEADER_RANK = 0
 
 
+def _get_peer(communicator: PeerGroup, rank: int) -> Peer:
+    if rank == LOCALHOST_LEADER_RANK:
+        return communicator.leader
+    return communicator.peers()[rank]
+
+
 class GatherOperation:
+    """
+    The out_of_band_buffers get sent as separate frames after the value,
+    such that large buffers don't need to be copied into the value.
+
+    The values get gathered at the root, which is the instance with the
+    localhost rank local_root_rank on the node with the multi node rank
+    root_node_rank. The instances on the node of the root send their value
+    directly to the root, the instances on the other nodes to their localhost
+    leader, which forwards them to the localhost leader of the node of the
+    root. If the root is not the localhost leader, this one forwards them
+    to the root. For the instances on the other nodes, local_root_rank needs
+    to be the localhost leader rank. Only a root, which is not a localhost
+    leader, needs the number_of_nodes, because it has no multi node communicator.
+    """
 
     def __init__(
         self,
         sequence_number: int,
-        value: bytes,
-        localhost_communicator: PeerCommunicator,
-        multi_node_communicator: PeerCommunicator | None,
+        value: bytes | memoryview,
+        localhost_communicator: PeerGroup,
+        multi_node_communicator: PeerGroup | None,
         socket_factory: SocketFactory,
         number_of_instances_per_node: int,
+        out_of_band_buffers: list[bytes] | list[memoryview] | None = None,
+        root_node_rank: int = MULTI_NODE_LEADER_RANK,
+        local_root_rank: int = LOCALHOST_LEADER_RANK,
+        number_of_nodes: int | None = None,
     ):
+        self._root_node_rank = root_node_rank
+        self._local_root_rank = local_root_rank
+        self._number_of_nodes = number_of_nodes
+        self._node_base_position = root_node_rank * number_of_instances_per_node
         self._number_of_instances_per_node = number_of_instances_per_node
         self._socket_factory = socket_factory
-        self._value = value
+        self._value_parts: list[bytes | memoryview] = [value]
+        if out_of_band_buffers is not None:
+            self._value_parts.extend(out_of_band_buffers)
         self._sequence_number = sequence_number
         self._multi_node_communicator = multi_node_communicator
         self._localhost_communicator = localhost_communicator
@@ -54,41 +91,194 @@ class GatherOperation:
             sequence_number=self._sequence_number,
         )
 
-    def __call__(self) -> list[bytes] | None:
-        if self._localhost_communicator.rank > LOCALHOST_LEADER_RANK:
-            self._send_to_localhost_leader()
+    def __call__(self) -> list[memoryview] | None:
+        return run_blocking(self.steps())
+
+    def call_with_out_of_band_buffers(self) -> list[list[memoryview]] | None:
+        """
+        Returns for each instance its value followed by its out_of_band_buffers.
+        """
+        return run_blocking(self.steps_with_out_of_band_buffers())
+
+    def steps(self) -> Steps[list[memoryview] | None]:
+        """
+        Steps of the operation, see operation_steps.
+        """
+        result = yield from self.steps_with_out_of_band_buffers()
+        if result is None:
             return None
-        return self._handle_messages_from_local_peers()
+        return [value_parts[0] for value_parts in result]
 
-    def _send_to_localhost_leader(self):
-        leader = self._localhost_communicator.leader
+    def steps_with_out_of_band_buffers(self) -> Steps[list[list[memoryview]] | None]:
+        localhost_rank = self._localhost_communicator.rank
+        if localhost_rank > LOCALHOST_LEADER_RANK:
+            if localhost_rank == self._local_root_rank:
+                return (yield from self._handle_messages_as_local_root())
+            yield from self._send_to_localhost_leader()
+            return None
+        return (yield from self._handle_messages_from_local_peers())
+
+    def _create_value_frames(self) -> list[Frame]:
+        return [self._socket_factory.create_frame(part) for part in self._value_parts]
+
+    def _send_to_localhost_leader(self) -> Steps[None]:
+        """
+        Sends the value to the local root, which is the localhost leader,
+        if the root is on another node.
+        """
+        leader = _get_peer(self._localhost_communicator, self._local_root_rank)
         position = self._localhost_communicator.rank
         source = self._localhost_communicator.peer
-        value_frame = self._socket_factory.create_frame(self._value)
+        value_frames = self._create_value_frames()
         frames = self._construct_gather_message(
-            source=source, leader=leader, position=position, value_frame=value_frame
+            source=source, leader=leader, position=position, value_frames=value_frames
         )
         self._logger.info("_send_to_localhost_leader", frame=frames[0].to_bytes())
-        self._localhost_communicator.send(peer=leader, message=frames)
+        yield from send(
+            self._localhost_communicator,
+            peer=leader,
+            message=frames,
+            tag=self._sequence_number,
+        )
 
-    def _handle_messages_from_local_peers(self) -> list[bytes] | None:
-        if self._checked_multi_node_communicator.rank > 0:
-            self._forward_to_multi_node_leader()
+    def _handle_messages_from_local_peers(
+        self,
+    ) -> Steps[list[list[memoryview]] | None]:
+        if self._checked_multi_node_communicator.rank != self._root_node_rank:
+            yield from self._forward_to_multi_node_leader()
             return None
-        return self._handle_messages_from_all_nodes()
+        if self._local_root_rank != LOCALHOST_LEADER_RANK:
+            yield from self._forward_to_local_root()
+            return None
+        return (yield from self._handle_messages_from_all_nodes())
+
+    def _forward_to_local_root(self) -> Steps[None]:
+        """
+        Sends the own value and forwards the values of the other nodes
+        with their position in the cluster to the local root.
+        """
+        communicator = self._checked_multi_node_communicator
+        local_root = _get_peer(self._localhost_communicator, self._local_root_rank)
+        source = self._localhost_communicator.peer
+        frames = self._construct_gather_message(
+            source=source,
+            leader=local_root,
+            position=self._node_base_position + LOCALHOST_LEADER_RANK,
+            value_frames=self._create_value_frames(),
+        )
+        yield from send(
+            self._localhost_communicator,
+            peer=local_root,
+            message=frames,
+            tag=self._sequence_number,
+        )
+        number_of_instances_in_cluster = (
+            communicator.number_of_peers * self._number_of_instances_per_node
+        )
+        missing_messages_per_node = {
+            peer: self._number_of_instances_per_node
+            for peer in self._get_other_peers(communicator)
+        }
+        while len(missing_messages_per_node) > 0:
+            peers_with_messages = yield from poll_peers(
+                communicator,
+                peers=list(missing_messages_per_node.keys()),
+                tag=self._sequence_number,
+            )
+            for peer in peers_with_messages:
+                frames = yield from recv(communicator, peer, tag=self._sequence_number)
+                message = deserialize_message(frames[0].to_bytes(), messages.Message)
+                specific_message_obj = self._get_and_check_specific_message_obj(message)
+                self._check_sequence_number(specific_message_obj)
+                position = self._get_and_check_multi_node_position(
+                    specific_message_obj, number_of_instances_in_cluster
+                )
+                forward_frames = self._construct_gather_message(
+                    source=source,
+                    leader=local_root,
+                    position=position,
+                    value_frames=frames[1:],
+                )
+                yield from send(
+                    self._localhost_communicator,
+                    peer=local_root,
+                    message=forward_frames,
+                    tag=self._sequence_number,
+                )
+                missing_messages_per_node[peer] -= 1
+                if missing_messages_per_node[peer] == 0:
+                    del missing_messages_per_node[peer]
+
+    def _handle_messages_as_local_root(self) -> Steps[list[list[memoryview]]]:
+        """
+        The localhost leader sends its own value and the values of the other
+        nodes with their position in the cluster, the other local peers
+        send their value with their localhost rank.
+        """
+        if self._number_of_nodes is None:
+            raise UninitializedAttributeError("Number of nodes is undefined.")
+        number_of_instances_in_cluster = (
+            self._number_of_nodes * self._number_of_instances_per_node
+        )
+        leader = self._localhost_communicator.leader
+        result: dict[int, list[memoryview]] = {
+            self._node_base_position
+            + self._local_root_rank: [memoryview(part) for part in self._value_parts]
+        }
+        missing_messages_per_peer = {
+            peer: 1 for peer in self._get_other_peers(self._localhost_communicator)
+        }
+        missing_messages_per_peer[leader] += (
+            number_of_instances_in_cluster - self._number_of_instances_per_node
+        )
+        while len(missing_messages_per_peer) > 0:
+            peers_with_messages = yield from poll_peers(
+                self._localhost_communicator,
+                peers=list(missing_messages_per_peer.keys()),
+                tag=self._sequence_number,
+            )
+            for peer in peers_with_messages:
+                frames = yield from recv(
+                    self._localhost_communicator, peer, tag=self._sequence_number
+                )
+                message = deserialize_message(frames[0].to_bytes(), messages.Message)
+                specific_message_obj = self._get_and_check_specific_message_obj(message)
+                self._check_sequence_number(specific_message_obj)
+                if peer == leader:
+                    position = self._get_and_check_position_from_leader(
+                        specific_message_obj, number_of_instances_in_cluster
+                    )
+                else:
+                    position = self._node_base_position + (
+                        self._get_and_check_local_position(specific_message_obj)
+                    )
+                self._check_if_position_is_already_set(
+                    position, result, specific_message_obj
+                )
+                result[position] = [frame.to_memoryview() for frame in frames[1:]]
+                missing_messages_per_peer[peer] -= 1
+                if missing_messages_per_peer[peer] == 0:
+                    del missing_messages_per_peer[peer]
+        sorted_items = sorted(result.items(), key=lambda kv: kv[0])
+        return [v for k, v in sorted_items]
 
-    def _forward_to_multi_node_leader(self):
-        self._send_local_leader_message_to_multi_node_leader()
-        peers_without_message = set(self._localhost_communicator.peers())
-        peers_without_message.remove(self._localhost_communicator.peer)
+    def _forward_to_multi_node_leader(self) -> Steps[None]:
+        yield from self._send_local_leader_message_to_multi_node_leader()
+        peers_without_message = self._get_other_peers(self._localhost_communicator)
         while len(peers_without_message) > 0:
-            peers_with_messages = self._localhost_communicator.poll_peers()
+            peers_with_messages = yield from poll_peers(
+                self._localhost_communicator,
+                peers=list(peers_without_message),
+                tag=self._sequence_number,
+            )
             for peer in peers_with_messages:
-                self._forward_message_for_peer(peer)
+                yield from self._forward_message_for_peer(peer)
                 peers_without_message.remove(peer)
 
-    def _forward_message_for_peer(self, peer: Peer):
-        frames = self._localhost_communicator.recv(peer)
+    def _forward_message_for_peer(self, peer: Peer) -> Steps[None]:
+        frames = yield from recv(
+            self._localhost_communicator, peer, tag=self._sequence_number
+        )
         message = deserialize_message(frames[0].to_bytes(), messages.Message)
         specific_message_obj = self._get_and_check_specific_message_obj(message)
         self._check_sequence_number(specific_message_obj)
@@ -96,38 +286,42 @@ class GatherOperation:
         self._logger.info(
             "_forward_message_for_peer", local_position=local_position, peer=peer
         )
-        self._send_to_multi_node_leader(
-            local_position=local_position, value_frame=frames[1]
+        yield from self._send_to_multi_node_leader(
+            local_position=local_position, value_frames=frames[1:]
         )
 
-    def _send_local_leader_message_to_multi_node_leader(self):
+    def _send_local_leader_message_to_multi_node_leader(self) -> Steps[None]:
         local_position = LOCALHOST_LEADER_RANK
-        value_frame = self._socket_factory.create_frame(self._value)
-        self._send_to_multi_node_leader(
-            local_position=local_position, value_frame=value_frame
+        value_frames = self._create_value_frames()
+        yield from self._send_to_multi_node_leader(
+            local_position=local_position, value_frames=value_frames
         )
 
     @property
-    def _checked_multi_node_communicator(self) -> PeerCommunicator:
+    def _checked_multi_node_communicator(self) -> PeerGroup:
         value = self._multi_node_communicator
         if value is None:
             raise UninitializedAttributeError("Multi node communicator is undefined.")
         return value
 
-    def _send_to_multi_node_leader(self, local_position: int, value_frame: Frame):
+    def _send_to_multi_node_leader(
+        self, local_position: int, value_frames: list[Frame]
+    ) -> Steps[None]:
         communicator = self._checked_multi_node_communicator
-        leader = communicator.leader
+        leader = _get_peer(communicator, self._root_node_rank)
         source = communicator.peer
         base_position = communicator.rank * self._number_of_instances_per_node
         position = base_position + local_position
         frames = self._construct_gather_message(
-            source=source, leader=leader, position=position, value_frame=value_frame
+            source=source, leader=leader, position=position, value_frames=value_frames
         )
         self._logger.info("_send_to_multi_node_leader", frame=frames[0].to_bytes())
-        communicator.send(peer=leader, message=frames)
+        yield from send(
+            communicator, peer=leader, message=frames, tag=self._sequence_number
+        )
 
     def _construct_gather_message(
-        self, source: Peer, leader: Peer, position: int, value_frame: Frame
+        self, source: Peer, leader: Peer, position: int, value_frames: list[Frame]
     ):
         message = Gather(
             sequence_number=self._sequence_number,
@@ -136,55 +330,105 @@ class GatherOperation:
             position=position,
         )
         serialized_message = serialize_message(message)
-        frames = [self._socket_factory.create_frame(serialized_message), value_frame]
+        frames = [self._socket_factory.create_frame(serialized_message), *value_frames]
         return frames
 
-    def _handle_messages_from_all_nodes(self) -> list[bytes]:
+    def _handle_messages_from_all_nodes(self) -> Steps[list[list[memoryview]]]:
         communicator = self._checked_multi_node_communicator
         number_of_instances_in_cluster = (
             communicator.number_of_peers * self._number_of_instances_per_node
         )
-        result: dict[int, bytes] = {MULTI_NODE_LEADER_RANK: self._value}
+        result: dict[int, list[memoryview]] = {
+            self._node_base_position: [memoryview(part) for part in self._value_parts]
+        }
+        # We only poll the peers, which still owe us messages of this operation,
+        # otherwise we could receive messages of their next operation.
+        localhost_peers_without_message = (
+            self._get_other_peers(self._localhost_communicator)
+            if self._number_of_instances_per_node > 1
+            else []
+        )
+        missing_messages_per_node = (
+            {
+                peer: self._number_of_instances_per_node
+                for peer in self._get_other_peers(communicator)
+            }
+            if communicator.number_of_peers > 1
+            else {}
+        )
         localhost_messages_are_done = False
         multi_node_messages_are_done = False
         while not self._is_result_complete(result, number_of_instances_in_cluster):
             if not localhost_messages_are_done:
-                localhost_messages_are_done = self._receive_localhost_messages(result)
+                localhost_messages_are_done = (
+                    yield from self._receive_localhost_messages(
+                        result, localhost_peers_without_message
+                    )
+                )
             if not multi_node_messages_are_done:
-                multi_node_messages_are_done = self._receive_multi_node_messages(
-                    result, number_of_instances_in_cluster
+                multi_node_messages_are_done = (
+                    yield from self._receive_multi_node_messages(
+                        result,
+                        number_of_instances_in_cluster,
+                        missing_messages_per_node,
+                    )
                 )
         sorted_items = sorted(result.items(), key=lambda kv: kv[0])
         return [v for k, v in sorted_items]
 
-    def _receive_localhost_messages(self, result: dict[int, bytes]) -> bool:
+    def _receive_localhost_messages(
+        self, result: dict[int, list[memoryview]], peers_without_message: list[Peer]
+    ) -> Steps[bool]:
         if self._number_of_instances_per_node == 1:
             return True
-        peers_with_messages = self._localhost_communicator.poll_peers()
+        peers_with_messages = yield from poll_peers(
+            self._localhost_communicator,
+            peers=list(peers_without_message),
+            tag=self._sequence_number,
+        )
         for peer in peers_with_messages:
-            frames = self._localhost_communicator.recv(peer)
+            frames = yield from recv(
+                self._localhost_communicator, peer, tag=self._sequence_number
+            )
             self._logger.info("_receive_localhost_messages", frame=frames[0].to_bytes())
             message = deserialize_message(frames[0].to_bytes(), messages.Message)
             specific_message_obj = self._get_and_check_specific_message_obj(message)
             self._check_sequence_number(specific_message_obj)
-            local_position = self._get_and_check_local_position(specific_message_obj)
+            position = self._node_base_position + (
+                self._get_and_check_local_position(specific_message_obj)
+            )
             self._check_if_position_is_already_set(
-                local_position, result, specific_message_obj
+                position, result, specific_message_obj
             )
-            result[local_position] = frames[1].to_bytes()
-        positions_required_by_localhost = range(self._number_of_instances_per_node)
+            result[position] = [frame.to_memoryview() for frame in frames[1:]]
+            peers_without_message.remove(peer)
+        positions_required_by_localhost = range(
+            self._node_base_position,
+            self._node_base_position + self._number_of_instances_per_node,
+        )
         is_done = set(positions_required_by_localhost).issubset(result.keys())
         return is_done
 
     def _receive_multi_node_messages(
-        self, result: dict[int, bytes], number_of_instances_in_cluster: int
-    ) -> bool:
+        self,
+        result: dict[int, list[memoryview]],
+        number_of_instances_in_cluster: int,
+        missing_messages_per_node: dict[Peer, int],
+    ) -> Steps[bool]:
         communicator = self._checked_multi_node_communicator
         if communicator.number_of_peers == 1:
             return True
-        peers_with_messages = communicator.poll_peers()
+        peers_with_messages = yield from poll_peers(
+            communicator,
+            peers=[
+                peer
+                for peer, number_of_messages in missing_messages_per_node.items()
+                if number_of_messages > 0
+            ],
+            tag=self._sequence_number,
+        )
         for peer in peers_with_messages:
-            frames = communicator.recv(peer)
+            frames = yield from recv(communicator, peer, tag=self._sequence_number)
             self._logger.info(
                 "_receive_multi_node_messages", frame=frames[0].to_bytes()
             )
@@ -197,15 +441,21 @@ class GatherOperation:
             self._check_if_position_is_already_set(
                 position, result, specific_message_obj
             )
-            result[position] = frames[1].to_bytes()
-        positions_required_from_other_nodes = range(
-            self._number_of_instances_per_node, number_of_instances_in_cluster
-        )
+            result[position] = [frame.to_memoryview() for frame in frames[1:]]
+            missing_messages_per_node[peer] -= 1
+        positions_required_from_other_nodes = [
+            position
+            for position in range(number_of_instances_in_cluster)
+            if not self._is_on_root_node(position)
+        ]
         is_done = set(positions_required_from_other_nodes).issubset(result.keys())
         return is_done
 
+    def _get_other_peers(self, communicator: PeerGroup) -> list[Peer]:
+        return [peer for peer in communicator.peers() if peer != communicator.peer]
+
     def _is_result_complete(
-        self, result: dict[int, bytes], number_of_instances_in_cluster: int
+        self, result: dict[int, list[memoryview]], number_of_instances_in_cluster: int
     ) -> bool:
         complete = len(result) == number_of_instances_in_cluster
         return complete
@@ -220,29 +470,43 @@ class GatherOperation:
             )
         return local_position
 
+    def _is_on_root_node(self, position: int) -> bool:
+        return (
+            self._node_base_position
+            <= position
+            < self._node_base_position + self._number_of_instances_per_node
+        )
+
     def _get_and_check_multi_node_position(
         self, specific_message_obj: Gather, number_of_instances_in_cluster: int
     ) -> int:
         position = specific_message_obj.position
-        if not (
-            self._number_of_instances_per_node
-            <= position
-            < number_of_instances_in_cluster
+        if not (0 <= position < number_of_instances_in_cluster) or (
+            self._is_on_root_node(position)
         ):
             raise RuntimeError(
                 f"Got message with not allowed position. "
-                f"Position needs to be greater equal than {self._number_of_instances_per_node} and "
-                f"smaller than {number_of_instances_in_cluster}, "
+                f"Position needs to be smaller than {number_of_instances_in_cluster} "
+                f"and not on the node of the root, "
                 f"but we got {position} in message {specific_message_obj}"
             )
         return position
 
+    def _get_and_check_position_from_leader(
+        self, specific_message_obj: Gather, number_of_instances_in_cluster: int
+    ) -> int:
+        if specific_message_obj.position == self._node_base_position:
+            return specific_message_obj.position
+        return self._get_and_check_multi_node_position(
+            specific_message_obj, number_of_instances_in_cluster
+        )
+
     def _check_sequence_number(self, specific_message_obj: Gather):
         if specific_message_obj.sequence_number != self._sequence_number:
             raise RuntimeError(
                 f"Got message with different sequence number. "
                 f"We expect the sequence number {self._sequence_number} "
-                f"but we got {self._sequence_number} in message {specific_message_obj}"
+                f"but we got {specific_message_obj.sequence_number} in message {specific_message_obj}"
             )
 
     def _get_and_check_specific_message_obj(self, message: messages.Message) -> Gather:
@@ -256,7 +520,10 @@ class GatherOperation:
         return specific_message_obj
 
     def _check_if_position_is_already_set(
-        self, position: int, result: dict[int, bytes], specific_message_obj: Gather
+        self,
+        position: int,
+        result: dict[int, list[memoryview]],
+        specific_message_obj: Gather,
     ):
         if position in result:
             raise RuntimeError(
@@ -0,0 +1,67 @@
+import abc
+
+
+class GatherTopology(abc.ABC):
+    """
+    Tree over the multi node ranks along which the localhost leaders
+    combine their results during a gather. The multi node leader with
+    rank 0 is always the root of the tree.
+    """
+
+    @abc.abstractmethod
+    def parent(self, rank: int, number_of_nodes: int) -> int | None:
+        """Returns the rank to which the given rank sends its result, or None for the root"""
+
+    @abc.abstractmethod
+    def children(self, rank: int, number_of_nodes: int) -> list[int]:
+        """Returns the ranks from which the given rank receives results"""
+
+    def subtree_size(self, rank: int, number_of_nodes: int) -> int:
+        """Returns the number of nodes in the subtree rooted at the given rank"""
+        return 1 + sum(
+            self.subtree_size(child, number_of_nodes)
+            for child in self.children(rank, number_of_nodes)
+        )
+
+
+class BinomialTreeGatherTopology(GatherTopology):
+    """
+    A rank receives from the ranks which differ only in a bit below its
+    lowest set bit. The root receives ceil(log2(N)) messages, which is also
+    the depth of the tree.
+    """
+
+    def parent(self, rank: int, number_of_nodes: int) -> int | None:
+        if rank == 0:
+            return None
+        return rank & (rank - 1)
+
+    def children(self, rank: int, number_of_nodes: int) -> list[int]:
+        lowest_set_bit = rank & -rank if rank > 0 else number_of_nodes
+        result = []
+        distance = 1
+        while distance < lowest_set_bit and rank + distance < number_of_nodes:
+            result.append(rank + distance)
+            distance *= 2
+        return result
+
+
+class KAryTreeGatherTopology(GatherTopology):
+    """
+    A complete tree in which each rank receives from at most arity ranks.
+    The depth of the tree is log_arity(N).
+    """
+
+    def __init__(self, arity: int):
+        if arity < 1:
+            raise ValueError(f"Arity needs to be at least 1, but got {arity}.")
+        self._arity = arity
+
+    def parent(self, rank: int, number_of_nodes: int) -> int | None:
+        if rank == 0:
+            return None
+        return (rank - 1) // self._arity
+
+    def children(self, rank: int, number_of_nodes: int) -> list[int]:
+        first_child = rank * self._arity + 1
+        return list(range(first_child, min(first_child + self._arity, number_of_nodes)))
@@ -63,13 +63,36 @@ class Payload(BaseMessage, frozen=True):
     source: Peer
     destination: Peer
     sequence_number: int
+    compressed_frame_indices: list[int] = []
+    """Indices of the payload frames, which are compressed with zlib."""
+    tag: int = 0
+    """The receiver matches the payloads by their tag."""
 
 
 class AcknowledgePayload(BaseMessage, frozen=True):
+    """
+    Acknowledges all payloads up to and including sequence_number.
+    consumed_messages and consumed_bytes are the totals of the payloads,
+    which the frontend of the source received so far. They free the flow
+    control window of the destination.
+    """
+
     message_type: Literal["AcknowledgePayload"] = "AcknowledgePayload"
     source: Peer
     destination: Peer
     sequence_number: int
+    consumed_messages: int = 0
+    consumed_bytes: int = 0
+
+
+class ConsumedPayload(BaseMessage, frozen=True):
+    """
+    The frontend received a payload of the peer, which had the given size on the wire.
+    """
+
+    message_type: Literal["ConsumedPayload"] = "ConsumedPayload"
+    peer: Peer
+    size_in_bytes: int
 
 
 class AbortPayload(BaseMessage, frozen=True):
@@ -132,6 +155,14 @@ class Gather(BaseMessage, frozen=True):
     position: int
 
 
+class GatherBundle(BaseMessage, frozen=True):
+    message_type: Literal["GatherBundle"] = "GatherBundle"
+    source: Peer
+    destination: Peer
+    sequence_number: int
+    positions: list[int]
+
+
 class Broadcast(BaseMessage, frozen=True):
     message_type: Literal["Broadcast"] = "Broadcast"
     source: Peer
@@ -139,6 +170,81 @@ class Broadcast(BaseMessage, frozen=True):
     sequence_number: int
 
 
+class BroadcastChunk(BaseMessage, frozen=True):
+    message_type: Literal["BroadcastChunk"] = "BroadcastChunk"
+    source: Peer
+    destination: Peer
+    sequence_number: int
+    chunk_index: int
+    number_of_chunks: int
+
+
+class Reduce(BaseMessage, frozen=True):
+    message_type: Literal["Reduce"] = "Reduce"
+    source: Peer
+    destination: Peer
+    sequence_number: int
+    position: int
+
+
+class Scatter(BaseMessage, frozen=True):
+    message_type: Literal["Scatter"] = "Scatter"
+    source: Peer
+    destination: Peer
+    sequence_number: int
+    position: int
+
+
+class NodeRank(BaseMessage, frozen=True):
+    message_type: Literal["NodeRank"] = "NodeRank"
+    source: Peer
+    destination: Peer
+    node_rank: int
+
+
+class Alltoall(BaseMessage, frozen=True):
+    message_type: Literal["Alltoall"] = "Alltoall"
+    source: Peer
+    destination: Peer
+    sequence_number: int
+    source_positions: list[int]
+    destination_positions: list[int]
+
+
+class Allgather(BaseMessage, frozen=True):
+    message_type: Literal["Allgather"] = "Allgather"
+    source: Peer
+    destination: Peer
+    sequence_number: int
+    positions: list[int]
+
+
+class StreamChunk(BaseMessage, frozen=True):
+    message_type: Literal["StreamChunk"] = "StreamChunk"
+    source: Peer
+    destination: Peer
+    sequence_number: int
+    chunk_index: int
+
+
+class StreamCredit(BaseMessage, frozen=True):
+    """Allows the sender to send the chunks before number_of_chunks."""
+
+    message_type: Literal["StreamCredit"] = "StreamCredit"
+    source: Peer
+    destination: Peer
+    sequence_number: int
+    number_of_chunks: int
+
+
+class StreamEnd(BaseMessage, frozen=True):
+    message_type: Literal["StreamEnd"] = "StreamEnd"
+    source: Peer
+    destination: Peer
+    sequence_number: int
+    number_of_chunks: int
+
+
 class Message(RootModel, frozen=True):
     root: (
         Ping
@@ -151,6 +257,7 @@ class Message(RootModel, frozen=True):
         | IsReadyToStop
         | Payload
         | AcknowledgePayload
+        | ConsumedPayload
         | AbortPayload
         | MyConnectionInfo
         | ConnectionIsReady
@@ -162,4 +269,14 @@ class Message(RootModel, frozen=True):
         | Timeout
         | Gather
         | Broadcast
+        | Reduce
+        | Scatter
+        | NodeRank
+        | Alltoall
+        | Allgather
+        | BroadcastChunk
+        | GatherBundle
+        | StreamChunk
+        | StreamCredit
+        | StreamEnd
     ) = Field(discriminator="message_type")
@@ -0,0 +1,49 @@
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.serialization import (
+    deserialize_message,
+    serialize_message,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import SocketFactory
+from exasol.analytics.utils.errors import UninitializedAttributeError
+
+NODE_RANK_TAG = -1
+"""
+Reserved tag of the NodeRank messages, which lies outside the tags of all
+Communicators and the credit tags of the streams, such that no other operation
+receives them.
+"""
+
+
+def exchange_node_rank(
+    localhost_communicator: PeerCommunicator,
+    multi_node_communicator: PeerCommunicator | None,
+    socket_factory: SocketFactory,
+) -> int:
+    """
+    Only the localhost leaders know the rank of their node in the multi node
+    communicator, so they send it to the other instances on their node.
+    """
+    communicator = localhost_communicator
+    if communicator.peer == communicator.leader:
+        if multi_node_communicator is None:
+            raise UninitializedAttributeError("Multi node communicator is undefined.")
+        node_rank = multi_node_communicator.rank
+        for peer in communicator.peers():
+            if peer != communicator.peer:
+                message = messages.NodeRank(
+                    source=communicator.peer, destination=peer, node_rank=node_rank
+                )
+                frame = socket_factory.create_frame(serialize_message(message))
+                communicator.send(peer=peer, message=[frame], tag=NODE_RANK_TAG)
+        return node_rank
+    frames = communicator.recv(peer=communicator.leader, tag=NODE_RANK_TAG)
+    message_obj = deserialize_message(frames[0].to_bytes(), messages.Message)
+    specific_message_obj = message_obj.root
+    if not isinstance(specific_message_obj, messages.NodeRank):
+        raise TypeError(
+            f"Received the wrong message type. "
+            f"Expected {messages.NodeRank.__name__} got {type(specific_message_obj)}. "
+            f"For message {message_obj}."
+        )
+    return specific_message_obj.node_rank
@@ -0,0 +1,23 @@
+import pickle
+from typing import Any
+
+
+def serialize_object(obj: Any) -> tuple[bytes, list[memoryview]]:
+    """
+    Pickles the object with protocol 5 and returns the pickle and its
+    out-of-band buffers, for example the data of NumPy arrays, which can be
+    sent as separate frames without copying them into the pickle.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    return data, [buffer.raw() for buffer in buffers]
+
+
+def deserialize_object(data: memoryview, out_of_band_buffers: list[memoryview]) -> Any:
+    """
+    Unpickles the object with the out-of-band buffers from serialize_object.
+    NumPy arrays get reconstructed on top of the buffers without copying them,
+    so they are read-only, if the buffers are read-only.
+    Unpickling can execute arbitrary code, only use it for data of trusted instances.
+    """
+    return pickle.loads(data, buffers=out_of_band_buffers)
@@ -0,0 +1,95 @@
+"""
+The collective operations are generators, which yield the calls of the
+PeerCommunicators that can block, send, recv and poll_peers, and get their
+results sent back. run_blocking executes the calls directly, while run_async
+awaits them with AsyncPeerCommunicators. With that, the same operation works
+with and without an event loop.
+"""
+
+import dataclasses
+from collections.abc import (
+    Callable,
+    Generator,
+)
+from typing import (
+    Any,
+    TypeVar,
+)
+
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerGroup
+from exasol.analytics.udf.communication.peer_communicator.async_peer_communicator import (
+    AsyncPeerCommunicator,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import Frame
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass(frozen=True)
+class BlockingCall:
+    """
+    Call of the method of the PeerCommunicator with the arguments.
+    AsyncPeerCommunicator provides the same methods as coroutines.
+    """
+
+    communicator: PeerGroup
+    method_name: str
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+
+
+Steps = Generator[BlockingCall, Any, T]
+
+
+def send(communicator: PeerGroup, *args: Any, **kwargs: Any) -> Steps[None]:
+    yield BlockingCall(communicator, "send", args, kwargs)
+
+
+def recv(communicator: PeerGroup, *args: Any, **kwargs: Any) -> Steps[list[Frame]]:
+    return (yield BlockingCall(communicator, "recv", args, kwargs))
+
+
+def poll_peers(communicator: PeerGroup, *args: Any, **kwargs: Any) -> Steps[list[Peer]]:
+    return (yield BlockingCall(communicator, "poll_peers", args, kwargs))
+
+
+def run_blocking(steps: Steps[T]) -> T:
+    """
+    Runs the steps of an operation with the blocking methods of the PeerCommunicators.
+    """
+    try:
+        call = next(steps)
+        while True:
+            method = getattr(call.communicator, call.method_name)
+            try:
+                result = method(*call.args, **call.kwargs)
+            except Exception as e:
+                call = steps.throw(e)
+            else:
+                call = steps.send(result)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def run_async(
+    steps: Steps[T],
+    get_async_peer_communicator: Callable[[PeerGroup], AsyncPeerCommunicator],
+) -> T:
+    """
+    Runs the steps of an operation with the coroutines of the AsyncPeerCommunicators,
+    which get_async_peer_communicator returns for the PeerCommunicators.
+    """
+    try:
+        call = next(steps)
+        while True:
+            async_peer_communicator = get_async_peer_communicator(call.communicator)
+            method = getattr(async_peer_communicator, call.method_name)
+            try:
+                result = await method(*call.args, **call.kwargs)
+            except Exception as e:
+                call = steps.throw(e)
+            else:
+                call = steps.send(result)
+    except StopIteration as stop:
+        return stop.value
@@ -1 +1,2 @@
 from .peer_communicator import PeerCommunicator as PeerCommunicator
+from .peer_group import PeerGroup as PeerGroup
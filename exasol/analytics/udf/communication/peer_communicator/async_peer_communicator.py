@@ -0,0 +1,207 @@
+import asyncio
+import dataclasses
+from collections.abc import Callable
+
+import structlog
+from structlog.typing import FilteringBoundLogger
+
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator.peer_group import PeerGroup
+from exasol.analytics.udf.communication.socket_factory.abstract import Frame
+
+LOGGER: FilteringBoundLogger = structlog.get_logger()
+
+NO_WAIT = 0
+
+
+@dataclasses.dataclass
+class _Readable:
+    future: asyncio.Future
+    number_of_waiters: int = 0
+
+
+_ReadableKey = tuple[asyncio.AbstractEventLoop, int]
+
+_READABLE_BY_FILE_DESCRIPTOR: dict[_ReadableKey, _Readable] = {}
+"""
+The event loop allows only one reader per file descriptor. For that reason,
+all coroutines waiting concurrently for a file descriptor share one future,
+which gets resolved, when the file descriptor becomes readable. This includes
+the AsyncPeerCommunicators of SubPeerCommunicators, which share the file
+descriptor of their PeerCommunicator.
+"""
+
+
+class AsyncPeerCommunicator:
+    """
+    asyncio facade for a PeerGroup, like a PeerCommunicator.
+
+    Instead of blocking in the busy-wait loops of the PeerCommunicator,
+    the coroutines check without waiting, whether their condition holds,
+    and otherwise wait in the event loop until the file descriptor of the
+    PeerCommunicator signals that new messages might have arrived.
+    With that, a UDF can overlap its computation with the communication
+    in a single thread.
+
+    The PeerCommunicator must not be used concurrently outside the facade.
+    """
+
+    def __init__(self, peer_communicator: PeerGroup):
+        self._peer_communicator = peer_communicator
+        self._logger = LOGGER.bind(
+            my_connection_info=peer_communicator.peer.connection_info.model_dump()
+        )
+
+    @property
+    def peer_communicator(self) -> PeerGroup:
+        return self._peer_communicator
+
+    async def wait_for_peers(self, timeout_in_milliseconds: int | None = None) -> bool:
+        return await self._wait_for_condition(
+            lambda: self._peer_communicator.wait_for_peers(NO_WAIT),
+            timeout_in_milliseconds,
+        )
+
+    async def peers(self, timeout_in_milliseconds: int | None = None) -> list[Peer]:
+        if await self.wait_for_peers(timeout_in_milliseconds):
+            return self._peer_communicator.peers(NO_WAIT)
+        return []
+
+    async def send(
+        self,
+        peer: Peer,
+        message: list[Frame],
+        timeout_in_milliseconds: int | None = None,
+        tag: int = 0,
+    ):
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        if not await self._wait_for_connections([peer], timeout_in_milliseconds):
+            raise TimeoutError("Timeout occurred during waiting for the connection.")
+        is_sent = await self._wait_for_condition(
+            lambda: self._peer_communicator.try_send(peer, message, tag),
+            _remaining_timeout(loop, start_time, timeout_in_milliseconds),
+        )
+        if not is_sent:
+            raise TimeoutError("Timeout occurred during waiting to send the message.")
+
+    async def recv(
+        self,
+        peer: Peer,
+        timeout_in_milliseconds: int | None = None,
+        tag: int | None = None,
+    ) -> list[Frame]:
+        peers = await self.poll_peers([peer], timeout_in_milliseconds, tag)
+        if len(peers) == 0:
+            raise TimeoutError("Timeout occurred during waiting for messages.")
+        return self._peer_communicator.recv(peer, NO_WAIT, tag)
+
+    async def poll_peers(
+        self,
+        peers: list[Peer] | None = None,
+        timeout_in_milliseconds: int | None = None,
+        tag: int | None = None,
+    ) -> list[Peer]:
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        if not await self._wait_for_connections(
+            [] if peers is None else peers, timeout_in_milliseconds
+        ):
+            return []
+        result: list[Peer] = []
+
+        def have_peers_received_messages() -> bool:
+            nonlocal result
+            result = self._peer_communicator.poll_peers(peers, NO_WAIT, tag)
+            return len(result) > 0
+
+        await self._wait_for_condition(
+            have_peers_received_messages,
+            _remaining_timeout(loop, start_time, timeout_in_milliseconds),
+        )
+        return result
+
+    async def _wait_for_connections(
+        self, peers: list[Peer], timeout_in_milliseconds: int | None
+    ) -> bool:
+        """
+        Unlike wait_for_peers, this only waits for the given peers with connect_lazily,
+        because the other peers might never connect.
+        """
+        return await self._wait_for_condition(
+            lambda: self._peer_communicator.are_connected(peers),
+            timeout_in_milliseconds,
+        )
+
+    async def _wait_for_condition(
+        self,
+        condition: Callable[[], bool],
+        timeout_in_milliseconds: int | None,
+    ) -> bool:
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        while not condition():
+            remaining_timeout = _remaining_timeout(
+                loop, start_time, timeout_in_milliseconds
+            )
+            if remaining_timeout is not None and remaining_timeout <= 0:
+                return False
+            await _wait_for_file_descriptor(
+                loop, self._peer_communicator.file_descriptor, remaining_timeout
+            )
+        return True
+
+
+async def _wait_for_file_descriptor(
+    loop: asyncio.AbstractEventLoop,
+    file_descriptor: int,
+    timeout_in_milliseconds: int | None,
+):
+    """
+    The reader gets removed, when the file descriptor became readable or
+    no coroutine waits for it anymore, such that it doesn't stay registered
+    after the PeerCommunicator closed it.
+    """
+    key = (loop, file_descriptor)
+    readable = _READABLE_BY_FILE_DESCRIPTOR.get(key)
+    if readable is None:
+        future = loop.create_future()
+
+        def set_readable():
+            loop.remove_reader(file_descriptor)
+            del _READABLE_BY_FILE_DESCRIPTOR[key]
+            future.set_result(None)
+
+        readable = _Readable(future=future)
+
+        loop.add_reader(file_descriptor, set_readable)
+        _READABLE_BY_FILE_DESCRIPTOR[key] = readable
+    readable.number_of_waiters += 1
+    try:
+        await asyncio.wait(
+            [readable.future],
+            timeout=(
+                None
+                if timeout_in_milliseconds is None
+                else timeout_in_milliseconds / 1000
+            ),
+        )
+    finally:
+        readable.number_of_waiters -= 1
+        if (
+            readable.number_of_waiters == 0
+            and _READABLE_BY_FILE_DESCRIPTOR.get(key) is readable
+        ):
+            loop.remove_reader(file_descriptor)
+            del _READABLE_BY_FILE_DESCRIPTOR[key]
+
+
+def _remaining_timeout(
+    loop: asyncio.AbstractEventLoop,
+    start_time: float,
+    timeout_in_milliseconds: int | None,
+) -> int | None:
+    if timeout_in_milliseconds is None:
+        return None
+    elapsed_in_milliseconds = int((loop.time() - start_time) * 1000)
+    return max(0, timeout_in_milliseconds - elapsed_in_milliseconds)
@@ -10,7 +10,10 @@ from structlog.types import FilteringBoundLogger
 
 from exasol.analytics.udf.communication import messages
 from exasol.analytics.udf.communication.connection_info import ConnectionInfo
-from exasol.analytics.udf.communication.ip_address import IPAddress
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
 from exasol.analytics.udf.communication.messages import (
     Message,
     PrepareToStop,
@@ -21,6 +24,9 @@ from exasol.analytics.udf.communication.peer_communicator.background_listener_th
     BackgroundListenerThread,
 )
 from exasol.analytics.udf.communication.peer_communicator.clock import Clock
+from exasol.analytics.udf.communication.peer_communicator.metrics import (
+    PeerCommunicatorMetrics,
+)
 from exasol.analytics.udf.communication.peer_communicator.peer_communicator_config import (
     PeerCommunicatorConfig,
 )
@@ -38,6 +44,8 @@ from exasol.analytics.udf.communication.socket_factory.abstract import (
 
 LOGGER: FilteringBoundLogger = structlog.get_logger()
 
+START_POLL_TIMEOUT_IN_MS = 100
+
 
 class UnexpectedMessageError(Exception):
     """
@@ -71,6 +79,8 @@ class BackgroundListenerInterface:
         config: PeerCommunicatorConfig,
         clock: Clock,
         trace_logging: bool,
+        metrics: PeerCommunicatorMetrics,
+        listen_port: Port | None = None,
     ):
         self._socket_factory = socket_factory
         self._config = config
@@ -96,6 +106,8 @@ class BackgroundListenerInterface:
             clock=clock,
             config=config,
             trace_logging=trace_logging,
+            metrics=metrics,
+            listen_port=listen_port,
         )
         self._thread = threading.Thread(target=self._background_listener_run.run)
         self._thread.daemon = True
@@ -105,6 +117,7 @@ class BackgroundListenerInterface:
     def _get_my_connection_info(self) -> ConnectionInfo:
         received = None
         try:
+            self._wait_for_background_listener_start()
             received = self._out_control.socket.receive()
             generic = deserialize_message(received, messages.Message)
             message = generic.root
@@ -117,10 +130,31 @@ class BackgroundListenerInterface:
             self._logger.exception("Exception", raw_message=received)
             raise
 
+    def _wait_for_background_listener_start(self):
+        """
+        The background listener can fail before it sends its connection info,
+        for example, if its listen port is already in use.
+        """
+        while not self._out_control.socket.poll(
+            flags=PollerFlag.POLLIN, timeout_in_ms=START_POLL_TIMEOUT_IN_MS
+        ):
+            if not self._thread.is_alive():
+                raise RuntimeError(
+                    "Background listener stopped before sending its connection info."
+                )
+
     @property
     def my_connection_info(self) -> ConnectionInfo:
         return self._my_connection_info
 
+    @property
+    def out_control_file_descriptor(self) -> int:
+        """
+        File descriptor, which becomes readable when the background listener
+        might have sent new messages, see Socket.get_file_descriptor.
+        """
+        return self._out_control.socket.get_file_descriptor()
+
     def register_peer(self, peer: Peer):
         register_message = messages.RegisterPeer(peer=peer)
         self._in_control.socket.send(serialize_message(register_message))
@@ -130,6 +164,10 @@ class BackgroundListenerInterface:
         frame = self._socket_factory.create_frame(serialized_message)
         self._in_control.socket.send_multipart([frame] + payload)
 
+    def consumed_payload(self, peer: Peer, size_in_bytes: int):
+        message = messages.ConsumedPayload(peer=peer, size_in_bytes=size_in_bytes)
+        self._in_control.socket.send(serialize_message(message))
+
     def receive_messages(
         self, timeout_in_milliseconds: int | None = 0
     ) -> Iterator[tuple[Message, list[Frame]]]:
@@ -25,12 +25,18 @@ from exasol.analytics.udf.communication.peer_communicator.clock import Clock
 from exasol.analytics.udf.communication.peer_communicator.connection_establisher_builder import (
     ConnectionEstablisherBuilder,
 )
+from exasol.analytics.udf.communication.peer_communicator.metrics import (
+    PeerCommunicatorMetrics,
+)
 from exasol.analytics.udf.communication.peer_communicator.payload_handler_builder import (
     PayloadHandlerBuilder,
 )
 from exasol.analytics.udf.communication.peer_communicator.payload_message_sender_factory import (
     PayloadMessageSenderFactory,
 )
+from exasol.analytics.udf.communication.peer_communicator.payload_receiver_factory import (
+    PayloadReceiverFactory,
+)
 from exasol.analytics.udf.communication.peer_communicator.payload_sender_factory import (
     PayloadSenderFactory,
 )
@@ -53,7 +59,14 @@ from exasol.analytics.udf.communication.peer_communicator.send_socket_factory im
     SendSocketFactory,
 )
 from exasol.analytics.udf.communication.peer_communicator.sender import SenderFactory
-from exasol.analytics.udf.communication.peer_communicator.timer import TimerFactory
+from exasol.analytics.udf.communication.peer_communicator.timer import (
+    Timer,
+    TimerFactory,
+    TimerScheduler,
+)
+from exasol.analytics.udf.communication.peer_communicator.transport_address import (
+    get_ipc_address,
+)
 from exasol.analytics.udf.communication.serialization import (
     deserialize_message,
     serialize_message,
@@ -71,8 +84,10 @@ from exasol.analytics.utils.errors import UninitializedAttributeError
 LOGGER: FilteringBoundLogger = structlog.get_logger()
 
 
-def create_background_peer_state_builder() -> BackgroundPeerStateBuilder:
-    timer_factory = TimerFactory()
+def create_background_peer_state_builder(
+    timer_scheduler: TimerScheduler,
+) -> BackgroundPeerStateBuilder:
+    timer_factory = TimerFactory(scheduler=timer_scheduler)
     sender_factory = SenderFactory()
     connection_establisher_builder = ConnectionEstablisherBuilder(
         timer_factory=timer_factory
@@ -87,8 +102,10 @@ def create_background_peer_state_builder() -> BackgroundPeerStateBuilder:
     payload_sender_factory = PayloadSenderFactory(
         payload_message_sender_factory=payload_message_sender_factory
     )
+    payload_receiver_factory = PayloadReceiverFactory(timer_factory=timer_factory)
     payload_handler_builder = PayloadHandlerBuilder(
-        payload_sender_factory=payload_sender_factory
+        payload_sender_factory=payload_sender_factory,
+        payload_receiver_factory=payload_receiver_factory,
     )
     background_peer_state_factory = BackgroundPeerStateBuilder(
         sender_factory=sender_factory,
@@ -115,11 +132,27 @@ class RuntimeSockets:
         name: str,
         in_control_address: str,
         out_control_address: str,
+        listen_port: Port | None = None,
+        ipc_directory: str | None = None,
     ) -> "RuntimeSockets":
         def listen_socket():
             socket = socket_factory.create_socket(SocketType.ROUTER)
             socket.set_identity(name)
-            port = socket.bind_to_random_port(f"tcp://*")
+            if listen_port is None:
+                port = socket.bind_to_random_port(f"tcp://*")
+            else:
+                try:
+                    socket.bind(f"tcp://*:{listen_port.port}")
+                except Exception:
+                    socket.close(linger=0)
+                    raise
+                port = listen_port.port
+            if ipc_directory is not None:
+                try:
+                    socket.bind(get_ipc_address(ipc_directory, Port(port=port)))
+                except Exception:
+                    socket.close(linger=0)
+                    raise
             return (socket, port)
 
         def control_socket(address: str):
@@ -162,10 +195,18 @@ class BackgroundListenerThread:
         clock: Clock,
         config: PeerCommunicatorConfig,
         trace_logging: bool,
-        background_peer_state_factory: BackgroundPeerStateBuilder = create_background_peer_state_builder(),
+        metrics: PeerCommunicatorMetrics,
+        listen_port: Port | None = None,
+        background_peer_state_factory: BackgroundPeerStateBuilder | None = None,
     ):
         self._number_of_peers = number_of_peers
+        self._metrics = metrics
         self._config = config
+        self._timer_scheduler = TimerScheduler(clock)
+        if background_peer_state_factory is None:
+            background_peer_state_factory = create_background_peer_state_builder(
+                self._timer_scheduler
+            )
         self._background_peer_state_factory = background_peer_state_factory
         self._trace_logging = trace_logging
         self._clock = clock
@@ -177,6 +218,7 @@ class BackgroundListenerThread:
         )
         self._group_identifier = group_identifier
         self._listen_ip = listen_ip
+        self._listen_port = listen_port
         self._in_control_socket_address = in_control_socket_address
         self._out_control_socket_address = out_control_socket_address
         self._socket_factory = socket_factory
@@ -191,6 +233,8 @@ class BackgroundListenerThread:
             self._name,
             self._in_control_socket_address,
             self._out_control_socket_address,
+            self._listen_port,
+            self._config.transport_config.ipc_directory,
         )
         self._set_my_connection_info(self.sockets.listen_port)
         try:
@@ -200,6 +244,8 @@ class BackgroundListenerThread:
 
     def _stop(self):
         self._logger.info("start")
+        for peer_state in self._peer_state.values():
+            peer_state.close()
         if self._register_peer_connection is not None:
             self._register_peer_connection.close()
         self.sockets.out_control.close(linger=0)
@@ -210,20 +256,40 @@ class BackgroundListenerThread:
     def _run_message_loop(self):
         try:
             while self._status != BackgroundListenerThread.Status.STOPPED:
-                self._handle_message()
-                self._try_send()
+                has_handled_messages = self._handle_message()
+                expired_timers = self._timer_scheduler.pop_expired_timers()
+                if has_handled_messages:
+                    self._try_send(list(self._peer_state.values()))
+                elif len(expired_timers) > 0:
+                    self._try_send(self._get_peer_states_of_timers(expired_timers))
         except Exception as e:
             self._logger.exception("Exception in message loop")
 
-    def _try_send(self):
+    def _get_peer_states_of_timers(
+        self, timers: list[Timer]
+    ) -> list[BackgroundPeerState]:
+        """
+        An expired timer only concerns the peer, which owns it. In contrast,
+        a handled message can concern other peers than its source,
+        for example PrepareToStop or a forwarded RegisterPeer.
+        """
+        owners = {timer.owner for timer in timers}
+        if None in owners:
+            return list(self._peer_state.values())
+        return [self._peer_state[peer] for peer in owners if peer in self._peer_state]
+
+    def _try_send(self, peer_states: list[BackgroundPeerState]):
         if self._status != BackgroundListenerThread.Status.STOPPED:
-            for peer_state in self._peer_state.values():
+            for peer_state in peer_states:
                 if self._status == BackgroundListenerThread.Status.PREPARE_TO_STOP:
                     peer_state.prepare_to_stop()
                 peer_state.try_send()
 
-    def _handle_message(self):
-        poll = self.sockets.poller.poll(timeout_in_ms=self._config.poll_timeout_in_ms)
+    def _handle_message(self) -> bool:
+        timeout_in_ms = self._timer_scheduler.compute_timeout_in_ms(
+            self._config.poll_timeout_in_ms
+        )
+        poll = self.sockets.poller.poll(timeout_in_ms=timeout_in_ms)
         if (
             self.sockets.in_control in poll
             and PollerFlag.POLLIN in poll[self.sockets.in_control]
@@ -236,6 +302,7 @@ class BackgroundListenerThread:
         ):
             message = self.sockets.listen.receive_multipart()
             self._handle_listener_message(message)
+        return len(poll) > 0
 
     def _handle_control_message(self, frames: list[Frame]) -> Status:
         try:
@@ -257,6 +324,8 @@ class BackgroundListenerThread:
                     )
             elif isinstance(specific_message_obj, messages.Payload):
                 self.send_payload(payload=specific_message_obj, frames=frames)
+            elif isinstance(specific_message_obj, messages.ConsumedPayload):
+                self._handle_consumed_payload_message(specific_message_obj)
             else:
                 self._logger.error(
                     "Unknown message type",
@@ -273,9 +342,14 @@ class BackgroundListenerThread:
         ) or not self._config.forward_register_peer_config.is_enabled
 
     def send_payload(self, payload: messages.Payload, frames: list[Frame]):
-        self._peer_state[payload.destination].send_payload(
-            message=payload, frames=frames
-        )
+        with self._timer_scheduler.owned_by(payload.destination):
+            self._peer_state[payload.destination].send_payload(
+                message=payload, frames=frames
+            )
+
+    def _handle_consumed_payload_message(self, message: messages.ConsumedPayload):
+        if message.peer in self._peer_state:
+            self._peer_state[message.peer].consumed_payload(message.size_in_bytes)
 
     @property
     def sockets(self) -> RuntimeSockets:
@@ -304,18 +378,21 @@ class BackgroundListenerThread:
                 timeout_config=self._config.register_peer_forwarder_timeout_config,
                 behavior_config=register_peer_forwarder_behavior_config,
             )
-            self._peer_state[peer] = self._background_peer_state_factory.create(
-                my_connection_info=self._my_connection_info,
-                peer=peer,
-                out_control_socket=self.sockets.out_control,
-                socket_factory=self._socket_factory,
-                clock=self._clock,
-                send_socket_linger_time_in_ms=self._config.send_socket_linger_time_in_ms,
-                connection_establisher_timeout_config=self._config.connection_establisher_timeout_config,
-                connection_closer_timeout_config=self._config.connection_closer_timeout_config,
-                register_peer_forwarder_builder_parameter=parameter,
-                payload_message_sender_timeout_config=self._config.payload_message_sender_timeout_config,
-            )
+            with self._timer_scheduler.owned_by(peer):
+                self._peer_state[peer] = self._background_peer_state_factory.create(
+                    my_connection_info=self._my_connection_info,
+                    peer=peer,
+                    out_control_socket=self.sockets.out_control,
+                    socket_factory=self._socket_factory,
+                    clock=self._clock,
+                    send_socket_linger_time_in_ms=self._config.send_socket_linger_time_in_ms,
+                    connection_establisher_timeout_config=self._config.connection_establisher_timeout_config,
+                    connection_closer_timeout_config=self._config.connection_closer_timeout_config,
+                    register_peer_forwarder_builder_parameter=parameter,
+                    payload_message_sender_timeout_config=self._config.payload_message_sender_timeout_config,
+                    peer_metrics=self._metrics.get_peer_metrics(peer),
+                    transport_config=self._config.transport_config,
+                )
 
     def _handle_listener_message(self, frames: list[Frame]):
         logger = self._logger.bind(sender_queue_id=frames[0].to_bytes())
@@ -433,12 +510,14 @@ class BackgroundListenerThread:
             my_connection_info=self._my_connection_info,
             peer=message.peer,
             socket_factory=self._socket_factory,
+            transport_config=self._config.transport_config,
         )
         if message.source is not None:
             predecessor_send_socket_factory = SendSocketFactory(
                 my_connection_info=self._my_connection_info,
                 peer=message.source,
                 socket_factory=self._socket_factory,
+                transport_config=self._config.transport_config,
             )
         else:
             predecessor_send_socket_factory = None
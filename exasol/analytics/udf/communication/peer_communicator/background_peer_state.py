@@ -86,6 +86,9 @@ class BackgroundPeerState:
     def received_acknowledge_payload(self, message: messages.AcknowledgePayload):
         self._payload_handler.received_acknowledge_payload(message=message)
 
+    def consumed_payload(self, size_in_bytes: int):
+        self._payload_handler.consumed_payload(size_in_bytes)
+
     def prepare_to_stop(self):
         self._logger.info("prepare_to_stop")
         self._prepare_to_stop = True
@@ -116,3 +119,7 @@ class BackgroundPeerState:
 
     def received_acknowledge_close_connection(self):
         self._connection_closer.received_acknowledge_close_connection()
+
+    def close(self):
+        self._logger.info("close")
+        self._connection_closer.close()
@@ -19,6 +19,7 @@ from exasol.analytics.udf.communication.peer_communicator.connection_establisher
 from exasol.analytics.udf.communication.peer_communicator.connection_establisher_timeout_config import (
     ConnectionEstablisherTimeoutConfig,
 )
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.payload_handler_builder import (
     PayloadHandlerBuilder,
 )
@@ -32,6 +33,9 @@ from exasol.analytics.udf.communication.peer_communicator.register_peer_forwarde
     RegisterPeerForwarderBuilderParameter,
 )
 from exasol.analytics.udf.communication.peer_communicator.sender import SenderFactory
+from exasol.analytics.udf.communication.peer_communicator.transport_config import (
+    TransportConfig,
+)
 from exasol.analytics.udf.communication.socket_factory.abstract import (
     Socket,
     SocketFactory,
@@ -68,12 +72,15 @@ class BackgroundPeerStateBuilder:
         connection_establisher_timeout_config: ConnectionEstablisherTimeoutConfig,
         connection_closer_timeout_config: ConnectionCloserTimeoutConfig,
         payload_message_sender_timeout_config: PayloadMessageSenderTimeoutConfig,
+        peer_metrics: PeerMetrics,
+        transport_config: TransportConfig = TransportConfig(),
     ) -> BackgroundPeerState:
         sender = self._sender_factory.create(
             my_connection_info=my_connection_info,
             socket_factory=socket_factory,
             peer=peer,
             send_socket_linger_time_in_ms=send_socket_linger_time_in_ms,
+            transport_config=transport_config,
         )
         connection_establisher = self._connection_establisher_builder.create(
             peer=peer,
@@ -82,6 +89,7 @@ class BackgroundPeerStateBuilder:
             clock=clock,
             sender=sender,
             timeout_config=connection_establisher_timeout_config,
+            peer_metrics=peer_metrics,
         )
         connection_closer = self._connection_closer_builder.create(
             peer=peer,
@@ -107,6 +115,7 @@ class BackgroundPeerStateBuilder:
             payload_message_sender_timeout_config=payload_message_sender_timeout_config,
             sender=sender,
             clock=clock,
+            peer_metrics=peer_metrics,
         )
         peer_state = self._background_peer_state_factory.create(
             my_connection_info=my_connection_info,
@@ -55,6 +55,10 @@ class ConnectionCloser:
         self._connection_is_closed_sender.received_acknowledge_close_connection()
         self._close_connection_sender.stop()
 
+    def close(self):
+        self._logger.debug("close")
+        self._sender.close()
+
     def try_send(self):
         self._close_connection_sender.try_send()
         self._connection_is_closed_sender.try_send()
@@ -8,9 +8,11 @@ from exasol.analytics.udf.communication.peer import Peer
 from exasol.analytics.udf.communication.peer_communicator.abort_timeout_sender import (
     AbortTimeoutSender,
 )
+from exasol.analytics.udf.communication.peer_communicator.clock import Clock
 from exasol.analytics.udf.communication.peer_communicator.connection_is_ready_sender import (
     ConnectionIsReadySender,
 )
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.sender import Sender
 from exasol.analytics.udf.communication.peer_communicator.synchronize_connection_sender import (
     SynchronizeConnectionSender,
@@ -28,6 +30,8 @@ class ConnectionEstablisher:
         abort_timeout_sender: AbortTimeoutSender,
         connection_is_ready_sender: ConnectionIsReadySender,
         synchronize_connection_sender: SynchronizeConnectionSender,
+        clock: Clock,
+        peer_metrics: PeerMetrics,
     ):
         self._synchronize_connection_sender = synchronize_connection_sender
         self._connection_is_ready_sender = connection_is_ready_sender
@@ -35,6 +39,9 @@ class ConnectionEstablisher:
         self._my_connection_info = my_connection_info
         self._peer = peer
         self._sender = sender
+        self._clock = clock
+        self._peer_metrics = peer_metrics
+        self._start_timestamp_in_ms = clock.current_timestamp_in_ms()
         self._logger = LOGGER.bind(
             peer=self._peer.model_dump(),
             my_connection_info=self._my_connection_info.model_dump(),
@@ -66,6 +73,16 @@ class ConnectionEstablisher:
         self._synchronize_connection_sender.try_send()
         self._abort_timeout_sender.try_send()
         self._connection_is_ready_sender.try_send()
+        self._record_handshake_duration()
+
+    def _record_handshake_duration(self):
+        if (
+            self._peer_metrics.handshake_duration_in_ms is None
+            and self._connection_is_ready_sender.is_ready_to_stop()
+        ):
+            self._peer_metrics.handshake_duration_in_ms = (
+                self._clock.current_timestamp_in_ms() - self._start_timestamp_in_ms
+            )
 
     def is_ready_to_stop(self):
         return self._connection_is_ready_sender.is_ready_to_stop()
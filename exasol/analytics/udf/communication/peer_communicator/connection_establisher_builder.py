@@ -16,6 +16,7 @@ from exasol.analytics.udf.communication.peer_communicator.connection_establisher
 from exasol.analytics.udf.communication.peer_communicator.connection_is_ready_sender import (
     ConnectionIsReadySenderFactory,
 )
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.sender import Sender
 from exasol.analytics.udf.communication.peer_communicator.synchronize_connection_sender import (
     SynchronizeConnectionSenderFactory,
@@ -50,6 +51,7 @@ class ConnectionEstablisherBuilder:
         clock: Clock,
         sender: Sender,
         timeout_config: ConnectionEstablisherTimeoutConfig,
+        peer_metrics: PeerMetrics,
     ) -> ConnectionEstablisher:
         synchronize_connection_sender = self._create_synchronize_connection_sender(
             my_connection_info=my_connection_info,
@@ -79,6 +81,8 @@ class ConnectionEstablisherBuilder:
             abort_timeout_sender=abort_timeout_sender,
             connection_is_ready_sender=connection_is_ready_sender,
             synchronize_connection_sender=synchronize_connection_sender,
+            clock=clock,
+            peer_metrics=peer_metrics,
         )
 
     def _create_connection_is_ready_sender(
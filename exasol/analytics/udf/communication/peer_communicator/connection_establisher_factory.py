@@ -3,12 +3,14 @@ from exasol.analytics.udf.communication.peer import Peer
 from exasol.analytics.udf.communication.peer_communicator.abort_timeout_sender import (
     AbortTimeoutSender,
 )
+from exasol.analytics.udf.communication.peer_communicator.clock import Clock
 from exasol.analytics.udf.communication.peer_communicator.connection_establisher import (
     ConnectionEstablisher,
 )
 from exasol.analytics.udf.communication.peer_communicator.connection_is_ready_sender import (
     ConnectionIsReadySender,
 )
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.sender import Sender
 from exasol.analytics.udf.communication.peer_communicator.synchronize_connection_sender import (
     SynchronizeConnectionSender,
@@ -25,6 +27,8 @@ class ConnectionEstablisherFactory:
         abort_timeout_sender: AbortTimeoutSender,
         connection_is_ready_sender: ConnectionIsReadySender,
         synchronize_connection_sender: SynchronizeConnectionSender,
+        clock: Clock,
+        peer_metrics: PeerMetrics,
     ) -> ConnectionEstablisher:
         return ConnectionEstablisher(
             peer=peer,
@@ -33,4 +37,6 @@ class ConnectionEstablisherFactory:
             abort_timeout_sender=abort_timeout_sender,
             connection_is_ready_sender=connection_is_ready_sender,
             synchronize_connection_sender=synchronize_connection_sender,
+            clock=clock,
+            peer_metrics=peer_metrics,
         )
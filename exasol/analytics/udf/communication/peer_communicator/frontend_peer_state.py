@@ -12,6 +12,18 @@ from exasol.analytics.udf.communication.peer import Peer
 from exasol.analytics.udf.communication.peer_communicator.background_listener_interface import (
     BackgroundListenerInterface,
 )
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
+from exasol.analytics.udf.communication.peer_communicator.payload_compression import (
+    CompressedPayload,
+    compress_payload,
+    decompress_payload,
+)
+from exasol.analytics.udf.communication.peer_communicator.payload_compression_config import (
+    PayloadCompressionConfig,
+)
+from exasol.analytics.udf.communication.peer_communicator.payload_flow_control_config import (
+    PayloadFlowControlConfig,
+)
 from exasol.analytics.udf.communication.socket_factory.abstract import (
     Frame,
     SocketFactory,
@@ -20,7 +32,24 @@ from exasol.analytics.udf.communication.socket_factory.abstract import (
 LOGGER: FilteringBoundLogger = structlog.getLogger()
 
 
+def _compute_payload_size_in_bytes(payload: list[Frame]) -> int:
+    return sum(frame.to_memoryview().nbytes for frame in payload)
+
+
 class FrontendPeerState:
+    """
+    Frontend side of the connection to a peer. It bounds the payloads in flight,
+    which are sent but not yet received from the mailboxes of the peer, by the
+    PayloadFlowControlConfig. The peer grants the credit for further payloads
+    with its acknowledgements, only after its frontend received them, such that
+    a slow consumer throttles the sender and its mailboxes stay bounded.
+    Because the peer only buffers payloads out of order, which are in flight,
+    this bounds also its reorder buffer.
+
+    The received payloads get parked in a mailbox per tag, such that a receiver
+    of one tag skips the payloads of other tags. Receiving without a tag returns
+    the payload which arrived first.
+    """
 
     def __init__(
         self,
@@ -28,9 +57,15 @@ class FrontendPeerState:
         socket_factory: SocketFactory,
         background_listener: BackgroundListenerInterface,
         peer: Peer,
+        peer_metrics: PeerMetrics,
+        payload_flow_control_config: PayloadFlowControlConfig = PayloadFlowControlConfig(),
+        payload_compression_config: PayloadCompressionConfig = PayloadCompressionConfig(),
     ):
         self._connection_is_closed = False
-        self._received_messages: Deque[list[Frame]] = deque()
+        self._peer_metrics = peer_metrics
+        self._received_messages: dict[int, Deque[tuple[int, list[Frame], int]]] = {}
+        self._number_of_received_messages = 0
+        self._arrival_index = 0
         self._background_listener = background_listener
         self._my_connection_info = my_connection_info
         self._peer = peer
@@ -38,6 +73,12 @@ class FrontendPeerState:
         self._connection_is_ready = False
         self._peer_register_forwarder_is_ready = False
         self._sequence_number = 0
+        self._payload_flow_control_config = payload_flow_control_config
+        self._payload_compression_config = payload_compression_config
+        self._sent_messages = 0
+        self._sent_bytes = 0
+        self._consumed_messages = 0
+        self._consumed_bytes = 0
         self._logger = LOGGER.bind(
             peer=peer.model_dump(), my_connection_info=my_connection_info.model_dump()
         )
@@ -62,30 +103,93 @@ class FrontendPeerState:
                 f"Expected peer is {self._peer}, but got {message_obj.source}."
                 f"Message was: {message_obj}"
             )
-        self._received_messages.append(frames[1:])
+        size_in_bytes = _compute_payload_size_in_bytes(frames[1:])
+        payload = decompress_payload(
+            frames[1:],
+            message_obj.compressed_frame_indices,
+            self._payload_compression_config,
+            self._socket_factory,
+        )
+        mailbox = self._received_messages.setdefault(message_obj.tag, deque())
+        mailbox.append((self._arrival_index, payload, size_in_bytes))
+        self._arrival_index += 1
+        self._number_of_received_messages += 1
+        self._peer_metrics.received_queue_messages = self._number_of_received_messages
 
     @property
     def peer_is_ready(self) -> bool:
         return self._connection_is_ready and self._peer_register_forwarder_is_ready
 
-    def send(self, payload: list[Frame]):
+    def compress(self, payload: list[Frame]) -> CompressedPayload:
+        """
+        Compresses the payload for can_send and send, such that the flow control
+        checks and accounts the bytes which actually get sent.
+        """
+        frames, compressed_frame_indices = compress_payload(
+            payload, self._payload_compression_config, self._socket_factory
+        )
+        return CompressedPayload(
+            frames=frames,
+            compressed_frame_indices=compressed_frame_indices,
+            size_in_bytes=_compute_payload_size_in_bytes(frames),
+        )
+
+    def can_send(self, payload: CompressedPayload) -> bool:
+        if self.in_flight_messages == 0:
+            return True
+        config = self._payload_flow_control_config
+        return (
+            self.in_flight_messages < config.max_in_flight_messages
+            and self.in_flight_bytes + payload.size_in_bytes
+            <= config.max_in_flight_bytes
+        )
+
+    @property
+    def in_flight_messages(self) -> int:
+        return self._sent_messages - self._consumed_messages
+
+    @property
+    def in_flight_bytes(self) -> int:
+        return self._sent_bytes - self._consumed_bytes
+
+    def send(self, payload: CompressedPayload, tag: int = 0):
         message = messages.Payload(
             source=Peer(connection_info=self._my_connection_info),
             destination=self._peer,
             sequence_number=self._next_sequence_number(),
+            compressed_frame_indices=payload.compressed_frame_indices,
+            tag=tag,
         )
         self._logger.debug("send", message=message.model_dump())
-        self._background_listener.send_payload(message=message, payload=payload)
+        self._sent_messages += 1
+        self._sent_bytes += payload.size_in_bytes
+        self._update_in_flight_metrics()
+        self._background_listener.send_payload(message=message, payload=payload.frames)
         return message.sequence_number
 
-    def has_received_messages(self) -> bool:
-        return len(self._received_messages) > 0
+    def has_received_messages(self, tag: int | None = None) -> bool:
+        if tag is None:
+            return self._number_of_received_messages > 0
+        return tag in self._received_messages
 
-    def recv(self) -> list[Frame]:
-        if len(self._received_messages) > 0:
-            return self._received_messages.pop()
-        else:
+    def recv(self, tag: int | None = None) -> list[Frame]:
+        if not self.has_received_messages(tag):
             raise RuntimeError("No messages to receive.")
+        if tag is None:
+            tag = min(
+                self._received_messages,
+                key=lambda tag: self._received_messages[tag][0][0],
+            )
+        mailbox = self._received_messages[tag]
+        _, payload, size_in_bytes = mailbox.popleft()
+        if len(mailbox) == 0:
+            del self._received_messages[tag]
+        self._number_of_received_messages -= 1
+        self._peer_metrics.received_queue_messages = self._number_of_received_messages
+        self._background_listener.consumed_payload(
+            peer=self._peer, size_in_bytes=size_in_bytes
+        )
+        return payload
 
     def received_connection_is_closed(self):
         self._connection_is_closed = True
@@ -97,4 +201,18 @@ class FrontendPeerState:
     def received_acknowledge_payload_message(
         self, acknowledge_payload: messages.AcknowledgePayload
     ):
-        """Not yet implemented and for that reason we ignore the input"""
+        """
+        The acknowledgements carry the totals of the consumed payloads, so older
+        acknowledgements, which arrive late, don't shrink them.
+        """
+        self._consumed_messages = max(
+            self._consumed_messages, acknowledge_payload.consumed_messages
+        )
+        self._consumed_bytes = max(
+            self._consumed_bytes, acknowledge_payload.consumed_bytes
+        )
+        self._update_in_flight_metrics()
+
+    def _update_in_flight_metrics(self):
+        self._peer_metrics.in_flight_messages = self.in_flight_messages
+        self._peer_metrics.in_flight_bytes = self.in_flight_bytes
@@ -0,0 +1,145 @@
+import dataclasses
+import threading
+
+from exasol.analytics.udf.communication.peer import Peer
+
+NUMBER_OF_LATENCY_BUCKETS = 20
+
+
+@dataclasses.dataclass(frozen=True)
+class LatencyHistogramSnapshot:
+    bucket_counts: tuple[int, ...]
+    """
+    Bucket 0 counts the latencies of 0 ms and
+    bucket i > 0 the ones from 2**(i-1) ms up to 2**i - 1 ms.
+    The last bucket counts also all larger latencies.
+    """
+    count: int
+    sum_in_ms: int
+    max_in_ms: int
+
+    @property
+    def mean_in_ms(self) -> float:
+        return self.sum_in_ms / self.count if self.count > 0 else 0.0
+
+
+class LatencyHistogram:
+    """
+    Histogram with exponentially growing buckets, such that recording a latency
+    is cheap enough for the BackgroundListenerThread.
+    """
+
+    def __init__(self):
+        self._bucket_counts = [0] * NUMBER_OF_LATENCY_BUCKETS
+        self._count = 0
+        self._sum_in_ms = 0
+        self._max_in_ms = 0
+
+    def record(self, latency_in_ms: int):
+        latency_in_ms = max(latency_in_ms, 0)
+        bucket = min(latency_in_ms.bit_length(), NUMBER_OF_LATENCY_BUCKETS - 1)
+        self._bucket_counts[bucket] += 1
+        self._count += 1
+        self._sum_in_ms += latency_in_ms
+        self._max_in_ms = max(self._max_in_ms, latency_in_ms)
+
+    def snapshot(self) -> LatencyHistogramSnapshot:
+        return LatencyHistogramSnapshot(
+            bucket_counts=tuple(self._bucket_counts),
+            count=self._count,
+            sum_in_ms=self._sum_in_ms,
+            max_in_ms=self._max_in_ms,
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class PeerMetricsSnapshot:
+    payloads_sent: int
+    bytes_sent: int
+    payload_retransmissions: int
+    payloads_received: int
+    bytes_received: int
+    round_trip_time: LatencyHistogramSnapshot
+    """
+    Estimated round trip time of the payloads, the time from sending a payload
+    until its acknowledgement arrived minus the delay of the acknowledgements,
+    see PayloadMessageSenderTimeoutConfig.acknowledge_delay_in_ms, assuming the
+    peer uses the same delay. The time until a retransmitted payload arrived
+    counts in. A cumulative acknowledgement also covers the payloads, which
+    arrived during the delay, so their round trip time gets underestimated,
+    down to 0 ms.
+    """
+    in_flight_messages: int
+    in_flight_bytes: int
+    reorder_buffer_messages: int
+    reorder_buffer_bytes: int
+    received_queue_messages: int
+    handshake_duration_in_ms: int | None
+    """
+    Time from the first SynchronizeConnection until the connection was ready.
+    """
+
+
+class PeerMetrics:
+    """
+    Counters, gauges and histograms of the communication with a peer.
+    Each attribute gets updated by a single thread, either the
+    BackgroundListenerThread or the frontend, with plain assignments,
+    so updating them needs no lock. A snapshot may be slightly
+    inconsistent between the attributes.
+    """
+
+    def __init__(self):
+        # Updated by the BackgroundListenerThread
+        self.payloads_sent = 0
+        self.bytes_sent = 0
+        self.payload_retransmissions = 0
+        self.payloads_received = 0
+        self.bytes_received = 0
+        self.round_trip_time = LatencyHistogram()
+        self.reorder_buffer_messages = 0
+        self.reorder_buffer_bytes = 0
+        self.handshake_duration_in_ms: int | None = None
+        # Updated by the frontend
+        self.in_flight_messages = 0
+        self.in_flight_bytes = 0
+        self.received_queue_messages = 0
+
+    def snapshot(self) -> PeerMetricsSnapshot:
+        return PeerMetricsSnapshot(
+            payloads_sent=self.payloads_sent,
+            bytes_sent=self.bytes_sent,
+            payload_retransmissions=self.payload_retransmissions,
+            payloads_received=self.payloads_received,
+            bytes_received=self.bytes_received,
+            round_trip_time=self.round_trip_time.snapshot(),
+            in_flight_messages=self.in_flight_messages,
+            in_flight_bytes=self.in_flight_bytes,
+            reorder_buffer_messages=self.reorder_buffer_messages,
+            reorder_buffer_bytes=self.reorder_buffer_bytes,
+            received_queue_messages=self.received_queue_messages,
+            handshake_duration_in_ms=self.handshake_duration_in_ms,
+        )
+
+
+class PeerCommunicatorMetrics:
+    """
+    Metrics of all peers of a PeerCommunicator, shared between the frontend
+    and the BackgroundListenerThread. Only adding a peer takes a lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._peer_metrics: dict[Peer, PeerMetrics] = {}
+
+    def get_peer_metrics(self, peer: Peer) -> PeerMetrics:
+        peer_metrics = self._peer_metrics.get(peer)
+        if peer_metrics is None:
+            with self._lock:
+                peer_metrics = self._peer_metrics.setdefault(peer, PeerMetrics())
+        return peer_metrics
+
+    def snapshot(self) -> dict[Peer, PeerMetricsSnapshot]:
+        with self._lock:
+            peer_metrics = dict(self._peer_metrics)
+        return {peer: metrics.snapshot() for peer, metrics in peer_metrics.items()}
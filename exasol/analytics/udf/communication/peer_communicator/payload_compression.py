@@ -0,0 +1,78 @@
+import dataclasses
+import zlib
+
+from exasol.analytics.udf.communication.peer_communicator.payload_compression_config import (
+    PayloadCompressionConfig,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import (
+    Frame,
+    SocketFactory,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class CompressedPayload:
+    """
+    Payload as it gets sent. The flow control accounts it by its size in bytes.
+    """
+
+    frames: list[Frame]
+    compressed_frame_indices: list[int]
+    size_in_bytes: int
+
+
+def compress_payload(
+    payload: list[Frame],
+    config: PayloadCompressionConfig,
+    socket_factory: SocketFactory,
+) -> tuple[list[Frame], list[int]]:
+    """
+    Compresses the frames of the payload, which reach the threshold of the config
+    and get actually smaller. Returns the resulting frames and the indices of
+    the compressed frames, which the receiver needs for the decompression.
+    """
+    if config.threshold_in_bytes is None:
+        return payload, []
+    result: list[Frame] = []
+    compressed_frame_indices: list[int] = []
+    for index, frame in enumerate(payload):
+        value = frame.to_memoryview()
+        if value.nbytes >= config.threshold_in_bytes:
+            compressed_value = zlib.compress(value, config.level)
+            if len(compressed_value) < value.nbytes:
+                result.append(socket_factory.create_frame(compressed_value))
+                compressed_frame_indices.append(index)
+                continue
+        result.append(frame)
+    return result, compressed_frame_indices
+
+
+def decompress_payload(
+    payload: list[Frame],
+    compressed_frame_indices: list[int],
+    config: PayloadCompressionConfig,
+    socket_factory: SocketFactory,
+) -> list[Frame]:
+    """
+    Decompresses the frames at the compressed_frame_indices. It raises a
+    RuntimeError for frames, which decompress to more than the maximum frame
+    size of the config, without decompressing them completely.
+    """
+    if len(compressed_frame_indices) == 0:
+        return payload
+    max_size_in_bytes = config.max_decompressed_frame_size_in_bytes
+    result = list(payload)
+    for index in compressed_frame_indices:
+        decompressor = zlib.decompressobj()
+        value = decompressor.decompress(
+            payload[index].to_memoryview(), max_size_in_bytes + 1
+        )
+        if len(value) > max_size_in_bytes:
+            raise RuntimeError(
+                f"Compressed frame {index} exceeds the maximum decompressed size "
+                f"of {max_size_in_bytes} bytes."
+            )
+        if not decompressor.eof:
+            raise RuntimeError(f"Compressed frame {index} is incomplete.")
+        result[index] = socket_factory.create_frame(value)
+    return result
@@ -0,0 +1,19 @@
+import dataclasses
+
+
+@dataclasses.dataclass(frozen=True)
+class PayloadCompressionConfig:
+    threshold_in_bytes: int | None = None
+    """
+    If set, the frames of a payload with at least this size get compressed with zlib.
+    The receiver decompresses them independent of its own configuration.
+    """
+    level: int = 1
+    """
+    zlib compression level, lower levels are faster, higher levels compress better.
+    """
+    max_decompressed_frame_size_in_bytes: int = 1024 * 1024 * 1024
+    """
+    Maximum size of a received frame after its decompression. The receiver
+    rejects larger frames, instead of allocating the memory for them.
+    """
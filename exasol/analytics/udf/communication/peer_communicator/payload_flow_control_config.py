@@ -0,0 +1,17 @@
+import dataclasses
+
+
+@dataclasses.dataclass(frozen=True)
+class PayloadFlowControlConfig:
+    max_in_flight_messages: int = 1000
+    """
+    Maximum number of payloads per peer, which the frontend of the peer didn't
+    receive yet. Further sends block or get rejected, until the peer received
+    some of them, such that a slow receiver throttles the sender.
+    """
+    max_in_flight_bytes: int = 256 * 1024 * 1024
+    """
+    Maximum number of bytes of the payloads per peer, which the frontend of the
+    peer didn't receive yet.
+    A single payload larger than this is still sent, if no other payload is in flight.
+    """
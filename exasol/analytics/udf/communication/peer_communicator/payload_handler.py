@@ -24,8 +24,12 @@ class PayloadHandler:
     def received_payload(self, message: messages.Payload, frames: list[Frame]):
         self._payload_receiver.received_payload(message, frames)
 
+    def consumed_payload(self, size_in_bytes: int):
+        self._payload_receiver.consumed_payload(size_in_bytes)
+
     def try_send(self):
         self._payload_sender.try_send()
+        self._payload_receiver.try_send()
 
     def is_ready_to_stop(self) -> bool:
         sender_is_ready_to_stop = self._payload_sender.is_ready_to_stop()
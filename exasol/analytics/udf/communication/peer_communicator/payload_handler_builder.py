@@ -1,6 +1,7 @@
 from exasol.analytics.udf.communication.connection_info import ConnectionInfo
 from exasol.analytics.udf.communication.peer import Peer
 from exasol.analytics.udf.communication.peer_communicator.clock import Clock
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.payload_handler import (
     PayloadHandler,
 )
@@ -27,7 +28,7 @@ class PayloadHandlerBuilder:
     def __init__(
         self,
         payload_sender_factory: PayloadSenderFactory,
-        payload_receiver_factory: PayloadReceiverFactory = PayloadReceiverFactory(),
+        payload_receiver_factory: PayloadReceiverFactory,
         payload_handler_factory: PayloadHandlerFactory = PayloadHandlerFactory(),
     ):
         self._payload_handler_factory = payload_handler_factory
@@ -43,6 +44,7 @@ class PayloadHandlerBuilder:
         sender: Sender,
         clock: Clock,
         payload_message_sender_timeout_config: PayloadMessageSenderTimeoutConfig,
+        peer_metrics: PeerMetrics,
     ) -> PayloadHandler:
         payload_sender = self._payload_sender_factory.create(
             my_connection_info=my_connection_info,
@@ -51,12 +53,16 @@ class PayloadHandlerBuilder:
             out_control_socket=out_control_socket,
             clock=clock,
             payload_message_sender_timeout_config=payload_message_sender_timeout_config,
+            peer_metrics=peer_metrics,
         )
         payload_receiver = self._payload_receiver_factory.create(
             my_connection_info=my_connection_info,
             peer=peer,
             sender=sender,
             out_control_socket=out_control_socket,
+            clock=clock,
+            payload_message_sender_timeout_config=payload_message_sender_timeout_config,
+            peer_metrics=peer_metrics,
         )
         payload_handler = self._payload_handler_factory.create(
             payload_sender=payload_sender,
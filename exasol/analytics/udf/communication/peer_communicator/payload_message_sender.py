@@ -2,6 +2,7 @@ import structlog
 from structlog.typing import FilteringBoundLogger
 
 from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.sender import Sender
 from exasol.analytics.udf.communication.peer_communicator.timer import Timer
 from exasol.analytics.udf.communication.serialization import serialize_message
@@ -22,8 +23,10 @@ class PayloadMessageSender:
         abort_timer: Timer,
         sender: Sender,
         out_control_socket: Socket,
+        peer_metrics: PeerMetrics,
     ):
         self._logger = LOGGER.bind(message=message)
+        self._peer_metrics = peer_metrics
         self._abort_timer = abort_timer
         self._out_control_socket = out_control_socket
         self._sender = sender
@@ -40,6 +43,7 @@ class PayloadMessageSender:
             self._logger.debug("send", send_attempt_count=self._send_attempt_count)
         else:
             self._logger.warning("resend", send_attempt_count=self._send_attempt_count)
+            self._peer_metrics.payload_retransmissions += 1
 
         self._sender.send_multipart(self._frames)
 
@@ -1,5 +1,6 @@
 from exasol.analytics.udf.communication.messages import Payload
 from exasol.analytics.udf.communication.peer_communicator.clock import Clock
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.payload_message_sender import (
     PayloadMessageSender,
 )
@@ -26,6 +27,7 @@ class PayloadMessageSenderFactory:
         frames: list[Frame],
         payload_message_sender_timeout_config: PayloadMessageSenderTimeoutConfig,
         out_control_socket: Socket,
+        peer_metrics: PeerMetrics,
     ) -> PayloadMessageSender:
         retry_timer = self._timer_factory.create(
             clock, payload_message_sender_timeout_config.retry_timeout_in_ms
@@ -40,4 +42,5 @@ class PayloadMessageSenderFactory:
             abort_timer=abort_timer,
             sender=sender,
             out_control_socket=out_control_socket,
+            peer_metrics=peer_metrics,
         )
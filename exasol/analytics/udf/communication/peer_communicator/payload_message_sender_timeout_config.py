@@ -5,3 +5,4 @@ import dataclasses
 class PayloadMessageSenderTimeoutConfig:
     abort_timeout_in_ms: int = 10000
     retry_timeout_in_ms: int = 200
+    acknowledge_delay_in_ms: int = 20
@@ -4,7 +4,9 @@ from structlog.typing import FilteringBoundLogger
 from exasol.analytics.udf.communication import messages
 from exasol.analytics.udf.communication.connection_info import ConnectionInfo
 from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.sender import Sender
+from exasol.analytics.udf.communication.peer_communicator.timer import Timer
 from exasol.analytics.udf.communication.socket_factory.abstract import (
     Frame,
     Socket,
@@ -13,15 +15,35 @@ from exasol.analytics.udf.communication.socket_factory.abstract import (
 LOGGER: FilteringBoundLogger = structlog.get_logger()
 
 
+def _compute_frames_size_in_bytes(frames: list[Frame]) -> int:
+    return sum(frame.to_memoryview().nbytes for frame in frames)
+
+
 class PayloadReceiver:
+    """
+    Forwards the received payloads in order of their sequence numbers to the frontend.
+    The payloads get acknowledged cumulatively, an AcknowledgePayload with sequence
+    number N acknowledges all payloads up to N. The acknowledgement gets delayed
+    by the acknowledge_timer, such that a stream of payloads needs only a few of them.
+
+    The acknowledgements also carry the totals of the payloads, which the frontend
+    received from its mailboxes. Only these free the flow control window of the peer,
+    such that a slow consumer throttles the peer.
+    """
+
     def __init__(
         self,
         peer: Peer,
         my_connection_info: ConnectionInfo,
         out_control_socket: Socket,
         sender: Sender,
+        acknowledge_timer: Timer,
+        peer_metrics: PeerMetrics,
     ):
         self._peer = peer
+        self._peer_metrics = peer_metrics
+        self._acknowledge_timer = acknowledge_timer
+        self._is_acknowledge_pending = False
         self._my_connection_info = my_connection_info
         self._out_control_socket = out_control_socket
         self._sender = sender
@@ -31,21 +53,47 @@ class PayloadReceiver:
         )
         self._next_received_payload_sequence_number = 0
         self._received_payload_dict: dict[int, list[Frame]] = {}
+        self._reorder_buffer_size_in_bytes = 0
+        self._consumed_messages = 0
+        self._consumed_bytes = 0
 
     def received_payload(self, message: messages.Payload, frames: list[Frame]):
         self._logger.info("received_payload", message=message.model_dump())
-        self._send_acknowledge_payload_message(message.sequence_number)
         if message.sequence_number == self._next_received_payload_sequence_number:
             self._forward_new_message_directly(message, frames)
             self._forward_messages_from_buffer()
         elif message.sequence_number > self._next_received_payload_sequence_number:
             self._add_new_message_to_buffer(message, frames)
+        self._schedule_acknowledge_payload_message()
+
+    def consumed_payload(self, size_in_bytes: int):
+        self._consumed_messages += 1
+        self._consumed_bytes += size_in_bytes
+        self._schedule_acknowledge_payload_message()
+
+    def try_send(self):
+        if self._is_acknowledge_pending and self._acknowledge_timer.is_time():
+            self._send_acknowledge_payload_message()
+
+    def _schedule_acknowledge_payload_message(self):
+        if not self._is_acknowledge_pending:
+            self._is_acknowledge_pending = True
+            self._acknowledge_timer.reset_timer()
 
     def _add_new_message_to_buffer(
         self, message: messages.Payload, frames: list[Frame]
     ):
-        self._logger.info("put_to_buffer", message=message.model_dump())
+        if message.sequence_number in self._received_payload_dict:
+            return
         self._received_payload_dict[message.sequence_number] = frames
+        self._reorder_buffer_size_in_bytes += _compute_frames_size_in_bytes(frames)
+        self._update_reorder_buffer_metrics()
+        self._logger.info(
+            "put_to_buffer",
+            message=message.model_dump(),
+            reorder_buffer_messages=self.reorder_buffer_messages,
+            reorder_buffer_size_in_bytes=self.reorder_buffer_size_in_bytes,
+        )
 
     def _forward_new_message_directly(
         self, message: messages.Payload, frames: list[Frame]
@@ -65,13 +113,22 @@ class PayloadReceiver:
             next_frames = self._received_payload_dict.pop(
                 self._next_received_payload_sequence_number
             )
+            self._reorder_buffer_size_in_bytes -= _compute_frames_size_in_bytes(
+                next_frames
+            )
+            self._update_reorder_buffer_metrics()
             self._forward_received_payload(next_frames)
 
-    def _send_acknowledge_payload_message(self, sequence_number: int):
+    def _send_acknowledge_payload_message(self):
+        self._is_acknowledge_pending = False
+        if self._next_received_payload_sequence_number == 0:
+            return
         acknowledge_payload_message = messages.AcknowledgePayload(
             source=Peer(connection_info=self._my_connection_info),
-            sequence_number=sequence_number,
+            sequence_number=self._next_received_payload_sequence_number - 1,
             destination=self._peer,
+            consumed_messages=self._consumed_messages,
+            consumed_bytes=self._consumed_bytes,
         )
         self._logger.info(
             "_send_acknowledge_payload_message",
@@ -82,8 +139,25 @@ class PayloadReceiver:
     def _forward_received_payload(self, frames: list[Frame]):
         self._out_control_socket.send_multipart(frames)
         self._next_received_payload_sequence_number += 1
+        self._peer_metrics.payloads_received += 1
+        self._peer_metrics.bytes_received += _compute_frames_size_in_bytes(frames)
+
+    def _update_reorder_buffer_metrics(self):
+        self._peer_metrics.reorder_buffer_messages = self.reorder_buffer_messages
+        self._peer_metrics.reorder_buffer_bytes = self._reorder_buffer_size_in_bytes
+
+    @property
+    def reorder_buffer_messages(self) -> int:
+        return len(self._received_payload_dict)
+
+    @property
+    def reorder_buffer_size_in_bytes(self) -> int:
+        """Bytes of the payloads, which arrived out of order and wait for their predecessors."""
+        return self._reorder_buffer_size_in_bytes
 
     def is_ready_to_stop(self) -> bool:
-        is_ready = len(self._received_payload_dict) == 0
+        is_ready = (
+            len(self._received_payload_dict) == 0 and not self._is_acknowledge_pending
+        )
         self._logger.debug("payload_receiver_is_ready", is_ready=is_ready)
         return is_ready
@@ -3,26 +3,43 @@ from structlog.typing import FilteringBoundLogger
 
 from exasol.analytics.udf.communication.connection_info import ConnectionInfo
 from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator.clock import Clock
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
+from exasol.analytics.udf.communication.peer_communicator.payload_message_sender_timeout_config import (
+    PayloadMessageSenderTimeoutConfig,
+)
 from exasol.analytics.udf.communication.peer_communicator.payload_receiver import (
     PayloadReceiver,
 )
 from exasol.analytics.udf.communication.peer_communicator.sender import Sender
+from exasol.analytics.udf.communication.peer_communicator.timer import TimerFactory
 from exasol.analytics.udf.communication.socket_factory.abstract import Socket
 
 LOGGER: FilteringBoundLogger = structlog.get_logger()
 
 
 class PayloadReceiverFactory:
+    def __init__(self, timer_factory: TimerFactory):
+        self._timer_factory = timer_factory
+
     def create(
         self,
         peer: Peer,
         my_connection_info: ConnectionInfo,
         sender: Sender,
         out_control_socket: Socket,
+        clock: Clock,
+        payload_message_sender_timeout_config: PayloadMessageSenderTimeoutConfig,
+        peer_metrics: PeerMetrics,
     ) -> PayloadReceiver:
+        acknowledge_timer = self._timer_factory.create(
+            clock, payload_message_sender_timeout_config.acknowledge_delay_in_ms
+        )
         return PayloadReceiver(
             peer=peer,
             my_connection_info=my_connection_info,
             sender=sender,
             out_control_socket=out_control_socket,
+            acknowledge_timer=acknowledge_timer,
+            peer_metrics=peer_metrics,
         )
@@ -7,6 +7,7 @@ from exasol.analytics.udf.communication import messages
 from exasol.analytics.udf.communication.connection_info import ConnectionInfo
 from exasol.analytics.udf.communication.peer import Peer
 from exasol.analytics.udf.communication.peer_communicator.clock import Clock
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.payload_message_sender import (
     PayloadMessageSender,
 )
@@ -36,7 +37,9 @@ class PayloadSender:
         out_control_socket: Socket,
         payload_message_sender_timeout_config: PayloadMessageSenderTimeoutConfig,
         payload_message_sender_factory: PayloadMessageSenderFactory,
+        peer_metrics: PeerMetrics,
     ):
+        self._peer_metrics = peer_metrics
         self._out_control_socket = out_control_socket
         self._payload_message_sender_timeout_config = (
             payload_message_sender_timeout_config
@@ -54,22 +57,59 @@ class PayloadSender:
         self._payload_message_sender_dict: dict[int, PayloadMessageSender] = (
             OrderedDict()
         )
+        self._send_timestamps_in_ms: dict[int, int] = {}
+        self._consumed_messages = 0
 
     def try_send(self):
         for payload_sender in self._payload_message_sender_dict.values():
             payload_sender.try_send()
 
     def received_acknowledge_payload(self, message: messages.AcknowledgePayload):
+        """
+        The acknowledgement is cumulative, it retires all payloads
+        up to its sequence number. It gets forwarded to the frontend,
+        if it retires payloads or the peer consumed further payloads.
+        """
         self._logger.info("received_acknowledge_payload", message=message.model_dump())
-        if message.sequence_number in self._payload_message_sender_dict:
-            self._payload_message_sender_dict[message.sequence_number].stop()
-            del self._payload_message_sender_dict[message.sequence_number]
+        acknowledged_sequence_numbers = [
+            sequence_number
+            for sequence_number in self._payload_message_sender_dict
+            if sequence_number <= message.sequence_number
+        ]
+        for sequence_number in acknowledged_sequence_numbers:
+            self._payload_message_sender_dict[sequence_number].stop()
+            del self._payload_message_sender_dict[sequence_number]
+        if len(acknowledged_sequence_numbers) > 0:
+            self._record_round_trip_time(acknowledged_sequence_numbers)
+        has_consumed_further = message.consumed_messages > self._consumed_messages
+        self._consumed_messages = max(
+            self._consumed_messages, message.consumed_messages
+        )
+        if len(acknowledged_sequence_numbers) > 0 or has_consumed_further:
             self._out_control_socket.send(
                 serialize_message(messages.Message(root=message))
             )
 
+    def _record_round_trip_time(self, acknowledged_sequence_numbers: list[int]):
+        current_timestamp_in_ms = self._clock.current_timestamp_in_ms()
+        acknowledge_delay_in_ms = (
+            self._payload_message_sender_timeout_config.acknowledge_delay_in_ms
+        )
+        for sequence_number in acknowledged_sequence_numbers:
+            send_timestamp_in_ms = self._send_timestamps_in_ms.pop(sequence_number)
+            self._peer_metrics.round_trip_time.record(
+                current_timestamp_in_ms - send_timestamp_in_ms - acknowledge_delay_in_ms
+            )
+
     def send_payload(self, message: messages.Payload, frames: list[Frame]):
         self._logger.info("send_payload", message=message.model_dump())
+        self._peer_metrics.payloads_sent += 1
+        self._peer_metrics.bytes_sent += sum(
+            frame.to_memoryview().nbytes for frame in frames
+        )
+        self._send_timestamps_in_ms[message.sequence_number] = (
+            self._clock.current_timestamp_in_ms()
+        )
         self._payload_message_sender_dict[message.sequence_number] = (
             self._payload_message_sender_factory.create(
                 message=message,
@@ -78,6 +118,7 @@ class PayloadSender:
                 out_control_socket=self._out_control_socket,
                 clock=self._clock,
                 payload_message_sender_timeout_config=self._payload_message_sender_timeout_config,
+                peer_metrics=self._peer_metrics,
             )
         )
 
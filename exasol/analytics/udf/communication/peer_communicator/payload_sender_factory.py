@@ -1,6 +1,7 @@
 from exasol.analytics.udf.communication.connection_info import ConnectionInfo
 from exasol.analytics.udf.communication.peer import Peer
 from exasol.analytics.udf.communication.peer_communicator.clock import Clock
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.payload_message_sender_factory import (
     PayloadMessageSenderFactory,
 )
@@ -27,6 +28,7 @@ class PayloadSenderFactory:
         clock: Clock,
         payload_message_sender_timeout_config: PayloadMessageSenderTimeoutConfig,
         out_control_socket: Socket,
+        peer_metrics: PeerMetrics,
     ) -> PayloadSender:
         return PayloadSender(
             my_connection_info=my_connection_info,
@@ -36,4 +38,5 @@ class PayloadSenderFactory:
             payload_message_sender_timeout_config=payload_message_sender_timeout_config,
             out_control_socket=out_control_socket,
             payload_message_sender_factory=self._payload_message_sender_factory,
+            peer_metrics=peer_metrics,
         )
@@ -7,7 +7,10 @@ from structlog.types import FilteringBoundLogger
 
 from exasol.analytics.udf.communication import messages
 from exasol.analytics.udf.communication.connection_info import ConnectionInfo
-from exasol.analytics.udf.communication.ip_address import IPAddress
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
 from exasol.analytics.udf.communication.peer import Peer
 from exasol.analytics.udf.communication.peer_communicator.background_listener_interface import (
     BackgroundListenerInterface,
@@ -19,6 +22,9 @@ from exasol.analytics.udf.communication.peer_communicator.forward_register_peer_
 from exasol.analytics.udf.communication.peer_communicator.frontend_peer_state import (
     FrontendPeerState,
 )
+from exasol.analytics.udf.communication.peer_communicator.metrics import (
+    PeerCommunicatorMetrics,
+)
 from exasol.analytics.udf.communication.peer_communicator.peer_communicator_config import (
     PeerCommunicatorConfig,
 )
@@ -59,8 +65,14 @@ class PeerCommunicator:
         config: PeerCommunicatorConfig = PeerCommunicatorConfig(),
         clock: Clock = Clock(),
         trace_logging: bool = False,
+        listen_port: Port | None = None,
     ):
+        """
+        If listen_port is None, the PeerCommunicator listens on a random port,
+        otherwise on the given one, such that the peers can know it up front.
+        """
         self._config = config
+        self._metrics = PeerCommunicatorMetrics()
         self._socket_factory = socket_factory
         self._name = name
         self._group_identifier = group_identifier
@@ -81,13 +93,18 @@ class PeerCommunicator:
             config=config,
             clock=clock,
             trace_logging=trace_logging,
+            metrics=self._metrics,
+            listen_port=listen_port,
         )
         self._my_connection_info = self._background_listener.my_connection_info
         self._logger = self._logger.bind(
             my_connection_info=self._my_connection_info.model_dump()
         )
         self._logger.info("my_connection_info")
+        self._peer = Peer(connection_info=self._my_connection_info)
         self._peer_states: dict[Peer, FrontendPeerState] = {}
+        self._sorted_peers: list[Peer] | None = None
+        self._rank_by_peer: dict[Peer, int] = {}
 
     def _handle_messages(self, timeout_in_milliseconds: int | None = 0):
         for message_obj, frames in self._background_listener.receive_messages(
@@ -127,11 +144,15 @@ class PeerCommunicator:
 
     def _add_peer_state(self, peer: Peer):
         if peer not in self._peer_states:
+            self._invalidate_sorted_peers()
             self._peer_states[peer] = FrontendPeerState(
                 my_connection_info=self.my_connection_info,
                 socket_factory=self._socket_factory,
                 peer=peer,
                 background_listener=self._background_listener,
+                peer_metrics=self._metrics.get_peer_metrics(peer),
+                payload_flow_control_config=self._config.payload_flow_control_config,
+                payload_compression_config=self._config.payload_compression_config,
             )
 
     def _wait_for_condition(
@@ -158,15 +179,58 @@ class PeerCommunicator:
             self._are_all_peers_connected, timeout_in_milliseconds
         )
 
+    def _wait_for_connections(self, peers: list[Peer]):
+        self._wait_for_condition(lambda: self._are_connected(peers))
+
+    def are_connected(self, peers: list[Peer]) -> bool:
+        """
+        Returns without waiting, whether the connections to the peers are ready
+        to send and receive. Without connect_lazily, all peers need to be connected.
+        """
+        self._handle_messages()
+        return self._are_connected(peers)
+
+    def is_connected(self, peer: Peer) -> bool:
+        """
+        Returns without waiting, whether the connection to this single peer
+        is ready to send and receive.
+        """
+        self._handle_messages()
+        return self._is_peer_ready(peer)
+
+    def _are_connected(self, peers: list[Peer]) -> bool:
+        if self._config.connect_lazily:
+            return all(self._is_peer_ready(peer) for peer in peers)
+        return self._are_all_peers_connected()
+
+    def _is_peer_ready(self, peer: Peer) -> bool:
+        return peer in self._peer_states and self._peer_states[peer].peer_is_ready
+
     def peers(self, timeout_in_milliseconds: int | None = None) -> list[Peer]:
-        self.wait_for_peers(timeout_in_milliseconds)
-        if self._are_all_peers_connected():
-            peers = [peer for peer in self._peer_states.keys()] + [
-                Peer(connection_info=self._my_connection_info)
-            ]
-            return sorted(peers, key=key_for_peer)
-        else:
-            return []
+        return list(self._get_sorted_peers(timeout_in_milliseconds))
+
+    def _get_sorted_peers(
+        self, timeout_in_milliseconds: int | None = None
+    ) -> list[Peer]:
+        """
+        The sorted peers and the ranks get computed once all peers are connected
+        and are cached until the peers change, because the collective operations
+        access them several times per call.
+        """
+        if self._sorted_peers is None:
+            self.wait_for_peers(timeout_in_milliseconds)
+            if not self._are_all_peers_connected():
+                return []
+            peers = list(self._peer_states.keys()) + [self._peer]
+            self._sorted_peers = sorted(peers, key=key_for_peer)
+            self._rank_by_peer = {
+                peer: rank for rank, peer in enumerate(self._sorted_peers)
+            }
+        return self._sorted_peers
+
+    def _invalidate_sorted_peers(self):
+        self._sorted_peers = None
+        self._rank_by_peer = {}
 
     def register_peer(self, peer_connection_info: ConnectionInfo):
         self._logger.info(
@@ -194,15 +258,40 @@ class PeerCommunicator:
 
     @property
     def peer(self) -> Peer:
-        return Peer(connection_info=self._my_connection_info)
+        return self._peer
 
     @property
     def leader(self) -> Peer:
-        return self.peers()[0]
+        return self._get_sorted_peers()[0]
 
     @property
     def rank(self) -> int:
-        return self.peers().index(self.peer)
+        return self.rank_of(self._peer)
+
+    def rank_of(self, peer: Peer) -> int:
+        """
+        Position of the peer in peers.
+        """
+        self._get_sorted_peers()
+        if peer not in self._rank_by_peer:
+            raise ValueError(f"{peer} is not in the peers.")
+        return self._rank_by_peer[peer]
+
+    @property
+    def file_descriptor(self) -> int:
+        """
+        File descriptor, which becomes readable when new messages might have
+        arrived. It allows to wait for messages in an event loop, for example
+        with AsyncPeerCommunicator, instead of blocking in recv or poll_peers.
+        """
+        return self._background_listener.out_control_file_descriptor
+
+    @property
+    def metrics(self) -> PeerCommunicatorMetrics:
+        """
+        Metrics of the communication with each peer, see PeerCommunicatorMetrics.snapshot.
+        """
+        return self._metrics
 
     @property
     def forward_register_peer_config(self) -> ForwardRegisterPeerConfig:
@@ -220,20 +309,64 @@ class PeerCommunicator:
         result = len(self._peer_states) == self._number_of_peers - 1 and all_peers_ready
         return result
 
-    def send(self, peer: Peer, message: list[Frame]):
-        self.wait_for_peers()
-        self._peer_states[peer].send(message)
+    def send(
+        self,
+        peer: Peer,
+        message: list[Frame],
+        timeout_in_milliseconds: int | None = None,
+        tag: int = 0,
+    ):
+        """
+        Sends the message to the peer. If the peer has too many messages in
+        flight, which it didn't receive yet, it blocks until the peer received
+        enough of them or raises a TimeoutError after the timeout.
+        The peer can receive the message by its tag.
+        """
+        self._wait_for_connections([peer])
+        peer_state = self._peer_states[peer]
+        payload = peer_state.compress(message)
+        can_send = self._wait_for_condition(
+            lambda: peer_state.can_send(payload),
+            timeout_in_milliseconds=timeout_in_milliseconds,
+        )
+        if can_send:
+            peer_state.send(payload, tag)
+        else:
+            raise TimeoutError("Timeout occurred during waiting to send the message.")
+
+    def try_send(self, peer: Peer, message: list[Frame], tag: int = 0) -> bool:
+        """
+        Sends the message to the peer, if this is possible without blocking.
+        Returns False, if the peer has too many messages in flight, which it didn't receive yet.
+        """
+        self._wait_for_connections([peer])
+        self._handle_messages()
+        peer_state = self._peer_states[peer]
+        payload = peer_state.compress(message)
+        if peer_state.can_send(payload):
+            peer_state.send(payload, tag)
+            return True
+        return False
 
     def recv(
-        self, peer: Peer, timeout_in_milliseconds: int | None = None
+        self,
+        peer: Peer,
+        timeout_in_milliseconds: int | None = None,
+        tag: int | None = None,
     ) -> list[Frame]:
-        self.wait_for_peers()
+        """
+        Receives the next message from the peer with the tag or,
+        if the tag is None, with any tag. Messages with other tags
+        stay buffered for later receives.
+        """
+        self._wait_for_connections([peer])
+        peer_state = self._peer_states[peer]
         peer_has_received_messages = self._wait_for_condition(
-            self._peer_states[peer].has_received_messages,
+            lambda: peer_state.has_received_messages(tag),
             timeout_in_milliseconds=timeout_in_milliseconds,
         )
         if peer_has_received_messages:
-            return self._peer_states[peer].recv()
+            return peer_state.recv(tag)
         else:
             raise TimeoutError("Timeout occurred during waiting for messages.")
 
@@ -241,14 +374,15 @@ class PeerCommunicator:
         self,
         peers: list[Peer] | None = None,
         timeout_in_milliseconds: int | None = None,
+        tag: int | None = None,
     ) -> list[Peer]:
-        self.wait_for_peers()
+        self._wait_for_connections([] if peers is None else peers)
 
         _peers = self._peer_states.keys() if peers is None else peers
 
         def have_peers_received_messages() -> bool:
             result = any(
-                self._peer_states[peer].has_received_messages() for peer in _peers
+                self._peer_states[peer].has_received_messages(tag) for peer in _peers
             )
             return result
 
@@ -257,7 +391,9 @@ class PeerCommunicator:
             timeout_in_milliseconds=timeout_in_milliseconds,
         )
         return [
-            peer for peer in _peers if self._peer_states[peer].has_received_messages()
+            peer
+            for peer in _peers
+            if self._peer_states[peer].has_received_messages(tag)
         ]
 
     def stop(self):
@@ -288,6 +424,8 @@ class PeerCommunicator:
         all_peers_ready = all(
             peer_state.connection_is_closed for peer_state in self._peer_states.values()
         )
+        if self._config.connect_lazily:
+            return all_peers_ready
         result = len(self._peer_states) == self._number_of_peers - 1 and all_peers_ready
         return result
 
@@ -295,6 +433,9 @@ class PeerCommunicator:
         self._logger.info("stop peer_states")
         for peer_state_key in list(self._peer_states.keys()):
             del self._peer_states[peer_state_key]
+        self._invalidate_sorted_peers()
 
     def __del__(self):
-        self.stop()
+        # The BackgroundListenerInterface is missing, if it failed to start.
+        if hasattr(self, "_background_listener"):
+            self.stop()
@@ -9,12 +9,21 @@ from exasol.analytics.udf.communication.peer_communicator.connection_establisher
 from exasol.analytics.udf.communication.peer_communicator.forward_register_peer_config import (
     ForwardRegisterPeerConfig,
 )
+from exasol.analytics.udf.communication.peer_communicator.payload_compression_config import (
+    PayloadCompressionConfig,
+)
+from exasol.analytics.udf.communication.peer_communicator.payload_flow_control_config import (
+    PayloadFlowControlConfig,
+)
 from exasol.analytics.udf.communication.peer_communicator.payload_message_sender_timeout_config import (
     PayloadMessageSenderTimeoutConfig,
 )
 from exasol.analytics.udf.communication.peer_communicator.register_peer_forwarder_timeout_config import (
     RegisterPeerForwarderTimeoutConfig,
 )
+from exasol.analytics.udf.communication.peer_communicator.transport_config import (
+    TransportConfig,
+)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -34,6 +43,16 @@ class PeerCommunicatorConfig:
     payload_message_sender_timeout_config: PayloadMessageSenderTimeoutConfig = (
         PayloadMessageSenderTimeoutConfig()
     )
+    payload_flow_control_config: PayloadFlowControlConfig = PayloadFlowControlConfig()
+    payload_compression_config: PayloadCompressionConfig = PayloadCompressionConfig()
+    transport_config: TransportConfig = TransportConfig()
     poll_timeout_in_ms: int = 200
     send_socket_linger_time_in_ms: int = 100
     close_timeout_in_ms: int = 100000
+    connect_lazily: bool = False
+    """
+    If True, send, recv and poll_peers only wait for the connections to the
+    given peers, instead of the connections to all peers, such that the
+    connections can be established on demand with register_peer. Then, stop
+    only closes the established connections.
+    """
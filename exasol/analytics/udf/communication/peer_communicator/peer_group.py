@@ -0,0 +1,63 @@
+from typing import Protocol
+
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator.metrics import (
+    PeerCommunicatorMetrics,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import Frame
+
+
+class PeerGroup(Protocol):
+    """
+    The part of a PeerCommunicator, which the collective operations and
+    the AsyncPeerCommunicator use to exchange messages with a fixed group of
+    peers. PeerCommunicator and SubPeerCommunicator provide it.
+    """
+
+    @property
+    def peer(self) -> Peer: ...
+
+    @property
+    def leader(self) -> Peer: ...
+
+    @property
+    def rank(self) -> int: ...
+
+    @property
+    def number_of_peers(self) -> int: ...
+
+    @property
+    def file_descriptor(self) -> int: ...
+
+    @property
+    def metrics(self) -> PeerCommunicatorMetrics: ...
+
+    def wait_for_peers(self, timeout_in_milliseconds: int | None = None) -> bool: ...
+
+    def peers(self, timeout_in_milliseconds: int | None = None) -> list[Peer]: ...
+
+    def are_connected(self, peers: list[Peer]) -> bool: ...
+
+    def send(
+        self,
+        peer: Peer,
+        message: list[Frame],
+        timeout_in_milliseconds: int | None = None,
+        tag: int = 0,
+    ): ...
+
+    def try_send(self, peer: Peer, message: list[Frame], tag: int = 0) -> bool: ...
+
+    def recv(
+        self,
+        peer: Peer,
+        timeout_in_milliseconds: int | None = None,
+        tag: int | None = None,
+    ) -> list[Frame]: ...
+
+    def poll_peers(
+        self,
+        peers: list[Peer] | None = None,
+        timeout_in_milliseconds: int | None = None,
+        tag: int | None = None,
+    ) -> list[Peer]: ...
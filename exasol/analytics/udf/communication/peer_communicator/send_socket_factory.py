@@ -3,6 +3,12 @@ from structlog.typing import FilteringBoundLogger
 
 from exasol.analytics.udf.communication.connection_info import ConnectionInfo
 from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator.transport_address import (
+    get_connect_address,
+)
+from exasol.analytics.udf.communication.peer_communicator.transport_config import (
+    TransportConfig,
+)
 from exasol.analytics.udf.communication.socket_factory.abstract import (
     Socket,
     SocketFactory,
@@ -18,7 +24,9 @@ class SendSocketFactory:
         my_connection_info: ConnectionInfo,
         socket_factory: SocketFactory,
         peer: Peer,
+        transport_config: TransportConfig = TransportConfig(),
     ):
+        self._transport_config = transport_config
         self._my_connection_info = my_connection_info
         self._peer = peer
         self._socket_factory = socket_factory
@@ -33,7 +41,7 @@ class SendSocketFactory:
         try:
             send_socket = self._socket_factory.create_socket(SocketType.DEALER)
             send_socket.connect(
-                f"tcp://{self._peer.connection_info.ipaddress.ip_address}:{self._peer.connection_info.port.port}"
+                get_connect_address(self._peer.connection_info, self._transport_config)
             )
             return send_socket
         except Exception:
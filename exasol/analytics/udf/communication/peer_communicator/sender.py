@@ -7,9 +7,13 @@ from exasol.analytics.udf.communication.peer import Peer
 from exasol.analytics.udf.communication.peer_communicator.send_socket_factory import (
     SendSocketFactory,
 )
+from exasol.analytics.udf.communication.peer_communicator.transport_config import (
+    TransportConfig,
+)
 from exasol.analytics.udf.communication.serialization import serialize_message
 from exasol.analytics.udf.communication.socket_factory.abstract import (
     Frame,
+    Socket,
     SocketFactory,
 )
 
@@ -17,30 +21,69 @@ LOGGER: FilteringBoundLogger = structlog.get_logger(__name__)
 
 
 class Sender:
+    """
+    Sends messages to a peer over a single long-lived socket.
+
+    The socket gets connected with the first message and is reused for all
+    further messages, such that the messages don't pay for the connection
+    setup. If sending fails, the socket gets discarded and the next message
+    reconnects. The socket needs to be closed explicitly with close().
+    """
+
     def __init__(
         self,
         my_connection_info: ConnectionInfo,
         socket_factory: SocketFactory,
         peer: Peer,
         send_socket_linger_time_in_ms: int,
+        transport_config: TransportConfig = TransportConfig(),
     ):
         self._send_socket_linger_time_in_ms = send_socket_linger_time_in_ms
         self._send_socket_factory = SendSocketFactory(
             my_connection_info=my_connection_info,
             socket_factory=socket_factory,
             peer=peer,
+            transport_config=transport_config,
+        )
+        self._send_socket: Socket | None = None
+        self._logger = LOGGER.bind(
+            peer=peer.model_dump(),
+            my_connection_info=my_connection_info.model_dump(),
         )
 
     def send(self, message: Message):
-        with self._send_socket_factory.create_send_socket() as send_socket:
-            serialized_message = serialize_message(message.root)
+        serialized_message = serialize_message(message.root)
+        send_socket = self._get_send_socket()
+        try:
             send_socket.send(serialized_message)
-            send_socket.close(self._send_socket_linger_time_in_ms)
+        except Exception:
+            self._discard_send_socket()
+            raise
 
     def send_multipart(self, frames: list[Frame]):
-        with self._send_socket_factory.create_send_socket() as send_socket:
+        send_socket = self._get_send_socket()
+        try:
             send_socket.send_multipart(frames)
-            send_socket.close(self._send_socket_linger_time_in_ms)
+        except Exception:
+            self._discard_send_socket()
+            raise
+
+    def close(self):
+        if self._send_socket is not None:
+            self._logger.debug("close")
+            self._send_socket.close(self._send_socket_linger_time_in_ms)
+            self._send_socket = None
+
+    def _get_send_socket(self) -> Socket:
+        if self._send_socket is None:
+            self._send_socket = self._send_socket_factory.create_send_socket()
+        return self._send_socket
+
+    def _discard_send_socket(self):
+        self._logger.exception("Error during send, reconnecting with next message")
+        if self._send_socket is not None:
+            self._send_socket.close(linger=0)
+            self._send_socket = None
 
 
 class SenderFactory:
@@ -50,11 +93,13 @@ class SenderFactory:
         socket_factory: SocketFactory,
         peer: Peer,
         send_socket_linger_time_in_ms: int,
+        transport_config: TransportConfig = TransportConfig(),
     ) -> Sender:
         sender = Sender(
             my_connection_info=my_connection_info,
             socket_factory=socket_factory,
             peer=peer,
             send_socket_linger_time_in_ms=send_socket_linger_time_in_ms,
+            transport_config=transport_config,
         )
         return sender
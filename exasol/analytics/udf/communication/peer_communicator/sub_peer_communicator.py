@@ -0,0 +1,101 @@
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator.metrics import (
+    PeerCommunicatorMetrics,
+)
+from exasol.analytics.udf.communication.peer_communicator.peer_group import PeerGroup
+from exasol.analytics.udf.communication.socket_factory.abstract import Frame
+
+
+class SubPeerCommunicator:
+    """
+    PeerGroup of a subset of the peers of a PeerCommunicator, which reuses its
+    connections. The peers keep the given order, which defines their ranks
+    and the leader. The tags of the messages get shifted by tag_offset,
+    such that the messages of different groups of the same PeerCommunicator
+    don't get mixed up. The group doesn't own the connections, so the peers
+    get registered at the PeerCommunicator and its owner stops it.
+    """
+
+    def __init__(
+        self, peer_communicator: PeerGroup, peers: list[Peer], tag_offset: int
+    ):
+        if peer_communicator.peer not in peers:
+            raise ValueError(f"{peer_communicator.peer} is not in the peers.")
+        self._peer_communicator = peer_communicator
+        self._peers = list(peers)
+        self._rank = self._peers.index(peer_communicator.peer)
+        self._tag_offset = tag_offset
+
+    def _shift_tag(self, tag: int | None) -> int | None:
+        if tag is None:
+            return None
+        return tag + self._tag_offset
+
+    def wait_for_peers(self, timeout_in_milliseconds: int | None = None) -> bool:
+        return True
+
+    def peers(self, timeout_in_milliseconds: int | None = None) -> list[Peer]:
+        return list(self._peers)
+
+    @property
+    def number_of_peers(self) -> int:
+        return len(self._peers)
+
+    @property
+    def peer(self) -> Peer:
+        return self._peer_communicator.peer
+
+    @property
+    def leader(self) -> Peer:
+        return self._peers[0]
+
+    @property
+    def rank(self) -> int:
+        return self._rank
+
+    @property
+    def file_descriptor(self) -> int:
+        return self._peer_communicator.file_descriptor
+
+    @property
+    def metrics(self) -> PeerCommunicatorMetrics:
+        return self._peer_communicator.metrics
+
+    def are_connected(self, peers: list[Peer]) -> bool:
+        return self._peer_communicator.are_connected(peers)
+
+    def send(
+        self,
+        peer: Peer,
+        message: list[Frame],
+        timeout_in_milliseconds: int | None = None,
+        tag: int = 0,
+    ):
+        self._peer_communicator.send(
+            peer, message, timeout_in_milliseconds, tag + self._tag_offset
+        )
+
+    def try_send(self, peer: Peer, message: list[Frame], tag: int = 0) -> bool:
+        return self._peer_communicator.try_send(peer, message, tag + self._tag_offset)
+
+    def recv(
+        self,
+        peer: Peer,
+        timeout_in_milliseconds: int | None = None,
+        tag: int | None = None,
+    ) -> list[Frame]:
+        return self._peer_communicator.recv(
+            peer, timeout_in_milliseconds, self._shift_tag(tag)
+        )
+
+    def poll_peers(
+        self,
+        peers: list[Peer] | None = None,
+        timeout_in_milliseconds: int | None = None,
+        tag: int | None = None,
+    ) -> list[Peer]:
+        if peers is None:
+            peers = [peer for peer in self._peers if peer != self.peer]
+        return self._peer_communicator.poll_peers(
+            peers, timeout_in_milliseconds, self._shift_tag(tag)
+        )
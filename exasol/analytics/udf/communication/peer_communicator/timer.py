@@ -1,23 +1,126 @@
+import contextlib
+import heapq
+import itertools
+from collections.abc import (
+    Hashable,
+    Iterator,
+)
+
 from exasol.analytics.udf.communication.peer_communicator.clock import Clock
 
 
 class Timer:
 
-    def __init__(self, clock: Clock, timeout_in_ms: int):
+    def __init__(
+        self,
+        clock: Clock,
+        timeout_in_ms: int,
+        scheduler: "TimerScheduler | None" = None,
+    ):
         self._timeout_in_ms = timeout_in_ms
         self._clock = clock
+        self._scheduler = scheduler
+        self._owner = None if scheduler is None else scheduler.current_owner
         self._last_send_timestamp_in_ms = clock.current_timestamp_in_ms()
+        self._schedule()
 
     def reset_timer(self):
         self._last_send_timestamp_in_ms = self._clock.current_timestamp_in_ms()
+        self._schedule()
 
     def is_time(self):
         current_timestamp_in_ms = self._clock.current_timestamp_in_ms()
         diff = current_timestamp_in_ms - self._last_send_timestamp_in_ms
         return diff > self._timeout_in_ms
 
+    @property
+    def deadline_in_ms(self) -> int:
+        """
+        First timestamp for which is_time returns True.
+        """
+        return self._last_send_timestamp_in_ms + self._timeout_in_ms + 1
+
+    @property
+    def owner(self) -> Hashable | None:
+        """
+        Owner of the Timer, see TimerScheduler.owned_by.
+        """
+        return self._owner
+
+    def _schedule(self):
+        if self._scheduler is not None:
+            self._scheduler.schedule(self)
+
+
+class TimerScheduler:
+    """
+    Min-heap of the deadlines of the Timers. It allows the BackgroundListenerThread
+    to sleep until the next Timer expires and to only try to send for the
+    owners of the Timers, which actually expired. A Timer adds a new entry
+    each time it gets reset, the outdated entries get discarded lazily.
+    """
+
+    def __init__(self, clock: Clock):
+        self._clock = clock
+        self._deadlines: list[tuple[int, int, Timer]] = []
+        self._sequence = itertools.count()
+        self._current_owner: Hashable | None = None
+
+    @property
+    def current_owner(self) -> Hashable | None:
+        return self._current_owner
+
+    @contextlib.contextmanager
+    def owned_by(self, owner: Hashable) -> Iterator[None]:
+        """
+        The Timers created within the context belong to the owner.
+        """
+        previous_owner = self._current_owner
+        self._current_owner = owner
+        try:
+            yield
+        finally:
+            self._current_owner = previous_owner
+
+    def schedule(self, timer: Timer):
+        entry = (timer.deadline_in_ms, next(self._sequence), timer)
+        heapq.heappush(self._deadlines, entry)
+
+    def compute_timeout_in_ms(self, max_timeout_in_ms: int) -> int:
+        self._discard_outdated_deadlines()
+        if len(self._deadlines) == 0:
+            return max_timeout_in_ms
+        next_deadline_in_ms = self._deadlines[0][0]
+        timeout_in_ms = next_deadline_in_ms - self._clock.current_timestamp_in_ms()
+        return min(max(timeout_in_ms, 0), max_timeout_in_ms)
+
+    def pop_expired_timers(self) -> list[Timer]:
+        current_timestamp_in_ms = self._clock.current_timestamp_in_ms()
+        expired_timers = []
+        self._discard_outdated_deadlines()
+        while (
+            len(self._deadlines) > 0
+            and self._deadlines[0][0] <= current_timestamp_in_ms
+        ):
+            _, _, timer = heapq.heappop(self._deadlines)
+            expired_timers.append(timer)
+            self._discard_outdated_deadlines()
+        return expired_timers
+
+    def _discard_outdated_deadlines(self):
+        while (
+            len(self._deadlines) > 0
+            and self._deadlines[0][0] != self._deadlines[0][2].deadline_in_ms
+        ):
+            heapq.heappop(self._deadlines)
+
 
 class TimerFactory:
 
+    def __init__(self, scheduler: TimerScheduler | None = None):
+        self._scheduler = scheduler
+
     def create(self, clock: Clock, timeout_in_ms: int):
-        return Timer(clock=clock, timeout_in_ms=timeout_in_ms)
+        return Timer(
+            clock=clock, timeout_in_ms=timeout_in_ms, scheduler=self._scheduler
+        )
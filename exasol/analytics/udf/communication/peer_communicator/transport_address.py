@@ -0,0 +1,23 @@
+from exasol.analytics.udf.communication.connection_info import ConnectionInfo
+from exasol.analytics.udf.communication.ip_address import Port
+from exasol.analytics.udf.communication.peer_communicator.transport_config import (
+    TransportConfig,
+    get_ipc_path,
+)
+
+
+def get_ipc_address(ipc_directory: str, port: Port) -> str:
+    """
+    The ipc endpoint gets derived from the TCP port of the listen socket,
+    which is unique on the machine, such that the ConnectionInfo stays the same
+    for both transports.
+    """
+    return f"ipc://{get_ipc_path(ipc_directory, port.port)}"
+
+
+def get_connect_address(
+    connection_info: ConnectionInfo, transport_config: TransportConfig
+) -> str:
+    if transport_config.ipc_directory is not None:
+        return get_ipc_address(transport_config.ipc_directory, connection_info.port)
+    return f"tcp://{connection_info.ipaddress.ip_address}:{connection_info.port.port}"
@@ -0,0 +1,41 @@
+import dataclasses
+import os
+
+MAX_IPC_PATH_LENGTH = 107
+"""
+Maximum length in bytes of the path of a unix domain socket, because
+sockaddr_un.sun_path holds 108 bytes including the terminating null byte on Linux.
+"""
+
+MAX_PORT = 65535
+
+
+def get_ipc_path(ipc_directory: str, port: int) -> str:
+    return f"{ipc_directory}/peer_communicator_{port}"
+
+
+@dataclasses.dataclass(frozen=True)
+class TransportConfig:
+    ipc_directory: str | None = None
+    """
+    If set, the listen socket additionally binds a zmq ipc endpoint in this
+    directory and the peers connect to each other via these endpoints instead
+    of TCP, which avoids the loopback TCP stack. Only possible, if all peers run
+    on the same machine and use the same directory.
+    """
+
+    def __post_init__(self):
+        if self.ipc_directory is None:
+            return
+        if not os.path.isdir(self.ipc_directory):
+            raise ValueError(
+                f"The ipc directory {self.ipc_directory} does not exist "
+                f"or is not a directory."
+            )
+        longest_ipc_path = get_ipc_path(self.ipc_directory, MAX_PORT)
+        if len(os.fsencode(longest_ipc_path)) > MAX_IPC_PATH_LENGTH:
+            raise ValueError(
+                f"The ipc directory {self.ipc_directory} is too long, the path "
+                f"{longest_ipc_path} of the ipc endpoints would exceed "
+                f"{MAX_IPC_PATH_LENGTH} bytes."
+            )
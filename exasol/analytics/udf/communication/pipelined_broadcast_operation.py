@@ -0,0 +1,223 @@
+import math
+
+import structlog
+from structlog.typing import FilteringBoundLogger
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.messages import BroadcastChunk
+from exasol.analytics.udf.communication.operation_steps import (
+    Steps,
+    recv,
+    run_blocking,
+    send,
+)
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerGroup
+from exasol.analytics.udf.communication.serialization import (
+    deserialize_message,
+    serialize_message,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import (
+    Frame,
+    SocketFactory,
+)
+from exasol.analytics.utils.errors import UninitializedAttributeError
+
+LOGGER: FilteringBoundLogger = structlog.getLogger()
+
+LOCALHOST_LEADER_RANK = 0
+MULTI_NODE_LEADER_RANK = 0
+
+
+class PipelinedBroadcastOperation:
+    """
+    Broadcasts the value of the multi node leader in chunks of a fixed size.
+
+    The localhost leaders form a chain ordered by their multi node rank.
+    Each localhost leader forwards every chunk to the next localhost leader
+    in the chain and to its local peers as soon as it arrives. With that,
+    the transfers of the chunks overlap and the total time approaches the
+    time of a single transfer of the value, instead of growing with the number
+    of nodes. The chunks get forwarded as received frames without copying them.
+    """
+
+    def __init__(
+        self,
+        sequence_number: int,
+        value: bytes | memoryview | None,
+        chunk_size_in_bytes: int,
+        localhost_communicator: PeerGroup,
+        multi_node_communicator: PeerGroup | None,
+        socket_factory: SocketFactory,
+    ):
+        if chunk_size_in_bytes <= 0:
+            raise ValueError(
+                f"Chunk size needs to be greater than 0, but got {chunk_size_in_bytes}."
+            )
+        self._chunk_size_in_bytes = chunk_size_in_bytes
+        self._socket_factory = socket_factory
+        self._value = value
+        self._sequence_number = sequence_number
+        self._multi_node_communicator = multi_node_communicator
+        self._localhost_communicator = localhost_communicator
+        self._logger = LOGGER.bind(
+            sequence_number=self._sequence_number,
+        )
+
+    def __call__(self) -> memoryview:
+        return run_blocking(self.steps())
+
+    def steps(self) -> Steps[memoryview]:
+        """
+        Steps of the operation, see operation_steps.
+        """
+        if self._localhost_communicator.rank > LOCALHOST_LEADER_RANK:
+            return (yield from self._receive_from_localhost_leader())
+        communicator = self._checked_multi_node_communicator
+        if communicator.rank > MULTI_NODE_LEADER_RANK:
+            return (yield from self._forward_from_previous_localhost_leader())
+        return (yield from self._send_from_multi_node_leader())
+
+    @property
+    def _checked_multi_node_communicator(self) -> PeerGroup:
+        value = self._multi_node_communicator
+        if value is None:
+            raise UninitializedAttributeError("Multi node communicator is undefined.")
+        return value
+
+    def _receive_from_localhost_leader(self) -> Steps[memoryview]:
+        self._logger.info("_receive_from_localhost_leader")
+        communicator = self._localhost_communicator
+        chunks = yield from self._receive_chunks(
+            communicator, communicator.leader, forward=False
+        )
+        # Joining the views of the chunks is the only copy of the value.
+        return memoryview(b"".join(chunk.to_memoryview() for chunk in chunks))
+
+    def _forward_from_previous_localhost_leader(self) -> Steps[memoryview]:
+        self._logger.info("_forward_from_previous_localhost_leader")
+        communicator = self._checked_multi_node_communicator
+        previous_leader = communicator.peers()[communicator.rank - 1]
+        chunks = yield from self._receive_chunks(
+            communicator, previous_leader, forward=True
+        )
+        return memoryview(b"".join(chunk.to_memoryview() for chunk in chunks))
+
+    def _send_from_multi_node_leader(self) -> Steps[memoryview]:
+        self._logger.info("_send_from_multi_node_leader")
+        if self._value is None:
+            raise UninitializedAttributeError("Value is unset.")
+        value = memoryview(self._value).cast("B")
+        number_of_chunks = max(1, math.ceil(len(value) / self._chunk_size_in_bytes))
+        for chunk_index in range(number_of_chunks):
+            start = chunk_index * self._chunk_size_in_bytes
+            chunk = self._socket_factory.create_frame(
+                value[start : start + self._chunk_size_in_bytes]
+            )
+            yield from self._send_chunk(chunk_index, number_of_chunks, chunk)
+        return value
+
+    def _send_chunk(
+        self, chunk_index: int, number_of_chunks: int, chunk: Frame
+    ) -> Steps[None]:
+        multi_node_communicator = self._checked_multi_node_communicator
+        next_rank = multi_node_communicator.rank + 1
+        if next_rank < multi_node_communicator.number_of_peers:
+            next_leader = multi_node_communicator.peers()[next_rank]
+            yield from self._send(
+                multi_node_communicator,
+                next_leader,
+                chunk_index,
+                number_of_chunks,
+                chunk,
+            )
+        localhost_communicator = self._localhost_communicator
+        for peer in localhost_communicator.peers():
+            if peer != localhost_communicator.peer:
+                yield from self._send(
+                    localhost_communicator,
+                    peer,
+                    chunk_index,
+                    number_of_chunks,
+                    chunk,
+                )
+
+    def _send(
+        self,
+        communicator: PeerGroup,
+        peer: Peer,
+        chunk_index: int,
+        number_of_chunks: int,
+        chunk: Frame,
+    ) -> Steps[None]:
+        message = BroadcastChunk(
+            sequence_number=self._sequence_number,
+            source=communicator.peer,
+            destination=peer,
+            chunk_index=chunk_index,
+            number_of_chunks=number_of_chunks,
+        )
+        serialized_message = serialize_message(message)
+        frames = [self._socket_factory.create_frame(serialized_message), chunk]
+        yield from send(
+            communicator, peer=peer, message=frames, tag=self._sequence_number
+        )
+
+    def _receive_chunks(
+        self, communicator: PeerGroup, peer: Peer, forward: bool
+    ) -> Steps[list[Frame]]:
+        """
+        Returns the frames of the chunks in the order of the chunks.
+        With forward, each chunk gets sent on as soon as it arrives.
+        """
+        chunks: list[Frame] = []
+        number_of_chunks = 1
+        while len(chunks) < number_of_chunks:
+            chunk_index = len(chunks)
+            frames = yield from recv(communicator, peer, tag=self._sequence_number)
+            message = deserialize_message(frames[0].to_bytes(), messages.Message)
+            specific_message_obj = self._get_and_check_specific_message_obj(message)
+            self._check_sequence_number(specific_message_obj)
+            self._check_chunk_index(specific_message_obj, chunk_index)
+            if chunk_index == 0:
+                number_of_chunks = specific_message_obj.number_of_chunks
+            elif specific_message_obj.number_of_chunks != number_of_chunks:
+                raise RuntimeError(
+                    f"Got message with different number of chunks. "
+                    f"We expect {number_of_chunks} chunks, "
+                    f"but we got {specific_message_obj.number_of_chunks} in message {specific_message_obj}"
+                )
+            if forward:
+                yield from self._send_chunk(chunk_index, number_of_chunks, frames[1])
+            chunks.append(frames[1])
+        return chunks
+
+    def _check_chunk_index(
+        self, specific_message_obj: BroadcastChunk, expected_chunk_index: int
+    ):
+        if specific_message_obj.chunk_index != expected_chunk_index:
+            raise RuntimeError(
+                f"Got message with wrong chunk index. "
+                f"We expect the chunk index {expected_chunk_index} "
+                f"but we got {specific_message_obj.chunk_index} in message {specific_message_obj}"
+            )
+
+    def _check_sequence_number(self, specific_message_obj: BroadcastChunk):
+        if specific_message_obj.sequence_number != self._sequence_number:
+            raise RuntimeError(
+                f"Got message with different sequence number. "
+                f"We expect the sequence number {self._sequence_number} "
+                f"but we got {specific_message_obj.sequence_number} in message {specific_message_obj}"
+            )
+
+    def _get_and_check_specific_message_obj(
+        self, message: messages.Message
+    ) -> BroadcastChunk:
+        specific_message_obj = message.root
+        if not isinstance(specific_message_obj, BroadcastChunk):
+            raise TypeError(
+                f"Received the wrong message type. "
+                f"Expected {BroadcastChunk.__name__} got {type(message)}. "
+                f"For message {message}."
+            )
+        return specific_message_obj
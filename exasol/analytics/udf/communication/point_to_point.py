@@ -0,0 +1,100 @@
+from exasol.analytics.udf.communication.connection_info import ConnectionInfo
+from exasol.analytics.udf.communication.ip_address import IPAddress
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.peer_communicator.payload_compression_config import (
+    PayloadCompressionConfig,
+)
+from exasol.analytics.udf.communication.peer_communicator.peer_communicator_config import (
+    PeerCommunicatorConfig,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import SocketFactory
+from exasol.analytics.utils.errors import UninitializedAttributeError
+
+
+class PointToPointConnections:
+    """
+    Direct connections from this instance to all instances of the root
+    Communicator, which get addressed by their rank in it. The PeerCommunicator
+    connects lazily, so the instances exchange their connection infos up front,
+    but a peer only gets registered on its first use, which establishes the
+    connection.
+    """
+
+    def __init__(
+        self, peer_communicator: PeerCommunicator, socket_factory: SocketFactory
+    ):
+        self._peer_communicator = peer_communicator
+        self._socket_factory = socket_factory
+        self._connection_infos: list[ConnectionInfo] = []
+        self._peers: dict[int, Peer] = {}
+
+    @classmethod
+    def create(
+        cls,
+        name: str,
+        number_of_instances: int,
+        listen_ip: IPAddress,
+        group_identifier: str,
+        socket_factory: SocketFactory,
+        payload_compression_config: PayloadCompressionConfig,
+    ) -> "PointToPointConnections":
+        peer_communicator = PeerCommunicator(
+            name=name,
+            number_of_peers=number_of_instances,
+            listen_ip=listen_ip,
+            group_identifier=group_identifier,
+            socket_factory=socket_factory,
+            config=PeerCommunicatorConfig(
+                connect_lazily=True,
+                payload_compression_config=payload_compression_config,
+            ),
+        )
+        return cls(peer_communicator, socket_factory)
+
+    @property
+    def peer_communicator(self) -> PeerCommunicator:
+        return self._peer_communicator
+
+    @property
+    def connection_infos(self) -> list[ConnectionInfo]:
+        """
+        Connection infos of the point to point communicators of all instances,
+        ordered by their rank in the root Communicator.
+        """
+        return self._connection_infos
+
+    @connection_infos.setter
+    def connection_infos(self, connection_infos: list[ConnectionInfo]):
+        self._connection_infos = connection_infos
+
+    def peer(self, root_rank: int) -> Peer:
+        if root_rank not in self._peers:
+            connection_info = self._connection_infos[root_rank]
+            self._peer_communicator.register_peer(connection_info)
+            self._peers[root_rank] = Peer(connection_info=connection_info)
+        return self._peers[root_rank]
+
+    def send(self, root_rank: int, value: bytes | memoryview, tag: int):
+        frame = self._socket_factory.create_frame(value)
+        self._peer_communicator.send(
+            peer=self.peer(root_rank), message=[frame], tag=tag
+        )
+
+    def recv(self, root_rank: int, tag: int) -> memoryview:
+        frames = self._peer_communicator.recv(peer=self.peer(root_rank), tag=tag)
+        return frames[0].to_memoryview()
+
+    def stop(self):
+        self._peer_communicator.stop()
+
+
+def check_point_to_point_connections(
+    connections: PointToPointConnections | None,
+) -> PointToPointConnections:
+    if connections is None:
+        raise UninitializedAttributeError(
+            "Point to point communicator is undefined, "
+            "enable_point_to_point needs to be set in the CommunicatorConfig."
+        )
+    return connections
@@ -0,0 +1,71 @@
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+
+from exasol.analytics.udf.communication.point_to_point import (
+    PointToPointConnections,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import SocketFactory
+from exasol.analytics.udf.communication.stream_operation import (
+    ReceiveStreamOperation,
+    SendStreamOperation,
+)
+
+
+class PointToPointStreams:
+    """
+    Streams over the PointToPointConnections. The streams get numbered per
+    peer and tag, such that the sender and the receiver count the same streams,
+    independent of the other instances.
+    """
+
+    def __init__(
+        self, connections: PointToPointConnections, socket_factory: SocketFactory
+    ):
+        self._connections = connections
+        self._socket_factory = socket_factory
+        self._sent_sequence_numbers: dict[tuple[int, int], int] = {}
+        self._received_sequence_numbers: dict[tuple[int, int], int] = {}
+
+    def send(
+        self,
+        root_rank: int,
+        chunks: Iterable[bytes | memoryview],
+        tag: int,
+        window_size: int,
+        timeout_in_milliseconds: int | None,
+    ):
+        SendStreamOperation(
+            sequence_number=_next_sequence_number(
+                self._sent_sequence_numbers, root_rank, tag
+            ),
+            peer=self._connections.peer(root_rank),
+            peer_communicator=self._connections.peer_communicator,
+            socket_factory=self._socket_factory,
+            window_size=window_size,
+            tag=tag,
+            timeout_in_milliseconds=timeout_in_milliseconds,
+        )(chunks)
+
+    def receive(
+        self, root_rank: int, tag: int, window_size: int
+    ) -> Iterator[memoryview]:
+        return ReceiveStreamOperation(
+            sequence_number=_next_sequence_number(
+                self._received_sequence_numbers, root_rank, tag
+            ),
+            peer=self._connections.peer(root_rank),
+            peer_communicator=self._connections.peer_communicator,
+            socket_factory=self._socket_factory,
+            window_size=window_size,
+            tag=tag,
+        )()
+
+
+def _next_sequence_number(
+    sequence_numbers: dict[tuple[int, int], int], root_rank: int, tag: int
+) -> int:
+    sequence_number = sequence_numbers.get((root_rank, tag), 0)
+    sequence_numbers[(root_rank, tag)] = sequence_number + 1
+    return sequence_number
@@ -0,0 +1,49 @@
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
+
+Reducer = Callable[[bytes | memoryview, bytes | memoryview], bytes]
+"""
+Combines two values of a reduction into one value.
+
+The reducer needs to be associative, because the values get first reduced
+inside each node and afterward across the nodes. The values are always
+combined in the order of their positions, such that a reducer doesn't need
+to be commutative to produce the same result on every run.
+"""
+
+
+class NumpyReducer:
+    """
+    Reducer which interprets both values as raw buffers of a NumPy array with
+    the given dtype and combines them element-wise with the given ufunc.
+    """
+
+    def __init__(self, dtype: npt.DTypeLike, ufunc: np.ufunc):
+        self._dtype = np.dtype(dtype)
+        self._ufunc = ufunc
+
+    def __call__(self, left: bytes | memoryview, right: bytes | memoryview) -> bytes:
+        left_array = np.frombuffer(left, dtype=self._dtype)
+        right_array = np.frombuffer(right, dtype=self._dtype)
+        if left_array.shape != right_array.shape:
+            raise ValueError(
+                f"Values have different number of elements, "
+                f"got {left_array.shape[0]} and {right_array.shape[0]} "
+                f"for dtype {self._dtype}."
+            )
+        result = self._ufunc(left_array, right_array)
+        return result.tobytes()
+
+
+def sum_reducer(dtype: npt.DTypeLike) -> NumpyReducer:
+    return NumpyReducer(dtype=dtype, ufunc=np.add)
+
+
+def min_reducer(dtype: npt.DTypeLike) -> NumpyReducer:
+    return NumpyReducer(dtype=dtype, ufunc=np.minimum)
+
+
+def max_reducer(dtype: npt.DTypeLike) -> NumpyReducer:
+    return NumpyReducer(dtype=dtype, ufunc=np.maximum)
@@ -0,0 +1,225 @@
+import structlog
+from structlog.typing import FilteringBoundLogger
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.messages import Scatter
+from exasol.analytics.udf.communication.operation_steps import (
+    Steps,
+    recv,
+    run_blocking,
+    send,
+)
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerGroup
+from exasol.analytics.udf.communication.serialization import (
+    deserialize_message,
+    serialize_message,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import (
+    Frame,
+    SocketFactory,
+)
+from exasol.analytics.utils.errors import UninitializedAttributeError
+
+LOGGER: FilteringBoundLogger = structlog.getLogger()
+
+LOCALHOST_LEADER_RANK = 0
+MULTI_NODE_LEADER_RANK = 0
+
+
+class ScatterOperation:
+    """
+    Distributes one value per instance from the multi node leader.
+
+    The multi node leader sends each localhost leader only the values for the
+    instances on its node, and the localhost leaders pass on to each local
+    instance only its own value. The values are ordered by the same positions
+    as the result of the GatherOperation.
+    """
+
+    def __init__(
+        self,
+        sequence_number: int,
+        values: list[bytes] | list[memoryview] | None,
+        localhost_communicator: PeerGroup,
+        multi_node_communicator: PeerGroup | None,
+        socket_factory: SocketFactory,
+        number_of_instances_per_node: int,
+    ):
+        self._number_of_instances_per_node = number_of_instances_per_node
+        self._socket_factory = socket_factory
+        self._values = values
+        self._sequence_number = sequence_number
+        self._multi_node_communicator = multi_node_communicator
+        self._localhost_communicator = localhost_communicator
+        self._logger = LOGGER.bind(
+            sequence_number=self._sequence_number,
+        )
+
+    def __call__(self) -> memoryview:
+        return run_blocking(self.steps())
+
+    def steps(self) -> Steps[memoryview]:
+        """
+        Steps of the operation, see operation_steps.
+        """
+        if self._localhost_communicator.rank > LOCALHOST_LEADER_RANK:
+            return (yield from self._receive_from_localhost_leader())
+        communicator = self._checked_multi_node_communicator
+        if communicator.rank > MULTI_NODE_LEADER_RANK:
+            value_frames = yield from self._receive_from_multi_node_leader()
+        else:
+            value_frames = yield from self._send_to_local_leaders()
+        return (yield from self._send_to_local_peers(value_frames))
+
+    @property
+    def _checked_multi_node_communicator(self) -> PeerGroup:
+        value = self._multi_node_communicator
+        if value is None:
+            raise UninitializedAttributeError("Multi node communicator is undefined.")
+        return value
+
+    def _receive_from_localhost_leader(self) -> Steps[memoryview]:
+        self._logger.info("_receive_from_localhost_leader")
+        communicator = self._localhost_communicator
+        frames = yield from recv(
+            communicator, peer=communicator.leader, tag=self._sequence_number
+        )
+        specific_message_obj = self._receive_message(frames)
+        # Only the localhost leader knows the rank of the node,
+        # as such we can only check the position within the node.
+        local_position = specific_message_obj.position % (
+            self._number_of_instances_per_node
+        )
+        if local_position != communicator.rank:
+            raise RuntimeError(
+                f"Got message with wrong position. "
+                f"We expect a position for the local rank {communicator.rank}, "
+                f"but we got {specific_message_obj.position} in message {specific_message_obj}"
+            )
+        return frames[1].to_memoryview()
+
+    def _receive_from_multi_node_leader(self) -> Steps[list[Frame]]:
+        self._logger.info("_receive_from_multi_node_leader")
+        communicator = self._checked_multi_node_communicator
+        frames = yield from recv(
+            communicator, peer=communicator.leader, tag=self._sequence_number
+        )
+        specific_message_obj = self._receive_message(frames)
+        self._check_position(specific_message_obj, self._compute_node_base_position())
+        value_frames = frames[1:]
+        if len(value_frames) != self._number_of_instances_per_node:
+            raise RuntimeError(
+                f"Got message with wrong number of values. "
+                f"We expect {self._number_of_instances_per_node} values, "
+                f"but we got {len(value_frames)} in message {specific_message_obj}"
+            )
+        return value_frames
+
+    def _send_to_local_leaders(self) -> Steps[list[Frame]]:
+        self._logger.info("_send_to_local_leaders")
+        communicator = self._checked_multi_node_communicator
+        values = self._checked_values(communicator.number_of_peers)
+        value_frames = [self._socket_factory.create_frame(value) for value in values]
+        leader = communicator.leader
+        for rank, peer in enumerate(communicator.peers()):
+            if peer != leader:
+                base_position = rank * self._number_of_instances_per_node
+                node_value_frames = value_frames[
+                    base_position : base_position + self._number_of_instances_per_node
+                ]
+                frames = self._construct_scatter_message(
+                    source=leader,
+                    destination=peer,
+                    position=base_position,
+                    value_frames=node_value_frames,
+                )
+                yield from send(
+                    communicator, peer=peer, message=frames, tag=self._sequence_number
+                )
+        return value_frames[: self._number_of_instances_per_node]
+
+    def _send_to_local_peers(self, value_frames: list[Frame]) -> Steps[memoryview]:
+        self._logger.info("_send_to_local_peers")
+        communicator = self._localhost_communicator
+        leader = communicator.leader
+        node_base_position = self._compute_node_base_position()
+        for rank, peer in enumerate(communicator.peers()):
+            if peer != leader:
+                frames = self._construct_scatter_message(
+                    source=leader,
+                    destination=peer,
+                    position=node_base_position + rank,
+                    value_frames=[value_frames[rank]],
+                )
+                yield from send(
+                    communicator, peer=peer, message=frames, tag=self._sequence_number
+                )
+        return value_frames[LOCALHOST_LEADER_RANK].to_memoryview()
+
+    def _compute_node_base_position(self) -> int:
+        communicator = self._checked_multi_node_communicator
+        return communicator.rank * self._number_of_instances_per_node
+
+    def _checked_values(self, number_of_nodes: int) -> list[bytes] | list[memoryview]:
+        if self._values is None:
+            raise UninitializedAttributeError("Values are unset.")
+        number_of_instances_in_cluster = (
+            number_of_nodes * self._number_of_instances_per_node
+        )
+        if len(self._values) != number_of_instances_in_cluster:
+            raise ValueError(
+                f"Number of values needs to be equal to the number of instances "
+                f"in the cluster {number_of_instances_in_cluster}, "
+                f"but got {len(self._values)}."
+            )
+        return self._values
+
+    def _receive_message(self, frames: list[Frame]) -> Scatter:
+        message = deserialize_message(frames[0].to_bytes(), messages.Message)
+        specific_message_obj = self._get_and_check_specific_message_obj(message)
+        self._check_sequence_number(specific_message_obj)
+        return specific_message_obj
+
+    def _construct_scatter_message(
+        self,
+        source: Peer,
+        destination: Peer,
+        position: int,
+        value_frames: list[Frame],
+    ) -> list[Frame]:
+        message = Scatter(
+            sequence_number=self._sequence_number,
+            destination=destination,
+            source=source,
+            position=position,
+        )
+        serialized_message = serialize_message(message)
+        frames = [self._socket_factory.create_frame(serialized_message)] + value_frames
+        return frames
+
+    def _check_position(self, specific_message_obj: Scatter, expected_position: int):
+        if specific_message_obj.position != expected_position:
+            raise RuntimeError(
+                f"Got message with wrong position. "
+                f"We expect the position {expected_position} "
+                f"but we got {specific_message_obj.position} in message {specific_message_obj}"
+            )
+
+    def _check_sequence_number(self, specific_message_obj: Scatter):
+        if specific_message_obj.sequence_number != self._sequence_number:
+            raise RuntimeError(
+                f"Got message with different sequence number. "
+                f"We expect the sequence number {self._sequence_number} "
+                f"but we got {specific_message_obj.sequence_number} in message {specific_message_obj}"
+            )
+
+    def _get_and_check_specific_message_obj(self, message: messages.Message) -> Scatter:
+        specific_message_obj = message.root
+        if not isinstance(specific_message_obj, Scatter):
+            raise TypeError(
+                f"Received the wrong message type. "
+                f"Expected {Scatter.__name__} got {type(message)}. "
+                f"For message {message}."
+            )
+        return specific_message_obj
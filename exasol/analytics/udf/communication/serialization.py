@@ -4,8 +4,26 @@ from typing import (
 
 from pydantic import BaseModel
 
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.binary_serialization import (
+    construct_without_validation,
+    deserialize_binary_message,
+    has_binary_encoding,
+    is_binary_message,
+    serialize_binary_message,
+)
+
 
 def serialize_message(obj: BaseModel) -> bytes:
+    """
+    Uses the compact binary encoding for the frequent message types
+    and JSON for all others.
+    """
+    specific_obj = obj.root if isinstance(obj, messages.Message) else obj
+    if isinstance(specific_obj, messages.BaseMessage) and has_binary_encoding(
+        specific_obj
+    ):
+        return serialize_binary_message(specific_obj)
     json_str = obj.model_dump_json()
     return json_str.encode("UTF-8")
 
@@ -14,5 +32,17 @@ T = TypeVar("T", bound=BaseModel)
 
 
 def deserialize_message(message: bytes, base_model_class: type[T]) -> T:
+    if is_binary_message(message):
+        specific_obj = deserialize_binary_message(message)
+        if base_model_class is messages.Message:
+            return construct_without_validation(  # type: ignore
+                messages.Message, {"root": specific_obj}
+            )
+        if not isinstance(specific_obj, base_model_class):
+            raise TypeError(
+                f"Received the wrong message type. "
+                f"Expected {base_model_class.__name__} got {type(specific_obj)}."
+            )
+        return specific_obj
     obj = base_model_class.parse_raw(message, encoding="UTF-8")
     return obj
@@ -15,6 +15,11 @@ class Frame(abc.ABC):
         """Copies the memory buffer to Python"""
         pass
 
+    @abc.abstractmethod
+    def to_memoryview(self) -> memoryview:
+        """Returns a read-only view of the memory buffer without copying it"""
+        pass
+
 
 class PollerFlag(Enum):
     POLLIN = auto()
@@ -74,6 +79,15 @@ class Socket(abc.ABC):
         Sets the identity of the socket.
         """
 
+    @abc.abstractmethod
+    def get_file_descriptor(self) -> int:
+        """
+        Returns a file descriptor, which becomes readable when the events of
+        the socket might have changed. The notification is edge-triggered,
+        so poll needs to be called to check for the actual events
+        before waiting for the file descriptor again.
+        """
+
     @abc.abstractmethod
     def __enter__(self):
         pass
@@ -107,8 +121,14 @@ class SocketFactory(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def create_frame(self, message_part: bytes) -> Frame:
-        pass
+    def create_frame(self, message_part: bytes | memoryview) -> Frame:
+        """
+        Creates a frame for the message part, which can be sent multiple times
+        and to multiple sockets. Large message parts are not copied, if they are
+        bytes or read-only memoryviews, so the buffer of a read-only memoryview
+        must not be changed while the frame is in use. Other buffers get copied,
+        because a frame can get resent after the send returned.
+        """
 
     @abc.abstractmethod
     def create_poller(self) -> Poller:
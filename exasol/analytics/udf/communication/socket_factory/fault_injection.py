@@ -20,8 +20,11 @@ class Frame(abstract.Frame):
     def to_bytes(self) -> bytes:
         return self._internal_frame.to_bytes()
 
+    def to_memoryview(self) -> memoryview:
+        return self._internal_frame.to_memoryview()
+
     def __str__(self):
-        return self.to_bytes().decode("UTF-8")
+        return self.to_bytes().decode("UTF-8", errors="backslashreplace")
 
 
 def _is_address_inproc(address):
@@ -106,6 +109,9 @@ class Socket(abstract.Socket):
     def set_identity(self, name: str):
         self._internal_socket.set_identity(name)
 
+    def get_file_descriptor(self) -> int:
+        return self._internal_socket.get_file_descriptor()
+
     def __enter__(self):
         return self
 
@@ -176,7 +182,7 @@ class FaultInjectionSocketFactory(abstract.SocketFactory):
             self._random_state,
         )
 
-    def create_frame(self, message_part: bytes) -> abstract.Frame:
+    def create_frame(self, message_part: bytes | memoryview) -> abstract.Frame:
         return Frame(self._socket_factory.create_frame(message_part))
 
     def create_poller(self) -> abstract.Poller:
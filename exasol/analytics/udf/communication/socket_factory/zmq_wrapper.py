@@ -45,6 +45,9 @@ class ZMQFrame(Frame):
     def to_bytes(self) -> bytes:
         return self._internal_frame.bytes
 
+    def to_memoryview(self) -> memoryview:
+        return self._internal_frame.buffer.toreadonly()
+
 
 class ZMQSocket(Socket):
 
@@ -105,6 +108,9 @@ class ZMQSocket(Socket):
     def set_identity(self, name: str):
         self._internal_socket.setsockopt_string(zmq.IDENTITY, name)
 
+    def get_file_descriptor(self) -> int:
+        return self._internal_socket.getsockopt(zmq.FD)
+
     def __enter__(self):
         return self
 
@@ -163,7 +169,11 @@ class ZMQSocketFactory(SocketFactory):
             raise ValueError(f"Unknown socket_type {socket_type}")
         return ZMQSocket(self._context.socket(zmq_socket_type))
 
-    def create_frame(self, message_part: bytes) -> Frame:
+    def create_frame(self, message_part: bytes | memoryview) -> Frame:
+        if not isinstance(message_part, bytes) and not (
+            isinstance(message_part, memoryview) and message_part.readonly
+        ):
+            message_part = bytes(message_part)
         return ZMQFrame(zmq.Frame(message_part))
 
     def create_poller(self) -> Poller:
@@ -0,0 +1,104 @@
+"""
+Helpers of Communicator.split. Every instance contributes a split entry
+to an allgather, from which all instances derive the members and the context
+id of the new Communicators.
+"""
+
+import struct
+
+from exasol.analytics.udf.communication.peer_communicator import PeerGroup
+from exasol.analytics.udf.communication.peer_communicator.sub_peer_communicator import (
+    SubPeerCommunicator,
+)
+from exasol.analytics.udf.communication.point_to_point import (
+    PointToPointConnections,
+    check_point_to_point_connections,
+)
+
+CONTEXT_TAG_STRIDE = 2**32
+"""
+The tags of a Communicator derived with split get shifted by its context id
+times this stride, such that they don't collide with the tags of other ones.
+"""
+
+_SPLIT_ENTRY = struct.Struct("!?qqqq")
+"""
+Whether the color is set, the color, the key, the rank in the root
+Communicator and the next free context id of an instance.
+"""
+
+
+def pack_split_entry(
+    color: int | None, key: int, root_rank: int, next_free_context_id: int
+) -> bytes:
+    return _SPLIT_ENTRY.pack(
+        color is not None,
+        color if color is not None else 0,
+        key,
+        root_rank,
+        next_free_context_id,
+    )
+
+
+def compute_context_id(entries: list[memoryview]) -> int:
+    """
+    The context id is larger than any context id, which one of the instances
+    already used, because every instance contributed its next free context
+    id, so the tags of the new Communicators don't collide with the tags of
+    other Communicators.
+    """
+    return max(_SPLIT_ENTRY.unpack(entry)[4] for entry in entries)
+
+
+def compute_root_ranks(entries: list[memoryview], color: int) -> list[int]:
+    """
+    Returns the ranks in the root Communicator of the instances with the color,
+    ordered by their key and then by the order of the entries.
+    """
+    members = []
+    for index, entry in enumerate(entries):
+        has_color, other_color, other_key, root_rank, _ = _SPLIT_ENTRY.unpack(entry)
+        if has_color and other_color == color:
+            members.append((other_key, index, root_rank))
+    return [root_rank for _, _, root_rank in sorted(members)]
+
+
+def create_peer_groups(
+    root_ranks: list[int],
+    context_id: int,
+    number_of_instances_per_node: int,
+    localhost_communicator: PeerGroup,
+    point_to_point_connections: PointToPointConnections | None,
+) -> tuple[PeerGroup, PeerGroup | None]:
+    """
+    Returns the localhost and the multi node PeerGroup of the new Communicator.
+    If all its instances are on the same node, they use the localhost connections
+    of the root Communicator, otherwise its point to point connections. Either
+    way, all instances form a single localhost group and its leader is the only
+    member of the multi node group.
+    """
+    nodes = {root_rank // number_of_instances_per_node for root_rank in root_ranks}
+    peer_communicator: PeerGroup
+    if len(nodes) == 1:
+        peer_communicator = localhost_communicator
+        local_peers = peer_communicator.peers()
+        peers = [
+            local_peers[root_rank % number_of_instances_per_node]
+            for root_rank in root_ranks
+        ]
+    else:
+        connections = check_point_to_point_connections(point_to_point_connections)
+        peer_communicator = connections.peer_communicator
+        peers = [connections.peer(root_rank) for root_rank in root_ranks]
+    tag_offset = context_id * CONTEXT_TAG_STRIDE
+    localhost_group = SubPeerCommunicator(
+        peer_communicator=peer_communicator, peers=peers, tag_offset=tag_offset
+    )
+    multi_node_group: PeerGroup | None = None
+    if localhost_group.peer == localhost_group.leader:
+        multi_node_group = SubPeerCommunicator(
+            peer_communicator=peer_communicator,
+            peers=[peer_communicator.peer],
+            tag_offset=tag_offset,
+        )
+    return localhost_group, multi_node_group
@@ -0,0 +1,264 @@
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+
+import structlog
+from structlog.typing import FilteringBoundLogger
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerGroup
+from exasol.analytics.udf.communication.serialization import (
+    deserialize_message,
+    serialize_message,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import (
+    Frame,
+    SocketFactory,
+)
+from exasol.analytics.utils.errors import IllegalParametersError
+
+_LOGGER: FilteringBoundLogger = structlog.getLogger()
+
+DEFAULT_WINDOW_SIZE = 8
+
+
+def _compute_next_credit(
+    credit: int, number_of_consumed_chunks: int, window_size: int
+) -> int | None:
+    """
+    The receiver grants a new credit, as soon as less than half of the window
+    is left.
+    """
+    if credit - number_of_consumed_chunks <= window_size // 2:
+        return number_of_consumed_chunks + window_size
+    return None
+
+
+def _credit_tag(tag: int) -> int:
+    """
+    The credits flow against the chunks, so they get their own tag. Otherwise,
+    a stream in the other direction with the same tag would receive the credits,
+    which got granted after the last chunk of an earlier stream. The tags of the
+    chunks are non-negative, so the credit tags are the negative ones below -1.
+    """
+    return -tag - 2
+
+
+def _check_window_size(window_size: int):
+    if window_size < 1:
+        raise IllegalParametersError(
+            f"Window size needs to be at least 1, but got {window_size}."
+        )
+
+
+class SendStreamOperation:
+    """
+    Sends the chunks of an iterable one by one to the peer, which receives
+    them with a ReceiveStreamOperation with the same sequence number and window
+    size. The sender only sends the chunks, for which the receiver granted a
+    credit, so at most window_size chunks are buffered at the receiver and the
+    iterable gets consumed only as fast as the receiver consumes the chunks.
+
+    The chunks get sent with the tag, which is the sequence number by default,
+    and the credits with a tag derived from it. Consecutive streams with the same
+    tag need increasing sequence numbers.
+    The sender doesn't wait for the credits, which the receiver grants after the
+    last chunk, and skips them in the next stream with the same tag. If the receiver
+    stops early, the sender blocks as soon as it runs out of credit, so it raises
+    a TimeoutError, if it gets no credit within timeout_in_milliseconds.
+    """
+
+    def __init__(
+        self,
+        sequence_number: int,
+        peer: Peer,
+        peer_communicator: PeerGroup,
+        socket_factory: SocketFactory,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        tag: int | None = None,
+        timeout_in_milliseconds: int | None = None,
+    ):
+        _check_window_size(window_size)
+        self._timeout_in_milliseconds = timeout_in_milliseconds
+        self._tag = sequence_number if tag is None else tag
+        self._window_size = window_size
+        self._socket_factory = socket_factory
+        self._peer_communicator = peer_communicator
+        self._peer = peer
+        self._sequence_number = sequence_number
+        self._logger = _LOGGER.bind(
+            sequence_number=self._sequence_number,
+        )
+
+    def __call__(self, chunks: Iterable[bytes | memoryview]):
+        credit = self._window_size
+        number_of_chunks = 0
+        for chunk in chunks:
+            while number_of_chunks >= credit:
+                credit = self._receive_credit(number_of_chunks)
+            self._send_chunk(chunk, number_of_chunks)
+            number_of_chunks += 1
+        self._send_end(number_of_chunks)
+        self._logger.info("sent", number_of_chunks=number_of_chunks)
+
+    def _send_chunk(self, chunk: bytes | memoryview, chunk_index: int):
+        message = messages.StreamChunk(
+            source=self._peer_communicator.peer,
+            destination=self._peer,
+            sequence_number=self._sequence_number,
+            chunk_index=chunk_index,
+        )
+        self._send(message, [self._socket_factory.create_frame(chunk)])
+
+    def _send_end(self, number_of_chunks: int):
+        message = messages.StreamEnd(
+            source=self._peer_communicator.peer,
+            destination=self._peer,
+            sequence_number=self._sequence_number,
+            number_of_chunks=number_of_chunks,
+        )
+        self._send(message, [])
+
+    def _send(self, message: messages.BaseMessage, value_frames: list[Frame]):
+        serialized_message = serialize_message(message)
+        frames = [self._socket_factory.create_frame(serialized_message), *value_frames]
+        self._peer_communicator.send(peer=self._peer, message=frames, tag=self._tag)
+
+    def _receive_credit(self, number_of_chunks: int) -> int:
+        while True:
+            try:
+                frames = self._peer_communicator.recv(
+                    peer=self._peer,
+                    timeout_in_milliseconds=self._timeout_in_milliseconds,
+                    tag=_credit_tag(self._tag),
+                )
+            except TimeoutError as e:
+                raise TimeoutError(
+                    f"The receiver granted no credit for chunk {number_of_chunks} "
+                    f"within {self._timeout_in_milliseconds} ms, "
+                    f"it might have stopped receiving the stream."
+                ) from e
+            message = deserialize_message(frames[0].to_bytes(), messages.Message)
+            specific_message_obj = message.root
+            if not isinstance(specific_message_obj, messages.StreamCredit):
+                raise TypeError(
+                    f"Received the wrong message type. "
+                    f"Expected {messages.StreamCredit.__name__} got {type(specific_message_obj)}. "
+                    f"For message {message}."
+                )
+            if specific_message_obj.sequence_number < self._sequence_number:
+                # Credit of an earlier stream, which got granted after its last chunk
+                continue
+            if specific_message_obj.sequence_number != self._sequence_number:
+                raise RuntimeError(
+                    f"Got message with different sequence number. "
+                    f"We expect the sequence number {self._sequence_number} "
+                    f"but we got {specific_message_obj.sequence_number} in message {specific_message_obj}"
+                )
+            return specific_message_obj.number_of_chunks
+
+
+class ReceiveStreamOperation:
+    """
+    Yields the chunks, which the peer sends with a SendStreamOperation.
+    The chunks are memoryviews of the received frames. The next chunk
+    gets requested only after the consumer asked for it. If the consumer
+    stops early, the next stream with the same tag skips the remaining
+    chunks of this one.
+    """
+
+    def __init__(
+        self,
+        sequence_number: int,
+        peer: Peer,
+        peer_communicator: PeerGroup,
+        socket_factory: SocketFactory,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        tag: int | None = None,
+    ):
+        _check_window_size(window_size)
+        self._tag = sequence_number if tag is None else tag
+        self._window_size = window_size
+        self._socket_factory = socket_factory
+        self._peer_communicator = peer_communicator
+        self._peer = peer
+        self._sequence_number = sequence_number
+        self._logger = _LOGGER.bind(
+            sequence_number=self._sequence_number,
+        )
+
+    def __call__(self) -> Iterator[memoryview]:
+        credit = self._window_size
+        number_of_chunks = 0
+        while True:
+            frames = self._peer_communicator.recv(peer=self._peer, tag=self._tag)
+            message = deserialize_message(frames[0].to_bytes(), messages.Message)
+            specific_message_obj = message.root
+            if (
+                isinstance(
+                    specific_message_obj, (messages.StreamChunk, messages.StreamEnd)
+                )
+                and specific_message_obj.sequence_number < self._sequence_number
+            ):
+                # Rest of an earlier stream, which its consumer stopped early
+                continue
+            if isinstance(specific_message_obj, messages.StreamEnd):
+                self._check_sequence_number(specific_message_obj)
+                self._check_number_of_chunks(specific_message_obj, number_of_chunks)
+                self._logger.info("received", number_of_chunks=number_of_chunks)
+                return
+            if not isinstance(specific_message_obj, messages.StreamChunk):
+                raise TypeError(
+                    f"Received the wrong message type. "
+                    f"Expected {messages.StreamChunk.__name__} got {type(specific_message_obj)}. "
+                    f"For message {message}."
+                )
+            self._check_sequence_number(specific_message_obj)
+            if specific_message_obj.chunk_index != number_of_chunks:
+                raise RuntimeError(
+                    f"Got chunk {specific_message_obj.chunk_index}, "
+                    f"but expected chunk {number_of_chunks}."
+                )
+            yield frames[1].to_memoryview()
+            number_of_chunks += 1
+            next_credit = _compute_next_credit(
+                credit, number_of_chunks, self._window_size
+            )
+            if next_credit is not None:
+                credit = next_credit
+                self._send_credit(credit)
+
+    def _send_credit(self, credit: int):
+        message = messages.StreamCredit(
+            source=self._peer_communicator.peer,
+            destination=self._peer,
+            sequence_number=self._sequence_number,
+            number_of_chunks=credit,
+        )
+        serialized_message = serialize_message(message)
+        frames = [self._socket_factory.create_frame(serialized_message)]
+        self._peer_communicator.send(
+            peer=self._peer, message=frames, tag=_credit_tag(self._tag)
+        )
+
+    def _check_sequence_number(
+        self, specific_message_obj: messages.StreamChunk | messages.StreamEnd
+    ):
+        if specific_message_obj.sequence_number != self._sequence_number:
+            raise RuntimeError(
+                f"Got message with different sequence number. "
+                f"We expect the sequence number {self._sequence_number} "
+                f"but we got {specific_message_obj.sequence_number} in message {specific_message_obj}"
+            )
+
+    @staticmethod
+    def _check_number_of_chunks(
+        specific_message_obj: messages.StreamEnd, number_of_chunks: int
+    ):
+        if specific_message_obj.number_of_chunks != number_of_chunks:
+            raise RuntimeError(
+                f"Stream ended after {number_of_chunks} chunks, "
+                f"but the sender sent {specific_message_obj.number_of_chunks} chunks."
+            )
@@ -0,0 +1,228 @@
+import structlog
+from structlog.typing import FilteringBoundLogger
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.gather_operation import GatherOperation
+from exasol.analytics.udf.communication.gather_topology import GatherTopology
+from exasol.analytics.udf.communication.messages import (
+    Gather,
+    GatherBundle,
+)
+from exasol.analytics.udf.communication.operation_steps import (
+    Steps,
+    poll_peers,
+    recv,
+    run_blocking,
+    send,
+)
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerGroup
+from exasol.analytics.udf.communication.serialization import (
+    deserialize_message,
+    serialize_message,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import (
+    Frame,
+    SocketFactory,
+)
+from exasol.analytics.utils.errors import UninitializedAttributeError
+
+LOGGER: FilteringBoundLogger = structlog.getLogger()
+
+LOCALHOST_LEADER_RANK = 0
+
+
+class TreeGatherOperation:
+    """
+    Gathers the values of all instances at the multi node leader along a tree
+    over the multi node ranks.
+
+    The instances send their value to their localhost leader, as for the
+    GatherOperation. Each localhost leader combines the values of its node
+    with the results of its children in the tree and sends them as a single
+    message to its parent. With that, the multi node leader only receives
+    one message per child instead of one message per instance in the cluster.
+    """
+
+    def __init__(
+        self,
+        sequence_number: int,
+        value: bytes | memoryview,
+        localhost_communicator: PeerGroup,
+        multi_node_communicator: PeerGroup | None,
+        socket_factory: SocketFactory,
+        number_of_instances_per_node: int,
+        topology: GatherTopology,
+    ):
+        self._topology = topology
+        self._number_of_instances_per_node = number_of_instances_per_node
+        self._socket_factory = socket_factory
+        self._value = value
+        self._sequence_number = sequence_number
+        self._multi_node_communicator = multi_node_communicator
+        self._localhost_communicator = localhost_communicator
+        self._logger = LOGGER.bind(
+            sequence_number=self._sequence_number,
+        )
+
+    def __call__(self) -> list[memoryview] | None:
+        return run_blocking(self.steps())
+
+    def steps(self) -> Steps[list[memoryview] | None]:
+        """
+        Steps of the operation, see operation_steps.
+        """
+        if self._localhost_communicator.rank > LOCALHOST_LEADER_RANK:
+            # The messages to the localhost leader are the same as for the star.
+            operation = GatherOperation(
+                sequence_number=self._sequence_number,
+                value=self._value,
+                localhost_communicator=self._localhost_communicator,
+                multi_node_communicator=self._multi_node_communicator,
+                socket_factory=self._socket_factory,
+                number_of_instances_per_node=self._number_of_instances_per_node,
+            )
+            return (yield from operation.steps())
+        communicator = self._checked_multi_node_communicator
+        result = yield from self._receive_from_local_peers()
+        yield from self._receive_from_children(result)
+        parent = self._topology.parent(communicator.rank, communicator.number_of_peers)
+        if parent is not None:
+            yield from self._send_to_parent(communicator.peers()[parent], result)
+            return None
+        number_of_instances_in_cluster = (
+            communicator.number_of_peers * self._number_of_instances_per_node
+        )
+        if len(result) != number_of_instances_in_cluster:
+            raise RuntimeError(
+                f"Got {len(result)} values, but expected {number_of_instances_in_cluster}."
+            )
+        return [
+            result[position].to_memoryview()
+            for position in range(number_of_instances_in_cluster)
+        ]
+
+    @property
+    def _checked_multi_node_communicator(self) -> PeerGroup:
+        value = self._multi_node_communicator
+        if value is None:
+            raise UninitializedAttributeError("Multi node communicator is undefined.")
+        return value
+
+    def _receive_from_local_peers(self) -> Steps[dict[int, Frame]]:
+        self._logger.info("_receive_from_local_peers")
+        communicator = self._localhost_communicator
+        node_base_position = (
+            self._checked_multi_node_communicator.rank
+            * self._number_of_instances_per_node
+        )
+        # The frames get forwarded as they are, to not copy the values per hop.
+        result = {node_base_position: self._socket_factory.create_frame(self._value)}
+        peers_without_message = [
+            peer for peer in communicator.peers() if peer != communicator.peer
+        ]
+        while len(peers_without_message) > 0:
+            peers = yield from poll_peers(
+                communicator, peers=peers_without_message, tag=self._sequence_number
+            )
+            for peer in peers:
+                frames = yield from recv(communicator, peer, tag=self._sequence_number)
+                message = deserialize_message(frames[0].to_bytes(), messages.Message)
+                specific_message_obj = self._get_and_check_specific_message_obj(
+                    message, Gather
+                )
+                self._check_sequence_number(specific_message_obj)
+                local_position = specific_message_obj.position
+                if not (0 < local_position < self._number_of_instances_per_node):
+                    raise RuntimeError(
+                        f"Got message with not allowed position. "
+                        f"Position needs to be greater than 0 and smaller than {self._number_of_instances_per_node}, "
+                        f"but we got {local_position} in message {specific_message_obj}"
+                    )
+                self._add_to_result(
+                    result,
+                    node_base_position + local_position,
+                    frames[1],
+                )
+                peers_without_message.remove(peer)
+        return result
+
+    def _receive_from_children(self, result: dict[int, Frame]) -> Steps[None]:
+        self._logger.info("_receive_from_children")
+        communicator = self._checked_multi_node_communicator
+        number_of_nodes = communicator.number_of_peers
+        peers = communicator.peers()
+        expected_number_of_values = {
+            peers[child]: self._topology.subtree_size(child, number_of_nodes)
+            * self._number_of_instances_per_node
+            for child in self._topology.children(communicator.rank, number_of_nodes)
+        }
+        while len(expected_number_of_values) > 0:
+            peers_with_messages = yield from poll_peers(
+                communicator,
+                peers=list(expected_number_of_values.keys()),
+                tag=self._sequence_number,
+            )
+            for peer in peers_with_messages:
+                frames = yield from recv(communicator, peer, tag=self._sequence_number)
+                message = deserialize_message(frames[0].to_bytes(), messages.Message)
+                specific_message_obj = self._get_and_check_specific_message_obj(
+                    message, GatherBundle
+                )
+                self._check_sequence_number(specific_message_obj)
+                value_frames = frames[1:]
+                positions = specific_message_obj.positions
+                if not (
+                    len(positions)
+                    == len(value_frames)
+                    == expected_number_of_values[peer]
+                ):
+                    raise RuntimeError(
+                        f"Got message with {len(value_frames)} values, but expected "
+                        f"{expected_number_of_values[peer]} in message {specific_message_obj}"
+                    )
+                for position, frame in zip(positions, value_frames):
+                    self._add_to_result(result, position, frame)
+                del expected_number_of_values[peer]
+
+    def _send_to_parent(self, parent: Peer, result: dict[int, Frame]) -> Steps[None]:
+        self._logger.info("_send_to_parent", parent=parent)
+        communicator = self._checked_multi_node_communicator
+        message = GatherBundle(
+            sequence_number=self._sequence_number,
+            source=communicator.peer,
+            destination=parent,
+            positions=list(result.keys()),
+        )
+        serialized_message = serialize_message(message)
+        frames = [self._socket_factory.create_frame(serialized_message)] + list(
+            result.values()
+        )
+        yield from send(
+            communicator, peer=parent, message=frames, tag=self._sequence_number
+        )
+
+    def _add_to_result(self, result: dict[int, Frame], position: int, value: Frame):
+        if position in result:
+            raise RuntimeError(f"Already received a value for position {position}.")
+        result[position] = value
+
+    def _check_sequence_number(self, specific_message_obj: Gather | GatherBundle):
+        if specific_message_obj.sequence_number != self._sequence_number:
+            raise RuntimeError(
+                f"Got message with different sequence number. "
+                f"We expect the sequence number {self._sequence_number} "
+                f"but we got {specific_message_obj.sequence_number} in message {specific_message_obj}"
+            )
+
+    def _get_and_check_specific_message_obj(
+        self, message: messages.Message, expected_type: type
+    ):
+        specific_message_obj = message.root
+        if not isinstance(specific_message_obj, expected_type):
+            raise TypeError(
+                f"Received the wrong message type. "
+                f"Expected {expected_type.__name__} got {type(message)}. "
+                f"For message {message}."
+            )
+        return specific_message_obj
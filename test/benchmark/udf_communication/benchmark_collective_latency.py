@@ -0,0 +1,152 @@
+"""
+Benchmark for the latency of the collective operations of the Communicator.
+
+The given number of nodes times instances per node processes, by default 64,
+form a Communicator and run each collective operation repeatedly. The collective
+operations access rank, leader and peers of the PeerCommunicators several times
+per call, so the latency includes these accesses. Each line reports the mean
+latency of a collective operation and the mean duration of an access to rank
+and is_multi_node_leader at the first instance. All processes run on this
+machine, so it needs enough cores for the number of instances.
+
+Run with: python -m test.benchmark.udf_communication.benchmark_collective_latency
+[--number-of-nodes N] [--number-of-instances-per-node M]
+[--localhost-ipc-directory DIR]
+"""
+
+import argparse
+import logging
+import multiprocessing
+import time
+from collections.abc import Callable
+from multiprocessing import Queue
+
+import structlog
+import zmq
+
+from exasol.analytics.udf.communication.communicator import Communicator
+from exasol.analytics.udf.communication.communicator_config import (
+    CommunicatorConfig,
+)
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
+from exasol.analytics.udf.communication.socket_factory.zmq_wrapper import (
+    ZMQSocketFactory,
+)
+
+DEFAULT_NUMBER_OF_NODES = 8
+DEFAULT_NUMBER_OF_INSTANCES_PER_NODE = 8
+NUMBER_OF_WARMUP_REPETITIONS = 5
+NUMBER_OF_REPETITIONS = 50
+NUMBER_OF_ACCESSES = 10000
+MULTI_NODE_DISCOVERY_PORT = 45444
+FIRST_LOCAL_DISCOVERY_PORT = 45445
+
+
+def measure_latency_in_ms(operation: Callable[[], object]) -> float:
+    for _ in range(NUMBER_OF_WARMUP_REPETITIONS):
+        operation()
+    start_time = time.monotonic()
+    for _ in range(NUMBER_OF_REPETITIONS):
+        operation()
+    return (time.monotonic() - start_time) / NUMBER_OF_REPETITIONS * 1000
+
+
+def measure_access_in_us(communicator: Communicator) -> float:
+    start_time = time.monotonic()
+    for _ in range(NUMBER_OF_ACCESSES):
+        communicator.rank
+        communicator.is_multi_node_leader()
+    return (time.monotonic() - start_time) / NUMBER_OF_ACCESSES * 10**6
+
+
+def run(
+    node: int,
+    instance: int,
+    number_of_nodes: int,
+    number_of_instances_per_node: int,
+    group_identifier: str,
+    localhost_ipc_directory: str | None,
+    result_queue: Queue,
+):
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+    )
+    context = zmq.Context()
+    communicator = Communicator(
+        multi_node_discovery_ip=IPAddress(ip_address="127.0.0.1"),
+        multi_node_discovery_port=Port(port=MULTI_NODE_DISCOVERY_PORT),
+        local_discovery_port=Port(port=FIRST_LOCAL_DISCOVERY_PORT + node),
+        node_name=f"n{node}",
+        instance_name=f"i{instance}",
+        listen_ip=IPAddress(ip_address="127.0.0.1"),
+        group_identifier=group_identifier,
+        number_of_nodes=number_of_nodes,
+        number_of_instances_per_node=number_of_instances_per_node,
+        is_discovery_leader_node=node == 0,
+        socket_factory=ZMQSocketFactory(context),
+        config=CommunicatorConfig(localhost_ipc_directory=localhost_ipc_directory),
+    )
+    value = b"x" * 16
+    is_root = communicator.rank == 0
+    latencies_in_ms = {
+        "gather": measure_latency_in_ms(lambda: communicator.gather(value)),
+        "broadcast": measure_latency_in_ms(
+            lambda: communicator.broadcast(value if is_root else None)
+        ),
+        "allgather": measure_latency_in_ms(lambda: communicator.allgather(value)),
+        "barrier": measure_latency_in_ms(communicator.barrier),
+    }
+    access_in_us = measure_access_in_us(communicator)
+    if is_root:
+        result_queue.put((latencies_in_ms, access_in_us))
+    communicator.barrier()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number-of-nodes", type=int, default=DEFAULT_NUMBER_OF_NODES)
+    parser.add_argument(
+        "--number-of-instances-per-node",
+        type=int,
+        default=DEFAULT_NUMBER_OF_INSTANCES_PER_NODE,
+    )
+    parser.add_argument("--localhost-ipc-directory", default=None)
+    args = parser.parse_args()
+    number_of_nodes = args.number_of_nodes
+    number_of_instances_per_node = args.number_of_instances_per_node
+    group_identifier = f"{time.monotonic_ns()}"
+    result_queue: Queue = Queue()
+    processes = [
+        multiprocessing.Process(
+            target=run,
+            args=(
+                node,
+                instance,
+                number_of_nodes,
+                number_of_instances_per_node,
+                group_identifier,
+                args.localhost_ipc_directory,
+                result_queue,
+            ),
+        )
+        for node in range(number_of_nodes)
+        for instance in range(number_of_instances_per_node)
+    ]
+    for process in processes:
+        process.start()
+    latencies_in_ms, access_in_us = result_queue.get()
+    for process in processes:
+        process.join()
+    number_of_instances = number_of_nodes * number_of_instances_per_node
+    print(f"{number_of_instances} instances on {number_of_nodes} nodes")
+    print(f"{'operation':>12} {'latency ms':>12}")
+    for name, latency_in_ms in latencies_in_ms.items():
+        print(f"{name:>12} {latency_in_ms:>12.2f}")
+    print(f"rank and is_multi_node_leader: {access_in_us:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
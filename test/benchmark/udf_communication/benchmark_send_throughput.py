@@ -0,0 +1,174 @@
+"""
+Benchmark for the throughput of PeerCommunicator.send between two peers.
+
+Two processes connect to each other via PeerCommunicator. The first one sends
+a fixed number of messages to the second one, which receives all of them and
+reports the messages per second. Each message size gets measured with raw and
+with compressed payloads. The values are JSON records, which compress similar
+to the values of real UDFs. The MB/s refer to the uncompressed values.
+On loopback the raw payloads are faster, but the compression pays off on links,
+whose bandwidth is below the MB/s of the compressed payloads, as long as the
+bandwidth times the compression ratio exceeds it.
+
+Run with: python -m test.benchmark.udf_communication.benchmark_send_throughput
+"""
+
+import json
+import logging
+import multiprocessing
+import time
+import zlib
+from multiprocessing import Queue
+
+import structlog
+import zmq
+from numpy.random import RandomState
+
+from exasol.analytics.udf.communication.ip_address import IPAddress
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.peer_communicator.forward_register_peer_config import (
+    ForwardRegisterPeerConfig,
+)
+from exasol.analytics.udf.communication.peer_communicator.payload_compression_config import (
+    PayloadCompressionConfig,
+)
+from exasol.analytics.udf.communication.peer_communicator.peer_communicator_config import (
+    PeerCommunicatorConfig,
+)
+from exasol.analytics.udf.communication.socket_factory.zmq_wrapper import (
+    ZMQSocketFactory,
+)
+
+NUMBER_OF_MESSAGES = 2000
+MESSAGE_SIZES_IN_BYTES = [16, 1024, 65536, 1048576]
+COMPRESSION_CONFIGS = {
+    "raw": PayloadCompressionConfig(),
+    "zlib": PayloadCompressionConfig(threshold_in_bytes=1024),
+}
+
+
+def create_value(message_size_in_bytes: int) -> bytes:
+    random_state = RandomState(0)
+    records = []
+    size = 0
+    while size < message_size_in_bytes:
+        record = json.dumps(
+            {
+                "id": int(random_state.randint(0, 10**6)),
+                "category": f"category_{random_state.randint(0, 10)}",
+                "value": round(float(random_state.normal()), 4),
+            }
+        )
+        records.append(record)
+        size += len(record) + 1
+    return "\n".join(records).encode("utf8")[:message_size_in_bytes]
+
+
+def run(
+    instance_name: str,
+    group_identifier: str,
+    message_size_in_bytes: int,
+    compression_config: PayloadCompressionConfig,
+    put_queue: Queue,
+    get_queue: Queue,
+):
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+    context = zmq.Context()
+    socket_factory = ZMQSocketFactory(context)
+    communicator = PeerCommunicator(
+        name=instance_name,
+        number_of_peers=2,
+        listen_ip=IPAddress(ip_address="127.1.0.1"),
+        group_identifier=group_identifier,
+        socket_factory=socket_factory,
+        config=PeerCommunicatorConfig(
+            forward_register_peer_config=ForwardRegisterPeerConfig(
+                is_leader=False, is_enabled=False
+            ),
+            payload_compression_config=compression_config,
+        ),
+    )
+    try:
+        put_queue.put(communicator.my_connection_info)
+        communicator.register_peer(get_queue.get())
+        communicator.wait_for_peers()
+        other_peer = next(
+            peer for peer in communicator.peers() if peer != communicator.peer
+        )
+        if communicator.rank == 0:
+            value = create_value(message_size_in_bytes)
+            for _ in range(NUMBER_OF_MESSAGES):
+                communicator.send(other_peer, [socket_factory.create_frame(value)])
+            communicator.recv(other_peer)
+        else:
+            start_time = time.monotonic()
+            for _ in range(NUMBER_OF_MESSAGES):
+                communicator.recv(other_peer)
+            duration = time.monotonic() - start_time
+            communicator.send(other_peer, [socket_factory.create_frame(b"done")])
+            put_queue.put(NUMBER_OF_MESSAGES / duration)
+        communicator.stop()
+    finally:
+        context.destroy(linger=0)
+
+
+def measure_messages_per_second(
+    message_size_in_bytes: int, compression_config: PayloadCompressionConfig
+) -> float:
+    group_identifier = f"{time.monotonic_ns()}"
+    put_queues = [Queue(), Queue()]
+    get_queues = [Queue(), Queue()]
+    processes = [
+        multiprocessing.Process(
+            target=run,
+            args=(
+                f"i{index}",
+                group_identifier,
+                message_size_in_bytes,
+                compression_config,
+                put_queues[index],
+                get_queues[index],
+            ),
+        )
+        for index in range(2)
+    ]
+    for process in processes:
+        process.start()
+    connection_infos = [queue.get() for queue in put_queues]
+    for queue, connection_info in zip(get_queues, reversed(connection_infos)):
+        queue.put(connection_info)
+    # Only the receiving peer reports a result.
+    result = None
+    while result is None:
+        for queue in put_queues:
+            if not queue.empty():
+                result = queue.get()
+        time.sleep(0.01)
+    for process in processes:
+        process.join()
+    return result
+
+
+def main():
+    print(
+        f"{'message size':>14} {'compression':>12} {'ratio':>6} "
+        f"{'messages/s':>12} {'MB/s':>10}"
+    )
+    for message_size_in_bytes in MESSAGE_SIZES_IN_BYTES:
+        value = create_value(message_size_in_bytes)
+        compression_ratio = len(value) / len(zlib.compress(value, 1))
+        for name, compression_config in COMPRESSION_CONFIGS.items():
+            messages_per_second = measure_messages_per_second(
+                message_size_in_bytes, compression_config
+            )
+            megabytes_per_second = messages_per_second * message_size_in_bytes / 10**6
+            print(
+                f"{message_size_in_bytes:>14} {name:>12} {compression_ratio:>6.1f} "
+                f"{messages_per_second:>12.0f} {megabytes_per_second:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Micro-benchmark for the encoding and decoding of the protocol messages.
+
+Compares the JSON encoding, which was used for all messages before,
+with the binary encoding for the frequent message types.
+
+Run with: python -m test.benchmark.udf_communication.benchmark_serialization
+"""
+
+import timeit
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.connection_info import ConnectionInfo
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.serialization import (
+    deserialize_message,
+    serialize_message,
+)
+
+NUMBER_OF_MESSAGES = 20000
+REPEAT = 5
+
+
+def create_peer(name: str) -> Peer:
+    return Peer(
+        connection_info=ConnectionInfo(
+            name=name,
+            port=Port(port=44444),
+            ipaddress=IPAddress(ip_address="10.0.0.1"),
+            group_identifier="1730000000000000000_global",
+        )
+    )
+
+
+def create_messages() -> list[messages.BaseMessage]:
+    source = create_peer("n0_i0_global")
+    destination = create_peer("n1_i0_global")
+    return [
+        messages.Payload(source=source, destination=destination, sequence_number=1),
+        messages.AcknowledgePayload(
+            source=source, destination=destination, sequence_number=1
+        ),
+        messages.Gather(
+            source=source, destination=destination, sequence_number=1, position=3
+        ),
+        messages.Broadcast(source=source, destination=destination, sequence_number=1),
+    ]
+
+
+def serialize_json(message: messages.BaseMessage) -> bytes:
+    return message.model_dump_json().encode("UTF-8")
+
+
+def deserialize_json(byte_string: bytes) -> messages.Message:
+    return messages.Message.model_validate_json(byte_string)
+
+
+def measure_in_microseconds(function, argument) -> float:
+    seconds = min(
+        timeit.repeat(
+            lambda: function(argument), number=NUMBER_OF_MESSAGES, repeat=REPEAT
+        )
+    )
+    return seconds / NUMBER_OF_MESSAGES * 1e6
+
+
+def main():
+    print(
+        f"{'message':<20} {'size json':>10} {'size bin':>10} "
+        f"{'enc json':>10} {'enc bin':>10} {'dec json':>10} {'dec bin':>10}"
+    )
+    for message in create_messages():
+        json_bytes = serialize_json(message)
+        binary_bytes = serialize_message(message)
+        encode_json = measure_in_microseconds(serialize_json, message)
+        encode_binary = measure_in_microseconds(serialize_message, message)
+        decode_json = measure_in_microseconds(deserialize_json, json_bytes)
+        decode_binary = measure_in_microseconds(
+            lambda byte_string: deserialize_message(byte_string, messages.Message),
+            binary_bytes,
+        )
+        print(
+            f"{type(message).__name__:<20} {len(json_bytes):>10} {len(binary_bytes):>10} "
+            f"{encode_json:>8.2f}us {encode_binary:>8.2f}us "
+            f"{decode_json:>8.2f}us {decode_binary:>8.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -70,7 +70,15 @@ def run(parameter: PeerCommunicatorTestProcessParameter, queue: BidirectionalQue
                 com.register_peer(connection_info)
             peers = com.peers(timeout_in_milliseconds=None)
             logger.info("peers", number_of_peers=len(peers))
-            queue.put(peers)
+            ranks = [com.rank_of(peer) for peer in peers]
+            if (
+                com.leader != peers[0]
+                or com.rank != peers.index(com.peer)
+                or ranks != list(range(len(peers)))
+            ):
+                queue.put(f"Inconsistent leader {com.leader} or rank {com.rank}")
+            else:
+                queue.put(peers)
         finally:
             com.stop()
             logger.info("after close")
@@ -0,0 +1,124 @@
+import time
+from test.integration.no_db.structlog.structlog_utils import configure_structlog
+from test.integration.no_db.udf_communication.peer_communication.utils import (
+    BidirectionalQueue,
+    PeerCommunicatorTestProcessParameter,
+    TestProcess,
+    assert_processes_finish,
+)
+
+import structlog
+import zmq
+from structlog.typing import FilteringBoundLogger
+
+from exasol.analytics.udf.communication.connection_info import ConnectionInfo
+from exasol.analytics.udf.communication.ip_address import IPAddress
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.peer_communicator.forward_register_peer_config import (
+    ForwardRegisterPeerConfig,
+)
+from exasol.analytics.udf.communication.peer_communicator.payload_flow_control_config import (
+    PayloadFlowControlConfig,
+)
+from exasol.analytics.udf.communication.peer_communicator.peer_communicator_config import (
+    PeerCommunicatorConfig,
+)
+from exasol.analytics.udf.communication.socket_factory.zmq_wrapper import (
+    ZMQSocketFactory,
+)
+
+configure_structlog(__file__)
+
+LOGGER: FilteringBoundLogger = structlog.get_logger()
+
+MAX_IN_FLIGHT_MESSAGES = 2
+NUMBER_OF_MESSAGES = 5
+SENDER_WAIT_TIME_IN_SECONDS = 0.5
+RECEIVER_WAIT_TIME_IN_SECONDS = 1
+
+
+def run(parameter: PeerCommunicatorTestProcessParameter, queue: BidirectionalQueue):
+    """
+    The sender fills its window, while the receiver doesn't receive yet. The
+    acknowledgements of the arrived payloads must not free the window, only the
+    receive of the receiver does.
+    """
+    logger = LOGGER.bind(
+        group_identifier=parameter.group_identifier, name=parameter.instance_name
+    )
+    try:
+        listen_ip = IPAddress(ip_address=f"127.1.0.1")
+        context = zmq.Context()
+        socket_factory = ZMQSocketFactory(context)
+        com = PeerCommunicator(
+            name=parameter.instance_name,
+            number_of_peers=parameter.number_of_instances,
+            listen_ip=listen_ip,
+            group_identifier=parameter.group_identifier,
+            socket_factory=socket_factory,
+            config=PeerCommunicatorConfig(
+                forward_register_peer_config=ForwardRegisterPeerConfig(
+                    is_leader=False, is_enabled=False
+                ),
+                payload_flow_control_config=PayloadFlowControlConfig(
+                    max_in_flight_messages=MAX_IN_FLIGHT_MESSAGES
+                ),
+            ),
+        )
+        try:
+            queue.put(com.my_connection_info)
+            peer_connection_infos = queue.get()
+            for index, connection_infos in peer_connection_infos.items():
+                com.register_peer(connection_infos)
+            com.wait_for_peers()
+            other_peer = next(peer for peer in com.peers() if peer != com.peer)
+            if parameter.instance_name == "i0":
+                for index in range(MAX_IN_FLIGHT_MESSAGES):
+                    com.send(other_peer, [socket_factory.create_frame(b"%d" % index)])
+                time.sleep(SENDER_WAIT_TIME_IN_SECONDS)
+                frame = socket_factory.create_frame(b"%d" % MAX_IN_FLIGHT_MESSAGES)
+                was_throttled = not com.try_send(other_peer, [frame])
+                com.send(other_peer, [frame])
+                for index in range(MAX_IN_FLIGHT_MESSAGES + 1, NUMBER_OF_MESSAGES):
+                    com.send(other_peer, [socket_factory.create_frame(b"%d" % index)])
+                queue.put(was_throttled)
+            else:
+                time.sleep(RECEIVER_WAIT_TIME_IN_SECONDS)
+                received_values = [
+                    com.recv(other_peer)[0].to_bytes()
+                    for _ in range(NUMBER_OF_MESSAGES)
+                ]
+                queue.put(received_values)
+        finally:
+            com.stop()
+            context.destroy(linger=0)
+    except Exception as e:
+        logger.exception("Exception during test")
+        queue.put(f"Failed: {e}")
+
+
+def test_functionality():
+    group = f"{time.monotonic_ns()}"
+    number_of_instances = 2
+    parameters = [
+        PeerCommunicatorTestProcessParameter(
+            instance_name=f"i{i}",
+            group_identifier=group,
+            number_of_instances=number_of_instances,
+            seed=i,
+        )
+        for i in range(number_of_instances)
+    ]
+    processes: list[TestProcess[PeerCommunicatorTestProcessParameter]] = [
+        TestProcess(parameter, run=run) for parameter in parameters
+    ]
+    connection_infos: dict[int, ConnectionInfo] = {}
+    for i in range(number_of_instances):
+        processes[i].start()
+    for i in range(number_of_instances):
+        connection_infos[i] = processes[i].get()
+    for i in range(number_of_instances):
+        processes[i].put(connection_infos)
+    assert_processes_finish(processes, timeout_in_seconds=180)
+    results = [processes[i].get() for i in range(number_of_instances)]
+    assert results == [True, [b"%d" % index for index in range(NUMBER_OF_MESSAGES)]]
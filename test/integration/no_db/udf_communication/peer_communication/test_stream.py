@@ -0,0 +1,138 @@
+import hashlib
+import time
+from test.integration.no_db.structlog.structlog_utils import configure_structlog
+from test.integration.no_db.udf_communication.peer_communication.utils import (
+    BidirectionalQueue,
+    PeerCommunicatorTestProcessParameter,
+    TestProcess,
+    assert_processes_finish,
+)
+
+import structlog
+import zmq
+from numpy.random import RandomState
+from structlog.typing import FilteringBoundLogger
+
+from exasol.analytics.udf.communication.connection_info import ConnectionInfo
+from exasol.analytics.udf.communication.ip_address import IPAddress
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.peer_communicator.forward_register_peer_config import (
+    ForwardRegisterPeerConfig,
+)
+from exasol.analytics.udf.communication.peer_communicator.peer_communicator_config import (
+    PeerCommunicatorConfig,
+)
+from exasol.analytics.udf.communication.socket_factory.fault_injection import (
+    FaultInjectionSocketFactory,
+)
+from exasol.analytics.udf.communication.socket_factory.zmq_wrapper import (
+    ZMQSocketFactory,
+)
+from exasol.analytics.udf.communication.stream_operation import (
+    ReceiveStreamOperation,
+    SendStreamOperation,
+)
+
+configure_structlog(__file__)
+
+LOGGER: FilteringBoundLogger = structlog.get_logger()
+
+NUMBER_OF_CHUNKS = 50
+CHUNK_SIZE_IN_BYTES = 100_000
+WINDOW_SIZE = 4
+
+
+def generate_chunks(seed: int):
+    random_state = RandomState(seed)
+    for _ in range(NUMBER_OF_CHUNKS):
+        yield random_state.bytes(CHUNK_SIZE_IN_BYTES)
+
+
+def compute_digest(chunks) -> str:
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def run(parameter: PeerCommunicatorTestProcessParameter, queue: BidirectionalQueue):
+    logger = LOGGER.bind(
+        group_identifier=parameter.group_identifier, name=parameter.instance_name
+    )
+    try:
+        listen_ip = IPAddress(ip_address=f"127.1.0.1")
+        context = zmq.Context()
+        socket_factory = ZMQSocketFactory(context)
+        socket_factory = FaultInjectionSocketFactory(
+            socket_factory, 0.01, RandomState(parameter.seed)
+        )
+        com = PeerCommunicator(
+            name=parameter.instance_name,
+            number_of_peers=parameter.number_of_instances,
+            listen_ip=listen_ip,
+            group_identifier=parameter.group_identifier,
+            socket_factory=socket_factory,
+            config=PeerCommunicatorConfig(
+                forward_register_peer_config=ForwardRegisterPeerConfig(
+                    is_leader=False, is_enabled=False
+                ),
+            ),
+        )
+        try:
+            queue.put(com.my_connection_info)
+            peer_connection_infos = queue.get()
+            for index, connection_infos in peer_connection_infos.items():
+                com.register_peer(connection_infos)
+            com.wait_for_peers()
+            peer = next(peer for peer in com.peers() if peer != com.peer)
+            if com.rank == 0:
+                SendStreamOperation(
+                    sequence_number=0,
+                    peer=peer,
+                    peer_communicator=com,
+                    socket_factory=socket_factory,
+                    window_size=WINDOW_SIZE,
+                )(generate_chunks(parameter.seed))
+                queue.put(compute_digest(generate_chunks(parameter.seed)))
+            else:
+                chunks = ReceiveStreamOperation(
+                    sequence_number=0,
+                    peer=peer,
+                    peer_communicator=com,
+                    socket_factory=socket_factory,
+                    window_size=WINDOW_SIZE,
+                )()
+                queue.put(compute_digest(chunks))
+        finally:
+            com.stop()
+            context.destroy(linger=0)
+    except Exception as e:
+        logger.exception("Exception during test")
+        queue.put(f"Failed: {e}")
+
+
+def test_functionality():
+    group = f"{time.monotonic_ns()}"
+    number_of_instances = 2
+    parameters = [
+        PeerCommunicatorTestProcessParameter(
+            instance_name=f"i{i}",
+            group_identifier=group,
+            number_of_instances=number_of_instances,
+            seed=i,
+        )
+        for i in range(number_of_instances)
+    ]
+    processes: list[TestProcess[PeerCommunicatorTestProcessParameter]] = [
+        TestProcess(parameter, run=run) for parameter in parameters
+    ]
+    connection_infos: dict[int, ConnectionInfo] = {}
+    for i in range(number_of_instances):
+        processes[i].start()
+    for i in range(number_of_instances):
+        connection_infos[i] = processes[i].get()
+    for i in range(number_of_instances):
+        processes[i].put(connection_infos)
+    assert_processes_finish(processes, timeout_in_seconds=180)
+    digests = {processes[i].get() for i in range(number_of_instances)}
+    assert len(digests) == 1 and not next(iter(digests)).startswith("Failed")
@@ -0,0 +1,182 @@
+import time
+from test.integration.no_db.structlog.structlog_utils import configure_structlog
+from test.integration.no_db.udf_communication.peer_communication.utils import (
+    BidirectionalQueue,
+    CommunicatorTestProcessParameter,
+    TestProcess,
+    assert_processes_finish,
+)
+
+import numpy as np
+import structlog
+import zmq
+from structlog.types import FilteringBoundLogger
+
+from exasol.analytics.udf.communication.communicator import Communicator
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
+from exasol.analytics.udf.communication.reducers import (
+    max_reducer,
+    min_reducer,
+    sum_reducer,
+)
+from exasol.analytics.udf.communication.socket_factory.zmq_wrapper import (
+    ZMQSocketFactory,
+)
+
+configure_structlog(__file__)
+
+LOGGER: FilteringBoundLogger = structlog.get_logger(__name__)
+
+
+def run(parameter: CommunicatorTestProcessParameter, queue: BidirectionalQueue):
+    try:
+        is_discovery_leader_node = parameter.node_name == "n0"
+        context = zmq.Context()
+        socket_factory = ZMQSocketFactory(context)
+        communicator = Communicator(
+            multi_node_discovery_port=Port(port=44444),
+            local_discovery_port=parameter.local_discovery_port,
+            multi_node_discovery_ip=IPAddress(ip_address="127.0.0.1"),
+            node_name=parameter.node_name,
+            instance_name=parameter.instance_name,
+            listen_ip=IPAddress(ip_address="127.0.0.1"),
+            group_identifier=parameter.group_identifier,
+            number_of_nodes=parameter.number_of_nodes,
+            number_of_instances_per_node=parameter.number_of_instances_per_node,
+            is_discovery_leader_node=is_discovery_leader_node,
+            socket_factory=socket_factory,
+        )
+        node = int(parameter.node_name[1:])
+        instance = int(parameter.instance_name[1:])
+        position = node * parameter.number_of_instances_per_node + instance
+        number_of_instances = (
+            parameter.number_of_nodes * parameter.number_of_instances_per_node
+        )
+        value = np.array([position, 1.0], dtype=np.float64).tobytes()
+        sum_result = communicator.allreduce(value, sum_reducer(np.float64))
+        min_result = communicator.allreduce(value, min_reducer(np.float64))
+        max_result = communicator.allreduce(value, max_reducer(np.float64))
+        LOGGER.info(
+            "result",
+            sum_result=sum_result,
+            instance_name=parameter.instance_name,
+            node_name=parameter.node_name,
+        )
+        expected_sum = [sum(range(number_of_instances)), number_of_instances]
+        actual_sum = np.frombuffer(sum_result, dtype=np.float64).tolist()
+        if actual_sum != expected_sum:
+            queue.put(f"Sum failed: {actual_sum} != {expected_sum}")
+            return
+        actual_min = np.frombuffer(min_result, dtype=np.float64).tolist()
+        if actual_min != [0, 1]:
+            queue.put(f"Min failed: {actual_min} != [0, 1]")
+            return
+        actual_max = np.frombuffer(max_result, dtype=np.float64).tolist()
+        if actual_max != [number_of_instances - 1, 1]:
+            queue.put(f"Max failed: {actual_max} != [{number_of_instances - 1}, 1]")
+            return
+        queue.put("Success")
+    except Exception as e:
+        LOGGER.exception("Exception during test")
+        queue.put(f"Failed during test: {e}")
+
+
+REPETITIONS_FOR_FUNCTIONALITY = 1
+
+
+def test_functionality_2_1():
+    run_test_with_repetitions(
+        number_of_nodes=2,
+        number_of_instances_per_node=1,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+    )
+
+
+def test_functionality_1_2():
+    run_test_with_repetitions(
+        number_of_nodes=1,
+        number_of_instances_per_node=2,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+    )
+
+
+def test_functionality_2_2():
+    run_test_with_repetitions(
+        number_of_nodes=2,
+        number_of_instances_per_node=2,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+    )
+
+
+def test_functionality_3_3():
+    run_test_with_repetitions(
+        number_of_nodes=3,
+        number_of_instances_per_node=3,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+    )
+
+
+def run_test_with_repetitions(
+    number_of_nodes: int, number_of_instances_per_node: int, repetitions: int
+):
+    for i in range(repetitions):
+        group = f"{time.monotonic_ns()}"
+        LOGGER.info(
+            f"Start iteration",
+            iteration=i + 1,
+            repetitions=repetitions,
+            group_identifier=group,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+        )
+        start_time = time.monotonic()
+        expected_result_of_threads, actual_result_of_threads = run_test(
+            group_identifier=group,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+        )
+        assert expected_result_of_threads == actual_result_of_threads
+        end_time = time.monotonic()
+        LOGGER.info(
+            f"Finish iteration",
+            iteration=i + 1,
+            repetitions=repetitions,
+            group_identifier=group,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+            duration=end_time - start_time,
+        )
+
+
+def run_test(
+    group_identifier: str, number_of_nodes: int, number_of_instances_per_node: int
+):
+    parameters = [
+        CommunicatorTestProcessParameter(
+            node_name=f"n{n}",
+            instance_name=f"i{i}",
+            group_identifier=group_identifier,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+            local_discovery_port=Port(port=44445 + n),
+            seed=0,
+        )
+        for n in range(number_of_nodes)
+        for i in range(number_of_instances_per_node)
+    ]
+    processes: list[TestProcess[CommunicatorTestProcessParameter]] = [
+        TestProcess(parameter, run=run) for parameter in parameters
+    ]
+    for process in processes:
+        process.start()
+    assert_processes_finish(processes, timeout_in_seconds=180)
+    actual_result_of_threads: dict[tuple[str, str], str] = {}
+    expected_result_of_threads: dict[tuple[str, str], str] = {}
+    for process in processes:
+        result_key = (process.parameter.node_name, process.parameter.instance_name)
+        actual_result_of_threads[result_key] = process.get()
+        expected_result_of_threads[result_key] = "Success"
+    return expected_result_of_threads, actual_result_of_threads
@@ -53,7 +53,7 @@ def run(parameter: CommunicatorTestProcessParameter, queue: BidirectionalQueue):
             instance_name=parameter.instance_name,
             node_name=parameter.node_name,
         )
-        queue.put(result.decode("utf-8"))
+        queue.put(bytes(result).decode("utf-8"))
     except Exception as e:
         LOGGER.exception("Exception during test")
         queue.put(f"Failed during test: {e}")
@@ -0,0 +1,268 @@
+import time
+from collections.abc import Callable
+from test.integration.no_db.structlog.structlog_utils import configure_structlog
+from test.integration.no_db.udf_communication.peer_communication.utils import (
+    BidirectionalQueue,
+    CommunicatorTestProcessParameter,
+    TestProcess,
+    assert_processes_finish,
+)
+
+import structlog
+import zmq
+from structlog.types import FilteringBoundLogger
+
+from exasol.analytics.udf.communication.communicator import Communicator
+from exasol.analytics.udf.communication.communicator_config import (
+    CommunicatorConfig,
+)
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
+from exasol.analytics.udf.communication.socket_factory.zmq_wrapper import (
+    ZMQSocketFactory,
+)
+
+configure_structlog(__file__)
+
+LOGGER: FilteringBoundLogger = structlog.get_logger(__name__)
+
+WINDOW_SIZE = 4
+
+
+def create_chunks(number_of_chunks: int) -> list[bytes]:
+    return [f"{i}".encode() * 1000 for i in range(number_of_chunks)]
+
+
+def send_streams(communicator: Communicator, rank: int):
+    communicator.send_stream(rank, create_chunks(20), window_size=WINDOW_SIZE)
+    communicator.send_stream(rank, create_chunks(3), window_size=WINDOW_SIZE)
+    try:
+        communicator.send_stream(
+            rank,
+            create_chunks(20),
+            window_size=WINDOW_SIZE,
+            timeout_in_milliseconds=1000,
+        )
+        raise AssertionError("The sender didn't notice, that the receiver stopped.")
+    except TimeoutError:
+        pass
+    communicator.send_stream(rank, create_chunks(5), window_size=WINDOW_SIZE)
+
+
+def receive_streams(communicator: Communicator, rank: int) -> str | None:
+    result = [
+        bytes(chunk)
+        for chunk in communicator.receive_stream(rank, window_size=WINDOW_SIZE)
+    ]
+    if result != create_chunks(20):
+        return "Failed: first stream"
+    for _ in range(2):
+        stream = communicator.receive_stream(rank, window_size=WINDOW_SIZE)
+        if bytes(next(stream)) != create_chunks(1)[0]:
+            return "Failed: stopped stream"
+    result = [
+        bytes(chunk)
+        for chunk in communicator.receive_stream(rank, window_size=WINDOW_SIZE)
+    ]
+    if result != create_chunks(5):
+        return "Failed: stream after the stopped streams"
+    return None
+
+
+def exchange_streams_in_both_directions(
+    communicator: Communicator, rank: int, is_first: bool
+) -> str | None:
+    """
+    The streams in both directions use the same tag, so the receiver of the second
+    stream must not see the credits, which got granted after the last chunk of the first.
+    """
+    for sender_is_first in [True, False, True]:
+        if sender_is_first == is_first:
+            communicator.send_stream(rank, create_chunks(20), window_size=WINDOW_SIZE)
+        else:
+            result = [
+                bytes(chunk)
+                for chunk in communicator.receive_stream(rank, window_size=WINDOW_SIZE)
+            ]
+            if result != create_chunks(20):
+                return "Failed: stream in the other direction"
+    return None
+
+
+def run(parameter: CommunicatorTestProcessParameter, queue: BidirectionalQueue):
+    def exchange(communicator: Communicator, rank: int) -> str | None:
+        if rank % 2 == 0:
+            if rank + 1 < communicator.number_of_instances:
+                send_streams(communicator, rank + 1)
+            return None
+        return receive_streams(communicator, rank - 1)
+
+    run_with_communicator(parameter, queue, exchange)
+
+
+def run_both_directions(
+    parameter: CommunicatorTestProcessParameter, queue: BidirectionalQueue
+):
+    def exchange(communicator: Communicator, rank: int) -> str | None:
+        if rank % 2 == 0:
+            if rank + 1 < communicator.number_of_instances:
+                return exchange_streams_in_both_directions(
+                    communicator, rank + 1, is_first=True
+                )
+            return None
+        return exchange_streams_in_both_directions(
+            communicator, rank - 1, is_first=False
+        )
+
+    run_with_communicator(parameter, queue, exchange)
+
+
+def run_with_communicator(
+    parameter: CommunicatorTestProcessParameter,
+    queue: BidirectionalQueue,
+    exchange: Callable[[Communicator, int], str | None],
+):
+    try:
+        is_discovery_leader_node = parameter.node_name == "n0"
+        context = zmq.Context()
+        socket_factory = ZMQSocketFactory(context)
+        communicator = Communicator(
+            multi_node_discovery_port=Port(port=44444),
+            local_discovery_port=parameter.local_discovery_port,
+            multi_node_discovery_ip=IPAddress(ip_address="127.0.0.1"),
+            node_name=parameter.node_name,
+            instance_name=parameter.instance_name,
+            listen_ip=IPAddress(ip_address="127.0.0.1"),
+            group_identifier=parameter.group_identifier,
+            number_of_nodes=parameter.number_of_nodes,
+            number_of_instances_per_node=parameter.number_of_instances_per_node,
+            is_discovery_leader_node=is_discovery_leader_node,
+            socket_factory=socket_factory,
+            config=CommunicatorConfig(enable_point_to_point=True),
+        )
+        failure = exchange(communicator, communicator.rank)
+        if failure is not None:
+            queue.put(failure)
+            return
+        communicator.barrier()
+        queue.put("Success")
+    except Exception as e:
+        LOGGER.exception("Exception during test")
+        queue.put(f"Failed during test: {e}")
+
+
+REPETITIONS_FOR_FUNCTIONALITY = 1
+
+
+def test_functionality_2_1():
+    run_test_with_repetitions(
+        number_of_nodes=2,
+        number_of_instances_per_node=1,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+    )
+
+
+def test_functionality_1_2():
+    run_test_with_repetitions(
+        number_of_nodes=1,
+        number_of_instances_per_node=2,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+    )
+
+
+def test_functionality_2_2():
+    run_test_with_repetitions(
+        number_of_nodes=2,
+        number_of_instances_per_node=2,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+    )
+
+
+def test_both_directions_2_1():
+    run_test_with_repetitions(
+        number_of_nodes=2,
+        number_of_instances_per_node=1,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+        run=run_both_directions,
+    )
+
+
+def test_both_directions_1_2():
+    run_test_with_repetitions(
+        number_of_nodes=1,
+        number_of_instances_per_node=2,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+        run=run_both_directions,
+    )
+
+
+def run_test_with_repetitions(
+    number_of_nodes: int,
+    number_of_instances_per_node: int,
+    repetitions: int,
+    run: Callable[[CommunicatorTestProcessParameter, BidirectionalQueue], None] = run,
+):
+    for i in range(repetitions):
+        group = f"{time.monotonic_ns()}"
+        LOGGER.info(
+            f"Start iteration",
+            iteration=i + 1,
+            repetitions=repetitions,
+            group_identifier=group,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+        )
+        start_time = time.monotonic()
+        expected_result_of_threads, actual_result_of_threads = run_test(
+            group_identifier=group,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+            run=run,
+        )
+        assert expected_result_of_threads == actual_result_of_threads
+        end_time = time.monotonic()
+        LOGGER.info(
+            f"Finish iteration",
+            iteration=i + 1,
+            repetitions=repetitions,
+            group_identifier=group,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+            duration=end_time - start_time,
+        )
+
+
+def run_test(
+    group_identifier: str,
+    number_of_nodes: int,
+    number_of_instances_per_node: int,
+    run: Callable[[CommunicatorTestProcessParameter, BidirectionalQueue], None],
+):
+    parameters = [
+        CommunicatorTestProcessParameter(
+            node_name=f"n{n}",
+            instance_name=f"i{i}",
+            group_identifier=group_identifier,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+            local_discovery_port=Port(port=44445 + n),
+            seed=0,
+        )
+        for n in range(number_of_nodes)
+        for i in range(number_of_instances_per_node)
+    ]
+    processes: list[TestProcess[CommunicatorTestProcessParameter]] = [
+        TestProcess(parameter, run=run) for parameter in parameters
+    ]
+    for process in processes:
+        process.start()
+    assert_processes_finish(processes, timeout_in_seconds=180)
+    actual_result_of_threads: dict[tuple[str, str], str] = {}
+    expected_result_of_threads: dict[tuple[str, str], str] = {}
+    for process in processes:
+        result_key = (process.parameter.node_name, process.parameter.instance_name)
+        actual_result_of_threads[result_key] = process.get()
+        expected_result_of_threads[result_key] = "Success"
+    return expected_result_of_threads, actual_result_of_threads
@@ -0,0 +1,168 @@
+import threading
+import time
+from collections.abc import Callable
+from test.integration.no_db.structlog.structlog_utils import configure_structlog
+from test.integration.no_db.udf_communication.peer_communication.utils import (
+    BidirectionalQueue,
+    CommunicatorTestProcessParameter,
+    TestProcess,
+    assert_processes_finish,
+)
+
+import structlog
+import zmq
+from structlog.types import FilteringBoundLogger
+
+from exasol.analytics.udf.communication.communicator import Communicator
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
+from exasol.analytics.udf.communication.socket_factory.zmq_wrapper import (
+    ZMQSocketFactory,
+)
+
+configure_structlog(__file__)
+
+LOGGER: FilteringBoundLogger = structlog.get_logger(__name__)
+
+NUMBER_OF_REQUESTS = 3
+
+
+def run(parameter: CommunicatorTestProcessParameter, queue: BidirectionalQueue):
+    try:
+        is_discovery_leader_node = parameter.node_name == "n0"
+        context = zmq.Context()
+        socket_factory = ZMQSocketFactory(context)
+        communicator = Communicator(
+            multi_node_discovery_port=Port(port=44444),
+            local_discovery_port=parameter.local_discovery_port,
+            multi_node_discovery_ip=IPAddress(ip_address="127.0.0.1"),
+            node_name=parameter.node_name,
+            instance_name=parameter.instance_name,
+            listen_ip=IPAddress(ip_address="127.0.0.1"),
+            group_identifier=parameter.group_identifier,
+            number_of_nodes=parameter.number_of_nodes,
+            number_of_instances_per_node=parameter.number_of_instances_per_node,
+            is_discovery_leader_node=is_discovery_leader_node,
+            socket_factory=socket_factory,
+        )
+        rank = communicator.rank
+        is_leader = communicator.is_multi_node_leader()
+        requests = []
+        for iteration in range(NUMBER_OF_REQUESTS):
+            requests.append(communicator.igather(f"{iteration}_{rank}".encode()))
+            requests.append(
+                communicator.ibroadcast(f"{iteration}".encode() if is_leader else None)
+            )
+        blocking_result = communicator.broadcast(b"blocking" if is_leader else None)
+        if not all(request.done() for request in requests):
+            queue.put("Blocking operation didn't wait for the pending requests")
+            return
+        if blocking_result != b"blocking":
+            queue.put(f"Failed blocking broadcast: {blocking_result}")
+            return
+        for iteration in range(NUMBER_OF_REQUESTS):
+            gather_result = requests[2 * iteration].result()
+            broadcast_result = requests[2 * iteration + 1].result()
+            if is_leader:
+                expected = [
+                    f"{iteration}_{i}".encode()
+                    for i in range(communicator.number_of_instances)
+                ]
+                if gather_result != expected:
+                    queue.put(f"Failed gather: {gather_result} != {expected}")
+                    return
+            elif gather_result is not None:
+                queue.put(f"Failed gather: {gather_result} is not None")
+                return
+            if broadcast_result != f"{iteration}".encode():
+                queue.put(f"Failed broadcast: {broadcast_result}")
+                return
+        queue.put("Success")
+    except Exception as e:
+        LOGGER.exception("Exception during test")
+        queue.put(f"Failed during test: {e}")
+
+
+def run_close(parameter: CommunicatorTestProcessParameter, queue: BidirectionalQueue):
+    try:
+        is_discovery_leader_node = parameter.node_name == "n0"
+        context = zmq.Context()
+        socket_factory = ZMQSocketFactory(context)
+        with Communicator(
+            multi_node_discovery_port=Port(port=44444),
+            local_discovery_port=parameter.local_discovery_port,
+            multi_node_discovery_ip=IPAddress(ip_address="127.0.0.1"),
+            node_name=parameter.node_name,
+            instance_name=parameter.instance_name,
+            listen_ip=IPAddress(ip_address="127.0.0.1"),
+            group_identifier=parameter.group_identifier,
+            number_of_nodes=parameter.number_of_nodes,
+            number_of_instances_per_node=parameter.number_of_instances_per_node,
+            is_discovery_leader_node=is_discovery_leader_node,
+            socket_factory=socket_factory,
+        ) as communicator:
+            rank = communicator.rank
+            requests = [
+                communicator.igather(f"{iteration}_{rank}".encode())
+                for iteration in range(NUMBER_OF_REQUESTS)
+            ]
+        communicator.close()
+        if not all(request.done() for request in requests):
+            queue.put("Close didn't wait for the pending requests")
+            return
+        worker_threads = [
+            thread.name
+            for thread in threading.enumerate()
+            if thread.name.startswith("Communicator")
+        ]
+        if len(worker_threads) > 0:
+            queue.put(f"Close didn't shut the worker threads down: {worker_threads}")
+            return
+        queue.put("Success")
+    except Exception as e:
+        LOGGER.exception("Exception during test")
+        queue.put(f"Failed during test: {e}")
+
+
+def test_functionality_2_2():
+    run_test(number_of_nodes=2, number_of_instances_per_node=2, run=run)
+
+
+def test_close_2_2():
+    run_test(number_of_nodes=2, number_of_instances_per_node=2, run=run_close)
+
+
+def run_test(
+    number_of_nodes: int,
+    number_of_instances_per_node: int,
+    run: Callable[[CommunicatorTestProcessParameter, BidirectionalQueue], None],
+):
+    group_identifier = f"{time.monotonic_ns()}"
+    parameters = [
+        CommunicatorTestProcessParameter(
+            node_name=f"n{n}",
+            instance_name=f"i{i}",
+            group_identifier=group_identifier,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+            local_discovery_port=Port(port=44445 + n),
+            seed=0,
+        )
+        for n in range(number_of_nodes)
+        for i in range(number_of_instances_per_node)
+    ]
+    processes: list[TestProcess[CommunicatorTestProcessParameter]] = [
+        TestProcess(parameter, run=run) for parameter in parameters
+    ]
+    for process in processes:
+        process.start()
+    assert_processes_finish(processes, timeout_in_seconds=180)
+    actual_result_of_threads: dict[tuple[str, str], str] = {}
+    expected_result_of_threads: dict[tuple[str, str], str] = {}
+    for process in processes:
+        result_key = (process.parameter.node_name, process.parameter.instance_name)
+        actual_result_of_threads[result_key] = process.get()
+        expected_result_of_threads[result_key] = "Success"
+    assert expected_result_of_threads == actual_result_of_threads
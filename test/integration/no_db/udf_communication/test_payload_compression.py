@@ -0,0 +1,145 @@
+import time
+from test.integration.no_db.structlog.structlog_utils import configure_structlog
+from test.integration.no_db.udf_communication.peer_communication.utils import (
+    BidirectionalQueue,
+    CommunicatorTestProcessParameter,
+    TestProcess,
+    assert_processes_finish,
+)
+
+import structlog
+import zmq
+from structlog.types import FilteringBoundLogger
+
+from exasol.analytics.udf.communication.communicator import Communicator
+from exasol.analytics.udf.communication.communicator_config import (
+    CommunicatorConfig,
+)
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
+from exasol.analytics.udf.communication.peer_communicator.payload_compression_config import (
+    PayloadCompressionConfig,
+)
+from exasol.analytics.udf.communication.socket_factory.zmq_wrapper import (
+    ZMQSocketFactory,
+)
+
+configure_structlog(__file__)
+
+LOGGER: FilteringBoundLogger = structlog.get_logger(__name__)
+
+
+def run(
+    parameter: CommunicatorTestProcessParameter,
+    queue: BidirectionalQueue,
+):
+    try:
+        is_discovery_leader_node = parameter.node_name == "n0"
+        context = zmq.Context()
+        socket_factory = ZMQSocketFactory(context)
+        communicator = Communicator(
+            multi_node_discovery_port=Port(port=44444),
+            local_discovery_port=parameter.local_discovery_port,
+            multi_node_discovery_ip=IPAddress(ip_address="127.0.0.1"),
+            node_name=parameter.node_name,
+            instance_name=parameter.instance_name,
+            listen_ip=IPAddress(ip_address="127.0.0.1"),
+            group_identifier=parameter.group_identifier,
+            number_of_nodes=parameter.number_of_nodes,
+            number_of_instances_per_node=parameter.number_of_instances_per_node,
+            is_discovery_leader_node=is_discovery_leader_node,
+            socket_factory=socket_factory,
+            config=CommunicatorConfig(
+                payload_compression_config=PayloadCompressionConfig(
+                    threshold_in_bytes=1024
+                ),
+                enable_point_to_point=True,
+            ),
+        )
+        rank = communicator.rank
+        gather_result = communicator.gather(create_value(rank))
+        if communicator.is_multi_node_leader():
+            expected = [
+                create_value(i) for i in range(communicator.number_of_instances)
+            ]
+            if gather_result != expected:
+                queue.put(f"Leader failed: {gather_result} != {expected}")
+                return
+        elif gather_result is not None:
+            queue.put(f"Non-Leader failed: {gather_result} is not None")
+            return
+        value = b"broadcast" * 10000
+        broadcast_result = communicator.broadcast(
+            value if communicator.is_multi_node_leader() else None
+        )
+        if broadcast_result != value:
+            queue.put(f"Failed broadcast: {broadcast_result} != {value}")
+            return
+        number_of_instances = communicator.number_of_instances
+        communicator.send((rank + 1) % number_of_instances, create_value(rank))
+        source = (rank - 1) % number_of_instances
+        recv_result = communicator.recv(source)
+        if recv_result != create_value(source):
+            queue.put(f"Failed recv: {bytes(recv_result[:10])!r}")
+            return
+        point_to_point_bytes_sent = sum(
+            snapshot.bytes_sent
+            for snapshot in communicator._point_to_point_connections.peer_communicator.metrics.snapshot().values()
+        )
+        if point_to_point_bytes_sent >= len(create_value(rank)):
+            queue.put(
+                f"Point to point payload not compressed: {point_to_point_bytes_sent}"
+            )
+            return
+        queue.put("Success")
+    except Exception as e:
+        LOGGER.exception("Exception during test")
+        queue.put(f"Failed during test: {e}")
+
+
+def create_value(rank: int) -> bytes:
+    return f"{rank}".encode() * 100000
+
+
+def test_functionality_1_3():
+    run_test(number_of_nodes=1, number_of_instances_per_node=3)
+
+
+def test_functionality_2_2():
+    run_test(number_of_nodes=2, number_of_instances_per_node=2)
+
+
+def test_functionality_3_3():
+    run_test(number_of_nodes=3, number_of_instances_per_node=3)
+
+
+def run_test(number_of_nodes: int, number_of_instances_per_node: int):
+    group_identifier = f"{time.monotonic_ns()}"
+    parameters = [
+        CommunicatorTestProcessParameter(
+            node_name=f"n{n}",
+            instance_name=f"i{i}",
+            group_identifier=group_identifier,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+            local_discovery_port=Port(port=44445 + n),
+            seed=0,
+        )
+        for n in range(number_of_nodes)
+        for i in range(number_of_instances_per_node)
+    ]
+    processes: list[TestProcess[CommunicatorTestProcessParameter]] = [
+        TestProcess(parameter, run=run) for parameter in parameters
+    ]
+    for process in processes:
+        process.start()
+    assert_processes_finish(processes, timeout_in_seconds=180)
+    actual_result_of_threads: dict[tuple[str, str], str] = {}
+    expected_result_of_threads: dict[tuple[str, str], str] = {}
+    for process in processes:
+        result_key = (process.parameter.node_name, process.parameter.instance_name)
+        actual_result_of_threads[result_key] = process.get()
+        expected_result_of_threads[result_key] = "Success"
+    assert expected_result_of_threads == actual_result_of_threads
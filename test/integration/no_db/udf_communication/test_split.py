@@ -0,0 +1,251 @@
+import time
+from test.integration.no_db.structlog.structlog_utils import configure_structlog
+from test.integration.no_db.udf_communication.peer_communication.utils import (
+    BidirectionalQueue,
+    CommunicatorTestProcessParameter,
+    TestProcess,
+    assert_processes_finish,
+)
+
+import structlog
+import zmq
+from structlog.types import FilteringBoundLogger
+
+from exasol.analytics.udf.communication.communicator import Communicator
+from exasol.analytics.udf.communication.communicator_config import (
+    CommunicatorConfig,
+)
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
+from exasol.analytics.udf.communication.socket_factory.zmq_wrapper import (
+    ZMQSocketFactory,
+)
+
+configure_structlog(__file__)
+
+LOGGER: FilteringBoundLogger = structlog.get_logger(__name__)
+
+
+def check(name: str, actual: object, expected: object) -> str | None:
+    if actual != expected:
+        return f"Failed {name}: {actual} != {expected}"
+    return None
+
+
+def run(parameter: CommunicatorTestProcessParameter, queue: BidirectionalQueue):
+    try:
+        is_discovery_leader_node = parameter.node_name == "n0"
+        context = zmq.Context()
+        socket_factory = ZMQSocketFactory(context)
+        communicator = Communicator(
+            multi_node_discovery_port=Port(port=44444),
+            local_discovery_port=parameter.local_discovery_port,
+            multi_node_discovery_ip=IPAddress(ip_address="127.0.0.1"),
+            node_name=parameter.node_name,
+            instance_name=parameter.instance_name,
+            listen_ip=IPAddress(ip_address="127.0.0.1"),
+            group_identifier=parameter.group_identifier,
+            number_of_nodes=parameter.number_of_nodes,
+            number_of_instances_per_node=parameter.number_of_instances_per_node,
+            is_discovery_leader_node=is_discovery_leader_node,
+            socket_factory=socket_factory,
+            config=CommunicatorConfig(enable_point_to_point=True),
+        )
+        rank = communicator.rank
+        number_of_instances = communicator.number_of_instances
+        parity_ranks = sorted(
+            [other for other in range(number_of_instances) if other % 2 == rank % 2],
+            reverse=True,
+        )
+        parity_communicator = communicator.split(color=rank % 2, key=-rank)
+        gathered = parity_communicator.gather(str(rank).encode())
+        allgathered = parity_communicator.allgather(str(rank).encode())
+        pending_broadcast = parity_communicator.ibroadcast(
+            b"pending" if parity_communicator.rank == 0 else None
+        )
+        point_to_point_value = None
+        if parity_communicator.number_of_instances > 1:
+            if parity_communicator.rank == 0:
+                parity_communicator.send(1, b"point to point")
+            elif parity_communicator.rank == 1:
+                point_to_point_value = bytes(parity_communicator.recv(0))
+        node_base_rank = (
+            rank
+            // parameter.number_of_instances_per_node
+            * parameter.number_of_instances_per_node
+        )
+        node_ranks = list(
+            range(
+                node_base_rank, node_base_rank + parameter.number_of_instances_per_node
+            )
+        )
+        node_communicator = communicator.split(
+            color=rank // parameter.number_of_instances_per_node
+        )
+        node_allgathered = node_communicator.allgather(str(rank).encode())
+        nested_communicator = parity_communicator.split(
+            color=None if parity_communicator.rank == 0 else 0
+        )
+        nested_allgathered = (
+            None
+            if nested_communicator is None
+            else nested_communicator.allgather(str(rank).encode())
+        )
+        root_allgathered = communicator.allgather(str(rank).encode())
+        LOGGER.info(
+            "result",
+            gathered=gathered,
+            allgathered=allgathered,
+            instance_name=parameter.instance_name,
+            node_name=parameter.node_name,
+        )
+        failures = [
+            check(
+                "gather",
+                gathered,
+                (
+                    [str(other).encode() for other in parity_ranks]
+                    if parity_communicator.is_multi_node_leader()
+                    else None
+                ),
+            ),
+            check(
+                "allgather",
+                allgathered,
+                [str(other).encode() for other in parity_ranks],
+            ),
+            check("parity rank", parity_communicator.rank, parity_ranks.index(rank)),
+            check("pending broadcast", pending_broadcast.result(), b"pending"),
+            check(
+                "point to point during pending broadcast",
+                point_to_point_value,
+                b"point to point" if parity_communicator.rank == 1 else None,
+            ),
+            check(
+                "node allgather",
+                node_allgathered,
+                [str(other).encode() for other in node_ranks],
+            ),
+            check(
+                "nested allgather",
+                nested_allgathered,
+                (
+                    None
+                    if rank == parity_ranks[0]
+                    else [str(other).encode() for other in parity_ranks[1:]]
+                ),
+            ),
+            check(
+                "root allgather",
+                root_allgathered,
+                [str(other).encode() for other in range(number_of_instances)],
+            ),
+        ]
+        failures = [failure for failure in failures if failure is not None]
+        if len(failures) > 0:
+            queue.put(", ".join(failures))
+            return
+        queue.put("Success")
+    except Exception as e:
+        LOGGER.exception("Exception during test")
+        queue.put(f"Failed during test: {e}")
+
+
+REPETITIONS_FOR_FUNCTIONALITY = 1
+
+
+def test_functionality_2_1():
+    run_test_with_repetitions(
+        number_of_nodes=2,
+        number_of_instances_per_node=1,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+    )
+
+
+def test_functionality_1_2():
+    run_test_with_repetitions(
+        number_of_nodes=1,
+        number_of_instances_per_node=2,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+    )
+
+
+def test_functionality_2_2():
+    run_test_with_repetitions(
+        number_of_nodes=2,
+        number_of_instances_per_node=2,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+    )
+
+
+def test_functionality_3_3():
+    run_test_with_repetitions(
+        number_of_nodes=3,
+        number_of_instances_per_node=3,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+    )
+
+
+def run_test_with_repetitions(
+    number_of_nodes: int, number_of_instances_per_node: int, repetitions: int
+):
+    for i in range(repetitions):
+        group = f"{time.monotonic_ns()}"
+        LOGGER.info(
+            f"Start iteration",
+            iteration=i + 1,
+            repetitions=repetitions,
+            group_identifier=group,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+        )
+        start_time = time.monotonic()
+        expected_result_of_threads, actual_result_of_threads = run_test(
+            group_identifier=group,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+        )
+        assert expected_result_of_threads == actual_result_of_threads
+        end_time = time.monotonic()
+        LOGGER.info(
+            f"Finish iteration",
+            iteration=i + 1,
+            repetitions=repetitions,
+            group_identifier=group,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+            duration=end_time - start_time,
+        )
+
+
+def run_test(
+    group_identifier: str, number_of_nodes: int, number_of_instances_per_node: int
+):
+    parameters = [
+        CommunicatorTestProcessParameter(
+            node_name=f"n{n}",
+            instance_name=f"i{i}",
+            group_identifier=group_identifier,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+            local_discovery_port=Port(port=44445 + n),
+            seed=0,
+        )
+        for n in range(number_of_nodes)
+        for i in range(number_of_instances_per_node)
+    ]
+    processes: list[TestProcess[CommunicatorTestProcessParameter]] = [
+        TestProcess(parameter, run=run) for parameter in parameters
+    ]
+    for process in processes:
+        process.start()
+    assert_processes_finish(processes, timeout_in_seconds=180)
+    actual_result_of_threads: dict[tuple[str, str], str] = {}
+    expected_result_of_threads: dict[tuple[str, str], str] = {}
+    for process in processes:
+        result_key = (process.parameter.node_name, process.parameter.instance_name)
+        actual_result_of_threads[result_key] = process.get()
+        expected_result_of_threads[result_key] = "Success"
+    return expected_result_of_threads, actual_result_of_threads
@@ -0,0 +1,194 @@
+import time
+from functools import partial
+from test.integration.no_db.structlog.structlog_utils import configure_structlog
+from test.integration.no_db.udf_communication.peer_communication.utils import (
+    BidirectionalQueue,
+    CommunicatorTestProcessParameter,
+    TestProcess,
+    assert_processes_finish,
+)
+
+import pytest
+import structlog
+import zmq
+from structlog.types import FilteringBoundLogger
+
+from exasol.analytics.udf.communication.communicator import Communicator
+from exasol.analytics.udf.communication.communicator_config import (
+    CommunicatorConfig,
+)
+from exasol.analytics.udf.communication.gather_topology import (
+    BinomialTreeGatherTopology,
+    GatherTopology,
+    KAryTreeGatherTopology,
+)
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
+from exasol.analytics.udf.communication.socket_factory.zmq_wrapper import (
+    ZMQSocketFactory,
+)
+
+configure_structlog(__file__)
+
+LOGGER: FilteringBoundLogger = structlog.get_logger(__name__)
+
+
+def run(
+    parameter: CommunicatorTestProcessParameter,
+    queue: BidirectionalQueue,
+    topology: GatherTopology,
+):
+    try:
+        is_discovery_leader_node = parameter.node_name == "n0"
+        context = zmq.Context()
+        socket_factory = ZMQSocketFactory(context)
+        communicator = Communicator(
+            multi_node_discovery_port=Port(port=44444),
+            local_discovery_port=parameter.local_discovery_port,
+            multi_node_discovery_ip=IPAddress(ip_address="127.0.0.1"),
+            node_name=parameter.node_name,
+            instance_name=parameter.instance_name,
+            listen_ip=IPAddress(ip_address="127.0.0.1"),
+            group_identifier=parameter.group_identifier,
+            number_of_nodes=parameter.number_of_nodes,
+            number_of_instances_per_node=parameter.number_of_instances_per_node,
+            is_discovery_leader_node=is_discovery_leader_node,
+            socket_factory=socket_factory,
+            config=CommunicatorConfig(gather_topology=topology),
+        )
+        rank = communicator.rank
+        for iteration in range(2):
+            result = communicator.gather(f"{iteration}_{rank}".encode())
+            LOGGER.info(
+                "result",
+                result=result,
+                instance_name=parameter.instance_name,
+                node_name=parameter.node_name,
+            )
+            if communicator.is_multi_node_leader():
+                expected = [
+                    f"{iteration}_{i}".encode()
+                    for i in range(communicator.number_of_instances)
+                ]
+                if result != expected:
+                    queue.put(f"Leader failed: {result} != {expected}")
+                    return
+            elif result is not None:
+                queue.put(f"Non-Leader failed: {result} is not None")
+                return
+        queue.put("Success")
+    except Exception as e:
+        LOGGER.exception("Exception during test")
+        queue.put(f"Failed during test: {e}")
+
+
+REPETITIONS_FOR_FUNCTIONALITY = 1
+
+
+TOPOLOGIES = {
+    "binomial": BinomialTreeGatherTopology(),
+    "binary": KAryTreeGatherTopology(arity=2),
+}
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES.keys())
+def test_functionality_2_1(topology: str):
+    run_test_with_repetitions(
+        number_of_nodes=2,
+        number_of_instances_per_node=1,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+        topology=TOPOLOGIES[topology],
+    )
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES.keys())
+def test_functionality_1_2(topology: str):
+    run_test_with_repetitions(
+        number_of_nodes=1,
+        number_of_instances_per_node=2,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+        topology=TOPOLOGIES[topology],
+    )
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES.keys())
+def test_functionality_5_2(topology: str):
+    run_test_with_repetitions(
+        number_of_nodes=5,
+        number_of_instances_per_node=2,
+        repetitions=REPETITIONS_FOR_FUNCTIONALITY,
+        topology=TOPOLOGIES[topology],
+    )
+
+
+def run_test_with_repetitions(
+    number_of_nodes: int,
+    number_of_instances_per_node: int,
+    repetitions: int,
+    topology: GatherTopology,
+):
+    for i in range(repetitions):
+        group = f"{time.monotonic_ns()}"
+        LOGGER.info(
+            f"Start iteration",
+            iteration=i + 1,
+            repetitions=repetitions,
+            group_identifier=group,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+        )
+        start_time = time.monotonic()
+        expected_result_of_threads, actual_result_of_threads = run_test(
+            group_identifier=group,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+            topology=topology,
+        )
+        assert expected_result_of_threads == actual_result_of_threads
+        end_time = time.monotonic()
+        LOGGER.info(
+            f"Finish iteration",
+            iteration=i + 1,
+            repetitions=repetitions,
+            group_identifier=group,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+            duration=end_time - start_time,
+        )
+
+
+def run_test(
+    group_identifier: str,
+    number_of_nodes: int,
+    number_of_instances_per_node: int,
+    topology: GatherTopology,
+):
+    parameters = [
+        CommunicatorTestProcessParameter(
+            node_name=f"n{n}",
+            instance_name=f"i{i}",
+            group_identifier=group_identifier,
+            number_of_nodes=number_of_nodes,
+            number_of_instances_per_node=number_of_instances_per_node,
+            local_discovery_port=Port(port=44445 + n),
+            seed=0,
+        )
+        for n in range(number_of_nodes)
+        for i in range(number_of_instances_per_node)
+    ]
+    processes: list[TestProcess[CommunicatorTestProcessParameter]] = [
+        TestProcess(parameter, run=partial(run, topology=topology))
+        for parameter in parameters
+    ]
+    for process in processes:
+        process.start()
+    assert_processes_finish(processes, timeout_in_seconds=180)
+    actual_result_of_threads: dict[tuple[str, str], str] = {}
+    expected_result_of_threads: dict[tuple[str, str], str] = {}
+    for process in processes:
+        result_key = (process.parameter.node_name, process.parameter.instance_name)
+        actual_result_of_threads[result_key] = process.get()
+        expected_result_of_threads[result_key] = "Success"
+    return expected_result_of_threads, actual_result_of_threads
@@ -147,3 +147,15 @@ def test_received_acknowledge_close_connection():
         and test_setup.abort_timeout_sender_mock.mock_calls == []
         and test_setup.sender_mock.mock_calls == []
     )
+
+
+def test_close():
+    test_setup = create_test_setup()
+    test_setup.reset_mock()
+    test_setup.connection_closer.close()
+    assert (
+        test_setup.close_connection_sender_mock.mock_calls == []
+        and test_setup.connection_is_closed_sender_mock.mock_calls == []
+        and test_setup.abort_timeout_sender_mock.mock_calls == []
+        and test_setup.sender_mock.mock_calls == [call.close()]
+    )
@@ -0,0 +1,278 @@
+import asyncio
+import dataclasses
+import os
+from test.utils.mock_cast import mock_cast
+from unittest.mock import (
+    MagicMock,
+    PropertyMock,
+    call,
+    create_autospec,
+)
+
+import pytest
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from exasol.analytics.udf.communication.connection_info import ConnectionInfo
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.peer_communicator.async_peer_communicator import (
+    AsyncPeerCommunicator,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import Frame
+
+
+@dataclasses.dataclass()
+class TestSetup:
+    __test__ = False
+    peer: Peer
+    peer_communicator_mock: MagicMock | PeerCommunicator
+    read_file_descriptor: int
+    write_file_descriptor: int
+    async_peer_communicator: AsyncPeerCommunicator
+
+    def notify(self):
+        os.write(self.write_file_descriptor, b"x")
+
+    def close(self):
+        os.close(self.read_file_descriptor)
+        os.close(self.write_file_descriptor)
+
+
+@pytest.fixture
+def test_setup():
+    peer = ModelFactory.create_factory(Peer).build()
+    peer_communicator_mock: MagicMock | PeerCommunicator = create_autospec(
+        PeerCommunicator
+    )
+    type(peer_communicator_mock).my_connection_info = PropertyMock(
+        return_value=ModelFactory.create_factory(ConnectionInfo).build()
+    )
+    read_file_descriptor, write_file_descriptor = os.pipe()
+    type(peer_communicator_mock).file_descriptor = PropertyMock(
+        return_value=read_file_descriptor
+    )
+    mock_cast(peer_communicator_mock.wait_for_peers).return_value = True
+    mock_cast(peer_communicator_mock.are_connected).return_value = True
+    setup = TestSetup(
+        peer=peer,
+        peer_communicator_mock=peer_communicator_mock,
+        read_file_descriptor=read_file_descriptor,
+        write_file_descriptor=write_file_descriptor,
+        async_peer_communicator=AsyncPeerCommunicator(peer_communicator_mock),
+    )
+    yield setup
+    setup.close()
+
+
+def test_recv_waits_for_file_descriptor(test_setup: TestSetup):
+    frames = [create_autospec(Frame)]
+    mock_cast(test_setup.peer_communicator_mock.poll_peers).side_effect = [
+        [],
+        [test_setup.peer],
+    ]
+    mock_cast(test_setup.peer_communicator_mock.recv).return_value = frames
+
+    async def run():
+        asyncio.get_running_loop().call_later(0.01, test_setup.notify)
+        return await test_setup.async_peer_communicator.recv(test_setup.peer)
+
+    result = asyncio.run(run())
+    assert (
+        result == frames
+        and mock_cast(test_setup.peer_communicator_mock.poll_peers).mock_calls
+        == [call([test_setup.peer], 0, None)] * 2
+        and mock_cast(test_setup.peer_communicator_mock.recv).mock_calls
+        == [call(test_setup.peer, 0, None)]
+    )
+
+
+def test_recv_timeout(test_setup: TestSetup):
+    mock_cast(test_setup.peer_communicator_mock.poll_peers).return_value = []
+    with pytest.raises(TimeoutError):
+        asyncio.run(
+            test_setup.async_peer_communicator.recv(
+                test_setup.peer, timeout_in_milliseconds=10
+            )
+        )
+
+
+def test_poll_peers_timeout(test_setup: TestSetup):
+    mock_cast(test_setup.peer_communicator_mock.poll_peers).return_value = []
+    result = asyncio.run(
+        test_setup.async_peer_communicator.poll_peers(timeout_in_milliseconds=10)
+    )
+    assert result == []
+
+
+def test_wait_for_peers_timeout(test_setup: TestSetup):
+    mock_cast(test_setup.peer_communicator_mock.wait_for_peers).return_value = False
+    result = asyncio.run(
+        test_setup.async_peer_communicator.wait_for_peers(timeout_in_milliseconds=10)
+    )
+    assert result is False
+
+
+def test_send(test_setup: TestSetup):
+    frames = [create_autospec(Frame)]
+    mock_cast(test_setup.peer_communicator_mock.try_send).return_value = True
+    asyncio.run(test_setup.async_peer_communicator.send(test_setup.peer, frames))
+    assert mock_cast(test_setup.peer_communicator_mock.try_send).mock_calls == [
+        call(test_setup.peer, frames, 0)
+    ]
+
+
+def test_send_waits_for_file_descriptor_when_it_would_block(test_setup: TestSetup):
+    frames = [create_autospec(Frame)]
+    mock_cast(test_setup.peer_communicator_mock.try_send).side_effect = [False, True]
+
+    async def run():
+        asyncio.get_running_loop().call_later(0.01, test_setup.notify)
+        await test_setup.async_peer_communicator.send(test_setup.peer, frames)
+
+    asyncio.run(run())
+    assert (
+        mock_cast(test_setup.peer_communicator_mock.try_send).mock_calls
+        == [call(test_setup.peer, frames, 0)] * 2
+    )
+
+
+def test_send_timeout(test_setup: TestSetup):
+    frames = [create_autospec(Frame)]
+    mock_cast(test_setup.peer_communicator_mock.try_send).return_value = False
+    with pytest.raises(TimeoutError):
+        asyncio.run(
+            test_setup.async_peer_communicator.send(
+                test_setup.peer, frames, timeout_in_milliseconds=10
+            )
+        )
+
+
+def test_other_coroutines_run_while_waiting(test_setup: TestSetup):
+    mock_cast(test_setup.peer_communicator_mock.poll_peers).side_effect = [
+        [],
+        [test_setup.peer],
+    ]
+    events = []
+
+    async def compute():
+        events.append("compute")
+        test_setup.notify()
+
+    async def run():
+        recv = asyncio.create_task(
+            test_setup.async_peer_communicator.recv(test_setup.peer)
+        )
+        await asyncio.sleep(0)
+        events.append("waiting")
+        await compute()
+        await recv
+        events.append("received")
+
+    asyncio.run(run())
+    assert events == ["waiting", "compute", "received"]
+
+
+def test_concurrent_recv_share_file_descriptor(test_setup: TestSetup):
+    other_peer = ModelFactory.create_factory(Peer).build()
+    peers_with_messages: list[Peer] = []
+    mock_cast(test_setup.peer_communicator_mock.poll_peers).side_effect = (
+        lambda peers, timeout, tag: [
+            peer for peer in peers if peer in peers_with_messages
+        ]
+    )
+    mock_cast(test_setup.peer_communicator_mock.recv).side_effect = (
+        lambda peer, timeout, tag: [peer]
+    )
+
+    async def receive_messages():
+        peers_with_messages.extend([test_setup.peer, other_peer])
+        test_setup.notify()
+
+    async def run():
+        recvs = asyncio.gather(
+            test_setup.async_peer_communicator.recv(test_setup.peer),
+            test_setup.async_peer_communicator.recv(other_peer),
+        )
+        await asyncio.sleep(0)
+        await receive_messages()
+        return await asyncio.wait_for(recvs, timeout=10)
+
+    result = asyncio.run(run())
+    assert result == [[test_setup.peer], [other_peer]]
+
+
+def test_send_waits_only_for_the_connection_to_the_peer(test_setup: TestSetup):
+    frames = [create_autospec(Frame)]
+    mock_cast(test_setup.peer_communicator_mock.are_connected).side_effect = [
+        False,
+        True,
+    ]
+    mock_cast(test_setup.peer_communicator_mock.try_send).return_value = True
+
+    async def run():
+        asyncio.get_running_loop().call_later(0.01, test_setup.notify)
+        await test_setup.async_peer_communicator.send(test_setup.peer, frames)
+
+    asyncio.run(run())
+    assert (
+        mock_cast(test_setup.peer_communicator_mock.are_connected).mock_calls
+        == [call([test_setup.peer])] * 2
+        and mock_cast(test_setup.peer_communicator_mock.wait_for_peers).mock_calls == []
+        and mock_cast(test_setup.peer_communicator_mock.try_send).mock_calls
+        == [call(test_setup.peer, frames, 0)]
+    )
+
+
+def test_send_timeout_during_waiting_for_the_connection(test_setup: TestSetup):
+    mock_cast(test_setup.peer_communicator_mock.are_connected).return_value = False
+    with pytest.raises(TimeoutError):
+        asyncio.run(
+            test_setup.async_peer_communicator.send(
+                test_setup.peer,
+                [create_autospec(Frame)],
+                timeout_in_milliseconds=10,
+            )
+        )
+    assert mock_cast(test_setup.peer_communicator_mock.try_send).mock_calls == []
+
+
+def test_communicators_with_the_same_file_descriptor_wait_concurrently(
+    test_setup: TestSetup,
+):
+    other_peer_communicator_mock: MagicMock | PeerCommunicator = create_autospec(
+        PeerCommunicator
+    )
+    type(other_peer_communicator_mock).my_connection_info = PropertyMock(
+        return_value=ModelFactory.create_factory(ConnectionInfo).build()
+    )
+    type(other_peer_communicator_mock).file_descriptor = PropertyMock(
+        return_value=test_setup.read_file_descriptor
+    )
+    mock_cast(other_peer_communicator_mock.are_connected).return_value = True
+    peers_with_messages: list[Peer] = []
+    for peer_communicator_mock in [
+        test_setup.peer_communicator_mock,
+        other_peer_communicator_mock,
+    ]:
+        mock_cast(peer_communicator_mock.poll_peers).side_effect = (
+            lambda peers, timeout, tag: [
+                peer for peer in peers if peer in peers_with_messages
+            ]
+        )
+        mock_cast(peer_communicator_mock.recv).side_effect = (
+            lambda peer, timeout, tag: [peer]
+        )
+    other_async_peer_communicator = AsyncPeerCommunicator(other_peer_communicator_mock)
+
+    async def run():
+        recvs = asyncio.gather(
+            test_setup.async_peer_communicator.recv(test_setup.peer),
+            other_async_peer_communicator.recv(test_setup.peer),
+        )
+        await asyncio.sleep(0)
+        peers_with_messages.append(test_setup.peer)
+        test_setup.notify()
+        return await asyncio.wait_for(recvs, timeout=10)
+
+    result = asyncio.run(run())
+    assert result == [[test_setup.peer], [test_setup.peer]]
@@ -281,3 +281,23 @@ def test_send_payload():
     assert mock_cast(test_setup.payload_handler_mock.send_payload).mock_calls == [
         call(payload, frames)
     ]
+
+
+def test_consumed_payload():
+    test_setup = create_test_setup()
+    test_setup.reset_mocks()
+    test_setup.background_peer_state.consumed_payload(size_in_bytes=10)
+    assert test_setup.payload_handler_mock.mock_calls == [call.consumed_payload(10)]
+
+
+def test_close():
+    test_setup = create_test_setup()
+    test_setup.reset_mocks()
+    test_setup.background_peer_state.close()
+    assert (
+        test_setup.connection_closer_mock.mock_calls == [call.close()]
+        and test_setup.connection_establisher_mock.mock_calls == []
+        and test_setup.register_peer_forwarder_mock.mock_calls == []
+        and test_setup.sender_mock.mock_calls == []
+        and test_setup.payload_handler_mock.mock_calls == []
+    )
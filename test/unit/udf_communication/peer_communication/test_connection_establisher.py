@@ -1,4 +1,5 @@
 import dataclasses
+from test.utils.mock_cast import mock_cast
 from unittest.mock import (
     MagicMock,
     call,
@@ -18,12 +19,14 @@ from exasol.analytics.udf.communication.peer import Peer
 from exasol.analytics.udf.communication.peer_communicator.abort_timeout_sender import (
     AbortTimeoutSender,
 )
+from exasol.analytics.udf.communication.peer_communicator.clock import Clock
 from exasol.analytics.udf.communication.peer_communicator.connection_establisher import (
     ConnectionEstablisher,
 )
 from exasol.analytics.udf.communication.peer_communicator.connection_is_ready_sender import (
     ConnectionIsReadySender,
 )
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.sender import Sender
 from exasol.analytics.udf.communication.peer_communicator.synchronize_connection_sender import (
     SynchronizeConnectionSender,
@@ -39,6 +42,8 @@ class TestSetup:
     abort_timeout_sender_mock: MagicMock | AbortTimeoutSender
     connection_is_ready_sender_mock: MagicMock | ConnectionIsReadySender
     synchronize_connection_sender_mock: MagicMock | SynchronizeConnectionSender
+    clock_mock: MagicMock | Clock
+    peer_metrics: PeerMetrics
 
     connection_establisher: ConnectionEstablisher
 
@@ -74,6 +79,10 @@ def create_test_setup() -> TestSetup:
     synchronize_connection_sender_mock: MagicMock | SynchronizeConnectionSender = (
         create_autospec(SynchronizeConnectionSender)
     )
+    clock_mock: MagicMock | Clock = create_autospec(Clock)
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 10
+    mock_cast(connection_is_ready_sender.is_ready_to_stop).return_value = False
+    peer_metrics = PeerMetrics()
     connection_establisher = ConnectionEstablisher(
         my_connection_info=my_connection_info,
         peer=peer,
@@ -81,6 +90,8 @@ def create_test_setup() -> TestSetup:
         abort_timeout_sender=abort_timeout_sender_mock,
         connection_is_ready_sender=connection_is_ready_sender,
         synchronize_connection_sender=synchronize_connection_sender_mock,
+        clock=clock_mock,
+        peer_metrics=peer_metrics,
     )
     return TestSetup(
         peer=peer,
@@ -90,6 +101,8 @@ def create_test_setup() -> TestSetup:
         connection_is_ready_sender_mock=connection_is_ready_sender,
         synchronize_connection_sender_mock=synchronize_connection_sender_mock,
         connection_establisher=connection_establisher,
+        clock_mock=clock_mock,
+        peer_metrics=peer_metrics,
     )
 
 
@@ -110,7 +123,8 @@ def test_try_send():
     test_setup.connection_establisher.try_send()
     assert (
         test_setup.synchronize_connection_sender_mock.mock_calls == [call.try_send()]
-        and test_setup.connection_is_ready_sender_mock.mock_calls == [call.try_send()]
+        and test_setup.connection_is_ready_sender_mock.mock_calls
+        == [call.try_send(), call.is_ready_to_stop()]
         and test_setup.abort_timeout_sender_mock.mock_calls == [call.try_send()]
         and test_setup.sender_mock.mock_calls == []
     )
@@ -150,3 +164,20 @@ def test_received_acknowledge_connection():
         and test_setup.abort_timeout_sender_mock.mock_calls == [call.stop()]
         and test_setup.sender_mock.mock_calls == []
     )
+
+
+def test_try_send_records_handshake_duration_once_the_connection_is_ready():
+    test_setup = create_test_setup()
+    mock_cast(test_setup.clock_mock.current_timestamp_in_ms).return_value = 30
+    test_setup.connection_establisher.try_send()
+    handshake_duration_before_ready = test_setup.peer_metrics.handshake_duration_in_ms
+    mock_cast(
+        test_setup.connection_is_ready_sender_mock.is_ready_to_stop
+    ).return_value = True
+    test_setup.connection_establisher.try_send()
+    mock_cast(test_setup.clock_mock.current_timestamp_in_ms).return_value = 50
+    test_setup.connection_establisher.try_send()
+    assert (
+        handshake_duration_before_ready is None
+        and test_setup.peer_metrics.handshake_duration_in_ms == 20
+    )
@@ -29,6 +29,7 @@ from exasol.analytics.udf.communication.peer_communicator.connection_establisher
 from exasol.analytics.udf.communication.peer_communicator.connection_is_ready_sender import (
     ConnectionIsReadySenderFactory,
 )
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.sender import Sender
 from exasol.analytics.udf.communication.peer_communicator.synchronize_connection_sender import (
     SynchronizeConnectionSenderFactory,
@@ -145,6 +146,7 @@ def test_init():
 def test_create():
     test_setup = create_test_setup()
     test_setup.reset_mock()
+    peer_metrics = PeerMetrics()
     test_setup.connection_establisher_builder.create(
         my_connection_info=test_setup.my_connection_info,
         sender=test_setup.sender_mock,
@@ -152,6 +154,7 @@ def test_create():
         out_control_socket=test_setup.out_control_socket_mock,
         peer=test_setup.peer,
         timeout_config=test_setup.timeout_config,
+        peer_metrics=peer_metrics,
     )
     assert_timer_factory(test_setup)
     test_setup.sender_mock.assert_not_called()
@@ -161,6 +164,24 @@ def test_create():
     assert_synchronize_connection_sender_factory_mock(test_setup)
     assert_abort_timeout_sender_factory_mock(test_setup)
     assert_connection_is_ready_sender_factory_mock(test_setup)
+    mock_cast(
+        test_setup.connection_establisher_factory_mock.create
+    ).assert_called_once_with(
+        peer=test_setup.peer,
+        my_connection_info=test_setup.my_connection_info,
+        sender=test_setup.sender_mock,
+        abort_timeout_sender=mock_cast(
+            test_setup.abort_timeout_sender_factory_mock.create
+        ).return_value,
+        connection_is_ready_sender=mock_cast(
+            test_setup.connection_is_ready_sender_factory_mock.create
+        ).return_value,
+        synchronize_connection_sender=mock_cast(
+            test_setup.synchronize_connection_sender_factory_mock.create
+        ).return_value,
+        clock=test_setup.clock_mock,
+        peer_metrics=peer_metrics,
+    )
 
 
 def assert_connection_is_ready_sender_factory_mock(test_setup):
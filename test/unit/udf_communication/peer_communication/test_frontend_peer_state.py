@@ -0,0 +1,316 @@
+import dataclasses
+from test.utils.mock_cast import mock_cast
+from unittest.mock import (
+    MagicMock,
+    call,
+    create_autospec,
+)
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.connection_info import ConnectionInfo
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator.background_listener_interface import (
+    BackgroundListenerInterface,
+)
+from exasol.analytics.udf.communication.peer_communicator.frontend_peer_state import (
+    FrontendPeerState,
+)
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
+from exasol.analytics.udf.communication.peer_communicator.payload_compression import (
+    CompressedPayload,
+)
+from exasol.analytics.udf.communication.peer_communicator.payload_compression_config import (
+    PayloadCompressionConfig,
+)
+from exasol.analytics.udf.communication.peer_communicator.payload_flow_control_config import (
+    PayloadFlowControlConfig,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import (
+    Frame,
+    SocketFactory,
+)
+
+
+@dataclasses.dataclass
+class TestSetup:
+    __test__ = False
+    background_listener_mock: MagicMock | BackgroundListenerInterface
+    socket_factory_mock: MagicMock | SocketFactory
+    peer_metrics: PeerMetrics
+    my_connection_info: ConnectionInfo
+    peer: Peer
+    frontend_peer_state: FrontendPeerState
+
+
+def create_test_setup(
+    max_in_flight_messages: int = 1000,
+    max_in_flight_bytes: int = 1000,
+    payload_compression_config: PayloadCompressionConfig = PayloadCompressionConfig(),
+) -> TestSetup:
+    background_listener_mock = create_autospec(BackgroundListenerInterface)
+    socket_factory_mock = create_autospec(SocketFactory)
+    peer_metrics = PeerMetrics()
+    my_connection_info = ConnectionInfo(
+        name="t1",
+        ipaddress=IPAddress(ip_address="127.0.0.1"),
+        port=Port(port=1000),
+        group_identifier="group",
+    )
+    peer = Peer(
+        connection_info=ConnectionInfo(
+            name="t2",
+            ipaddress=IPAddress(ip_address="127.0.0.1"),
+            port=Port(port=2000),
+            group_identifier="group",
+        )
+    )
+    frontend_peer_state = FrontendPeerState(
+        my_connection_info=my_connection_info,
+        socket_factory=socket_factory_mock,
+        background_listener=background_listener_mock,
+        peer=peer,
+        peer_metrics=peer_metrics,
+        payload_flow_control_config=PayloadFlowControlConfig(
+            max_in_flight_messages=max_in_flight_messages,
+            max_in_flight_bytes=max_in_flight_bytes,
+        ),
+        payload_compression_config=payload_compression_config,
+    )
+    return TestSetup(
+        background_listener_mock=background_listener_mock,
+        socket_factory_mock=socket_factory_mock,
+        peer_metrics=peer_metrics,
+        my_connection_info=my_connection_info,
+        peer=peer,
+        frontend_peer_state=frontend_peer_state,
+    )
+
+
+def create_frame(value: bytes) -> Frame:
+    frame = create_autospec(Frame)
+    mock_cast(frame.to_memoryview).return_value = memoryview(value)
+    return frame
+
+
+def create_payload(test_setup: TestSetup, size_in_bytes: int) -> CompressedPayload:
+    return test_setup.frontend_peer_state.compress([create_frame(b"x" * size_in_bytes)])
+
+
+def create_acknowledge_payload_message(
+    test_setup: TestSetup,
+    sequence_number: int,
+    consumed_messages: int = 0,
+    consumed_bytes: int = 0,
+) -> messages.AcknowledgePayload:
+    return messages.AcknowledgePayload(
+        source=test_setup.peer,
+        destination=Peer(connection_info=test_setup.my_connection_info),
+        sequence_number=sequence_number,
+        consumed_messages=consumed_messages,
+        consumed_bytes=consumed_bytes,
+    )
+
+
+def test_can_send_initially():
+    test_setup = create_test_setup()
+    assert test_setup.frontend_peer_state.can_send(create_payload(test_setup, 10))
+
+
+def test_can_send_more_than_max_in_flight_bytes_without_messages_in_flight():
+    test_setup = create_test_setup(max_in_flight_bytes=10)
+    assert test_setup.frontend_peer_state.can_send(create_payload(test_setup, 100))
+
+
+def test_can_not_send_more_than_max_in_flight_messages():
+    test_setup = create_test_setup(max_in_flight_messages=2)
+    for _ in range(2):
+        test_setup.frontend_peer_state.send(create_payload(test_setup, 10))
+    assert (
+        not test_setup.frontend_peer_state.can_send(create_payload(test_setup, 10))
+        and test_setup.frontend_peer_state.in_flight_messages == 2
+    )
+
+
+def test_can_not_send_more_than_max_in_flight_bytes():
+    test_setup = create_test_setup(max_in_flight_bytes=25)
+    for _ in range(2):
+        test_setup.frontend_peer_state.send(create_payload(test_setup, 10))
+    assert (
+        not test_setup.frontend_peer_state.can_send(create_payload(test_setup, 10))
+        and test_setup.frontend_peer_state.can_send(create_payload(test_setup, 5))
+        and test_setup.frontend_peer_state.in_flight_bytes == 20
+    )
+
+
+def test_acknowledge_payload_frees_the_consumed_payloads():
+    test_setup = create_test_setup(max_in_flight_messages=3)
+    for _ in range(3):
+        test_setup.frontend_peer_state.send(create_payload(test_setup, 10))
+    test_setup.frontend_peer_state.received_acknowledge_payload_message(
+        create_acknowledge_payload_message(
+            test_setup, 2, consumed_messages=2, consumed_bytes=20
+        )
+    )
+    assert (
+        test_setup.frontend_peer_state.can_send(create_payload(test_setup, 10))
+        and test_setup.frontend_peer_state.in_flight_messages == 1
+        and test_setup.frontend_peer_state.in_flight_bytes == 10
+    )
+
+
+def test_acknowledge_payload_keeps_the_unconsumed_payloads_in_flight():
+    test_setup = create_test_setup(max_in_flight_messages=3)
+    for _ in range(3):
+        test_setup.frontend_peer_state.send(create_payload(test_setup, 10))
+    test_setup.frontend_peer_state.received_acknowledge_payload_message(
+        create_acknowledge_payload_message(test_setup, 2)
+    )
+    assert (
+        not test_setup.frontend_peer_state.can_send(create_payload(test_setup, 10))
+        and test_setup.frontend_peer_state.in_flight_messages == 3
+    )
+
+
+def test_late_acknowledge_payload_keeps_the_consumed_totals():
+    test_setup = create_test_setup()
+    for _ in range(3):
+        test_setup.frontend_peer_state.send(create_payload(test_setup, 10))
+    for consumed_messages in [2, 1]:
+        test_setup.frontend_peer_state.received_acknowledge_payload_message(
+            create_acknowledge_payload_message(
+                test_setup,
+                2,
+                consumed_messages=consumed_messages,
+                consumed_bytes=consumed_messages * 10,
+            )
+        )
+    assert (
+        test_setup.frontend_peer_state.in_flight_messages == 1
+        and test_setup.frontend_peer_state.in_flight_bytes == 10
+    )
+
+
+def test_send_forwards_payload_to_background_listener():
+    test_setup = create_test_setup()
+    payload = create_payload(test_setup, 10)
+    sequence_number = test_setup.frontend_peer_state.send(payload)
+    assert (
+        sequence_number == 0
+        and mock_cast(
+            test_setup.background_listener_mock.send_payload
+        ).call_args.kwargs["payload"]
+        == payload.frames
+    )
+
+
+def test_compressed_payloads_get_accounted_by_their_compressed_size():
+    test_setup = create_test_setup(
+        max_in_flight_bytes=1000,
+        payload_compression_config=PayloadCompressionConfig(threshold_in_bytes=100),
+    )
+    mock_cast(test_setup.socket_factory_mock.create_frame).side_effect = create_frame
+    state = test_setup.frontend_peer_state
+    payload = state.compress([create_frame(b"x" * 10000)])
+    state.send(payload)
+    assert (
+        payload.compressed_frame_indices == [0]
+        and state.in_flight_bytes == payload.size_in_bytes
+        and payload.size_in_bytes < 100
+        and state.can_send(state.compress([create_frame(b"y" * 10000)]))
+    )
+
+
+def test_metrics_in_flight_after_acknowledge_payload():
+    test_setup = create_test_setup()
+    for _ in range(3):
+        test_setup.frontend_peer_state.send(create_payload(test_setup, 10))
+    test_setup.frontend_peer_state.received_acknowledge_payload_message(
+        create_acknowledge_payload_message(
+            test_setup, 0, consumed_messages=1, consumed_bytes=10
+        )
+    )
+    snapshot = test_setup.peer_metrics.snapshot()
+    assert snapshot.in_flight_messages == 2 and snapshot.in_flight_bytes == 20
+
+
+def receive_payload(test_setup: TestSetup, sequence_number: int, tag: int) -> Frame:
+    frame = create_autospec(Frame)
+    test_setup.frontend_peer_state.received_payload_message(
+        messages.Payload(
+            source=test_setup.peer,
+            destination=Peer(connection_info=test_setup.my_connection_info),
+            sequence_number=sequence_number,
+            tag=tag,
+        ),
+        [create_autospec(Frame), frame],
+    )
+    return frame
+
+
+def test_recv_with_tag_skips_payloads_of_other_tags():
+    test_setup = create_test_setup()
+    frame_with_tag_1 = receive_payload(test_setup, 0, tag=1)
+    frame_with_tag_2 = receive_payload(test_setup, 1, tag=2)
+    state = test_setup.frontend_peer_state
+    assert (
+        not state.has_received_messages(tag=3)
+        and state.recv(tag=2) == [frame_with_tag_2]
+        and not state.has_received_messages(tag=2)
+        and state.recv(tag=1) == [frame_with_tag_1]
+        and not state.has_received_messages()
+    )
+
+
+def test_recv_without_tag_returns_payloads_in_arrival_order():
+    test_setup = create_test_setup()
+    frames = [
+        receive_payload(test_setup, 0, tag=2),
+        receive_payload(test_setup, 1, tag=1),
+        receive_payload(test_setup, 2, tag=2),
+    ]
+    state = test_setup.frontend_peer_state
+    assert [state.recv()[0] for _ in range(3)] == frames
+
+
+def test_metrics_received_queue_messages_counts_all_tags():
+    test_setup = create_test_setup()
+    receive_payload(test_setup, 0, tag=1)
+    receive_payload(test_setup, 1, tag=2)
+    test_setup.frontend_peer_state.recv(tag=2)
+    assert test_setup.peer_metrics.snapshot().received_queue_messages == 1
+
+
+def test_recv_grants_the_credit_for_the_received_payload():
+    test_setup = create_test_setup()
+    test_setup.frontend_peer_state.received_payload_message(
+        messages.Payload(
+            source=test_setup.peer,
+            destination=Peer(connection_info=test_setup.my_connection_info),
+            sequence_number=0,
+        ),
+        [create_frame(b"header"), create_frame(b"x" * 7)],
+    )
+    test_setup.frontend_peer_state.recv()
+    assert mock_cast(
+        test_setup.background_listener_mock.consumed_payload
+    ).mock_calls == [call(peer=test_setup.peer, size_in_bytes=7)]
+
+
+def test_recv_returns_payloads_in_order_of_arrival():
+    test_setup = create_test_setup()
+    frames = [create_autospec(Frame) for _ in range(2)]
+    for sequence_number, frame in enumerate(frames):
+        test_setup.frontend_peer_state.received_payload_message(
+            messages.Payload(
+                source=test_setup.peer,
+                destination=Peer(connection_info=test_setup.my_connection_info),
+                sequence_number=sequence_number,
+            ),
+            [create_autospec(Frame), frame],
+        )
+    state = test_setup.frontend_peer_state
+    assert [state.recv(), state.recv()] == [[frames[0]], [frames[1]]]
@@ -0,0 +1,50 @@
+import pytest
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator.metrics import (
+    NUMBER_OF_LATENCY_BUCKETS,
+    LatencyHistogram,
+    PeerCommunicatorMetrics,
+)
+
+
+@pytest.mark.parametrize(
+    "latency_in_ms, expected_bucket",
+    [(0, 0), (1, 1), (2, 2), (3, 2), (4, 3), (1000, 10), (10**9, 19), (-1, 0)],
+)
+def test_latency_histogram_bucket(latency_in_ms: int, expected_bucket: int):
+    histogram = LatencyHistogram()
+    histogram.record(latency_in_ms)
+    expected_bucket_counts = tuple(
+        1 if bucket == expected_bucket else 0
+        for bucket in range(NUMBER_OF_LATENCY_BUCKETS)
+    )
+    assert histogram.snapshot().bucket_counts == expected_bucket_counts
+
+
+def test_latency_histogram_snapshot():
+    histogram = LatencyHistogram()
+    for latency_in_ms in [1, 2, 6]:
+        histogram.record(latency_in_ms)
+    snapshot = histogram.snapshot()
+    histogram.record(100)
+    assert (
+        snapshot.count == 3
+        and snapshot.sum_in_ms == 9
+        and snapshot.max_in_ms == 6
+        and snapshot.mean_in_ms == 3.0
+    )
+
+
+def test_peer_communicator_metrics_snapshot():
+    peers = ModelFactory.create_factory(Peer).batch(2)
+    metrics = PeerCommunicatorMetrics()
+    for index, peer in enumerate(peers):
+        metrics.get_peer_metrics(peer).payloads_sent += index + 1
+    metrics.get_peer_metrics(peers[0]).payloads_sent += 1
+    snapshot = metrics.snapshot()
+    assert {peer: snapshot[peer].payloads_sent for peer in snapshot} == {
+        peers[0]: 2,
+        peers[1]: 2,
+    }
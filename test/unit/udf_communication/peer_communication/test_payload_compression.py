@@ -0,0 +1,96 @@
+import pytest
+import zmq
+
+from exasol.analytics.udf.communication.peer_communicator.payload_compression import (
+    compress_payload,
+    decompress_payload,
+)
+from exasol.analytics.udf.communication.peer_communicator.payload_compression_config import (
+    PayloadCompressionConfig,
+)
+from exasol.analytics.udf.communication.socket_factory.zmq_wrapper import (
+    ZMQSocketFactory,
+)
+
+COMPRESSIBLE_VALUE = b"abc" * 1000
+
+
+@pytest.fixture
+def socket_factory():
+    with zmq.Context() as context:
+        yield ZMQSocketFactory(context)
+
+
+def test_compression_disabled(socket_factory):
+    payload = [socket_factory.create_frame(COMPRESSIBLE_VALUE)]
+    result, compressed_frame_indices = compress_payload(
+        payload, PayloadCompressionConfig(), socket_factory
+    )
+    assert result == payload and compressed_frame_indices == []
+
+
+def test_frames_below_threshold_stay_raw(socket_factory):
+    header = socket_factory.create_frame(b"header")
+    payload = [header, socket_factory.create_frame(COMPRESSIBLE_VALUE)]
+    result, compressed_frame_indices = compress_payload(
+        payload, PayloadCompressionConfig(threshold_in_bytes=100), socket_factory
+    )
+    assert (
+        result[0] is header
+        and len(result[1].to_bytes()) < len(COMPRESSIBLE_VALUE)
+        and compressed_frame_indices == [1]
+    )
+
+
+def test_incompressible_frames_stay_raw(socket_factory):
+    value = bytes(range(256))
+    payload = [socket_factory.create_frame(value)]
+    result, compressed_frame_indices = compress_payload(
+        payload, PayloadCompressionConfig(threshold_in_bytes=100), socket_factory
+    )
+    assert result == payload and compressed_frame_indices == []
+
+
+def test_decompress_compressed_payload(socket_factory):
+    payload = [
+        socket_factory.create_frame(b"header"),
+        socket_factory.create_frame(COMPRESSIBLE_VALUE),
+    ]
+    compressed_payload, compressed_frame_indices = compress_payload(
+        payload, PayloadCompressionConfig(threshold_in_bytes=100), socket_factory
+    )
+    result = decompress_payload(
+        compressed_payload,
+        compressed_frame_indices,
+        PayloadCompressionConfig(),
+        socket_factory,
+    )
+    assert [frame.to_bytes() for frame in result] == [b"header", COMPRESSIBLE_VALUE]
+
+
+def test_decompress_rejects_frames_above_the_maximum_size(socket_factory):
+    payload = [socket_factory.create_frame(COMPRESSIBLE_VALUE)]
+    compressed_payload, compressed_frame_indices = compress_payload(
+        payload, PayloadCompressionConfig(threshold_in_bytes=100), socket_factory
+    )
+    config = PayloadCompressionConfig(
+        max_decompressed_frame_size_in_bytes=len(COMPRESSIBLE_VALUE) - 1
+    )
+    with pytest.raises(RuntimeError, match="exceeds the maximum decompressed size"):
+        decompress_payload(
+            compressed_payload, compressed_frame_indices, config, socket_factory
+        )
+
+
+def test_decompress_accepts_frames_of_the_maximum_size(socket_factory):
+    payload = [socket_factory.create_frame(COMPRESSIBLE_VALUE)]
+    compressed_payload, compressed_frame_indices = compress_payload(
+        payload, PayloadCompressionConfig(threshold_in_bytes=100), socket_factory
+    )
+    config = PayloadCompressionConfig(
+        max_decompressed_frame_size_in_bytes=len(COMPRESSIBLE_VALUE)
+    )
+    result = decompress_payload(
+        compressed_payload, compressed_frame_indices, config, socket_factory
+    )
+    assert result[0].to_bytes() == COMPRESSIBLE_VALUE
@@ -59,10 +59,9 @@ def test_init():
 def test_try_send():
     test_setup = create_resetted_test_setup()
     test_setup.payload_handler.try_send()
-    assert (
-        test_setup.payload_receiver_mock.mock_calls == []
-        and test_setup.payload_sender_mock.mock_calls == [call.try_send()]
-    )
+    assert test_setup.payload_receiver_mock.mock_calls == [
+        call.try_send()
+    ] and test_setup.payload_sender_mock.mock_calls == [call.try_send()]
 
 
 def create_resetted_test_setup():
@@ -106,6 +105,15 @@ def test_received_acknowledge_payload():
     )
 
 
+def test_consumed_payload():
+    test_setup = create_resetted_test_setup()
+    test_setup.payload_handler.consumed_payload(size_in_bytes=10)
+    assert (
+        test_setup.payload_receiver_mock.mock_calls == [call.consumed_payload(10)]
+        and test_setup.payload_sender_mock.mock_calls == []
+    )
+
+
 @pytest.mark.parametrize(
     "payload_receiver_answer,payload_sender_answer, expected",
     [
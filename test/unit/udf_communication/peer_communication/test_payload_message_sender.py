@@ -15,6 +15,7 @@ from exasol.analytics.udf.communication.ip_address import (
     Port,
 )
 from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.payload_message_sender import (
     PayloadMessageSender,
 )
@@ -36,6 +37,7 @@ class TestSetup:
     retry_timer_mock: Timer | MagicMock
     frame_mocks: list[Frame | MagicMock]
     message: messages.Payload
+    peer_metrics: PeerMetrics
     payload_message_sender: PayloadMessageSender
 
     def reset_mocks(self):
@@ -72,6 +74,7 @@ def create_test_setup() -> TestSetup:
         ),
         sequence_number=0,
     )
+    peer_metrics = PeerMetrics()
     payload_message_sender = PayloadMessageSender(
         sender=sender_mock,
         abort_timer=abort_time_mock,
@@ -79,6 +82,7 @@ def create_test_setup() -> TestSetup:
         out_control_socket=out_control_socket_mock,
         message=message,
         frames=frame_mocks,
+        peer_metrics=peer_metrics,
     )
     return TestSetup(
         message=message,
@@ -87,6 +91,7 @@ def create_test_setup() -> TestSetup:
         out_control_socket_mock=out_control_socket_mock,
         abort_time_mock=abort_time_mock,
         retry_timer_mock=retry_timer_mock,
+        peer_metrics=peer_metrics,
         payload_message_sender=payload_message_sender,
     )
 
@@ -148,6 +153,7 @@ def test_try_send_abort_timer_is_time_false_retry_timer_is_time_true():
         and test_setup.retry_timer_mock.mock_calls
         == [call.is_time(), call.reset_timer()]
         and test_setup.abort_time_mock.mock_calls == [call.is_time()]
+        and test_setup.peer_metrics.payload_retransmissions == 1
     )
 
 
@@ -1,4 +1,5 @@
 import dataclasses
+from test.utils.mock_cast import mock_cast
 from unittest.mock import (
     MagicMock,
     call,
@@ -14,33 +15,42 @@ from exasol.analytics.udf.communication.ip_address import (
     Port,
 )
 from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.payload_receiver import (
     PayloadReceiver,
 )
 from exasol.analytics.udf.communication.peer_communicator.sender import Sender
+from exasol.analytics.udf.communication.peer_communicator.timer import Timer
 from exasol.analytics.udf.communication.socket_factory.abstract import (
     Frame,
     Socket,
 )
 
+PAYLOAD = b"payload"
+
 
 @dataclasses.dataclass
 class TestSetup:
     __test__ = False
     sender_mock: MagicMock | Sender
     out_control_socket_mock: MagicMock | Socket
+    acknowledge_timer_mock: MagicMock | Timer
     my_connection_info: ConnectionInfo
     peer: Peer
+    peer_metrics: PeerMetrics
     payload_receiver: PayloadReceiver
 
     def reset_mock(self):
         self.out_control_socket_mock.reset_mock()
         self.sender_mock.reset_mock()
+        self.acknowledge_timer_mock.reset_mock()
 
 
 def create_test_setup() -> TestSetup:
     sender_mock = create_autospec(Sender)
     out_control_socket_mock = create_autospec(Socket)
+    acknowledge_timer_mock = create_autospec(Timer)
+    mock_cast(acknowledge_timer_mock.is_time).return_value = True
     my_connection_info = ConnectionInfo(
         name="t1",
         ipaddress=IPAddress(ip_address="127.0.0.1"),
@@ -55,29 +65,39 @@ def create_test_setup() -> TestSetup:
             group_identifier="group",
         )
     )
+    peer_metrics = PeerMetrics()
     payload_receiver = PayloadReceiver(
         sender=sender_mock,
         out_control_socket=out_control_socket_mock,
+        acknowledge_timer=acknowledge_timer_mock,
         my_connection_info=my_connection_info,
         peer=peer,
+        peer_metrics=peer_metrics,
     )
     return TestSetup(
         peer=peer,
         my_connection_info=my_connection_info,
         sender_mock=sender_mock,
         out_control_socket_mock=out_control_socket_mock,
+        acknowledge_timer_mock=acknowledge_timer_mock,
+        peer_metrics=peer_metrics,
         payload_receiver=payload_receiver,
     )
 
 
 def create_acknowledge_payload_message(
-    test_setup: TestSetup, message: messages.Payload
+    test_setup: TestSetup,
+    sequence_number: int,
+    consumed_messages: int = 0,
+    consumed_bytes: int = 0,
 ) -> messages.Message:
     acknowledge_message = messages.Message(
         root=messages.AcknowledgePayload(
             source=Peer(connection_info=test_setup.my_connection_info),
-            sequence_number=message.sequence_number,
+            sequence_number=sequence_number,
             destination=test_setup.peer,
+            consumed_messages=consumed_messages,
+            consumed_bytes=consumed_bytes,
         )
     )
     return acknowledge_message
@@ -86,7 +106,9 @@ def create_acknowledge_payload_message(
 def create_payload_message(
     test_setup: TestSetup, sequence_number: int
 ) -> tuple[messages.Payload, list[Frame]]:
-    frames = [create_autospec(Frame)]
+    frame = create_autospec(Frame)
+    mock_cast(frame.to_memoryview).return_value = memoryview(PAYLOAD)
+    frames = [frame]
     message = messages.Payload(
         source=test_setup.peer,
         destination=Peer(connection_info=test_setup.my_connection_info),
@@ -107,14 +129,16 @@ def test_init():
 def test_received_payload_in_sequence(number_of_messages: int):
     test_setup = create_test_setup()
     for sequence_number in range(number_of_messages - 1):
-        print(sequence_number)
         message, frames = create_payload_message(test_setup, sequence_number)
         test_setup.payload_receiver.received_payload(message, frames)
     test_setup.reset_mock()
     sequence_number = number_of_messages - 1
     message, frames = create_payload_message(test_setup, sequence_number)
     test_setup.payload_receiver.received_payload(message, frames)
-    acknowledge_message = create_acknowledge_payload_message(test_setup, message)
+    test_setup.payload_receiver.try_send()
+    acknowledge_message = create_acknowledge_payload_message(
+        test_setup, number_of_messages - 1
+    )
     assert test_setup.out_control_socket_mock.mock_calls == [
         call.send_multipart(frames)
     ] and test_setup.sender_mock.mock_calls == [call.send(message=acknowledge_message)]
@@ -132,7 +156,10 @@ def test_received_payload_in_reverse_sequence(number_of_messages: int):
     sequence_number = 0
     message, frames = create_payload_message(test_setup, sequence_number)
     test_setup.payload_receiver.received_payload(message, frames)
-    acknowledge_message = create_acknowledge_payload_message(test_setup, message)
+    test_setup.payload_receiver.try_send()
+    acknowledge_message = create_acknowledge_payload_message(
+        test_setup, number_of_messages - 1
+    )
     send_of_previous_messages = [
         call.send_multipart(frames) for frames in reversed(frames_of_previous_message)
     ]
@@ -155,11 +182,15 @@ def test_received_payload_in_sequence_multiple_times(
     for sequence_number in range(number_of_messages):
         message, frames = create_payload_message(test_setup, sequence_number)
         test_setup.payload_receiver.received_payload(message, frames)
+    test_setup.payload_receiver.try_send()
     test_setup.reset_mock()
     sequence_number = duplicated_message
     message, frames = create_payload_message(test_setup, sequence_number)
     test_setup.payload_receiver.received_payload(message, frames)
-    acknowledge_message = create_acknowledge_payload_message(test_setup, message)
+    test_setup.payload_receiver.try_send()
+    acknowledge_message = create_acknowledge_payload_message(
+        test_setup, number_of_messages - 1
+    )
     assert (
         test_setup.out_control_socket_mock.mock_calls == []
         and test_setup.sender_mock.mock_calls
@@ -184,11 +215,55 @@ def test_received_payload_in_reverse_sequence_incomplete_multiple_times(
     sequence_number = duplicated_message
     message, frames = create_payload_message(test_setup, sequence_number)
     test_setup.payload_receiver.received_payload(message, frames)
-    acknowledge_message = create_acknowledge_payload_message(test_setup, message)
+    test_setup.payload_receiver.try_send()
     assert (
         test_setup.out_control_socket_mock.mock_calls == []
+        and test_setup.sender_mock.mock_calls == []
+    )
+
+
+@pytest.mark.parametrize("number_of_messages", [i for i in range(1, 10)])
+def test_received_payload_acknowledges_cumulative_after_delay(number_of_messages: int):
+    test_setup = create_test_setup()
+    mock_cast(test_setup.acknowledge_timer_mock.is_time).return_value = False
+    for sequence_number in range(number_of_messages):
+        message, frames = create_payload_message(test_setup, sequence_number)
+        test_setup.payload_receiver.received_payload(message, frames)
+        test_setup.payload_receiver.try_send()
+    calls_before_delay = test_setup.sender_mock.mock_calls.copy()
+    mock_cast(test_setup.acknowledge_timer_mock.is_time).return_value = True
+    test_setup.payload_receiver.try_send()
+    test_setup.payload_receiver.try_send()
+    acknowledge_message = create_acknowledge_payload_message(
+        test_setup, number_of_messages - 1
+    )
+    assert (
+        calls_before_delay == []
         and test_setup.sender_mock.mock_calls
         == [call.send(message=acknowledge_message)]
+        and mock_cast(test_setup.acknowledge_timer_mock.reset_timer).mock_calls
+        == [call()]
+    )
+
+
+def test_consumed_payload_gets_acknowledged_with_the_consumed_totals():
+    test_setup = create_test_setup()
+    for sequence_number in range(3):
+        message, frames = create_payload_message(test_setup, sequence_number)
+        test_setup.payload_receiver.received_payload(message, frames)
+    test_setup.payload_receiver.try_send()
+    test_setup.reset_mock()
+    test_setup.payload_receiver.consumed_payload(size_in_bytes=7)
+    test_setup.payload_receiver.consumed_payload(size_in_bytes=5)
+    test_setup.payload_receiver.try_send()
+    acknowledge_message = create_acknowledge_payload_message(
+        test_setup, 2, consumed_messages=2, consumed_bytes=12
+    )
+    assert (
+        test_setup.sender_mock.mock_calls == [call.send(message=acknowledge_message)]
+        and mock_cast(test_setup.acknowledge_timer_mock.reset_timer).mock_calls
+        == [call()]
+        and test_setup.payload_receiver.is_ready_to_stop()
     )
 
 
@@ -196,14 +271,25 @@ def test_received_payload_in_reverse_sequence_incomplete_multiple_times(
 def test_is_ready_to_close_after_received_payload_in_sequence(number_of_messages: int):
     test_setup = create_test_setup()
     for sequence_number in range(number_of_messages):
-        print(sequence_number)
         message, frames = create_payload_message(test_setup, sequence_number)
         test_setup.payload_receiver.received_payload(message, frames)
+    test_setup.payload_receiver.try_send()
     test_setup.reset_mock()
     result = test_setup.payload_receiver.is_ready_to_stop()
     assert result
 
 
+@pytest.mark.parametrize("number_of_messages", [i for i in range(1, 10)])
+def test_is_not_ready_to_close_with_pending_acknowledgement(number_of_messages: int):
+    test_setup = create_test_setup()
+    for sequence_number in range(number_of_messages):
+        message, frames = create_payload_message(test_setup, sequence_number)
+        test_setup.payload_receiver.received_payload(message, frames)
+    test_setup.reset_mock()
+    result = test_setup.payload_receiver.is_ready_to_stop()
+    assert not result
+
+
 @pytest.mark.parametrize("number_of_messages", [i for i in range(1, 10)])
 def test_is_ready_to_stop_after_received_payload_in_reverse_sequence(
     number_of_messages: int,
@@ -214,6 +300,7 @@ def test_is_ready_to_stop_after_received_payload_in_reverse_sequence(
         message, frames = create_payload_message(test_setup, sequence_number)
         frames_of_previous_message.append(frames)
         test_setup.payload_receiver.received_payload(message, frames)
+    test_setup.payload_receiver.try_send()
     test_setup.reset_mock()
     is_ready_to_stop = test_setup.payload_receiver.is_ready_to_stop()
     assert is_ready_to_stop
@@ -234,6 +321,7 @@ def test_is_ready_to_stop_payload_in_sequence_multiple_times(
     for sequence_number in range(duplicated_message_sequence_number):
         message, frames = create_payload_message(test_setup, sequence_number)
         test_setup.payload_receiver.received_payload(message, frames)
+    test_setup.payload_receiver.try_send()
     is_ready_to_stop = test_setup.payload_receiver.is_ready_to_stop()
     assert is_ready_to_stop
 
@@ -248,6 +336,51 @@ def test_is_ready_to_stop_after_received_payload_in_reverse_sequence_incomplete(
         message, frames = create_payload_message(test_setup, sequence_number)
         frames_of_previous_message.append(frames)
         test_setup.payload_receiver.received_payload(message, frames)
+    test_setup.payload_receiver.try_send()
     test_setup.reset_mock()
     is_ready_to_stop = test_setup.payload_receiver.is_ready_to_stop()
     assert not is_ready_to_stop
+
+
+@pytest.mark.parametrize("number_of_messages", [i for i in range(2, 10)])
+def test_reorder_buffer_size_in_bytes(number_of_messages: int):
+    test_setup = create_test_setup()
+    for sequence_number in range(number_of_messages - 1, 0, -1):
+        message, frames = create_payload_message(test_setup, sequence_number)
+        test_setup.payload_receiver.received_payload(message, frames)
+    message, frames = create_payload_message(test_setup, 1)
+    test_setup.payload_receiver.received_payload(message, frames)
+    size_before = (
+        test_setup.payload_receiver.reorder_buffer_messages,
+        test_setup.payload_receiver.reorder_buffer_size_in_bytes,
+    )
+    message, frames = create_payload_message(test_setup, 0)
+    test_setup.payload_receiver.received_payload(message, frames)
+    size_after = (
+        test_setup.payload_receiver.reorder_buffer_messages,
+        test_setup.payload_receiver.reorder_buffer_size_in_bytes,
+    )
+    assert size_before == (
+        number_of_messages - 1,
+        (number_of_messages - 1) * len(PAYLOAD),
+    ) and size_after == (0, 0)
+
+
+def test_metrics_after_received_payload_out_of_order():
+    test_setup = create_test_setup()
+    for sequence_number in [2, 1, 1]:
+        message, frames = create_payload_message(test_setup, sequence_number)
+        test_setup.payload_receiver.received_payload(message, frames)
+    snapshot_before = test_setup.peer_metrics.snapshot()
+    message, frames = create_payload_message(test_setup, 0)
+    test_setup.payload_receiver.received_payload(message, frames)
+    snapshot_after = test_setup.peer_metrics.snapshot()
+    assert (
+        snapshot_before.payloads_received == 0
+        and snapshot_before.reorder_buffer_messages == 2
+        and snapshot_before.reorder_buffer_bytes == 2 * len(PAYLOAD)
+        and snapshot_after.payloads_received == 3
+        and snapshot_after.bytes_received == 3 * len(PAYLOAD)
+        and snapshot_after.reorder_buffer_messages == 0
+        and snapshot_after.reorder_buffer_bytes == 0
+    )
@@ -6,6 +6,8 @@ from unittest.mock import (
     create_autospec,
 )
 
+import pytest
+
 from exasol.analytics.udf.communication import messages
 from exasol.analytics.udf.communication.connection_info import ConnectionInfo
 from exasol.analytics.udf.communication.ip_address import (
@@ -14,6 +16,7 @@ from exasol.analytics.udf.communication.ip_address import (
 )
 from exasol.analytics.udf.communication.peer import Peer
 from exasol.analytics.udf.communication.peer_communicator.clock import Clock
+from exasol.analytics.udf.communication.peer_communicator.metrics import PeerMetrics
 from exasol.analytics.udf.communication.peer_communicator.payload_message_sender import (
     PayloadMessageSender,
 )
@@ -33,6 +36,8 @@ from exasol.analytics.udf.communication.socket_factory.abstract import (
     Socket,
 )
 
+PAYLOAD = b"payload"
+
 
 @dataclasses.dataclass
 class TestSetup:
@@ -45,6 +50,7 @@ class TestSetup:
     payload_message_sender_timeout_config: PayloadMessageSenderTimeoutConfig
     my_connection_info: ConnectionInfo
     peer: Peer
+    peer_metrics: PeerMetrics
     payload_sender: PayloadSender
 
     def reset_mock(self):
@@ -74,6 +80,8 @@ def create_test_setup(number_of_messages: int) -> TestSetup:
         )
     )
     clock_mock = create_autospec(Clock)
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 0
+    peer_metrics = PeerMetrics()
     payload_message_sender_factory_mock: MagicMock | PayloadMessageSenderFactory = (
         create_autospec(PayloadMessageSenderFactory)
     )
@@ -84,7 +92,7 @@ def create_test_setup(number_of_messages: int) -> TestSetup:
         payload_message_sender_mocks
     )
     payload_message_sender_timeout_config = PayloadMessageSenderTimeoutConfig(
-        abort_timeout_in_ms=2, retry_timeout_in_ms=1
+        abort_timeout_in_ms=2, retry_timeout_in_ms=1, acknowledge_delay_in_ms=4
     )
     payload_sender = PayloadSender(
         sender=sender_mock,
@@ -94,6 +102,7 @@ def create_test_setup(number_of_messages: int) -> TestSetup:
         clock=clock_mock,
         payload_message_sender_factory=payload_message_sender_factory_mock,
         payload_message_sender_timeout_config=payload_message_sender_timeout_config,
+        peer_metrics=peer_metrics,
     )
     return TestSetup(
         peer=peer,
@@ -104,6 +113,7 @@ def create_test_setup(number_of_messages: int) -> TestSetup:
         payload_message_sender_factory_mock=payload_message_sender_factory_mock,
         payload_message_sender_mocks=payload_message_sender_mocks,
         payload_message_sender_timeout_config=payload_message_sender_timeout_config,
+        peer_metrics=peer_metrics,
         payload_sender=payload_sender,
     )
 
@@ -124,7 +134,9 @@ def create_acknowledge_payload_message(
 def create_payload_message(
     test_setup: TestSetup, sequence_number: int
 ) -> tuple[messages.Payload, list[Frame]]:
-    frames = [create_autospec(Frame)]
+    frame = create_autospec(Frame)
+    mock_cast(frame.to_memoryview).return_value = memoryview(PAYLOAD)
+    frames = [frame]
     message = messages.Payload(
         source=test_setup.peer,
         destination=Peer(connection_info=test_setup.my_connection_info),
@@ -163,7 +175,7 @@ def test_send_payload():
     assert (
         test_setup.out_control_socket_mock.mock_calls == []
         and test_setup.sender_mock.mock_calls == []
-        and test_setup.clock_mock.mock_calls == []
+        and test_setup.clock_mock.mock_calls == [call.current_timestamp_in_ms()]
         and test_setup.payload_message_sender_factory_mock.mock_calls
         == [
             call.create(
@@ -173,6 +185,7 @@ def test_send_payload():
                 out_control_socket=test_setup.out_control_socket_mock,
                 clock=test_setup.clock_mock,
                 payload_message_sender_timeout_config=test_setup.payload_message_sender_timeout_config,
+                peer_metrics=test_setup.peer_metrics,
             )
         ]
         and test_setup.payload_message_sender_mocks[0].mock_calls == []
@@ -209,7 +222,7 @@ def test_received_acknowledge_payload_after_send_payload():
         test_setup.out_control_socket_mock.mock_calls
         == [call.send(serialize_message(acknowledge_payload_message))]
         and test_setup.sender_mock.mock_calls == []
-        and test_setup.clock_mock.mock_calls == []
+        and test_setup.clock_mock.mock_calls == [call.current_timestamp_in_ms()]
         and test_setup.payload_message_sender_factory_mock.mock_calls == []
         and test_setup.payload_message_sender_mocks[0].mock_calls == [call.stop()]
     )
@@ -236,3 +249,96 @@ def test_received_acknowledge_payload_twice_after_send_payload():
         and test_setup.payload_message_sender_factory_mock.mock_calls == []
         and test_setup.payload_message_sender_mocks[0].mock_calls == []
     )
+
+
+@pytest.mark.parametrize(
+    "number_of_messages, acknowledged_sequence_number",
+    [(i, j) for i in range(1, 5) for j in range(0, i)],
+)
+def test_received_cumulative_acknowledge_payload_after_send_payload(
+    number_of_messages: int, acknowledged_sequence_number: int
+):
+    test_setup = create_test_setup(number_of_messages=number_of_messages)
+    for sequence_number in range(number_of_messages):
+        payload_message, frames = create_payload_message(test_setup, sequence_number)
+        test_setup.payload_sender.send_payload(payload_message, frames)
+    test_setup.reset_mock()
+    acknowledge_payload_message = messages.Message(
+        root=messages.AcknowledgePayload(
+            source=Peer(connection_info=test_setup.my_connection_info),
+            sequence_number=acknowledged_sequence_number,
+            destination=test_setup.peer,
+        )
+    )
+    test_setup.payload_sender.received_acknowledge_payload(
+        message=acknowledge_payload_message.root
+    )
+    test_setup.payload_sender.try_send()
+    payload_message_sender_mock_calls = [
+        mock.mock_calls for mock in test_setup.payload_message_sender_mocks
+    ]
+    expected_payload_message_sender_mock_calls = [
+        [call.stop()] if i <= acknowledged_sequence_number else [call.try_send()]
+        for i in range(number_of_messages)
+    ]
+    assert (
+        test_setup.out_control_socket_mock.mock_calls
+        == [call.send(serialize_message(acknowledge_payload_message))]
+        and payload_message_sender_mock_calls
+        == expected_payload_message_sender_mock_calls
+        and test_setup.payload_sender.is_ready_to_stop()
+        == (acknowledged_sequence_number == number_of_messages - 1)
+    )
+
+
+def test_received_acknowledge_payload_with_further_consumed_payloads_gets_forwarded():
+    test_setup = create_test_setup(number_of_messages=1)
+    payload_message, frames = create_payload_message(test_setup, 0)
+    test_setup.payload_sender.send_payload(payload_message, frames)
+    acknowledge_payload_message = create_acknowledge_payload_message(
+        test_setup, payload_message
+    )
+    test_setup.payload_sender.received_acknowledge_payload(
+        message=acknowledge_payload_message.root
+    )
+    test_setup.reset_mock()
+    consumed_acknowledge_payload_message = messages.Message(
+        root=messages.AcknowledgePayload(
+            source=Peer(connection_info=test_setup.my_connection_info),
+            sequence_number=payload_message.sequence_number,
+            destination=test_setup.peer,
+            consumed_messages=1,
+            consumed_bytes=10,
+        )
+    )
+    test_setup.payload_sender.received_acknowledge_payload(
+        message=consumed_acknowledge_payload_message.root
+    )
+    assert (
+        test_setup.out_control_socket_mock.mock_calls
+        == [call.send(serialize_message(consumed_acknowledge_payload_message))]
+        and test_setup.clock_mock.mock_calls == []
+        and test_setup.payload_message_sender_mocks[0].mock_calls == []
+    )
+
+
+def test_metrics_after_received_acknowledge_payload():
+    test_setup = create_test_setup(number_of_messages=2)
+    mock_cast(test_setup.clock_mock.current_timestamp_in_ms).side_effect = [0, 5, 20]
+    for sequence_number in range(2):
+        payload_message, frames = create_payload_message(test_setup, sequence_number)
+        test_setup.payload_sender.send_payload(payload_message, frames)
+    acknowledge_payload_message = create_acknowledge_payload_message(
+        test_setup, payload_message
+    )
+    test_setup.payload_sender.received_acknowledge_payload(
+        message=acknowledge_payload_message.root
+    )
+    snapshot = test_setup.peer_metrics.snapshot()
+    assert (
+        snapshot.payloads_sent == 2
+        and snapshot.bytes_sent == 2 * len(PAYLOAD)
+        and snapshot.round_trip_time.count == 2
+        and snapshot.round_trip_time.sum_in_ms == 27
+        and snapshot.round_trip_time.max_in_ms == 16
+    )
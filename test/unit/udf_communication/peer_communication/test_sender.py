@@ -0,0 +1,156 @@
+import dataclasses
+from test.utils.mock_cast import mock_cast
+from unittest.mock import (
+    MagicMock,
+    call,
+    create_autospec,
+)
+
+import pytest
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.connection_info import ConnectionInfo
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator.sender import Sender
+from exasol.analytics.udf.communication.peer_communicator.transport_config import (
+    TransportConfig,
+)
+from exasol.analytics.udf.communication.serialization import serialize_message
+from exasol.analytics.udf.communication.socket_factory.abstract import (
+    Frame,
+    Socket,
+    SocketFactory,
+    SocketType,
+)
+
+
+@dataclasses.dataclass()
+class TestSetup:
+    __test__ = False
+    peer: Peer
+    my_connection_info: ConnectionInfo
+    socket_factory_mock: MagicMock | SocketFactory
+    send_socket_mocks: list[MagicMock | Socket]
+    sender: Sender
+
+
+def create_test_setup(
+    number_of_sockets: int = 1, transport_config: TransportConfig = TransportConfig()
+) -> TestSetup:
+    peer = Peer(
+        connection_info=ConnectionInfo(
+            name="t1",
+            ipaddress=IPAddress(ip_address="127.0.0.1"),
+            port=Port(port=11),
+            group_identifier="g",
+        )
+    )
+    my_connection_info = ConnectionInfo(
+        name="t0",
+        ipaddress=IPAddress(ip_address="127.0.0.1"),
+        port=Port(port=10),
+        group_identifier="g",
+    )
+    socket_factory_mock: MagicMock | SocketFactory = create_autospec(SocketFactory)
+    send_socket_mocks = [create_autospec(Socket) for _ in range(number_of_sockets)]
+    mock_cast(socket_factory_mock.create_socket).side_effect = send_socket_mocks
+    sender = Sender(
+        my_connection_info=my_connection_info,
+        socket_factory=socket_factory_mock,
+        peer=peer,
+        send_socket_linger_time_in_ms=100,
+        transport_config=transport_config,
+    )
+    return TestSetup(
+        peer=peer,
+        my_connection_info=my_connection_info,
+        socket_factory_mock=socket_factory_mock,
+        send_socket_mocks=send_socket_mocks,
+        sender=sender,
+    )
+
+
+def create_message(test_setup: TestSetup) -> messages.Message:
+    return messages.Message(
+        root=messages.SynchronizeConnection(
+            source=test_setup.my_connection_info,
+            destination=test_setup.peer,
+            attempt=1,
+        )
+    )
+
+
+def test_init():
+    test_setup = create_test_setup()
+    assert test_setup.socket_factory_mock.mock_calls == []
+
+
+def test_send_reuses_socket():
+    test_setup = create_test_setup()
+    message = create_message(test_setup)
+    frames = [create_autospec(Frame)]
+    test_setup.sender.send(message)
+    test_setup.sender.send_multipart(frames)
+    test_setup.sender.send(message)
+    serialized_message = serialize_message(message.root)
+    assert test_setup.socket_factory_mock.mock_calls == [
+        call.create_socket(SocketType.DEALER)
+    ] and test_setup.send_socket_mocks[0].mock_calls == [
+        call.connect("tcp://127.0.0.1:11"),
+        call.send(serialized_message),
+        call.send_multipart(frames),
+        call.send(serialized_message),
+    ]
+
+
+def test_send_connects_to_ipc_endpoint(tmp_path):
+    test_setup = create_test_setup(
+        transport_config=TransportConfig(ipc_directory=str(tmp_path))
+    )
+    test_setup.sender.send(create_message(test_setup))
+    assert test_setup.send_socket_mocks[0].mock_calls[0] == call.connect(
+        f"ipc://{tmp_path}/peer_communicator_11"
+    )
+
+
+def test_send_reconnects_after_error():
+    test_setup = create_test_setup(number_of_sockets=2)
+    message = create_message(test_setup)
+    mock_cast(test_setup.send_socket_mocks[0].send).side_effect = RuntimeError()
+    with pytest.raises(RuntimeError):
+        test_setup.sender.send(message)
+    test_setup.sender.send(message)
+    serialized_message = serialize_message(message.root)
+    assert (
+        test_setup.socket_factory_mock.mock_calls
+        == [call.create_socket(SocketType.DEALER)] * 2
+        and test_setup.send_socket_mocks[0].mock_calls
+        == [
+            call.connect("tcp://127.0.0.1:11"),
+            call.send(serialized_message),
+            call.close(linger=0),
+        ]
+        and test_setup.send_socket_mocks[1].mock_calls
+        == [
+            call.connect("tcp://127.0.0.1:11"),
+            call.send(serialized_message),
+        ]
+    )
+
+
+def test_close():
+    test_setup = create_test_setup()
+    test_setup.sender.send(create_message(test_setup))
+    test_setup.sender.close()
+    test_setup.sender.close()
+    assert test_setup.send_socket_mocks[0].mock_calls[2:] == [call.close(100)]
+
+
+def test_close_without_send():
+    test_setup = create_test_setup()
+    test_setup.sender.close()
+    assert test_setup.socket_factory_mock.mock_calls == []
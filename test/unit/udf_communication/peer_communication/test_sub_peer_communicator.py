@@ -0,0 +1,107 @@
+import dataclasses
+from test.utils.mock_cast import mock_cast
+from unittest.mock import (
+    MagicMock,
+    call,
+    create_autospec,
+)
+
+import pytest
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.peer_communicator.sub_peer_communicator import (
+    SubPeerCommunicator,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import Frame
+
+TAG_OFFSET = 2**32
+
+
+@dataclasses.dataclass(frozen=True)
+class Fixture:
+    my_peer: Peer
+    peers: list[Peer]
+    peer_communicator_mock: MagicMock | PeerCommunicator
+    sub_peer_communicator: SubPeerCommunicator
+
+
+def create_setup() -> Fixture:
+    my_peer = ModelFactory.create_factory(Peer).build()
+    other_peers = [ModelFactory.create_factory(Peer).build() for _ in range(2)]
+    peers = [other_peers[0], my_peer, other_peers[1]]
+    peer_communicator_mock: MagicMock | PeerCommunicator = create_autospec(
+        PeerCommunicator
+    )
+    peer_communicator_mock.peer = my_peer
+    return Fixture(
+        my_peer=my_peer,
+        peers=peers,
+        peer_communicator_mock=peer_communicator_mock,
+        sub_peer_communicator=SubPeerCommunicator(
+            peer_communicator=peer_communicator_mock,
+            peers=peers,
+            tag_offset=TAG_OFFSET,
+        ),
+    )
+
+
+def test_ranks_follow_order_of_peers():
+    fixture = create_setup()
+    communicator = fixture.sub_peer_communicator
+    assert (
+        communicator.peers() == fixture.peers
+        and communicator.rank == 1
+        and communicator.leader == fixture.peers[0]
+        and communicator.number_of_peers == 3
+    )
+
+
+def test_my_peer_not_in_peers():
+    fixture = create_setup()
+    with pytest.raises(ValueError):
+        SubPeerCommunicator(
+            peer_communicator=fixture.peer_communicator_mock,
+            peers=[fixture.peers[0]],
+            tag_offset=TAG_OFFSET,
+        )
+
+
+def test_send_shifts_tag():
+    fixture = create_setup()
+    frames = [create_autospec(Frame)]
+    fixture.sub_peer_communicator.send(peer=fixture.peers[0], message=frames, tag=3)
+    assert mock_cast(fixture.peer_communicator_mock.send).mock_calls == [
+        call(fixture.peers[0], frames, None, TAG_OFFSET + 3)
+    ]
+
+
+def test_recv_shifts_tag():
+    fixture = create_setup()
+    frames = [create_autospec(Frame)]
+    mock_cast(fixture.peer_communicator_mock.recv).return_value = frames
+    result = fixture.sub_peer_communicator.recv(peer=fixture.peers[2], tag=3)
+    assert result == frames and mock_cast(
+        fixture.peer_communicator_mock.recv
+    ).mock_calls == [call(fixture.peers[2], None, TAG_OFFSET + 3)]
+
+
+def test_poll_peers_defaults_to_other_peers():
+    fixture = create_setup()
+    mock_cast(fixture.peer_communicator_mock.poll_peers).return_value = [
+        fixture.peers[2]
+    ]
+    result = fixture.sub_peer_communicator.poll_peers(tag=3)
+    assert result == [fixture.peers[2]] and mock_cast(
+        fixture.peer_communicator_mock.poll_peers
+    ).mock_calls == [call([fixture.peers[0], fixture.peers[2]], None, TAG_OFFSET + 3)]
+
+
+def test_are_connected_is_delegated():
+    fixture = create_setup()
+    mock_cast(fixture.peer_communicator_mock.are_connected).return_value = False
+    result = fixture.sub_peer_communicator.are_connected([fixture.peers[0]])
+    assert result is False and mock_cast(
+        fixture.peer_communicator_mock.are_connected
+    ).mock_calls == [call([fixture.peers[0]])]
@@ -6,7 +6,10 @@ from unittest.mock import (
 )
 
 from exasol.analytics.udf.communication.peer_communicator.clock import Clock
-from exasol.analytics.udf.communication.peer_communicator.timer import Timer
+from exasol.analytics.udf.communication.peer_communicator.timer import (
+    Timer,
+    TimerScheduler,
+)
 
 
 def test_init():
@@ -84,3 +87,108 @@ def test_it_time_true_after_reset_timer():
     result = timer.is_time()
 
     assert result == True and clock_mock.mock_calls == [call.current_timestamp_in_ms()]
+
+
+def test_deadline_in_ms():
+    clock_mock: MagicMock | Clock = create_autospec(Clock)
+    mock_cast(clock_mock.current_timestamp_in_ms).side_effect = [0, 10, 11]
+    timer = Timer(clock=clock_mock, timeout_in_ms=10)
+
+    result = timer.deadline_in_ms
+
+    assert result == 11 and not timer.is_time() and timer.is_time()
+
+
+def test_scheduler_timeout_without_timers():
+    clock_mock: MagicMock | Clock = create_autospec(Clock)
+    scheduler = TimerScheduler(clock_mock)
+
+    result = scheduler.compute_timeout_in_ms(max_timeout_in_ms=200)
+
+    assert result == 200
+
+
+def test_scheduler_timeout_until_next_deadline():
+    clock_mock: MagicMock | Clock = create_autospec(Clock)
+    scheduler = TimerScheduler(clock_mock)
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 0
+    Timer(clock=clock_mock, timeout_in_ms=50, scheduler=scheduler)
+    Timer(clock=clock_mock, timeout_in_ms=10, scheduler=scheduler)
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 5
+
+    result = scheduler.compute_timeout_in_ms(max_timeout_in_ms=200)
+
+    assert result == 6
+
+
+def test_scheduler_timeout_is_limited():
+    clock_mock: MagicMock | Clock = create_autospec(Clock)
+    scheduler = TimerScheduler(clock_mock)
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 0
+    Timer(clock=clock_mock, timeout_in_ms=1000, scheduler=scheduler)
+
+    result = scheduler.compute_timeout_in_ms(max_timeout_in_ms=200)
+
+    assert result == 200
+
+
+def test_scheduler_pop_expired_timers():
+    clock_mock: MagicMock | Clock = create_autospec(Clock)
+    scheduler = TimerScheduler(clock_mock)
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 0
+    timer1 = Timer(clock=clock_mock, timeout_in_ms=10, scheduler=scheduler)
+    timer2 = Timer(clock=clock_mock, timeout_in_ms=50, scheduler=scheduler)
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 11
+
+    result = scheduler.pop_expired_timers()
+
+    assert result == [timer1] and scheduler.pop_expired_timers() == []
+
+
+def test_scheduler_discards_deadline_of_reset_timer():
+    clock_mock: MagicMock | Clock = create_autospec(Clock)
+    scheduler = TimerScheduler(clock_mock)
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 0
+    timer = Timer(clock=clock_mock, timeout_in_ms=10, scheduler=scheduler)
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 5
+    timer.reset_timer()
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 11
+
+    expired_timers = scheduler.pop_expired_timers()
+    timeout_in_ms = scheduler.compute_timeout_in_ms(max_timeout_in_ms=200)
+
+    assert expired_timers == [] and timeout_in_ms == 5
+
+
+def test_scheduler_timers_belong_to_owner_of_context():
+    clock_mock: MagicMock | Clock = create_autospec(Clock)
+    scheduler = TimerScheduler(clock_mock)
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 0
+    with scheduler.owned_by("peer1"):
+        timer1 = Timer(clock=clock_mock, timeout_in_ms=10, scheduler=scheduler)
+        with scheduler.owned_by("peer2"):
+            timer2 = Timer(clock=clock_mock, timeout_in_ms=10, scheduler=scheduler)
+        timer3 = Timer(clock=clock_mock, timeout_in_ms=10, scheduler=scheduler)
+    timer4 = Timer(clock=clock_mock, timeout_in_ms=10, scheduler=scheduler)
+
+    assert [timer.owner for timer in [timer1, timer2, timer3, timer4]] == [
+        "peer1",
+        "peer2",
+        "peer1",
+        None,
+    ]
+
+
+def test_scheduler_reset_timer_keeps_owner():
+    clock_mock: MagicMock | Clock = create_autospec(Clock)
+    scheduler = TimerScheduler(clock_mock)
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 0
+    with scheduler.owned_by("peer1"):
+        timer = Timer(clock=clock_mock, timeout_in_ms=10, scheduler=scheduler)
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 5
+    timer.reset_timer()
+    mock_cast(clock_mock.current_timestamp_in_ms).return_value = 16
+
+    expired_timers = scheduler.pop_expired_timers()
+
+    assert [timer.owner for timer in expired_timers] == ["peer1"]
@@ -0,0 +1,33 @@
+import pytest
+
+from exasol.analytics.udf.communication.peer_communicator.transport_config import (
+    MAX_IPC_PATH_LENGTH,
+    TransportConfig,
+)
+
+
+def test_without_ipc_directory():
+    assert TransportConfig().ipc_directory is None
+
+
+def test_ipc_directory(tmp_path):
+    assert TransportConfig(ipc_directory=str(tmp_path)).ipc_directory == str(tmp_path)
+
+
+def test_missing_ipc_directory(tmp_path):
+    with pytest.raises(ValueError, match="does not exist"):
+        TransportConfig(ipc_directory=str(tmp_path / "missing"))
+
+
+def test_ipc_file_is_no_directory(tmp_path):
+    ipc_file = tmp_path / "file"
+    ipc_file.touch()
+    with pytest.raises(ValueError, match="is not a directory"):
+        TransportConfig(ipc_directory=str(ipc_file))
+
+
+def test_too_long_ipc_directory(tmp_path):
+    ipc_directory = tmp_path / ("d" * MAX_IPC_PATH_LENGTH)
+    ipc_directory.mkdir()
+    with pytest.raises(ValueError, match="is too long"):
+        TransportConfig(ipc_directory=str(ipc_directory))
@@ -201,6 +201,15 @@ def test_socket_set_identity():
     assert mock_cast(socket_mock.set_identity).mock_calls == [call(name)]
 
 
+def test_socket_get_file_descriptor():
+    socket_mock: abstract.Socket | MagicMock = create_autospec(abstract.Socket)
+    random_state_mock: RandomState | MagicMock = create_autospec(RandomState)
+    mock_cast(socket_mock.get_file_descriptor).return_value = 42
+    with fault_injection.Socket(socket_mock, 0.1, random_state_mock) as socket:
+        result = socket.get_file_descriptor()
+    assert result == 42
+
+
 @pytest.mark.parametrize("linger", [None, 2])
 def test_close_linger(linger: int | None):
     socket_mock: abstract.Socket | MagicMock = create_autospec(abstract.Socket)
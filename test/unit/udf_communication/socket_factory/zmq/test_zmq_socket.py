@@ -81,6 +81,27 @@ def test_socket_send_receive_multipart():
                 )
 
 
+def test_socket_send_same_frame_multiple_times():
+    with zmq.Context() as context:
+        factory = ZMQSocketFactory(context)
+        with factory.create_socket(SocketType.PAIR) as socket1:
+            with factory.create_socket(SocketType.PAIR) as socket2:
+                socket1.bind("inproc://test")
+                socket2.connect("inproc://test")
+                value = b"0123456789" * 10000
+                frame = factory.create_frame(value)
+                socket1.send_multipart([frame])
+                socket1.send_multipart([frame])
+                output_messages = [
+                    socket2.receive_multipart(),
+                    socket2.receive_multipart(),
+                ]
+                assert [message[0].to_memoryview() for message in output_messages] == [
+                    value,
+                    value,
+                ]
+
+
 def test_socket_poll_in():
     with zmq.Context() as context:
         factory = ZMQSocketFactory(context)
@@ -127,6 +148,15 @@ def test_socket_set_identity():
             assert result == name
 
 
+def test_socket_get_file_descriptor():
+    with zmq.Context() as context:
+        factory = ZMQSocketFactory(context)
+        with factory.create_socket(SocketType.PAIR) as socket1:
+            if isinstance(socket1, ZMQSocket):
+                expected = socket1._internal_socket.getsockopt(zmq.FD)
+            assert socket1.get_file_descriptor() == expected
+
+
 @pytest.mark.parametrize("linger", [None, 2])
 def test_close_linger(linger: int | None):
     socket_mock: zmq.Socket | MagicMock = create_autospec(zmq.Socket)
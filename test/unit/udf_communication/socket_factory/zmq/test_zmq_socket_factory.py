@@ -42,6 +42,24 @@ def test_create_frame():
         )
 
 
+def test_create_frame_from_memoryview():
+    with zmq.Context() as context:
+        factory = ZMQSocketFactory(context)
+        value = b"0123456789" * 10000
+        frame = factory.create_frame(memoryview(value)[10:])
+        view = frame.to_memoryview()
+        assert view == value[10:] and view.readonly
+
+
+def test_create_frame_copies_writable_buffers():
+    with zmq.Context() as context:
+        factory = ZMQSocketFactory(context)
+        value = bytearray(b"0123456789" * 10000)
+        frame = factory.create_frame(memoryview(value))
+        value[0:1] = b"x"
+        assert frame.to_memoryview() == b"0123456789" * 10000
+
+
 def test_create_poller():
     with zmq.Context() as context:
         factory = ZMQSocketFactory(context)
@@ -0,0 +1,196 @@
+import asyncio
+import dataclasses
+import os
+from test.utils.mock_cast import mock_cast
+from unittest.mock import (
+    MagicMock,
+    PropertyMock,
+    call,
+    create_autospec,
+)
+
+import pytest
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from exasol.analytics.udf.communication.async_communicator import (
+    AsyncCommunicator,
+)
+from exasol.analytics.udf.communication.communicator import Communicator
+from exasol.analytics.udf.communication.connection_info import ConnectionInfo
+from exasol.analytics.udf.communication.operation_steps import (
+    Steps,
+    recv,
+    send,
+)
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.reducers import sum_reducer
+from exasol.analytics.udf.communication.socket_factory.abstract import Frame
+
+REDUCER = sum_reducer("int64")
+
+
+@dataclasses.dataclass()
+class TestSetup:
+    __test__ = False
+    peer: Peer
+    communicator_mock: MagicMock | Communicator
+    peer_communicator_mock: MagicMock | PeerCommunicator
+    read_file_descriptor: int
+    write_file_descriptor: int
+
+    def notify(self):
+        os.write(self.write_file_descriptor, b"x")
+
+    def close(self):
+        os.close(self.read_file_descriptor)
+        os.close(self.write_file_descriptor)
+
+
+@pytest.fixture
+def test_setup():
+    peer_communicator_mock: MagicMock | PeerCommunicator = create_autospec(
+        PeerCommunicator
+    )
+    type(peer_communicator_mock).my_connection_info = PropertyMock(
+        return_value=ModelFactory.create_factory(ConnectionInfo).build()
+    )
+    read_file_descriptor, write_file_descriptor = os.pipe()
+    type(peer_communicator_mock).file_descriptor = PropertyMock(
+        return_value=read_file_descriptor
+    )
+    mock_cast(peer_communicator_mock.are_connected).return_value = True
+    setup = TestSetup(
+        peer=ModelFactory.create_factory(Peer).build(),
+        communicator_mock=create_autospec(Communicator),
+        peer_communicator_mock=peer_communicator_mock,
+        read_file_descriptor=read_file_descriptor,
+        write_file_descriptor=write_file_descriptor,
+    )
+    yield setup
+    setup.close()
+
+
+def receive_value(test_setup: TestSetup, tag: int) -> Steps[memoryview]:
+    frames = yield from recv(
+        test_setup.peer_communicator_mock, test_setup.peer, tag=tag
+    )
+    return frames[0].to_memoryview()
+
+
+def create_frame(value: bytes) -> Frame:
+    frame = create_autospec(Frame)
+    mock_cast(frame.to_memoryview).return_value = memoryview(value)
+    return frame
+
+
+def test_gather_awaits_the_steps_of_the_communicator(test_setup: TestSetup):
+    mock_cast(test_setup.communicator_mock.create_gather_steps).return_value = (
+        receive_value(test_setup, tag=1)
+    )
+    mock_cast(test_setup.peer_communicator_mock.poll_peers).side_effect = [
+        [],
+        [test_setup.peer],
+    ]
+    mock_cast(test_setup.peer_communicator_mock.recv).return_value = [
+        create_frame(b"a")
+    ]
+
+    async def run():
+        async with AsyncCommunicator(test_setup.communicator_mock) as communicator:
+            asyncio.get_running_loop().call_later(0.01, test_setup.notify)
+            return await communicator.gather(b"x", root=2)
+
+    result = asyncio.run(run())
+    assert (
+        result == memoryview(b"a")
+        and test_setup.communicator_mock.mock_calls
+        == [call.create_gather_steps(b"x", 2)]
+        and mock_cast(test_setup.peer_communicator_mock.poll_peers).mock_calls
+        == [call([test_setup.peer], 0, 1)] * 2
+        and mock_cast(test_setup.peer_communicator_mock.recv).mock_calls
+        == [call(test_setup.peer, 0, 1)]
+    )
+
+
+def test_operations_create_their_steps_with_the_arguments(test_setup: TestSetup):
+    communicator_mock = test_setup.communicator_mock
+    for steps in [
+        communicator_mock.create_broadcast_steps,
+        communicator_mock.create_gather_object_steps,
+        communicator_mock.create_broadcast_object_steps,
+        communicator_mock.create_allreduce_steps,
+        communicator_mock.create_allgather_steps,
+    ]:
+        mock_cast(steps).side_effect = lambda *args: iter([])
+
+    async def run():
+        async with AsyncCommunicator(communicator_mock) as communicator:
+            await communicator.broadcast(b"x", root=1)
+            await communicator.gather_object({"x": 1}, root=2)
+            await communicator.broadcast_object({"y": 2}, root=3)
+            await communicator.allreduce(b"y", REDUCER)
+            await communicator.barrier()
+
+    asyncio.run(run())
+    assert communicator_mock.mock_calls == [
+        call.create_broadcast_steps(b"x", 1),
+        call.create_gather_object_steps({"x": 1}, 2),
+        call.create_broadcast_object_steps({"y": 2}, 3),
+        call.create_allreduce_steps(b"y", REDUCER),
+        call.create_allgather_steps(b""),
+    ]
+
+
+def test_operations_run_one_at_a_time_in_the_order_they_were_started(
+    test_setup: TestSetup,
+):
+    events = []
+
+    def send_value(value: bytes) -> Steps[None]:
+        events.append(f"start {value!r}")
+        yield from send(
+            test_setup.peer_communicator_mock,
+            peer=test_setup.peer,
+            message=[create_frame(value)],
+            tag=0,
+        )
+        events.append(f"end {value!r}")
+
+    mock_cast(test_setup.communicator_mock.create_allgather_steps).side_effect = (
+        send_value
+    )
+    mock_cast(test_setup.peer_communicator_mock.try_send).side_effect = [
+        False,
+        True,
+        True,
+    ]
+
+    async def run():
+        communicator = AsyncCommunicator(test_setup.communicator_mock)
+        first = asyncio.create_task(communicator.allgather(b"a"))
+        second = asyncio.create_task(communicator.allgather(b"b"))
+        await asyncio.sleep(0.01)
+        events.append("compute")
+        test_setup.notify()
+        await asyncio.gather(first, second)
+
+    asyncio.run(run())
+    assert events == ["start b'a'", "compute", "end b'a'", "start b'b'", "end b'b'"]
+
+
+def test_errors_of_the_calls_get_raised_in_the_steps(test_setup: TestSetup):
+    def handle_timeout() -> Steps[str]:
+        try:
+            yield from recv(test_setup.peer_communicator_mock, test_setup.peer, 10)
+        except TimeoutError:
+            return "timeout"
+        return "received"
+
+    mock_cast(test_setup.communicator_mock.create_scatter_steps).return_value = (
+        handle_timeout()
+    )
+    mock_cast(test_setup.peer_communicator_mock.poll_peers).return_value = []
+
+    result = asyncio.run(AsyncCommunicator(test_setup.communicator_mock).scatter(None))
+    assert result == "timeout"
@@ -0,0 +1,83 @@
+import pytest
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.binary_serialization import (
+    BINARY_FORMAT_VERSION,
+    deserialize_binary_message,
+    has_binary_encoding,
+)
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.serialization import (
+    deserialize_message,
+    serialize_message,
+)
+
+
+def create_payload() -> messages.Payload:
+    peer_factory = ModelFactory.create_factory(Peer)
+    return messages.Payload(
+        source=peer_factory.build(),
+        destination=peer_factory.build(),
+        sequence_number=42,
+    )
+
+
+def test_payload_uses_binary_encoding():
+    message = create_payload()
+    byte_string = serialize_message(message)
+    assert byte_string[0] == BINARY_FORMAT_VERSION and len(byte_string) < len(
+        message.model_dump_json()
+    )
+
+
+def test_wrapped_payload_uses_binary_encoding():
+    message = create_payload()
+    byte_string = serialize_message(messages.Message(root=message))
+    assert byte_string == serialize_message(message)
+
+
+def test_handshake_message_uses_json():
+    message = ModelFactory.create_factory(messages.SynchronizeConnection).build()
+    byte_string = serialize_message(message)
+    assert not has_binary_encoding(message) and byte_string.startswith(b"{")
+
+
+def test_deserialize_binary_message_from_memoryview():
+    message = create_payload()
+    byte_string = serialize_message(message)
+    obj = deserialize_message(memoryview(byte_string), messages.Message)
+    assert obj.root == message
+
+
+def test_deserialize_binary_message_as_specific_class():
+    message = create_payload()
+    obj = deserialize_message(serialize_message(message), messages.Payload)
+    assert obj == message
+
+
+def test_deserialize_binary_message_as_wrong_class():
+    message = create_payload()
+    with pytest.raises(TypeError):
+        deserialize_message(serialize_message(message), messages.Gather)
+
+
+def test_deserialize_binary_message_reuses_peers():
+    message = create_payload()
+    byte_string = serialize_message(message)
+    first = deserialize_binary_message(byte_string)
+    second = deserialize_binary_message(byte_string)
+    assert first.source is second.source
+
+
+def test_deserialize_binary_message_with_unknown_version():
+    byte_string = bytearray(serialize_message(create_payload()))
+    byte_string[0] = BINARY_FORMAT_VERSION + 1
+    with pytest.raises(ValueError, match="version"):
+        deserialize_binary_message(bytes(byte_string))
+
+
+def test_deserialize_binary_message_with_trailing_bytes():
+    byte_string = serialize_message(create_payload()) + b"0"
+    with pytest.raises(ValueError, match="trailing"):
+        deserialize_binary_message(byte_string)
@@ -35,7 +35,11 @@ class Fixture:
         self.multi_node_communicator_mock.reset_mock()
 
 
-def create_setup(value: bytes | None) -> Fixture:
+def create_setup(
+    value: bytes | None,
+    out_of_band_buffers: list[bytes] | None = None,
+    local_root_rank: int = 0,
+) -> Fixture:
     sequence_number = 0
     localhost_communicator_mock: MagicMock | PeerCommunicator = create_autospec(
         PeerCommunicator
@@ -50,6 +54,8 @@ def create_setup(value: bytes | None) -> Fixture:
         localhost_communicator=localhost_communicator_mock,
         multi_node_communicator=multi_node_communicator_mock,
         socket_factory=socket_factory_mock,
+        out_of_band_buffers=out_of_band_buffers,
+        local_root_rank=local_root_rank,
     )
     test_setup = Fixture(
         sequence_number=sequence_number,
@@ -91,13 +97,13 @@ def test_call_localhost_rank_greater_zero():
             sequence_number=test_setup.sequence_number,
         )
     )
-    mock_cast(frames[1].to_bytes).return_value = expected_value
+    mock_cast(frames[1].to_memoryview).return_value = memoryview(expected_value)
     mock_cast(test_setup.localhost_communicator_mock.recv).side_effect = [frames]
     result = test_setup.broadcast_operation()
     assert (
         result == expected_value
         and mock_cast(test_setup.localhost_communicator_mock.recv).mock_calls
-        == [call(peer=leader)]
+        == [call(peer=leader, tag=test_setup.sequence_number)]
         and test_setup.socket_factory_mock.mock_calls == []
         and test_setup.multi_node_communicator_mock.mock_calls == []
     )
@@ -128,7 +134,7 @@ def test_call_localhost_rank_equal_zero_multi_node_rank_greater_zero():
             sequence_number=test_setup.sequence_number,
         )
     )
-    mock_cast(frames[1].to_bytes).return_value = expected_value
+    mock_cast(frames[1].to_memoryview).return_value = memoryview(expected_value)
     mock_cast(test_setup.multi_node_communicator_mock.recv).side_effect = [frames]
     mock_cast(test_setup.localhost_communicator_mock.peers).return_value = [
         localhost_leader,
@@ -138,9 +144,15 @@ def test_call_localhost_rank_equal_zero_multi_node_rank_greater_zero():
     assert (
         result == expected_value
         and mock_cast(test_setup.localhost_communicator_mock.send).mock_calls
-        == [call(peer=localhost_peer, message=[frame_mocks[0], frames[1]])]
+        == [
+            call(
+                peer=localhost_peer,
+                message=[frame_mocks[0], frames[1]],
+                tag=test_setup.sequence_number,
+            )
+        ]
         and mock_cast(test_setup.multi_node_communicator_mock.recv).mock_calls
-        == [call(multi_node_leader)]
+        == [call(multi_node_leader, tag=test_setup.sequence_number)]
         and mock_cast(test_setup.socket_factory_mock.create_frame).mock_calls
         == [
             call(
@@ -190,7 +202,13 @@ def test_call_localhost_rank_equal_zero_multi_node_rank_equal_zero_multi_node_nu
     assert (
         result == test_setup.value
         and mock_cast(test_setup.localhost_communicator_mock.send).mock_calls
-        == [call(peer=localhost_peer, message=[frame_mocks[1], frame_mocks[0]])]
+        == [
+            call(
+                peer=localhost_peer,
+                message=[frame_mocks[1], frame_mocks[0]],
+                tag=test_setup.sequence_number,
+            )
+        ]
         and mock_cast(test_setup.multi_node_communicator_mock.peers).mock_calls
         == [call()]
         and mock_cast(test_setup.socket_factory_mock.create_frame).mock_calls
@@ -243,7 +261,13 @@ def test_call_localhost_rank_equal_zero_multi_node_rank_equal_zero_multi_node_nu
     assert (
         result == test_setup.value
         and mock_cast(test_setup.multi_node_communicator_mock.send).mock_calls
-        == [call(peer=multi_node_peer, message=[frame_mocks[1], frame_mocks[0]])]
+        == [
+            call(
+                peer=multi_node_peer,
+                message=[frame_mocks[1], frame_mocks[0]],
+                tag=test_setup.sequence_number,
+            )
+        ]
         and mock_cast(test_setup.localhost_communicator_mock.peers).mock_calls
         == [call()]
         and mock_cast(test_setup.socket_factory_mock.create_frame).mock_calls
@@ -260,3 +284,115 @@ def test_call_localhost_rank_equal_zero_multi_node_rank_equal_zero_multi_node_nu
             ),
         ]
     )
+
+
+def test_call_with_out_of_band_buffers_localhost_rank_greater_zero():
+    test_setup = create_setup(value=None)
+    test_setup.reset_mocks()
+    test_setup.localhost_communicator_mock.rank = 1
+    peer = ModelFactory.create_factory(Peer).build()
+    leader = ModelFactory.create_factory(Peer).build()
+    test_setup.localhost_communicator_mock.peer = peer
+    test_setup.localhost_communicator_mock.leader = leader
+    frames: list[Frame | MagicMock] = [
+        create_autospec(Frame),
+        create_autospec(Frame),
+        create_autospec(Frame),
+    ]
+    mock_cast(frames[0].to_bytes).return_value = serialize_message(
+        messages.Broadcast(
+            source=leader,
+            destination=peer,
+            sequence_number=test_setup.sequence_number,
+        )
+    )
+    mock_cast(frames[1].to_memoryview).return_value = memoryview(b"0")
+    mock_cast(frames[2].to_memoryview).return_value = memoryview(b"1")
+    mock_cast(test_setup.localhost_communicator_mock.recv).side_effect = [frames]
+    result = test_setup.broadcast_operation.call_with_out_of_band_buffers()
+    assert result == [b"0", b"1"]
+
+
+def test_call_with_out_of_band_buffers_sends_buffers_as_separate_frames():
+    test_setup = create_setup(value=b"0", out_of_band_buffers=[b"1"])
+    test_setup.reset_mocks()
+    test_setup.localhost_communicator_mock.rank = 0
+    test_setup.multi_node_communicator_mock.rank = 0
+    multi_node_leader = ModelFactory.create_factory(Peer).build()
+    localhost_peer = ModelFactory.create_factory(Peer).build()
+    localhost_leader = ModelFactory.create_factory(Peer).build()
+    test_setup.localhost_communicator_mock.leader = localhost_leader
+    test_setup.multi_node_communicator_mock.leader = multi_node_leader
+    frame_mocks = [Mock(), Mock(), Mock()]
+    mock_cast(test_setup.socket_factory_mock.create_frame).side_effect = frame_mocks
+    mock_cast(test_setup.localhost_communicator_mock.peers).return_value = [
+        localhost_leader,
+        localhost_peer,
+    ]
+    mock_cast(test_setup.multi_node_communicator_mock.peers).return_value = [
+        multi_node_leader
+    ]
+    result = test_setup.broadcast_operation.call_with_out_of_band_buffers()
+    assert (
+        result == [b"0", b"1"]
+        and mock_cast(test_setup.localhost_communicator_mock.send).mock_calls
+        == [
+            call(
+                peer=localhost_peer,
+                message=[frame_mocks[2], frame_mocks[0], frame_mocks[1]],
+                tag=test_setup.sequence_number,
+            )
+        ]
+        and mock_cast(test_setup.socket_factory_mock.create_frame).mock_calls[:2]
+        == [call(b"0"), call(b"1")]
+    )
+
+
+def test_call_localhost_rank_equal_local_root_rank():
+    test_setup = create_setup(value=b"0", local_root_rank=1)
+    test_setup.reset_mocks()
+    test_setup.localhost_communicator_mock.rank = 1
+    localhost_leader = ModelFactory.create_factory(Peer).build()
+    localhost_root = ModelFactory.create_factory(Peer).build()
+    localhost_peer = ModelFactory.create_factory(Peer).build()
+    test_setup.localhost_communicator_mock.leader = localhost_leader
+    test_setup.localhost_communicator_mock.peer = localhost_root
+    frame_mocks = [Mock(), Mock(), Mock()]
+    mock_cast(test_setup.socket_factory_mock.create_frame).side_effect = frame_mocks
+    mock_cast(test_setup.localhost_communicator_mock.peers).return_value = [
+        localhost_leader,
+        localhost_root,
+        localhost_peer,
+    ]
+    result = test_setup.broadcast_operation()
+    assert (
+        result == test_setup.value
+        and mock_cast(test_setup.localhost_communicator_mock.send).mock_calls
+        == [
+            call(
+                peer=localhost_leader,
+                message=[frame_mocks[1], frame_mocks[0]],
+                tag=test_setup.sequence_number,
+            ),
+            call(
+                peer=localhost_peer,
+                message=[frame_mocks[2], frame_mocks[0]],
+                tag=test_setup.sequence_number,
+            ),
+        ]
+        and mock_cast(test_setup.localhost_communicator_mock.recv).mock_calls == []
+        and test_setup.multi_node_communicator_mock.mock_calls == []
+        and mock_cast(test_setup.socket_factory_mock.create_frame).mock_calls[1:]
+        == [
+            call(
+                serialize_message(
+                    messages.Broadcast(
+                        source=localhost_root,
+                        destination=destination,
+                        sequence_number=0,
+                    )
+                )
+            )
+            for destination in [localhost_leader, localhost_peer]
+        ]
+    )
@@ -0,0 +1,31 @@
+from concurrent.futures import Future
+
+import pytest
+
+from exasol.analytics.udf.communication.collective_request import CollectiveRequest
+
+
+def test_pending_request():
+    request: CollectiveRequest[bytes] = CollectiveRequest(Future())
+    assert not request.done() and not request.wait(timeout_in_milliseconds=1)
+
+
+def test_pending_request_result_times_out():
+    request: CollectiveRequest[bytes] = CollectiveRequest(Future())
+    with pytest.raises(TimeoutError):
+        request.result(timeout_in_milliseconds=1)
+
+
+def test_finished_request():
+    future: Future[bytes] = Future()
+    request = CollectiveRequest(future)
+    future.set_result(b"value")
+    assert request.done() and request.wait() and request.result() == b"value"
+
+
+def test_failed_request_raises_exception():
+    future: Future[bytes] = Future()
+    request = CollectiveRequest(future)
+    future.set_exception(RuntimeError("failed"))
+    with pytest.raises(RuntimeError, match="failed"):
+        request.result()
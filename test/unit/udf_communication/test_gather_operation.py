@@ -38,7 +38,12 @@ class Fixture:
         self.multi_node_communicator_mock.reset_mock()
 
 
-def create_setup(number_of_instances_per_node: int) -> Fixture:
+def create_setup(
+    number_of_instances_per_node: int,
+    out_of_band_buffers: list[bytes] | None = None,
+    local_root_rank: int = 0,
+    number_of_nodes: int | None = None,
+) -> Fixture:
     sequence_number = 0
     value = b"0"
     localhost_communicator_mock: MagicMock | PeerCommunicator = create_autospec(
@@ -55,6 +60,9 @@ def create_setup(number_of_instances_per_node: int) -> Fixture:
         localhost_communicator=localhost_communicator_mock,
         multi_node_communicator=multi_node_communicator_mock,
         socket_factory=socket_factory_mock,
+        out_of_band_buffers=out_of_band_buffers,
+        local_root_rank=local_root_rank,
+        number_of_nodes=number_of_nodes,
     )
     test_setup = Fixture(
         sequence_number=sequence_number,
@@ -91,7 +99,13 @@ def test_call_localhost_rank_greater_zero():
     assert (
         result is None
         and mock_cast(test_setup.localhost_communicator_mock.send).mock_calls
-        == [call(peer=leader, message=[frame_mocks[1], frame_mocks[0]])]
+        == [
+            call(
+                peer=leader,
+                message=[frame_mocks[1], frame_mocks[0]],
+                tag=test_setup.sequence_number,
+            )
+        ]
         and mock_cast(test_setup.socket_factory_mock.create_frame).mock_calls
         == [
             call(test_setup.value),
@@ -152,12 +166,22 @@ def test_call_localhost_rank_equal_zero_multi_node_rank_greater_zero():
     assert (
         result is None
         and test_setup.localhost_communicator_mock.mock_calls
-        == [call.peers(), call.poll_peers(), call.recv(localhost_peer)]
+        == [
+            call.peers(),
+            call.poll_peers(peers=[localhost_peer], tag=test_setup.sequence_number),
+            call.recv(localhost_peer, tag=test_setup.sequence_number),
+        ]
         and test_setup.multi_node_communicator_mock.mock_calls
         == [
-            call.send(peer=multi_node_leader, message=[frame_mocks[1], frame_mocks[0]]),
             call.send(
-                peer=multi_node_leader, message=[frame_mocks[2], recv_value_frame_mock]
+                peer=multi_node_leader,
+                message=[frame_mocks[1], frame_mocks[0]],
+                tag=test_setup.sequence_number,
+            ),
+            call.send(
+                peer=multi_node_leader,
+                message=[frame_mocks[2], recv_value_frame_mock],
+                tag=test_setup.sequence_number,
             ),
         ]
         and mock_cast(test_setup.socket_factory_mock.create_frame).mock_calls
@@ -209,6 +233,10 @@ def test_call_localhost_rank_equal_zero_multi_node_rank_equal_zero_multi_node_nu
         )
     )
     recv_value_frame_mock: MagicMock | Frame = create_autospec(Frame)
+    mock_cast(test_setup.localhost_communicator_mock.peers).return_value = [
+        localhost_leader,
+        localhost_peer,
+    ]
     mock_cast(test_setup.localhost_communicator_mock.poll_peers).return_value = [
         localhost_peer
     ]
@@ -219,7 +247,11 @@ def test_call_localhost_rank_equal_zero_multi_node_rank_equal_zero_multi_node_nu
     assert (
         result is not None
         and test_setup.localhost_communicator_mock.mock_calls
-        == [call.poll_peers(), call.recv(localhost_peer)]
+        == [
+            call.peers(),
+            call.poll_peers(peers=[localhost_peer], tag=test_setup.sequence_number),
+            call.recv(localhost_peer, tag=test_setup.sequence_number),
+        ]
         and test_setup.multi_node_communicator_mock.mock_calls == []
         and mock_cast(test_setup.socket_factory_mock).mock_calls == []
     )
@@ -233,7 +265,7 @@ def test_call_localhost_rank_equal_zero_multi_node_rank_equal_zero_multi_node_nu
     test_setup.multi_node_communicator_mock.number_of_peers = 2
     multi_node_peer = ModelFactory.create_factory(Peer).build()
     multi_node_leader = ModelFactory.create_factory(Peer).build()
-    test_setup.multi_node_communicator_mock.peer = multi_node_peer
+    test_setup.multi_node_communicator_mock.peer = multi_node_leader
     recv_message_frame_mock: MagicMock | Frame = create_autospec(Frame)
     mock_cast(recv_message_frame_mock.to_bytes).return_value = serialize_message(
         Gather(
@@ -260,6 +292,166 @@ def test_call_localhost_rank_equal_zero_multi_node_rank_equal_zero_multi_node_nu
         result is not None
         and test_setup.localhost_communicator_mock.mock_calls == []
         and test_setup.multi_node_communicator_mock.mock_calls
-        == [call.poll_peers(), call.recv(multi_node_peer)]
+        == [
+            call.peers(),
+            call.poll_peers(peers=[multi_node_peer], tag=test_setup.sequence_number),
+            call.recv(multi_node_peer, tag=test_setup.sequence_number),
+        ]
         and mock_cast(test_setup.socket_factory_mock).mock_calls == []
     )
+
+
+def test_call_localhost_rank_equal_zero_only_polls_peers_without_message():
+    test_setup = create_setup(number_of_instances_per_node=3)
+    test_setup.reset_mocks()
+    test_setup.localhost_communicator_mock.rank = 0
+    test_setup.multi_node_communicator_mock.rank = 0
+    test_setup.multi_node_communicator_mock.number_of_peers = 1
+    localhost_leader = ModelFactory.create_factory(Peer).build()
+    localhost_peers = [ModelFactory.create_factory(Peer).build() for _ in range(2)]
+    test_setup.localhost_communicator_mock.peer = localhost_leader
+    mock_cast(test_setup.localhost_communicator_mock.peers).return_value = [
+        localhost_leader,
+        *localhost_peers,
+    ]
+    recv_frames = []
+    for position, localhost_peer in enumerate(localhost_peers, start=1):
+        recv_message_frame_mock: MagicMock | Frame = create_autospec(Frame)
+        mock_cast(recv_message_frame_mock.to_bytes).return_value = serialize_message(
+            Gather(
+                source=localhost_peer,
+                destination=localhost_leader,
+                sequence_number=test_setup.sequence_number,
+                position=position,
+            )
+        )
+        recv_frames.append([recv_message_frame_mock, create_autospec(Frame)])
+    mock_cast(test_setup.localhost_communicator_mock.poll_peers).side_effect = [
+        [localhost_peers[0]],
+        [localhost_peers[1]],
+    ]
+    mock_cast(test_setup.localhost_communicator_mock.recv).side_effect = recv_frames
+    result = test_setup.gather_operation()
+    assert (
+        result is not None
+        and len(result) == 3
+        and mock_cast(test_setup.localhost_communicator_mock.poll_peers).mock_calls
+        == [
+            call(peers=localhost_peers, tag=test_setup.sequence_number),
+            call(peers=[localhost_peers[1]], tag=test_setup.sequence_number),
+        ]
+    )
+
+
+def test_call_with_out_of_band_buffers_localhost_rank_greater_zero():
+    test_setup = create_setup(
+        number_of_instances_per_node=2, out_of_band_buffers=[b"1"]
+    )
+    test_setup.reset_mocks()
+    frame_mocks = [Mock(), Mock(), Mock()]
+    mock_cast(test_setup.socket_factory_mock.create_frame).side_effect = frame_mocks
+    test_setup.localhost_communicator_mock.rank = 1
+    test_setup.localhost_communicator_mock.peer = ModelFactory.create_factory(
+        Peer
+    ).build()
+    leader = ModelFactory.create_factory(Peer).build()
+    test_setup.localhost_communicator_mock.leader = leader
+    result = test_setup.gather_operation.call_with_out_of_band_buffers()
+    assert (
+        result is None
+        and mock_cast(test_setup.localhost_communicator_mock.send).mock_calls
+        == [
+            call(
+                peer=leader,
+                message=[frame_mocks[2], frame_mocks[0], frame_mocks[1]],
+                tag=test_setup.sequence_number,
+            )
+        ]
+        and mock_cast(test_setup.socket_factory_mock.create_frame).mock_calls[:2]
+        == [call(test_setup.value), call(b"1")]
+    )
+
+
+def test_call_with_out_of_band_buffers_localhost_rank_equal_zero():
+    test_setup = create_setup(
+        number_of_instances_per_node=2, out_of_band_buffers=[b"1"]
+    )
+    test_setup.reset_mocks()
+    test_setup.localhost_communicator_mock.rank = 0
+    test_setup.multi_node_communicator_mock.rank = 0
+    test_setup.multi_node_communicator_mock.number_of_peers = 1
+    localhost_peer = ModelFactory.create_factory(Peer).build()
+    localhost_leader = ModelFactory.create_factory(Peer).build()
+    test_setup.localhost_communicator_mock.peer = localhost_leader
+    mock_cast(test_setup.localhost_communicator_mock.peers).return_value = [
+        localhost_leader,
+        localhost_peer,
+    ]
+    recv_frame_mocks: list[MagicMock | Frame] = [
+        create_autospec(Frame) for _ in range(3)
+    ]
+    mock_cast(recv_frame_mocks[0].to_bytes).return_value = serialize_message(
+        Gather(
+            source=localhost_peer,
+            destination=localhost_leader,
+            sequence_number=test_setup.sequence_number,
+            position=1,
+        )
+    )
+    mock_cast(recv_frame_mocks[1].to_memoryview).return_value = memoryview(b"2")
+    mock_cast(recv_frame_mocks[2].to_memoryview).return_value = memoryview(b"3")
+    mock_cast(test_setup.localhost_communicator_mock.poll_peers).return_value = [
+        localhost_peer
+    ]
+    mock_cast(test_setup.localhost_communicator_mock.recv).side_effect = [
+        recv_frame_mocks
+    ]
+    result = test_setup.gather_operation.call_with_out_of_band_buffers()
+    assert result == [[test_setup.value, b"1"], [b"2", b"3"]]
+
+
+def test_call_localhost_rank_equal_local_root_rank():
+    test_setup = create_setup(
+        number_of_instances_per_node=2, local_root_rank=1, number_of_nodes=2
+    )
+    test_setup.reset_mocks()
+    test_setup.localhost_communicator_mock.rank = 1
+    localhost_leader = ModelFactory.create_factory(Peer).build()
+    localhost_root = ModelFactory.create_factory(Peer).build()
+    test_setup.localhost_communicator_mock.leader = localhost_leader
+    test_setup.localhost_communicator_mock.peer = localhost_root
+    mock_cast(test_setup.localhost_communicator_mock.peers).return_value = [
+        localhost_leader,
+        localhost_root,
+    ]
+    mock_cast(test_setup.localhost_communicator_mock.poll_peers).return_value = [
+        localhost_leader
+    ]
+
+    def create_frames(position: int) -> list[Frame | MagicMock]:
+        message_frame: MagicMock | Frame = create_autospec(Frame)
+        mock_cast(message_frame.to_bytes).return_value = serialize_message(
+            Gather(
+                source=localhost_leader,
+                destination=localhost_root,
+                sequence_number=test_setup.sequence_number,
+                position=position,
+            )
+        )
+        value_frame: MagicMock | Frame = create_autospec(Frame)
+        mock_cast(value_frame.to_memoryview).return_value = memoryview(
+            f"v{position}".encode()
+        )
+        return [message_frame, value_frame]
+
+    mock_cast(test_setup.localhost_communicator_mock.recv).side_effect = [
+        create_frames(position) for position in [3, 0, 2]
+    ]
+    result = test_setup.gather_operation()
+    assert (
+        result == [b"v0", test_setup.value, b"v2", b"v3"]
+        and mock_cast(test_setup.localhost_communicator_mock.poll_peers).mock_calls
+        == [call(peers=[localhost_leader], tag=test_setup.sequence_number)] * 3
+        and mock_cast(test_setup.localhost_communicator_mock.send).mock_calls == []
+        and test_setup.multi_node_communicator_mock.mock_calls == []
+    )
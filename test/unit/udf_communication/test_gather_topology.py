@@ -0,0 +1,62 @@
+import pytest
+
+from exasol.analytics.udf.communication.gather_topology import (
+    BinomialTreeGatherTopology,
+    GatherTopology,
+    KAryTreeGatherTopology,
+)
+
+TOPOLOGIES = {
+    "binomial": BinomialTreeGatherTopology(),
+    "unary": KAryTreeGatherTopology(arity=1),
+    "binary": KAryTreeGatherTopology(arity=2),
+    "ternary": KAryTreeGatherTopology(arity=3),
+}
+
+
+@pytest.mark.parametrize("number_of_nodes", [1, 2, 3, 7, 8, 32, 33])
+@pytest.mark.parametrize("topology", TOPOLOGIES.keys())
+def test_parent_and_children_are_consistent(topology: str, number_of_nodes: int):
+    gather_topology: GatherTopology = TOPOLOGIES[topology]
+    parents = {
+        child: rank
+        for rank in range(number_of_nodes)
+        for child in gather_topology.children(rank, number_of_nodes)
+    }
+    expected_parents = {
+        rank: gather_topology.parent(rank, number_of_nodes)
+        for rank in range(1, number_of_nodes)
+    }
+    assert (
+        parents == expected_parents
+        and gather_topology.parent(0, number_of_nodes) is None
+        and gather_topology.subtree_size(0, number_of_nodes) == number_of_nodes
+    )
+
+
+def test_binomial_tree_children():
+    topology = BinomialTreeGatherTopology()
+    assert [topology.children(rank, 8) for rank in range(8)] == [
+        [1, 2, 4],
+        [],
+        [3],
+        [],
+        [5, 6],
+        [],
+        [7],
+        [],
+    ]
+
+
+def test_k_ary_tree_children():
+    topology = KAryTreeGatherTopology(arity=3)
+    assert [topology.children(rank, 8) for rank in range(3)] == [
+        [1, 2, 3],
+        [4, 5, 6],
+        [7],
+    ]
+
+
+def test_k_ary_tree_arity_zero():
+    with pytest.raises(ValueError):
+        KAryTreeGatherTopology(arity=0)
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from exasol.analytics.udf.communication.object_serialization import (
+    deserialize_object,
+    serialize_object,
+)
+
+
+def test_numpy_array_is_sent_out_of_band():
+    array = np.arange(1000, dtype=np.int64)
+    data, out_of_band_buffers = serialize_object(array)
+    assert (
+        len(out_of_band_buffers) == 1
+        and out_of_band_buffers[0].nbytes == array.nbytes
+        and len(data) < array.nbytes
+    )
+
+
+def test_numpy_array_is_reconstructed_on_top_of_buffer():
+    array = np.arange(1000, dtype=np.float64)
+    data, out_of_band_buffers = serialize_object(array)
+    received_buffers = [bytes(buffer) for buffer in out_of_band_buffers]
+    received_views = [memoryview(buffer) for buffer in received_buffers]
+    result = deserialize_object(memoryview(data), received_views)
+    assert (
+        np.array_equal(result, array)
+        and np.shares_memory(result, np.frombuffer(received_buffers[0], np.uint8))
+        and not result.flags.writeable
+    )
+
+
+def test_data_frame_round_trip():
+    data_frame = pd.DataFrame({"a": np.arange(10), "b": np.linspace(0, 1, 10)})
+    data, out_of_band_buffers = serialize_object(data_frame)
+    result = deserialize_object(memoryview(data), out_of_band_buffers)
+    pd.testing.assert_frame_equal(result, data_frame)
+
+
+def test_object_without_buffers_round_trip():
+    value = {"key": [1, "two", 3.0]}
+    data, out_of_band_buffers = serialize_object(value)
+    result = deserialize_object(memoryview(data), out_of_band_buffers)
+    assert result == value and out_of_band_buffers == []
@@ -0,0 +1,162 @@
+from test.utils.mock_cast import mock_cast
+from unittest.mock import (
+    MagicMock,
+    Mock,
+    call,
+    create_autospec,
+)
+
+import pytest
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.pipelined_broadcast_operation import (
+    PipelinedBroadcastOperation,
+)
+from exasol.analytics.udf.communication.serialization import serialize_message
+from exasol.analytics.udf.communication.socket_factory.abstract import (
+    Frame,
+    SocketFactory,
+)
+
+
+def create_communicator_mock(rank: int, peers: list[Peer]) -> MagicMock:
+    communicator_mock: MagicMock = create_autospec(PeerCommunicator)
+    communicator_mock.rank = rank
+    communicator_mock.peer = peers[rank]
+    communicator_mock.leader = peers[0]
+    communicator_mock.number_of_peers = len(peers)
+    mock_cast(communicator_mock.peers).return_value = peers
+    return communicator_mock
+
+
+def create_chunk_frames(
+    source: Peer, destination: Peer, chunks: list[bytes]
+) -> list[list[Frame]]:
+    result = []
+    for chunk_index, chunk in enumerate(chunks):
+        frames: list[Frame | MagicMock] = [
+            create_autospec(Frame),
+            create_autospec(Frame),
+        ]
+        mock_cast(frames[0].to_bytes).return_value = serialize_message(
+            messages.BroadcastChunk(
+                source=source,
+                destination=destination,
+                sequence_number=0,
+                chunk_index=chunk_index,
+                number_of_chunks=len(chunks),
+            )
+        )
+        mock_cast(frames[1].to_memoryview).return_value = memoryview(chunk)
+        result.append(frames)
+    return result
+
+
+def test_chunk_size_zero():
+    with pytest.raises(ValueError):
+        PipelinedBroadcastOperation(
+            sequence_number=0,
+            value=None,
+            chunk_size_in_bytes=0,
+            localhost_communicator=create_autospec(PeerCommunicator),
+            multi_node_communicator=create_autospec(PeerCommunicator),
+            socket_factory=create_autospec(SocketFactory),
+        )
+
+
+def test_call_multi_node_leader_sends_chunks():
+    localhost_peers = ModelFactory.create_factory(Peer).batch(2)
+    multi_node_peers = ModelFactory.create_factory(Peer).batch(2)
+    localhost_communicator_mock = create_communicator_mock(0, localhost_peers)
+    multi_node_communicator_mock = create_communicator_mock(0, multi_node_peers)
+    socket_factory_mock: MagicMock = create_autospec(SocketFactory)
+    mock_cast(socket_factory_mock.create_frame).side_effect = lambda data: Mock(
+        data=data
+    )
+    operation = PipelinedBroadcastOperation(
+        sequence_number=0,
+        value=b"abcdefg",
+        chunk_size_in_bytes=3,
+        localhost_communicator=localhost_communicator_mock,
+        multi_node_communicator=multi_node_communicator_mock,
+        socket_factory=socket_factory_mock,
+    )
+    result = operation()
+    multi_node_chunks = [
+        kwargs["message"][1].data
+        for _, _, kwargs in mock_cast(multi_node_communicator_mock.send).mock_calls
+    ]
+    localhost_chunks = [
+        kwargs["message"][1].data
+        for _, _, kwargs in mock_cast(localhost_communicator_mock.send).mock_calls
+    ]
+    assert (
+        result == b"abcdefg"
+        and multi_node_chunks == [b"abc", b"def", b"g"]
+        and localhost_chunks == [b"abc", b"def", b"g"]
+    )
+
+
+def test_call_localhost_leader_in_chain_forwards_chunks():
+    localhost_peers = ModelFactory.create_factory(Peer).batch(2)
+    multi_node_peers = ModelFactory.create_factory(Peer).batch(3)
+    localhost_communicator_mock = create_communicator_mock(0, localhost_peers)
+    multi_node_communicator_mock = create_communicator_mock(1, multi_node_peers)
+    socket_factory_mock: MagicMock = create_autospec(SocketFactory)
+    chunk_frames = create_chunk_frames(
+        source=multi_node_peers[0],
+        destination=multi_node_peers[1],
+        chunks=[b"abc", b"def"],
+    )
+    mock_cast(multi_node_communicator_mock.recv).side_effect = chunk_frames
+    operation = PipelinedBroadcastOperation(
+        sequence_number=0,
+        value=None,
+        chunk_size_in_bytes=3,
+        localhost_communicator=localhost_communicator_mock,
+        multi_node_communicator=multi_node_communicator_mock,
+        socket_factory=socket_factory_mock,
+    )
+    result = operation()
+    forwarded_frames = [
+        (kwargs["peer"], kwargs["message"][1])
+        for _, _, kwargs in mock_cast(multi_node_communicator_mock.send).mock_calls
+    ]
+    assert (
+        result == b"abcdef"
+        and mock_cast(multi_node_communicator_mock.recv).mock_calls
+        == [call(multi_node_peers[0], tag=0)] * 2
+        and forwarded_frames
+        == [
+            (multi_node_peers[2], chunk_frames[0][1]),
+            (multi_node_peers[2], chunk_frames[1][1]),
+        ]
+        and len(mock_cast(localhost_communicator_mock.send).mock_calls) == 2
+    )
+
+
+def test_call_localhost_rank_greater_zero_wrong_chunk_index():
+    localhost_peers = ModelFactory.create_factory(Peer).batch(2)
+    localhost_communicator_mock = create_communicator_mock(1, localhost_peers)
+    chunk_frames = create_chunk_frames(
+        source=localhost_peers[0],
+        destination=localhost_peers[1],
+        chunks=[b"abc", b"def"],
+    )
+    mock_cast(localhost_communicator_mock.recv).side_effect = [
+        chunk_frames[1],
+        chunk_frames[0],
+    ]
+    operation = PipelinedBroadcastOperation(
+        sequence_number=0,
+        value=None,
+        chunk_size_in_bytes=3,
+        localhost_communicator=localhost_communicator_mock,
+        multi_node_communicator=None,
+        socket_factory=create_autospec(SocketFactory),
+    )
+    with pytest.raises(RuntimeError, match="wrong chunk index"):
+        operation()
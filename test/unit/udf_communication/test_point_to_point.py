@@ -0,0 +1,90 @@
+import dataclasses
+from test.utils.mock_cast import mock_cast
+from unittest.mock import (
+    MagicMock,
+    call,
+    create_autospec,
+)
+
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from exasol.analytics.udf.communication.connection_info import ConnectionInfo
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.point_to_point import (
+    PointToPointConnections,
+)
+from exasol.analytics.udf.communication.socket_factory.abstract import (
+    Frame,
+    SocketFactory,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class Fixture:
+    connection_infos: list[ConnectionInfo]
+    peer_communicator_mock: MagicMock | PeerCommunicator
+    socket_factory_mock: MagicMock | SocketFactory
+    connections: PointToPointConnections
+
+
+def create_setup() -> Fixture:
+    connection_infos = [
+        ModelFactory.create_factory(ConnectionInfo).build() for _ in range(3)
+    ]
+    peer_communicator_mock: MagicMock | PeerCommunicator = create_autospec(
+        PeerCommunicator
+    )
+    socket_factory_mock: MagicMock | SocketFactory = create_autospec(SocketFactory)
+    connections = PointToPointConnections(peer_communicator_mock, socket_factory_mock)
+    connections.connection_infos = connection_infos
+    return Fixture(
+        connection_infos=connection_infos,
+        peer_communicator_mock=peer_communicator_mock,
+        socket_factory_mock=socket_factory_mock,
+        connections=connections,
+    )
+
+
+def test_peer_registers_the_peer_only_on_first_use():
+    fixture = create_setup()
+    first_peer = fixture.connections.peer(2)
+    second_peer = fixture.connections.peer(2)
+    assert first_peer == second_peer == Peer(
+        connection_info=fixture.connection_infos[2]
+    ) and mock_cast(fixture.peer_communicator_mock.register_peer).mock_calls == [
+        call(fixture.connection_infos[2])
+    ]
+
+
+def test_send():
+    fixture = create_setup()
+    frame = create_autospec(Frame)
+    mock_cast(fixture.socket_factory_mock.create_frame).return_value = frame
+    fixture.connections.send(1, b"value", tag=3)
+    assert mock_cast(fixture.peer_communicator_mock.send).mock_calls == [
+        call(
+            peer=Peer(connection_info=fixture.connection_infos[1]),
+            message=[frame],
+            tag=3,
+        )
+    ]
+
+
+def test_recv():
+    fixture = create_setup()
+    frame = create_autospec(Frame)
+    mock_cast(frame.to_memoryview).return_value = memoryview(b"value")
+    mock_cast(fixture.peer_communicator_mock.recv).return_value = [frame]
+    result = fixture.connections.recv(0, tag=3)
+    assert result == b"value" and mock_cast(
+        fixture.peer_communicator_mock.recv
+    ).mock_calls == [
+        call(peer=Peer(connection_info=fixture.connection_infos[0]), tag=3)
+    ]
+
+
+def test_stop_stops_the_peer_communicator():
+    fixture = create_setup()
+    fixture.connections.stop()
+    assert mock_cast(fixture.peer_communicator_mock.stop).mock_calls == [call()]
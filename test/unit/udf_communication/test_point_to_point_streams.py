@@ -0,0 +1,53 @@
+from test.utils.mock_cast import mock_cast
+from unittest.mock import (
+    MagicMock,
+    create_autospec,
+)
+
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from exasol.analytics.udf.communication.messages import StreamEnd
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.point_to_point import (
+    PointToPointConnections,
+)
+from exasol.analytics.udf.communication.point_to_point_streams import (
+    PointToPointStreams,
+)
+from exasol.analytics.udf.communication.serialization import deserialize_message
+from exasol.analytics.udf.communication.socket_factory.abstract import SocketFactory
+
+
+def create_streams() -> tuple[PointToPointStreams, MagicMock]:
+    peer_communicator_mock: MagicMock | PeerCommunicator = create_autospec(
+        PeerCommunicator
+    )
+    peer_communicator_mock.peer = ModelFactory.create_factory(Peer).build()
+    connections: MagicMock | PointToPointConnections = create_autospec(
+        PointToPointConnections
+    )
+    connections.peer_communicator = peer_communicator_mock
+    mock_cast(connections.peer).side_effect = (
+        lambda root_rank: ModelFactory.create_factory(Peer).build()
+    )
+    socket_factory_mock: MagicMock | SocketFactory = create_autospec(SocketFactory)
+    mock_cast(socket_factory_mock.create_frame).side_effect = lambda data: data
+    return PointToPointStreams(connections, socket_factory_mock), peer_communicator_mock
+
+
+def sent_sequence_numbers(peer_communicator_mock: MagicMock) -> list[int]:
+    result = []
+    for sent_call in mock_cast(peer_communicator_mock.send).mock_calls:
+        message = deserialize_message(sent_call.kwargs["message"][0], StreamEnd)
+        result.append(message.sequence_number)
+    return result
+
+
+def test_streams_get_numbered_per_peer_and_tag():
+    streams, peer_communicator_mock = create_streams()
+    for root_rank, tag in [(1, 0), (1, 0), (2, 0), (1, 5), (1, 0)]:
+        streams.send(
+            root_rank, [], tag=tag, window_size=1, timeout_in_milliseconds=None
+        )
+    assert sent_sequence_numbers(peer_communicator_mock) == [0, 1, 0, 0, 2]
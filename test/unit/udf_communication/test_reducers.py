@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from exasol.analytics.udf.communication.reducers import (
+    max_reducer,
+    min_reducer,
+    sum_reducer,
+)
+
+
+@pytest.mark.parametrize(
+    "reducer_function, expected",
+    [
+        (sum_reducer, [5, 5, 6]),
+        (min_reducer, [1, 2, 3]),
+        (max_reducer, [4, 3, 3]),
+    ],
+)
+def test_numpy_reducer(reducer_function, expected):
+    reducer = reducer_function(np.int64)
+    left = np.array([1, 3, 3], dtype=np.int64).tobytes()
+    right = np.array([4, 2, 3], dtype=np.int64).tobytes()
+    result = reducer(left, right)
+    assert np.frombuffer(result, dtype=np.int64).tolist() == expected
+
+
+def test_numpy_reducer_accepts_memoryview():
+    reducer = sum_reducer(np.float64)
+    left = memoryview(np.array([1.5, 2.5]).tobytes())
+    right = memoryview(np.array([0.5, 0.5]).tobytes())
+    result = reducer(left, right)
+    assert np.frombuffer(result, dtype=np.float64).tolist() == [2.0, 3.0]
+
+
+def test_numpy_reducer_with_different_number_of_elements():
+    reducer = sum_reducer(np.int32)
+    left = np.array([1, 2], dtype=np.int32).tobytes()
+    right = np.array([1, 2, 3], dtype=np.int32).tobytes()
+    with pytest.raises(ValueError):
+        reducer(left, right)
@@ -0,0 +1,177 @@
+import dataclasses
+from test.utils.mock_cast import mock_cast
+from unittest.mock import (
+    MagicMock,
+    Mock,
+    call,
+    create_autospec,
+)
+
+import pytest
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.scatter_operation import ScatterOperation
+from exasol.analytics.udf.communication.serialization import serialize_message
+from exasol.analytics.udf.communication.socket_factory.abstract import (
+    Frame,
+    SocketFactory,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class Fixture:
+    sequence_number: int
+    localhost_communicator_mock: MagicMock | PeerCommunicator
+    multi_node_communicator_mock: MagicMock | PeerCommunicator
+    socket_factory_mock: MagicMock | SocketFactory
+    scatter_operation: ScatterOperation
+
+
+def create_setup(values: list[bytes] | None) -> Fixture:
+    sequence_number = 0
+    localhost_communicator_mock: MagicMock | PeerCommunicator = create_autospec(
+        PeerCommunicator
+    )
+    multi_node_communicator_mock: MagicMock | PeerCommunicator = create_autospec(
+        PeerCommunicator
+    )
+    socket_factory_mock: MagicMock | SocketFactory = create_autospec(SocketFactory)
+    scatter_operation = ScatterOperation(
+        sequence_number=sequence_number,
+        values=values,
+        localhost_communicator=localhost_communicator_mock,
+        multi_node_communicator=multi_node_communicator_mock,
+        socket_factory=socket_factory_mock,
+        number_of_instances_per_node=2,
+    )
+    return Fixture(
+        sequence_number=sequence_number,
+        localhost_communicator_mock=localhost_communicator_mock,
+        multi_node_communicator_mock=multi_node_communicator_mock,
+        socket_factory_mock=socket_factory_mock,
+        scatter_operation=scatter_operation,
+    )
+
+
+def test_init():
+    test_setup = create_setup(values=None)
+    assert (
+        test_setup.multi_node_communicator_mock.mock_calls == []
+        and test_setup.localhost_communicator_mock.mock_calls == []
+        and test_setup.socket_factory_mock.mock_calls == []
+    )
+
+
+def test_call_localhost_rank_greater_zero():
+    test_setup = create_setup(values=None)
+    expected_value = b"1"
+    test_setup.localhost_communicator_mock.rank = 1
+    peer = ModelFactory.create_factory(Peer).build()
+    leader = ModelFactory.create_factory(Peer).build()
+    test_setup.localhost_communicator_mock.peer = peer
+    test_setup.localhost_communicator_mock.leader = leader
+    frames: list[Frame | MagicMock] = [
+        create_autospec(Frame),
+        create_autospec(Frame),
+    ]
+    mock_cast(frames[0].to_bytes).return_value = serialize_message(
+        messages.Scatter(
+            source=leader,
+            destination=peer,
+            sequence_number=test_setup.sequence_number,
+            position=3,
+        )
+    )
+    mock_cast(frames[1].to_memoryview).return_value = memoryview(expected_value)
+    mock_cast(test_setup.localhost_communicator_mock.recv).side_effect = [frames]
+    result = test_setup.scatter_operation()
+    assert (
+        result == expected_value
+        and mock_cast(test_setup.localhost_communicator_mock.recv).mock_calls
+        == [call(peer=leader, tag=test_setup.sequence_number)]
+        and test_setup.multi_node_communicator_mock.mock_calls == []
+    )
+
+
+def test_call_localhost_rank_greater_zero_with_wrong_position():
+    test_setup = create_setup(values=None)
+    test_setup.localhost_communicator_mock.rank = 1
+    peer = ModelFactory.create_factory(Peer).build()
+    leader = ModelFactory.create_factory(Peer).build()
+    test_setup.localhost_communicator_mock.leader = leader
+    frames: list[Frame | MagicMock] = [
+        create_autospec(Frame),
+        create_autospec(Frame),
+    ]
+    mock_cast(frames[0].to_bytes).return_value = serialize_message(
+        messages.Scatter(
+            source=leader,
+            destination=peer,
+            sequence_number=test_setup.sequence_number,
+            position=2,
+        )
+    )
+    mock_cast(test_setup.localhost_communicator_mock.recv).side_effect = [frames]
+    with pytest.raises(RuntimeError, match="wrong position"):
+        test_setup.scatter_operation()
+
+
+def test_call_multi_node_leader_sends_only_node_values():
+    values = [b"0", b"1", b"2", b"3"]
+    test_setup = create_setup(values=values)
+    value_frame_mocks = [Mock() for _ in values]
+    header_frame_mocks = [Mock(), Mock()]
+    mock_cast(test_setup.socket_factory_mock.create_frame).side_effect = (
+        value_frame_mocks + header_frame_mocks
+    )
+    for frame_mock, value in zip(value_frame_mocks, values):
+        frame_mock.to_memoryview.return_value = memoryview(value)
+    test_setup.localhost_communicator_mock.rank = 0
+    test_setup.multi_node_communicator_mock.rank = 0
+    test_setup.multi_node_communicator_mock.number_of_peers = 2
+    multi_node_leader = ModelFactory.create_factory(Peer).build()
+    multi_node_peer = ModelFactory.create_factory(Peer).build()
+    localhost_leader = ModelFactory.create_factory(Peer).build()
+    localhost_peer = ModelFactory.create_factory(Peer).build()
+    test_setup.multi_node_communicator_mock.leader = multi_node_leader
+    mock_cast(test_setup.multi_node_communicator_mock.peers).return_value = [
+        multi_node_leader,
+        multi_node_peer,
+    ]
+    test_setup.localhost_communicator_mock.leader = localhost_leader
+    mock_cast(test_setup.localhost_communicator_mock.peers).return_value = [
+        localhost_leader,
+        localhost_peer,
+    ]
+    result = test_setup.scatter_operation()
+    assert (
+        result == b"0"
+        and mock_cast(test_setup.multi_node_communicator_mock.send).mock_calls
+        == [
+            call(
+                peer=multi_node_peer,
+                message=[header_frame_mocks[0]] + value_frame_mocks[2:],
+                tag=test_setup.sequence_number,
+            )
+        ]
+        and mock_cast(test_setup.localhost_communicator_mock.send).mock_calls
+        == [
+            call(
+                peer=localhost_peer,
+                message=[header_frame_mocks[1], value_frame_mocks[1]],
+                tag=test_setup.sequence_number,
+            )
+        ]
+    )
+
+
+def test_call_multi_node_leader_with_wrong_number_of_values():
+    test_setup = create_setup(values=[b"0"])
+    test_setup.localhost_communicator_mock.rank = 0
+    test_setup.multi_node_communicator_mock.rank = 0
+    test_setup.multi_node_communicator_mock.number_of_peers = 2
+    with pytest.raises(ValueError):
+        test_setup.scatter_operation()
@@ -0,0 +1,117 @@
+from test.utils.mock_cast import mock_cast
+from unittest.mock import (
+    MagicMock,
+    create_autospec,
+)
+
+import pytest
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.point_to_point import (
+    PointToPointConnections,
+)
+from exasol.analytics.udf.communication.split import (
+    CONTEXT_TAG_STRIDE,
+    compute_context_id,
+    compute_root_ranks,
+    create_peer_groups,
+    pack_split_entry,
+)
+from exasol.analytics.utils.errors import UninitializedAttributeError
+
+
+def create_entries(*entries: tuple[int | None, int, int]) -> list[memoryview]:
+    return [
+        memoryview(
+            pack_split_entry(
+                color=color,
+                key=key,
+                root_rank=root_rank,
+                next_free_context_id=root_rank + 1,
+            )
+        )
+        for color, key, root_rank in entries
+    ]
+
+
+def test_compute_context_id_is_the_largest_next_free_context_id():
+    entries = create_entries((0, 0, 0), (0, 0, 3), (0, 0, 1))
+    assert compute_context_id(entries) == 4
+
+
+def test_compute_root_ranks_orders_by_key_and_then_by_entry():
+    entries = create_entries((1, 5, 0), (2, 0, 1), (1, 0, 2), (1, 5, 3), (None, 0, 4))
+    assert compute_root_ranks(entries, color=1) == [2, 0, 3]
+
+
+def test_compute_root_ranks_skips_the_instances_without_color():
+    entries = create_entries((None, 0, 0), (0, 0, 1))
+    assert compute_root_ranks(entries, color=0) == [1]
+
+
+def create_peer_communicator_mock(peers: list[Peer], rank: int) -> MagicMock:
+    peer_communicator_mock: MagicMock | PeerCommunicator = create_autospec(
+        PeerCommunicator
+    )
+    peer_communicator_mock.peer = peers[rank]
+    mock_cast(peer_communicator_mock.peers).return_value = peers
+    return peer_communicator_mock
+
+
+def test_create_peer_groups_on_a_single_node():
+    peers = [ModelFactory.create_factory(Peer).build() for _ in range(3)]
+    localhost_communicator = create_peer_communicator_mock(peers, rank=2)
+    localhost_group, multi_node_group = create_peer_groups(
+        root_ranks=[5, 3],
+        context_id=1,
+        number_of_instances_per_node=3,
+        localhost_communicator=localhost_communicator,
+        point_to_point_connections=None,
+    )
+    assert (
+        localhost_group.peers() == [peers[2], peers[0]]
+        and localhost_group.rank == 0
+        and multi_node_group is not None
+        and multi_node_group.peers() == [peers[2]]
+    )
+
+
+def test_create_peer_groups_on_several_nodes_uses_the_point_to_point_connections():
+    peers = [ModelFactory.create_factory(Peer).build() for _ in range(4)]
+    localhost_communicator = create_peer_communicator_mock(peers[:2], rank=1)
+    point_to_point_communicator = create_peer_communicator_mock(peers, rank=1)
+    connections: MagicMock | PointToPointConnections = create_autospec(
+        PointToPointConnections
+    )
+    connections.peer_communicator = point_to_point_communicator
+    mock_cast(connections.peer).side_effect = lambda root_rank: peers[root_rank]
+    localhost_group, multi_node_group = create_peer_groups(
+        root_ranks=[3, 1],
+        context_id=2,
+        number_of_instances_per_node=2,
+        localhost_communicator=localhost_communicator,
+        point_to_point_connections=connections,
+    )
+    localhost_group.send(peers[3], [], tag=1)
+    assert (
+        localhost_group.peers() == [peers[3], peers[1]]
+        and localhost_group.rank == 1
+        and multi_node_group is None
+        and mock_cast(point_to_point_communicator.send).call_args.args[3]
+        == 2 * CONTEXT_TAG_STRIDE + 1
+    )
+
+
+def test_create_peer_groups_on_several_nodes_requires_point_to_point():
+    peers = [ModelFactory.create_factory(Peer).build() for _ in range(2)]
+    localhost_communicator = create_peer_communicator_mock(peers, rank=0)
+    with pytest.raises(UninitializedAttributeError):
+        create_peer_groups(
+            root_ranks=[0, 2],
+            context_id=1,
+            number_of_instances_per_node=2,
+            localhost_communicator=localhost_communicator,
+            point_to_point_connections=None,
+        )
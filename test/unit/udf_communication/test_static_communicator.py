@@ -0,0 +1,92 @@
+from unittest.mock import (
+    create_autospec,
+    patch,
+)
+
+import pytest
+
+from exasol.analytics.udf.communication.discovery.multi_node import (
+    DiscoverySocketFactory,
+    StaticCommunicatorFactory,
+    StaticEndpoint,
+    derive_static_endpoints,
+)
+from exasol.analytics.udf.communication.ip_address import (
+    IPAddress,
+    Port,
+)
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.socket_factory.abstract import SocketFactory
+
+IP_ADDRESSES = [IPAddress(ip_address=f"10.0.0.{i}") for i in range(3)]
+
+
+def test_derive_static_endpoints_is_deterministic():
+    assert derive_static_endpoints("group", IP_ADDRESSES) == derive_static_endpoints(
+        "group", IP_ADDRESSES
+    )
+
+
+def test_derive_static_endpoints():
+    endpoints = derive_static_endpoints("group", IP_ADDRESSES, port_range=(100, 110))
+    assert (
+        [endpoint.node_name for endpoint in endpoints] == ["n0", "n1", "n2"]
+        and [endpoint.ip_address for endpoint in endpoints] == IP_ADDRESSES
+        and len({endpoint.port for endpoint in endpoints}) == len(IP_ADDRESSES)
+        and all(100 <= endpoint.port.port < 110 for endpoint in endpoints)
+    )
+
+
+def test_derive_static_endpoints_depends_on_group_identifier():
+    ports = {
+        derive_static_endpoints(f"group{i}", IP_ADDRESSES)[0].port for i in range(10)
+    }
+    assert len(ports) > 1
+
+
+def test_derive_static_endpoints_port_range_too_small():
+    with pytest.raises(ValueError):
+        derive_static_endpoints("group", IP_ADDRESSES, port_range=(100, 102))
+
+
+def test_static_communicator_factory_without_own_endpoint():
+    endpoints = [
+        StaticEndpoint(node_name="n0", ip_address=IP_ADDRESSES[0], port=Port(port=100))
+    ]
+    with pytest.raises(ValueError):
+        StaticCommunicatorFactory(endpoints=endpoints, node_name="n1")
+
+
+@patch(
+    "exasol.analytics.udf.communication.discovery.multi_node.static_communicator.PeerCommunicator"
+)
+def test_static_communicator_factory_timeout_names_the_missing_peers(
+    peer_communicator_class,
+):
+    peer_communicator = peer_communicator_class.return_value
+    peer_communicator.wait_for_peers.return_value = False
+
+    def is_connected(peer: Peer) -> bool:
+        return peer.connection_info.name == "n1_global"
+
+    peer_communicator.is_connected.side_effect = is_connected
+    factory = StaticCommunicatorFactory(
+        endpoints=derive_static_endpoints("group", IP_ADDRESSES),
+        node_name="n0",
+        timeout_in_seconds=5,
+    )
+    with pytest.raises(
+        TimeoutError,
+        match=r"Instance i0 could not connect to the peers \['n2_global'\] within 5 seconds.",
+    ):
+        factory.create(
+            name="i0",
+            group_identifier="group",
+            is_discovery_leader=False,
+            number_of_instances=len(IP_ADDRESSES),
+            listen_ip=IP_ADDRESSES[0],
+            discovery_ip=IP_ADDRESSES[0],
+            discovery_port=Port(port=44444),
+            socket_factory=create_autospec(SocketFactory),
+            discovery_socket_factory=create_autospec(DiscoverySocketFactory),
+        )
@@ -0,0 +1,324 @@
+import dataclasses
+from test.utils.mock_cast import mock_cast
+from unittest.mock import (
+    MagicMock,
+    call,
+    create_autospec,
+)
+
+import pytest
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from exasol.analytics.udf.communication import messages
+from exasol.analytics.udf.communication.peer import Peer
+from exasol.analytics.udf.communication.peer_communicator import PeerCommunicator
+from exasol.analytics.udf.communication.serialization import serialize_message
+from exasol.analytics.udf.communication.socket_factory.abstract import (
+    Frame,
+    SocketFactory,
+)
+from exasol.analytics.udf.communication.stream_operation import (
+    ReceiveStreamOperation,
+    SendStreamOperation,
+)
+from exasol.analytics.utils.errors import IllegalParametersError
+
+SEQUENCE_NUMBER = 3
+CREDIT_TAG = -SEQUENCE_NUMBER - 2
+
+
+@dataclasses.dataclass(frozen=True)
+class Fixture:
+    my_peer: Peer
+    peer: Peer
+    peer_communicator_mock: MagicMock | PeerCommunicator
+    socket_factory_mock: MagicMock | SocketFactory
+
+
+def create_setup() -> Fixture:
+    my_peer = ModelFactory.create_factory(Peer).build()
+    peer = ModelFactory.create_factory(Peer).build()
+    peer_communicator_mock: MagicMock | PeerCommunicator = create_autospec(
+        PeerCommunicator
+    )
+    peer_communicator_mock.peer = my_peer
+    socket_factory_mock: MagicMock | SocketFactory = create_autospec(SocketFactory)
+    mock_cast(socket_factory_mock.create_frame).side_effect = lambda data: data
+    return Fixture(
+        my_peer=my_peer,
+        peer=peer,
+        peer_communicator_mock=peer_communicator_mock,
+        socket_factory_mock=socket_factory_mock,
+    )
+
+
+def create_frames(parts: list[bytes]) -> list[Frame | MagicMock]:
+    frames: list[Frame | MagicMock] = []
+    for part in parts:
+        frame = create_autospec(Frame)
+        mock_cast(frame.to_bytes).return_value = part
+        mock_cast(frame.to_memoryview).return_value = memoryview(part)
+        frames.append(frame)
+    return frames
+
+
+def serialize_chunk(
+    source: Peer,
+    destination: Peer,
+    chunk_index: int,
+    sequence_number: int = SEQUENCE_NUMBER,
+) -> bytes:
+    return serialize_message(
+        messages.StreamChunk(
+            source=source,
+            destination=destination,
+            sequence_number=sequence_number,
+            chunk_index=chunk_index,
+        )
+    )
+
+
+def serialize_credit(
+    source: Peer,
+    destination: Peer,
+    number_of_chunks: int,
+    sequence_number: int = SEQUENCE_NUMBER,
+) -> bytes:
+    return serialize_message(
+        messages.StreamCredit(
+            source=source,
+            destination=destination,
+            sequence_number=sequence_number,
+            number_of_chunks=number_of_chunks,
+        )
+    )
+
+
+def serialize_end(
+    source: Peer,
+    destination: Peer,
+    number_of_chunks: int,
+    sequence_number: int = SEQUENCE_NUMBER,
+) -> bytes:
+    return serialize_message(
+        messages.StreamEnd(
+            source=source,
+            destination=destination,
+            sequence_number=sequence_number,
+            number_of_chunks=number_of_chunks,
+        )
+    )
+
+
+def create_send_operation(
+    fixture: Fixture, window_size: int, timeout_in_milliseconds: int | None = None
+) -> SendStreamOperation:
+    return SendStreamOperation(
+        sequence_number=SEQUENCE_NUMBER,
+        peer=fixture.peer,
+        peer_communicator=fixture.peer_communicator_mock,
+        socket_factory=fixture.socket_factory_mock,
+        window_size=window_size,
+        timeout_in_milliseconds=timeout_in_milliseconds,
+    )
+
+
+def create_receive_operation(
+    fixture: Fixture, window_size: int
+) -> ReceiveStreamOperation:
+    return ReceiveStreamOperation(
+        sequence_number=SEQUENCE_NUMBER,
+        peer=fixture.peer,
+        peer_communicator=fixture.peer_communicator_mock,
+        socket_factory=fixture.socket_factory_mock,
+        window_size=window_size,
+    )
+
+
+def test_send_waits_for_credit_before_exceeding_window():
+    fixture = create_setup()
+    number_of_consumed_chunks_at_recv = []
+    chunks = [f"{i}".encode() for i in range(5)]
+    consumed_chunks = []
+
+    def generate_chunks():
+        for chunk in chunks:
+            consumed_chunks.append(chunk)
+            yield chunk
+
+    credits = iter([3, 4, 5])
+
+    def recv(peer: Peer, timeout_in_milliseconds: int | None, tag: int):
+        number_of_consumed_chunks_at_recv.append(len(consumed_chunks))
+        return create_frames(
+            [serialize_credit(fixture.peer, fixture.my_peer, next(credits))]
+        )
+
+    mock_cast(fixture.peer_communicator_mock.recv).side_effect = recv
+    create_send_operation(fixture, window_size=2)(generate_chunks())
+    expected_sends = [
+        call(
+            peer=fixture.peer,
+            message=[serialize_chunk(fixture.my_peer, fixture.peer, i), chunks[i]],
+            tag=SEQUENCE_NUMBER,
+        )
+        for i in range(5)
+    ] + [
+        call(
+            peer=fixture.peer,
+            message=[serialize_end(fixture.my_peer, fixture.peer, 5)],
+            tag=SEQUENCE_NUMBER,
+        )
+    ]
+    assert mock_cast(
+        fixture.peer_communicator_mock.send
+    ).mock_calls == expected_sends and number_of_consumed_chunks_at_recv == [3, 4, 5]
+
+
+def test_send_empty_stream():
+    fixture = create_setup()
+    create_send_operation(fixture, window_size=2)([])
+    assert (
+        mock_cast(fixture.peer_communicator_mock.send).mock_calls
+        == [
+            call(
+                peer=fixture.peer,
+                message=[serialize_end(fixture.my_peer, fixture.peer, 0)],
+                tag=SEQUENCE_NUMBER,
+            )
+        ]
+        and mock_cast(fixture.peer_communicator_mock.recv).mock_calls == []
+    )
+
+
+def test_send_with_wrong_message_type():
+    fixture = create_setup()
+    mock_cast(fixture.peer_communicator_mock.recv).side_effect = [
+        create_frames([serialize_end(fixture.peer, fixture.my_peer, 0)])
+    ]
+    with pytest.raises(TypeError, match="Expected StreamCredit"):
+        create_send_operation(fixture, window_size=1)([b"0", b"1"])
+
+
+def test_send_finishes_without_waiting_for_the_credits_after_the_last_chunk():
+    fixture = create_setup()
+    create_send_operation(fixture, window_size=4)([b"0", b"1", b"2"])
+    assert (
+        len(mock_cast(fixture.peer_communicator_mock.send).mock_calls) == 4
+        and mock_cast(fixture.peer_communicator_mock.recv).mock_calls == []
+    )
+
+
+def test_send_raises_timeout_if_the_receiver_stopped_early():
+    fixture = create_setup()
+    mock_cast(fixture.peer_communicator_mock.recv).side_effect = TimeoutError()
+    with pytest.raises(
+        TimeoutError, match="The receiver granted no credit for chunk 1 within 10 ms"
+    ):
+        create_send_operation(fixture, window_size=1, timeout_in_milliseconds=10)(
+            [b"0", b"1"]
+        )
+    assert mock_cast(fixture.peer_communicator_mock.recv).mock_calls == [
+        call(peer=fixture.peer, timeout_in_milliseconds=10, tag=CREDIT_TAG)
+    ]
+
+
+def test_send_skips_credits_of_earlier_streams():
+    fixture = create_setup()
+    mock_cast(fixture.peer_communicator_mock.recv).side_effect = [
+        create_frames(
+            [
+                serialize_credit(
+                    fixture.peer,
+                    fixture.my_peer,
+                    number_of_chunks=5,
+                    sequence_number=SEQUENCE_NUMBER - 1,
+                )
+            ]
+        ),
+        create_frames([serialize_credit(fixture.peer, fixture.my_peer, 2)]),
+    ]
+    create_send_operation(fixture, window_size=1)([b"0", b"1"])
+    assert len(mock_cast(fixture.peer_communicator_mock.send).mock_calls) == 3
+
+
+def test_receive_yields_chunks_and_sends_credits():
+    fixture = create_setup()
+    chunks = [f"{i}".encode() for i in range(5)]
+    mock_cast(fixture.peer_communicator_mock.recv).side_effect = [
+        create_frames([serialize_chunk(fixture.peer, fixture.my_peer, i), chunk])
+        for i, chunk in enumerate(chunks)
+    ] + [create_frames([serialize_end(fixture.peer, fixture.my_peer, 5)])]
+    result = [
+        bytes(chunk) for chunk in create_receive_operation(fixture, window_size=2)()
+    ]
+    assert result == chunks and mock_cast(
+        fixture.peer_communicator_mock.send
+    ).mock_calls == [
+        call(
+            peer=fixture.peer,
+            message=[serialize_credit(fixture.my_peer, fixture.peer, credit)],
+            tag=CREDIT_TAG,
+        )
+        for credit in [3, 4, 5, 6, 7]
+    ]
+
+
+def test_receive_skips_the_rest_of_earlier_streams():
+    fixture = create_setup()
+    earlier_sequence_number = SEQUENCE_NUMBER - 1
+    mock_cast(fixture.peer_communicator_mock.recv).side_effect = [
+        create_frames(
+            [
+                serialize_chunk(
+                    fixture.peer, fixture.my_peer, 1, earlier_sequence_number
+                ),
+                b"earlier",
+            ]
+        ),
+        create_frames(
+            [serialize_end(fixture.peer, fixture.my_peer, 2, earlier_sequence_number)]
+        ),
+        create_frames([serialize_chunk(fixture.peer, fixture.my_peer, 0), b"0"]),
+        create_frames([serialize_end(fixture.peer, fixture.my_peer, 1)]),
+    ]
+    result = [
+        bytes(chunk) for chunk in create_receive_operation(fixture, window_size=2)()
+    ]
+    assert result == [b"0"]
+
+
+def test_receive_requests_chunks_lazily():
+    fixture = create_setup()
+    mock_cast(fixture.peer_communicator_mock.recv).side_effect = [
+        create_frames([serialize_chunk(fixture.peer, fixture.my_peer, 0), b"0"])
+    ]
+    stream = create_receive_operation(fixture, window_size=2)()
+    next(stream)
+    assert mock_cast(fixture.peer_communicator_mock.recv).mock_calls == [
+        call(peer=fixture.peer, tag=SEQUENCE_NUMBER)
+    ]
+
+
+def test_receive_with_wrong_chunk_index():
+    fixture = create_setup()
+    mock_cast(fixture.peer_communicator_mock.recv).side_effect = [
+        create_frames([serialize_chunk(fixture.peer, fixture.my_peer, 1), b"1"])
+    ]
+    with pytest.raises(RuntimeError, match="Got chunk 1, but expected chunk 0"):
+        list(create_receive_operation(fixture, window_size=2)())
+
+
+def test_receive_with_wrong_number_of_chunks():
+    fixture = create_setup()
+    mock_cast(fixture.peer_communicator_mock.recv).side_effect = [
+        create_frames([serialize_end(fixture.peer, fixture.my_peer, 1)])
+    ]
+    with pytest.raises(RuntimeError, match="Stream ended after 0 chunks"):
+        list(create_receive_operation(fixture, window_size=2)())
+
+
+def test_invalid_window_size():
+    fixture = create_setup()
+    with pytest.raises(IllegalParametersError):
+        create_send_operation(fixture, window_size=0)